@@ -21,8 +21,13 @@ class StudioAgent(Agent):
 
     All studio agents should inherit from this class and use @tool
     decorators for their main methods to enable Strands orchestration.
+
+    Set `use_response_cache = False` on agents whose responses should never
+    be served from ClaudeClient's response cache.
     """
 
+    use_response_cache: bool = True
+
     def __init__(self, claude_client: Optional[ClaudeClient] = None, **kwargs):
         """
         Initialize studio agent.
@@ -33,6 +38,8 @@ class StudioAgent(Agent):
         """
         super().__init__(**kwargs)
         self.claude = claude_client or ClaudeClient()
+        if not self.use_response_cache and hasattr(self.claude, "without_cache"):
+            self.claude = self.claude.without_cache()
 
     def _format_budget(self, amount: float) -> str:
         """Format budget amount as currency string"""
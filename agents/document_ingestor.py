@@ -1,17 +1,19 @@
 """Document Ingestor Agent - Extracts knowledge atoms from documents using PyMuPDF + LLM"""
 
+import asyncio
 import base64
 import hashlib
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, Awaitable
 
 from strands import tool
 
 from core.claude_client import ClaudeClient, JSONExtractor
 from core.models.document import AtomType, DocumentAtom, DocumentGraph, ContentProfile
 from core.content_classifier import ContentClassifier, is_theme_candidate
+from core.pdf_extraction import extract_pdf, find_figure_captions, merge_figures, render_caption_figures
 from .base import StudioAgent
 
 
@@ -40,9 +42,20 @@ class DocumentIngestorAgent(StudioAgent):
         self,
         claude_client: Optional[ClaudeClient] = None,
         mock_mode: bool = False,
+        max_concurrent_requests: int = 4,
+        extraction_workers: Optional[int] = None,
     ):
+        """
+        Args:
+            claude_client: Optional ClaudeClient instance (creates one if not provided)
+            mock_mode: Use heuristic analysis instead of LLM calls
+            max_concurrent_requests: LLM calls in flight at once during analysis
+            extraction_workers: Processes for extracting large PDFs (default: CPU count)
+        """
         super().__init__(claude_client=claude_client)
         self.mock_mode = mock_mode
+        self.max_concurrent_requests = max_concurrent_requests
+        self.extraction_workers = extraction_workers
         self.classifier = ContentClassifier()
 
     async def ingest(self, source_path: str) -> DocumentGraph:
@@ -65,8 +78,9 @@ class DocumentIngestorAgent(StudioAgent):
         # Generate document ID from file hash
         doc_id = self._generate_doc_id(path)
 
-        # Phase 1: Extract raw content with PyMuPDF
-        extraction = self._extract_with_pymupdf(path)
+        # Phase 1: Extract raw content with PyMuPDF (off the event loop, so
+        # several documents can be ingested concurrently)
+        extraction = await asyncio.to_thread(self._extract_with_pymupdf, path)
 
         # Phase 1.5: Content-aware classification (before LLM)
         # This identifies document type and zones to guide extraction
@@ -92,73 +106,22 @@ class DocumentIngestorAgent(StudioAgent):
         """
         Phase 1: Use PyMuPDF (fitz) to extract raw text blocks and images.
 
-        Returns structured extraction with positional information.
+        Returns structured extraction with positional information. Large
+        documents are split into page ranges extracted in worker processes
+        (see core.pdf_extraction), merged back in page order.
 
         Args:
             use_rendered_figures: If True, extract figures by rendering pages and
                 detecting figure regions (better for academic PDFs). If False, use
                 raw embedded image extraction (faster but may produce fragments).
         """
-        import fitz  # PyMuPDF
-
-        doc = fitz.open(str(path))
-        page_count = len(doc)
-
-        text_blocks: List[Dict[str, Any]] = []
-        images: List[Dict[str, Any]] = []
-        seen_xrefs_global: set = set()  # Deduplicate images across pages
-        metadata = {
-            "title": doc.metadata.get("title", ""),
-            "author": doc.metadata.get("author", ""),
-            "subject": doc.metadata.get("subject", ""),
-            "keywords": doc.metadata.get("keywords", ""),
-            "creator": doc.metadata.get("creator", ""),
-            "creation_date": doc.metadata.get("creationDate", ""),
-        }
-
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-
-            # Extract text blocks with position
-            blocks = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)["blocks"]
-            for block in blocks:
-                if block["type"] == 0:  # Text block
-                    # Combine lines within the block
-                    text = ""
-                    for line in block.get("lines", []):
-                        line_text = ""
-                        for span in line.get("spans", []):
-                            line_text += span.get("text", "")
-                        text += line_text + "\n"
-                    text = text.strip()
-                    if text:
-                        # Detect font size for structure hints
-                        font_sizes = []
-                        is_bold = False
-                        for line in block.get("lines", []):
-                            for span in line.get("spans", []):
-                                font_sizes.append(span.get("size", 12))
-                                if "bold" in span.get("font", "").lower():
-                                    is_bold = True
-
-                        avg_font_size = sum(font_sizes) / len(font_sizes) if font_sizes else 12
-
-                        text_blocks.append({
-                            "text": text,
-                            "page": page_num,
-                            "bbox": (block["bbox"][0], block["bbox"][1],
-                                     block["bbox"][2], block["bbox"][3]),
-                            "font_size": avg_font_size,
-                            "is_bold": is_bold,
-                        })
-
-        # Close doc temporarily, we'll reopen if needed for figure extraction
-        doc.close()
+        text_blocks, images, page_count, metadata = extract_pdf(
+            str(path),
+            render_figures=use_rendered_figures,
+            max_workers=self.extraction_workers,
+        )
 
-        # Extract figures using rendered page approach (better for academic PDFs)
-        if use_rendered_figures:
-            images = self._extract_rendered_figures(path, text_blocks)
-        else:
+        if not use_rendered_figures:
             # Fallback: Extract embedded images (may produce fragments)
             images = self._extract_embedded_images(path)
 
@@ -180,100 +143,16 @@ class DocumentIngestorAgent(StudioAgent):
         embedded images are often fragmented.
         """
         import fitz
-        import re
-        import io
 
+        captions_by_page = find_figure_captions(text_blocks)
+        outcomes = []
         doc = fitz.open(str(path))
-        images = []
-
-        # Find figure captions grouped by page
-        caption_pattern = re.compile(
-            r"(FIGURE|Figure|Fig\.?|TABLE|Table)\s*(\d+)",
-            re.IGNORECASE
-        )
-
-        captions_by_page: Dict[int, List[Dict]] = {}
-        for block in text_blocks:
-            text = block["text"].strip()
-            match = caption_pattern.match(text)
-            if match:
-                page_num = block["page"]
-                if page_num not in captions_by_page:
-                    captions_by_page[page_num] = []
-                captions_by_page[page_num].append({
-                    "text": text,
-                    "bbox": block["bbox"],
-                    "figure_num": match.group(2),
-                    "figure_type": match.group(1).upper().replace(".", ""),
-                })
-
-        # For each page with captions, render and extract figure regions
-        seen_figures = set()  # Track figure numbers to avoid duplicates
-
-        for page_num in sorted(captions_by_page.keys()):
-            page = doc[page_num]
-            page_rect = page.rect
-            page_width = page_rect.width
-            page_height = page_rect.height
-
-            # Render page at 2x resolution for quality
-            zoom = 2.0
-            mat = fitz.Matrix(zoom, zoom)
-            pix = page.get_pixmap(matrix=mat)
-
-            for cap in captions_by_page[page_num]:
-                fig_key = f"{cap['figure_type']}_{cap['figure_num']}"
-                if fig_key in seen_figures:
-                    continue
-                seen_figures.add(fig_key)
-
-                # Caption bbox (in page coordinates)
-                cap_x0, cap_y0, cap_x1, cap_y1 = cap["bbox"]
-
-                # Figure region is above the caption
-                # Use full page width, from top of page (or previous caption) to caption top
-                margin = 10  # Small margin
-                fig_x0 = margin
-                fig_x1 = page_width - margin
-                fig_y0 = max(0, cap_y0 - 400)  # Up to 400pt above caption
-                fig_y1 = cap_y0 - 5  # Just above caption
-
-                # Skip if region is too small
-                if fig_y1 - fig_y0 < 50:
-                    continue
-
-                # Convert to pixel coordinates (account for zoom)
-                clip_rect = fitz.Rect(
-                    fig_x0 * zoom,
-                    fig_y0 * zoom,
-                    fig_x1 * zoom,
-                    fig_y1 * zoom
-                )
-
-                # Clip the pixmap to extract just the figure region
-                try:
-                    # Re-render with clip for this specific region
-                    fig_pix = page.get_pixmap(matrix=mat, clip=fitz.Rect(fig_x0, fig_y0, fig_x1, fig_y1))
-                    img_bytes = fig_pix.tobytes("png")
-
-                    if len(img_bytes) < 5000:  # Skip if too small
-                        continue
-
-                    images.append({
-                        "page": page_num,
-                        "bbox": (fig_x0, fig_y0, fig_x1, fig_y1),
-                        "image_bytes": img_bytes,
-                        "ext": "png",
-                        "width": fig_pix.width,
-                        "height": fig_pix.height,
-                        "figure_number": cap["figure_num"],
-                        "caption": cap["text"],
-                    })
-                except Exception as e:
-                    continue
-
-        doc.close()
-        return images
+        try:
+            for page_num in sorted(captions_by_page.keys()):
+                outcomes.extend(render_caption_figures(doc[page_num], page_num, captions_by_page[page_num]))
+        finally:
+            doc.close()
+        return merge_figures(outcomes)
 
     def _extract_embedded_images(self, path: Path) -> List[Dict[str, Any]]:
         """
@@ -358,6 +237,10 @@ class DocumentIngestorAgent(StudioAgent):
         # A 100-block document would need ~15k output tokens in one shot,
         # hitting limits and producing truncated JSON. Chunking to ~30 blocks
         # keeps each response well under 8k tokens.
+        #
+        # The chunk classifications, figure descriptions and the summary are
+        # independent, so they all run concurrently (bounded by
+        # max_concurrent_requests) and are merged back in document order.
         all_classified_blocks = []
         title = extraction.metadata.get("title", "")
         authors = []
@@ -365,24 +248,39 @@ class DocumentIngestorAgent(StudioAgent):
         num_blocks = len(extraction.text_blocks)
         chunk_size = 30
 
+        structure_prompts = []
         for chunk_start in range(0, num_blocks, chunk_size):
             chunk_end = min(chunk_start + chunk_size, num_blocks)
             chunk_blocks = extraction.text_blocks[chunk_start:chunk_end]
             chunk_indices = list(range(chunk_start, chunk_end))
 
             text_context = self._build_text_context_for_chunk(chunk_blocks, chunk_indices)
-            is_first_chunk = chunk_start == 0
-
-            structure_prompt = self._build_structure_prompt(
+            structure_prompts.append(self._build_structure_prompt(
                 text_context, extraction.metadata, profile,
                 chunk_start=chunk_start, chunk_end=chunk_end, total_blocks=num_blocks,
-                include_title_authors=is_first_chunk,
-            )
-            structure_response = await self.claude.query(structure_prompt)
-            structure = JSONExtractor.extract(structure_response)
+                include_title_authors=chunk_start == 0,
+            ))
+
+        # Summaries use abbreviated context — just title, abstract, conclusions
+        summary_context = self._build_summary_context(extraction)
+        summary_prompt = self._build_summary_prompt(summary_context)
+
+        async def query_json(prompt: str) -> Dict[str, Any]:
+            return JSONExtractor.extract(await self.claude.query(prompt))
 
+        # The summary prompt is the largest, so it goes first
+        results = await self._gather_limited(
+            [query_json(summary_prompt)]
+            + [query_json(prompt) for prompt in structure_prompts]
+            + [self._describe_image(img_info) for img_info in extraction.images]
+        )
+        summaries = results[0]
+        structures = results[1:1 + len(structure_prompts)]
+        descriptions = results[1 + len(structure_prompts):]
+
+        for chunk_num, structure in enumerate(structures):
             # Grab title/authors from first chunk only
-            if is_first_chunk:
+            if chunk_num == 0:
                 title = structure.get("title", title)
                 authors = structure.get("authors", [])
 
@@ -472,13 +370,10 @@ class DocumentIngestorAgent(StudioAgent):
             elif current_section_id and atom_type in (AtomType.PARAGRAPH, AtomType.QUOTE):
                 hierarchy[current_section_id].append(atom_id)
 
-        # Step 3: Process images as figure atoms
-        for i, img_info in enumerate(extraction.images):
+        # Step 3: Process images as figure atoms (described by the LLM in step 1)
+        for i, (img_info, description) in enumerate(zip(extraction.images, descriptions)):
             atom_id = f"{doc_id}_fig_{i:03d}"
 
-            # Use LLM to describe the image if not in mock mode
-            description = await self._describe_image(img_info)
-
             atom = DocumentAtom(
                 atom_id=atom_id,
                 atom_type=AtomType.FIGURE,
@@ -500,12 +395,6 @@ class DocumentIngestorAgent(StudioAgent):
                 if fig_match:
                     atom.figure_number = f"{fig_match.group(1)} {fig_match.group(2)}"
 
-        # Step 4: Generate summaries (use abbreviated context — just title, abstract, conclusions)
-        summary_context = self._build_summary_context(extraction)
-        summary_prompt = self._build_summary_prompt(summary_context)
-        summary_response = await self.claude.query(summary_prompt)
-        summaries = JSONExtractor.extract(summary_response)
-
         # Identify key quotes
         key_quote_ids = []
         for atom_id, atom in atoms.items():
@@ -533,6 +422,27 @@ class DocumentIngestorAgent(StudioAgent):
 
         return graph
 
+    async def _gather_limited(self, calls: List[Awaitable[Any]]) -> List[Any]:
+        """
+        Await calls with at most max_concurrent_requests running at once.
+
+        Results come back in input order. If any call fails, the rest are
+        cancelled and the error is raised.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrent_requests))
+
+        async def run(call: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await call
+
+        tasks = [asyncio.ensure_future(run(call)) for call in calls]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
     async def _describe_image(self, img_info: Dict[str, Any]) -> str:
         """Use LLM vision to describe an extracted image"""
         import tempfile
@@ -26,6 +26,7 @@ class ProducerAgent(StudioAgent):
     """
 
     _is_stub = False
+    use_response_cache = False  # Reruns of the same concept should explore new options
 
     def __init__(self, claude_client: Optional[ClaudeClient] = None):
         """
@@ -4,19 +4,21 @@ import asyncio
 import base64
 import os
 import random
-import subprocess
 import tempfile
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
-import httpx
+import aiohttp
 from strands import tool
 
 from core.budget import ProductionTier, COST_MODELS
 from core.claude_client import ClaudeClient, JSONExtractor
+from core.media_probe import get_media_probe
 from core.models.qa import FrameAnalysis, QAVisualAnalysis
+from core.providers.http import http_session
+from core.qa_cache import QACache, footage_hash, spec_hash
 from agents.script_writer import Scene
 from agents.video_generator import GeneratedVideo
 from .base import StudioAgent
@@ -48,6 +50,40 @@ class QAResult:
     frame_timestamps: List[float] = field(default_factory=list)
 
 
+# Longest edge of frames sent to the vision model; larger images are
+# downscaled by the API anyway, so sending them only inflates the payload
+VISION_MAX_FRAME_SIZE = 1568
+
+# Seconds allowed for extracting all frames of one video
+FRAME_EXTRACTION_TIMEOUT = 60
+
+
+def split_jpeg_stream(data: bytes) -> List[bytes]:
+    """Split concatenated JPEG images (ffmpeg image2pipe output)"""
+    images = []
+    start = data.find(b"\xff\xd8")
+    while start != -1:
+        # 0xFF bytes in entropy-coded data are stuffed, so FFD9 only marks an end
+        end = data.find(b"\xff\xd9", start + 2)
+        if end == -1:
+            break
+        images.append(data[start:end + 2])
+        start = data.find(b"\xff\xd8", end + 2)
+    return images
+
+
+def qa_result_from_dict(data: Dict[str, Any], **overrides: Any) -> QAResult:
+    """Rebuild a QAResult stored with dataclasses.asdict (e.g. in the QA cache)"""
+    data = {**data, **overrides}
+    analysis = data.get("visual_analysis")
+    if isinstance(analysis, dict):
+        data["visual_analysis"] = QAVisualAnalysis(**{
+            **analysis,
+            "frame_analyses": [FrameAnalysis(**fa) for fa in analysis.get("frame_analyses", [])],
+        })
+    return QAResult(**data)
+
+
 # QA score thresholds by production tier
 QA_THRESHOLDS = {
     ProductionTier.STATIC_IMAGES: 70,
@@ -70,7 +106,9 @@ class QAVerifierAgent(StudioAgent):
         claude_client: Optional[ClaudeClient] = None,
         mock_mode: bool = True,  # Use simulated scoring by default
         num_frames: int = 5,  # Number of frames to extract
-        use_vision: bool = True  # Use Claude vision API when available
+        use_vision: bool = True,  # Use Claude vision API when available
+        max_frame_size: Optional[int] = VISION_MAX_FRAME_SIZE,
+        cache: Optional[QACache] = None
     ):
         """
         Args:
@@ -78,11 +116,15 @@ class QAVerifierAgent(StudioAgent):
             mock_mode: Use simulated scoring instead of real analysis
             num_frames: Number of frames to extract from video
             use_vision: Whether to use Claude's vision API for analysis
+            max_frame_size: Downscale frames so neither side exceeds this (None keeps full size)
+            cache: Optional QACache; footage already scored for the same scene is not re-analyzed
         """
         super().__init__(claude_client=claude_client)
         self.mock_mode = mock_mode
         self.num_frames = num_frames
         self.use_vision = use_vision
+        self.max_frame_size = max_frame_size
+        self.cache = cache
 
     @tool
     async def verify_video(
@@ -117,6 +159,16 @@ class QAVerifierAgent(StudioAgent):
             total_duration=generated_video.total_video_duration
         )
 
+        # Footage already scored against this scene costs no vision tokens
+        cache_key = self._cache_key(scene, original_request, production_tier, frames)
+        if cache_key is not None:
+            cached = self.cache.get(*cache_key)
+            if cached is not None:
+                print(f"[QA] Cache hit for {scene.scene_id} (already scored footage)")
+                return qa_result_from_dict(
+                    cached, scene_id=scene.scene_id, video_url=generated_video.video_url
+                )
+
         # Analyze with Claude Vision
         qa_data = await self._analyze_with_vision(
             scene=scene,
@@ -131,7 +183,7 @@ class QAVerifierAgent(StudioAgent):
         # Calculate threshold
         threshold = QA_THRESHOLDS[production_tier]
 
-        return QAResult(
+        result = QAResult(
             scene_id=scene.scene_id,
             video_url=generated_video.video_url,
             overall_score=qa_data["overall_score"],
@@ -147,6 +199,39 @@ class QAVerifierAgent(StudioAgent):
             frame_timestamps=frame_timestamps
         )
 
+        if cache_key is not None:
+            self.cache.put(*cache_key, result)
+
+        return result
+
+    def _cache_key(
+        self,
+        scene: Scene,
+        original_request: str,
+        production_tier: ProductionTier,
+        frames: List[Dict[str, str]]
+    ) -> Optional[Tuple[str, str]]:
+        """(spec hash, footage hash) for the QA cache, or None if not caching"""
+        if self.cache is None or not frames:
+            # Without frames there's no footage to match a verdict against
+            return None
+
+        try:
+            footage = footage_hash([base64.b64decode(frame["data"]) for frame in frames])
+        except Exception as e:
+            print(f"[QA] Warning: could not hash frames for the QA cache: {e}")
+            return None
+
+        spec = spec_hash(
+            production_tier.value,
+            title=scene.title,
+            description=scene.description,
+            visual_elements=scene.visual_elements,
+            duration=scene.duration,
+            original_request=original_request,
+        )
+        return spec, footage
+
     async def verify_batch(
         self,
         scenes: List[Scene],
@@ -174,6 +259,153 @@ class QAVerifierAgent(StudioAgent):
 
         return await asyncio.gather(*tasks)
 
+    async def verify_stream(
+        self,
+        videos: AsyncIterator[GeneratedVideo],
+        scenes: List[Scene],
+        original_request: str,
+        production_tier: ProductionTier,
+        prepare: Optional[Callable[[GeneratedVideo], Awaitable[None]]] = None,
+        regenerate: Optional[Callable[[Scene, GeneratedVideo], Awaitable[Optional[GeneratedVideo]]]] = None,
+        max_regenerations: int = 1,
+        max_concurrent: int = 4
+    ) -> AsyncIterator[Tuple[GeneratedVideo, QAResult]]:
+        """
+        Verify videos as they arrive from an upstream generator
+
+        Videos flow through a queue into `max_concurrent` workers that prepare
+        (e.g. download) and verify them while later videos are still being
+        generated. A video that fails QA is handed to `regenerate` right away
+        and its replacement re-enters the queue.
+
+        Args:
+            videos: Async iterator of generated videos (e.g. VideoGeneratorAgent.stream_scenes)
+            scenes: Scene specifications for the videos
+            original_request: High-level video concept
+            production_tier: Expected quality tier
+            prepare: Optional async hook run on each video before QA (e.g. download it)
+            regenerate: Optional async callback(scene, failed_video) returning a replacement
+            max_regenerations: Replacement attempts per variation
+            max_concurrent: Videos verified at once
+
+        Yields:
+            (video, QAResult) per variation, in completion order. Replaced videos
+            aren't yielded; their cost is recorded in the replacement's
+            metadata["discarded_cost"]. A video whose preparation or
+            verification raises gets a failing QAResult naming the error.
+        """
+        scene_lookup = {scene.scene_id: scene for scene in scenes}
+        work: asyncio.Queue = asyncio.Queue()
+        done: asyncio.Queue = asyncio.Queue()
+        finished = object()
+        outstanding = 1  # Producer counts as one until the stream is exhausted
+        background: set = set()
+
+        def settle(item=None):
+            nonlocal outstanding
+            if item is not None:
+                done.put_nowait(item)
+            outstanding -= 1
+            if outstanding == 0:
+                done.put_nowait(finished)
+
+        async def produce():
+            nonlocal outstanding
+            try:
+                async for video in videos:
+                    outstanding += 1
+                    work.put_nowait(video)
+            finally:
+                settle()
+
+        async def replace(scene: Scene, video: GeneratedVideo, qa: QAResult):
+            nonlocal outstanding
+            try:
+                new_video = await regenerate(scene, video)
+            except Exception as e:
+                print(f"[QA] Regeneration failed for {scene.scene_id} v{video.variation_id}: {e}")
+                new_video = None
+
+            if new_video is None:
+                settle((video, qa))
+                return
+
+            new_video.metadata["qa_attempts"] = video.metadata.get("qa_attempts", 1) + 1
+            new_video.metadata["discarded_cost"] = (
+                video.metadata.get("discarded_cost", 0.0) + video.generation_cost
+            )
+            outstanding += 1
+            work.put_nowait(new_video)
+            settle()
+
+        async def verify(video: GeneratedVideo):
+            scene = scene_lookup[video.scene_id]
+            if prepare:
+                await prepare(video)
+            qa = await self.verify_video(scene, video, original_request, production_tier)
+            video.quality_score = qa.overall_score
+
+            attempts = video.metadata.get("qa_attempts", 1)
+            if not qa.passed and regenerate and attempts <= max_regenerations:
+                print(f"[QA] {scene.scene_id} v{video.variation_id} failed QA "
+                      f"({qa.overall_score:.0f}/{qa.threshold:.0f}), regenerating...")
+                task = asyncio.ensure_future(replace(scene, video, qa))
+                background.add(task)
+                task.add_done_callback(background.discard)
+            else:
+                settle((video, qa))
+
+        async def worker():
+            while True:
+                video = await work.get()
+                try:
+                    await verify(video)
+                except Exception as e:
+                    # Report the variation as failed rather than dropping it from the results
+                    print(f"[QA] Verification failed for {video.scene_id} v{video.variation_id}: "
+                          f"{type(e).__name__}: {e}")
+                    settle((video, self._failed_result(video, production_tier, e)))
+
+        tasks = [asyncio.ensure_future(produce())]
+        tasks += [asyncio.ensure_future(worker()) for _ in range(max_concurrent)]
+
+        try:
+            while True:
+                item = await done.get()
+                if item is finished:
+                    break
+                yield item
+        finally:
+            for task in tasks + list(background):
+                task.cancel()
+            await asyncio.gather(*tasks, *background, return_exceptions=True)
+
+        # Surface a failing upstream generator
+        producer = tasks[0]
+        if not producer.cancelled() and producer.exception():
+            raise producer.exception()
+
+    def _failed_result(
+        self,
+        video: GeneratedVideo,
+        production_tier: ProductionTier,
+        error: Exception
+    ) -> QAResult:
+        """Failing QAResult for a video whose verification raised"""
+        return QAResult(
+            scene_id=video.scene_id,
+            video_url=video.video_url,
+            overall_score=0.0,
+            visual_accuracy=0.0,
+            style_consistency=0.0,
+            technical_quality=0.0,
+            narrative_fit=0.0,
+            issues=[f"QA verification failed: {type(error).__name__}: {error}"],
+            suggestions=["Re-run QA for this variation"],
+            passed=False,
+            threshold=QA_THRESHOLDS[production_tier]
+        )
+
     async def _extract_frames(
         self,
         video_path: str,
@@ -205,12 +437,9 @@ class QAVerifierAgent(StudioAgent):
             cleanup_after = False
 
         try:
-            # Get video duration using ffprobe
+            # Get video duration (cached by the shared media probe)
             duration = total_duration or await self._get_video_duration(local_path)
 
-            frames = []
-            timestamps = []
-
             # Determine sampling region
             if new_content_start > 0:
                 # Chained video: sample from new content portion
@@ -223,99 +452,125 @@ class QAVerifierAgent(StudioAgent):
                 new_content_duration = duration
 
             # Calculate timestamps within the sampling region
+            timestamps = []
             for i in range(self.num_frames):
                 # Evenly spaced within the content region, avoiding edges
                 timestamp = sample_start + (new_content_duration / (self.num_frames + 1)) * (i + 1)
                 # Clamp to valid range
                 timestamp = max(0.1, min(timestamp, duration - 0.1))
+                if timestamp not in timestamps:
+                    timestamps.append(timestamp)
 
-                # Create temp file for frame
-                with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp:
-                    tmp_path = tmp.name
+            returncode, stdout, stderr = await self._run_ffmpeg(
+                self._frame_extraction_command(local_path, timestamps),
+                timeout=FRAME_EXTRACTION_TIMEOUT
+            )
 
-                try:
-                    # Extract frame with ffmpeg
-                    result = subprocess.run(
-                        [
-                            'ffmpeg', '-ss', str(timestamp),
-                            '-i', local_path,
-                            '-vframes', '1',
-                            '-q:v', '2',  # High quality JPEG
-                            '-y', tmp_path
-                        ],
-                        capture_output=True,
-                        timeout=30
-                    )
-
-                    if result.returncode != 0:
-                        # ffmpeg outputs version info to stderr first, so get the last lines for the actual error
-                        stderr_lines = result.stderr.decode().strip().split('\n')
-                        # Get last 3 non-empty lines which usually contain the actual error
-                        error_lines = [line for line in stderr_lines if line.strip()][-3:]
-                        error_msg = '\n'.join(error_lines)
-                        print(f"[QA] Warning: ffmpeg frame extraction failed:\n{error_msg}")
-                        continue
-
-                    # Read and encode as base64
-                    with open(tmp_path, 'rb') as f:
-                        frame_data = base64.b64encode(f.read()).decode('utf-8')
-
-                    frames.append({
-                        "data": frame_data,
-                        "media_type": "image/jpeg"
-                    })
-                    timestamps.append(timestamp)
-                finally:
-                    # Clean up temp frame file
-                    if os.path.exists(tmp_path):
-                        os.unlink(tmp_path)
+            if returncode != 0:
+                # ffmpeg outputs version info to stderr first, so get the last lines for the actual error
+                stderr_lines = stderr.decode(errors="replace").strip().split('\n')
+                # Get last 3 non-empty lines which usually contain the actual error
+                error_lines = [line for line in stderr_lines if line.strip()][-3:]
+                error_msg = '\n'.join(error_lines)
+                print(f"[QA] Warning: ffmpeg frame extraction failed:\n{error_msg}")
+
+            frames = [
+                {
+                    "data": base64.b64encode(image).decode('utf-8'),
+                    "media_type": "image/jpeg"
+                }
+                for image in split_jpeg_stream(stdout)
+            ]
 
             if not frames:
                 raise RuntimeError("Failed to extract any frames from video")
 
-            return frames, timestamps
+            # Frames come out in timestamp order; a video shorter than its
+            # metadata claims can yield fewer frames than requested
+            return frames, timestamps[:len(frames)]
 
         finally:
             # Clean up downloaded video
             if cleanup_after and os.path.exists(local_path):
                 os.unlink(local_path)
 
+    def _frame_extraction_command(self, video_path: str, timestamps: List[float]) -> List[str]:
+        """
+        Build one ffmpeg command that writes a JPEG per timestamp to stdout.
+
+        The select filter keeps the first frame at or after each timestamp,
+        so the video is decoded once instead of once per frame. Input seeking
+        skips straight to the first timestamp (output timestamps then count
+        from the seek point).
+        """
+        seek = max(0.0, min(timestamps) - 1.0)
+        # not(gte(...)) rather than lt(...): prev_t is NAN for the first frame
+        conditions = "+".join(
+            f"gte(t,{ts - seek:.3f})*not(gte(prev_t,{ts - seek:.3f}))" for ts in timestamps
+        )
+
+        filters = [f"select='{conditions}'"]
+        if self.max_frame_size:
+            size = self.max_frame_size
+            filters.append(
+                f"scale='min(iw,{size})':'min(ih,{size})':force_original_aspect_ratio=decrease"
+            )
+
+        return [
+            'ffmpeg', '-v', 'error',
+            '-ss', f"{seek:.3f}",
+            '-i', video_path,
+            '-vf', ",".join(filters),
+            '-vsync', 'vfr',
+            '-frames:v', str(len(timestamps)),
+            '-q:v', '2',  # High quality JPEG
+            '-f', 'image2pipe', '-c:v', 'mjpeg',
+            'pipe:1'
+        ]
+
+    async def _run_ffmpeg(self, cmd: List[str], timeout: float) -> Tuple[int, bytes, bytes]:
+        """
+        Run an ffmpeg/ffprobe command without blocking the event loop.
+
+        Returns:
+            (returncode, stdout, stderr)
+        """
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return -1, b"", f"{cmd[0]} timed out after {timeout}s".encode()
+        return process.returncode, stdout, stderr
+
     async def _download_video(self, url: str) -> str:
         """Download video from URL to temp file"""
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.get(url)
-            response.raise_for_status()
+        async with http_session() as session:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=120)) as response:
+                response.raise_for_status()
 
-            # Create temp file with appropriate extension
-            parsed = urlparse(url)
-            ext = Path(parsed.path).suffix or '.mp4'
+                # Create temp file with appropriate extension
+                parsed = urlparse(url)
+                ext = Path(parsed.path).suffix or '.mp4'
 
-            with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tmp:
-                tmp.write(response.content)
-                return tmp.name
+                with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tmp:
+                    async for chunk in response.content.iter_chunked(1024 * 1024):
+                        tmp.write(chunk)
+                    return tmp.name
 
     async def _get_video_duration(self, video_path: str) -> float:
-        """Get video duration in seconds using ffprobe"""
-        result = subprocess.run(
-            [
-                'ffprobe', '-v', 'error',
-                '-show_entries', 'format=duration',
-                '-of', 'default=noprint_wrappers=1:nokey=1',
-                video_path
-            ],
-            capture_output=True,
-            timeout=30
-        )
-
-        if result.returncode != 0:
+        """Get video duration in seconds using the media probe"""
+        duration = await get_media_probe().duration(video_path)
+        if duration is None:
             # Default to 5 seconds if we can't determine duration
             print(f"[QA] Warning: Could not determine video duration, defaulting to 5s")
             return 5.0
-
-        try:
-            return float(result.stdout.decode().strip())
-        except ValueError:
-            return 5.0
+        return duration
 
     async def _analyze_with_vision(
         self,
@@ -2,7 +2,7 @@
 
 import asyncio
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any, Tuple
+from typing import AsyncIterator, List, Dict, Optional, Any, Tuple
 from strands import tool
 
 from core.budget import ProductionTier, COST_MODELS
@@ -255,100 +255,209 @@ class VideoGeneratorAgent(StudioAgent):
             return results
 
         # Phase 1: Submit all generations
-        pending = []  # List of (scene, variation_id, generation_id, submission_info)
-
-        for scene in scenes:
-            start_image_url = self._get_seed_image(scene, seed_asset_lookup)
-            prompt = self._build_prompt(scene, production_tier)
-
-            for var_id in range(num_variations):
-                try:
-                    kwargs = {}
-                    if start_image_url:
-                        kwargs["start_image_url"] = start_image_url
-
-                    submission = await self.provider.submit_generation(
-                        prompt=prompt,
-                        duration=scene.duration,
-                        aspect_ratio="16:9",
-                        **kwargs
-                    )
-
-                    pending.append({
-                        "scene": scene,
-                        "variation_id": var_id,
-                        "generation_id": submission["generation_id"],
-                        "submission_info": submission,
-                        "prompt": prompt
-                    })
-
-                    print(f"[Parallel] Submitted {scene.scene_id} v{var_id}: {submission['generation_id'][:12]}...")
-
-                except Exception as e:
-                    print(f"[Parallel] Failed to submit {scene.scene_id} v{var_id}: {e}")
+        pending = await self._submit_all(scenes, production_tier, num_variations, seed_asset_lookup)
 
         if not pending:
             return {}
 
         print(f"[Parallel] All {len(pending)} generations submitted, waiting for completion...")
 
-        # Phase 2: Wait for all generations in parallel
-        async def wait_single(item):
-            try:
-                result = await self.provider.wait_for_generation(
-                    generation_id=item["generation_id"],
-                    submission_info=item["submission_info"],
-                    quiet=True  # Suppress individual status messages
-                )
-                return {
-                    "scene": item["scene"],
-                    "variation_id": item["variation_id"],
-                    "result": result,
-                    "prompt": item["prompt"]
-                }
-            except Exception as e:
-                return {
-                    "scene": item["scene"],
-                    "variation_id": item["variation_id"],
-                    "result": None,
-                    "error": str(e),
-                    "prompt": item["prompt"]
-                }
-
-        # Wait for all in parallel
-        completed = await asyncio.gather(*[wait_single(item) for item in pending])
+        # Phase 2: Wait for all generations in parallel (the provider's poller
+        # batches status checks, and each wait returns as soon as its job ends)
+        completed = await asyncio.gather(*[
+            self._wait_submission(item, production_tier) for item in pending
+        ])
 
         # Phase 3: Organize results by scene
         results: Dict[str, List[GeneratedVideo]] = {}
 
-        for item in completed:
+        for item, video in zip(pending, completed):
             scene = item["scene"]
             if scene.scene_id not in results:
                 results[scene.scene_id] = []
-
-            if item.get("result") and item["result"].success:
-                video = GeneratedVideo(
-                    scene_id=scene.scene_id,
-                    variation_id=item["variation_id"],
-                    video_url=item["result"].video_url or "",
-                    thumbnail_url="",
-                    duration=item["result"].duration or scene.duration,
-                    generation_cost=item["result"].cost or 0.0,
-                    provider=item["result"].provider_metadata.get("provider", "unknown"),
-                    metadata={
-                        "prompt": item["prompt"],
-                        "tier": production_tier.value,
-                        **item["result"].provider_metadata
-                    }
-                )
+            if video:
                 results[scene.scene_id].append(video)
-                print(f"[Parallel] Completed {scene.scene_id} v{item['variation_id']}")
-            else:
-                error = item.get("error", "Unknown error")
-                print(f"[Parallel] Failed {scene.scene_id} v{item['variation_id']}: {error}")
 
         return results
 
+    async def stream_scenes(
+        self,
+        scenes: List[Scene],
+        production_tier: ProductionTier,
+        budget_per_scene: float,
+        num_variations: int = 1,
+        seed_asset_lookup: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[GeneratedVideo]:
+        """
+        Generate videos for multiple scenes, yielding each as soon as it finishes.
+
+        Like generate_scenes_parallel, but lets downstream stages (download,
+        QA) start on finished videos while slower generations are still
+        rendering. Failed generations are reported and skipped.
+
+        Args:
+            scenes: List of scenes to generate
+            production_tier: Quality tier
+            budget_per_scene: Budget limit per scene
+            num_variations: Number of variations per scene
+            seed_asset_lookup: Optional dict mapping asset IDs to asset objects
+
+        Yields:
+            GeneratedVideo objects in completion order
+        """
+        if hasattr(self.provider, 'submit_generation'):
+            pending = await self._submit_all(scenes, production_tier, num_variations, seed_asset_lookup)
+            tasks = [
+                asyncio.ensure_future(self._wait_submission(item, production_tier))
+                for item in pending
+            ]
+        else:
+            # Providers without submit/wait generate each scene in one call
+            async def generate(scene: Scene) -> List[GeneratedVideo]:
+                return await self.generate_scene(
+                    scene=scene,
+                    production_tier=production_tier,
+                    budget_limit=budget_per_scene,
+                    num_variations=num_variations,
+                    image_url=self._get_seed_image(scene, seed_asset_lookup)
+                )
+
+            tasks = [asyncio.ensure_future(generate(scene)) for scene in scenes]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                done = await next_done
+                for video in (done if isinstance(done, list) else [done]):
+                    if video:
+                        yield video
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def regenerate_variation(
+        self,
+        scene: Scene,
+        variation_id: int,
+        production_tier: ProductionTier,
+        seed_asset_lookup: Optional[Dict[str, Any]] = None
+    ) -> Optional[GeneratedVideo]:
+        """
+        Generate one variation of a scene again (e.g. after it failed QA).
+
+        Returns:
+            The new GeneratedVideo, or None if generation failed
+        """
+        start_image_url = self._get_seed_image(scene, seed_asset_lookup)
+
+        if not hasattr(self.provider, 'submit_generation'):
+            return await self._generate_with_retry(
+                scene=scene,
+                variation_id=variation_id,
+                tier=production_tier,
+                image_url=start_image_url
+            )
+
+        item = await self._submit_variation(
+            scene, variation_id, self._build_prompt(scene, production_tier), start_image_url
+        )
+        if item is None:
+            return None
+        return await self._wait_submission(item, production_tier)
+
+    async def _submit_all(
+        self,
+        scenes: List[Scene],
+        production_tier: ProductionTier,
+        num_variations: int,
+        seed_asset_lookup: Optional[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Submit every variation of every scene; returns the accepted submissions"""
+        pending = []
+
+        for scene in scenes:
+            start_image_url = self._get_seed_image(scene, seed_asset_lookup)
+            prompt = self._build_prompt(scene, production_tier)
+
+            for var_id in range(num_variations):
+                item = await self._submit_variation(scene, var_id, prompt, start_image_url)
+                if item:
+                    pending.append(item)
+
+        return pending
+
+    async def _submit_variation(
+        self,
+        scene: Scene,
+        variation_id: int,
+        prompt: str,
+        start_image_url: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Submit one generation without waiting for it"""
+        try:
+            kwargs = {}
+            if start_image_url:
+                kwargs["start_image_url"] = start_image_url
+
+            submission = await self.provider.submit_generation(
+                prompt=prompt,
+                duration=scene.duration,
+                aspect_ratio="16:9",
+                **kwargs
+            )
+
+            print(f"[Parallel] Submitted {scene.scene_id} v{variation_id}: {submission['generation_id'][:12]}...")
+
+            return {
+                "scene": scene,
+                "variation_id": variation_id,
+                "generation_id": submission["generation_id"],
+                "submission_info": submission,
+                "prompt": prompt
+            }
+
+        except Exception as e:
+            print(f"[Parallel] Failed to submit {scene.scene_id} v{variation_id}: {e}")
+            return None
+
+    async def _wait_submission(
+        self,
+        item: Dict[str, Any],
+        production_tier: ProductionTier
+    ) -> Optional[GeneratedVideo]:
+        """Wait for a submitted generation; returns None if it failed"""
+        scene = item["scene"]
+
+        try:
+            result = await self.provider.wait_for_generation(
+                generation_id=item["generation_id"],
+                submission_info=item["submission_info"],
+                quiet=True  # Suppress individual status messages
+            )
+        except Exception as e:
+            print(f"[Parallel] Failed {scene.scene_id} v{item['variation_id']}: {e}")
+            return None
+
+        if not result or not result.success:
+            error = result.error_message if result else "Unknown error"
+            print(f"[Parallel] Failed {scene.scene_id} v{item['variation_id']}: {error}")
+            return None
+
+        print(f"[Parallel] Completed {scene.scene_id} v{item['variation_id']}")
+        return GeneratedVideo(
+            scene_id=scene.scene_id,
+            variation_id=item["variation_id"],
+            video_url=result.video_url or "",
+            thumbnail_url="",
+            duration=result.duration or scene.duration,
+            generation_cost=result.cost or 0.0,
+            provider=result.provider_metadata.get("provider", "unknown"),
+            metadata={
+                "prompt": item["prompt"],
+                "tier": production_tier.value,
+                **result.provider_metadata
+            }
+        )
+
     async def generate_with_graph(
         self,
         scenes: List[Scene],
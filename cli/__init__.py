@@ -24,6 +24,7 @@ from .assemble import assemble_cmd
 from .assets import assets
 from .upload import upload_cmd
 from .figures import figures
+from .cache import cache_cmd
 
 # Load .env file at CLI startup
 load_dotenv()
@@ -61,6 +62,7 @@ def main():
       agents         List and manage agents
       config         Manage configuration
       themes         List and preview color themes
+      cache          Inspect and prune artifact caches
     """
     pass
 
@@ -95,6 +97,7 @@ main.add_command(providers_cmd, name="providers")
 main.add_command(agents_cmd, name="agents")
 main.add_command(config_cmd, name="config")
 main.add_command(themes_cmd, name="themes")
+main.add_command(cache_cmd, name="cache")
 
 # Upload commands
 main.add_command(upload_cmd, name="upload")
@@ -10,18 +10,22 @@ This uses the assembly manifest from ContentLibrarian to:
 4. Create rough cut video with proper audio sync
 """
 
+import asyncio
 import subprocess
 import json
 import sys
 import tempfile
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from fractions import Fraction
 from pathlib import Path
-from typing import List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from dataclasses import asdict, dataclass, replace
 
 import click
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from rich.table import Table
@@ -37,10 +41,100 @@ from cli.theme import get_theme
 from core.models.structured_script import StructuredScript
 from core.models.content_library import ContentLibrary
 from core.content_librarian import ContentLibrarian
+from core.media_probe import get_media_probe
+from core.models.render import ENCODER_PROFILES, RenderConfig
+from core.render_cache import RenderCache, cache_key, file_digest, ffmpeg_version
+from core.render_scheduler import DEFAULT_THREADS_PER_JOB
 
 console = Console()
 
 
+
+@dataclass(frozen=True)
+class SegmentProfile:
+    """Encoding shared by every segment type.
+
+    create_final_video joins segments with the concat demuxer and copies the
+    video stream, which is only safe when every segment has the same codec
+    parameters, frame rate, timebase, pixel format and SAR. Each segment
+    encoder ends its filter chain with filters() and encodes with
+    output_args(), so all of these are pinned rather than left to ffmpeg's
+    per-input defaults.
+    """
+    width: int = 1920
+    height: int = 1080
+    fps: int = 30
+    timescale: int = 15360  # MP4 track timebase (1/15360, ffmpeg's default for 30fps)
+    gop: int = 60  # Keyframe interval in frames for moving segments
+    still_gop: int = 300  # Static images change never; keyframes are just overhead
+    pix_fmt: str = "yuv420p"
+    sar: str = "1:1"
+    codec: str = "libx264"
+    h264_profile: str = "high"
+    level: str = "4.0"
+    preset: str = "fast"
+    crf: int = 23
+    threads: int = 0  # Encoder threads per segment (0 = ffmpeg decides, i.e. every core)
+
+    @classmethod
+    def from_encoder_profile(cls, name: str) -> 'SegmentProfile':
+        """Segment profile at a named encoder profile's size and quality"""
+        settings = RenderConfig.for_profile(name)
+        return cls(
+            width=settings.output_width,
+            height=settings.output_height,
+            preset=settings.preset,
+            crf=settings.crf,
+        )
+
+    @property
+    def size(self) -> str:
+        return f"{self.width}x{self.height}"
+
+    def filters(self) -> str:
+        """Filter chain tail normalizing frame rate, SAR and pixel format"""
+        return f"fps={self.fps},setsar={self.sar.replace(':', '/')},format={self.pix_fmt}"
+
+    def output_args(self, still: bool = False) -> List[str]:
+        """Video encoder arguments (still=True for a held image)"""
+        args = ["-c:v", self.codec, "-preset", self.preset, "-crf", str(self.crf)]
+        if still:
+            args.extend(["-tune", "stillimage"])
+        args.extend([
+            "-profile:v", self.h264_profile, "-level:v", self.level,
+            "-pix_fmt", self.pix_fmt,
+            "-r", str(self.fps),
+            "-g", str(self.still_gop if still else self.gop),
+            "-sc_threshold", "0",  # No extra keyframes at scene cuts
+            "-video_track_timescale", str(self.timescale),
+        ])
+        if self.threads:
+            args.extend(["-threads", str(self.threads)])
+        return args
+
+    def mismatches(self, info) -> List[str]:
+        """How a probed segment (MediaInfo) deviates from the profile"""
+        if info is None or not info.has_video:
+            return ["no video stream"]
+        problems = []
+        if info.video_codec != "h264":
+            problems.append(f"codec {info.video_codec}")
+        if info.resolution != (self.width, self.height):
+            problems.append(f"size {info.width}x{info.height}")
+        if info.fps is None or abs(info.fps - self.fps) > 0.01:
+            problems.append(f"fps {info.fps}")
+        if info.pix_fmt != self.pix_fmt:
+            problems.append(f"pix_fmt {info.pix_fmt}")
+        if info.time_base != f"1/{self.timescale}":
+            problems.append(f"timebase {info.time_base}")
+        if info.sample_aspect_ratio not in (None, self.sar):
+            problems.append(f"SAR {info.sample_aspect_ratio}")
+        return problems
+
+
+SEGMENT_PROFILE = SegmentProfile()
+
+
 @dataclass
 class AudioClip:
     """Audio clip with timing information."""
@@ -64,18 +158,8 @@ class VisualSegment:
 
 
 def get_media_duration(path: Path) -> float:
-    """Get duration of audio/video file using ffprobe."""
-    try:
-        result = subprocess.run(
-            [
-                "ffprobe", "-v", "quiet", "-show_entries", "format=duration",
-                "-of", "csv=p=0", str(path)
-            ],
-            capture_output=True, text=True, timeout=30
-        )
-        return float(result.stdout.strip())
-    except (subprocess.TimeoutExpired, ValueError):
-        return 0.0
+    """Get duration of audio/video file (0.0 if unknown), cached by the media probe."""
+    return get_media_probe().duration_sync(path) or 0.0
 
 
 from dataclasses import dataclass
@@ -135,14 +219,16 @@ def _measure_text_with_kerning(draw, text: str, font, extra_spacing: int = 2) ->
 def create_transcript_overlay(text: str, duration: float, output_path: Path,
                                font_size: int = 48, max_chars_per_line: int = 42,
                                bg_color: tuple = (26, 26, 46),
-                               text_color: str = "white") -> bool:
+                               text_color: str = "white",
+                               profile: SegmentProfile = SEGMENT_PROFILE) -> bool:
     """Create a karaoke-style video segment with progressive text highlighting.
 
-    Renders frame-by-frame animation where the current word is highlighted white,
+    Renders animation where the current word is highlighted white,
     already-read words fade to grey, and upcoming words are dim.
-    Uses Pillow for rendering and ffmpeg for encoding.
+    Uses Pillow for rendering and ffmpeg for encoding: the background and
+    shadows are drawn once, only the words whose color changes are redrawn,
+    and raw frames are piped to ffmpeg's stdin (no temp files).
     """
-    import shutil
     from PIL import Image, ImageDraw
 
     if duration <= 0 or not text.strip():
@@ -205,13 +291,12 @@ def create_transcript_overlay(text: str, duration: float, output_path: Path,
             ))
             cursor_x += w + space_width
 
-    # --- Generate frames ---
-    fps = 30
-    total_frames = int(duration * fps)
-    if total_frames < 1:
-        total_frames = 1
-
-    words_per_second = len(word_positions) / duration if duration > 0 else len(word_positions)
+    # --- Stream frames ---
+    # The highlighted word advances at a constant rate, so the picture only
+    # changes len(word_positions) times. Emit one raw RGB frame per word
+    # (input rate = words per second) and let ffmpeg's fps filter hold each
+    # frame out to the profile's frame rate, instead of drawing every output frame.
+    word_rate = Fraction(len(word_positions)) / Fraction(duration).limit_denominator(1000)
 
     # Color scheme
     color_read = (102, 102, 102)      # already read - grey
@@ -219,64 +304,88 @@ def create_transcript_overlay(text: str, duration: float, output_path: Path,
     color_upcoming = (68, 68, 68)     # upcoming - dim
     color_shadow = (0, 0, 0)
 
-    temp_dir = tempfile.mkdtemp(prefix="karaoke_")
+    # Static layer: background plus drop shadows, rendered once
+    shadow_layer = Image.new('RGB', (1920, 1080), color=bg_color)
+    shadow_draw = ImageDraw.Draw(shadow_layer)
+    for wp in word_positions:
+        for offset in [(3, 3), (2, 2)]:
+            _render_text_with_kerning(
+                shadow_draw, wp.x + offset[0], wp.y + offset[1],
+                wp.word, font, fill=color_shadow, extra_spacing=extra_kerning
+            )
 
-    try:
-        for frame_num in range(total_frames):
-            elapsed = frame_num / fps
-            current_word_idx = min(int(elapsed * words_per_second), len(word_positions) - 1)
-
-            img = Image.new('RGB', (1920, 1080), color=bg_color)
-            draw = ImageDraw.Draw(img)
-
-            # Pass 1: drop shadows for all words
-            for wp in word_positions:
-                for offset in [(3, 3), (2, 2)]:
-                    _render_text_with_kerning(
-                        draw, wp.x + offset[0], wp.y + offset[1],
-                        wp.word, font, fill=color_shadow, extra_spacing=extra_kerning
-                    )
-
-            # Pass 2: colored text
-            for idx, wp in enumerate(word_positions):
-                if idx < current_word_idx:
-                    color = color_read
-                elif idx == current_word_idx:
-                    color = color_current
-                else:
-                    color = color_upcoming
+    # Working canvas starts with every word upcoming
+    canvas = shadow_layer.copy()
+    canvas_draw = ImageDraw.Draw(canvas)
+    for wp in word_positions:
+        _render_text_with_kerning(
+            canvas_draw, wp.x, wp.y, wp.word, font,
+            fill=color_upcoming, extra_spacing=extra_kerning
+        )
 
-                _render_text_with_kerning(
-                    draw, wp.x, wp.y, wp.word, font,
-                    fill=color, extra_spacing=extra_kerning
-                )
+    def repaint_word(idx: int, color: tuple):
+        """Restore one word's ink box from the static layer and redraw it."""
+        wp = word_positions[idx]
+        ink = canvas_draw.textbbox((wp.x, wp.y), wp.word, font=font)
+        box = (
+            min(ink[0], wp.x) - 1,
+            ink[1] - 1,
+            max(ink[2], wp.x + wp.width) + 1,
+            ink[3] + 1,
+        )
+        canvas.paste(shadow_layer.crop(box), box[:2])
+        _render_text_with_kerning(
+            canvas_draw, wp.x, wp.y, wp.word, font,
+            fill=color, extra_spacing=extra_kerning
+        )
 
-            frame_path = os.path.join(temp_dir, f"{frame_num:05d}.png")
-            img.save(frame_path)
+    cmd = [
+        "ffmpeg", "-y",
+        "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", "1920x1080",
+        "-framerate", f"{word_rate.numerator}/{word_rate.denominator}",
+        "-i", "-",
+        "-vf", (
+            f"tpad=stop_mode=clone:stop_duration=1,"
+            f"scale={profile.width}:{profile.height},{profile.filters()}"
+        ),
+        "-t", f"{duration:.3f}",
+        *profile.output_args(),
+        "-an",
+        str(output_path)
+    ]
 
-        # --- Encode with ffmpeg ---
-        cmd = [
-            "ffmpeg", "-y",
-            "-framerate", str(fps),
-            "-i", os.path.join(temp_dir, "%05d.png"),
-            "-c:v", "libx264", "-preset", "fast", "-crf", "23",
-            "-pix_fmt", "yuv420p",
-            str(output_path)
-        ]
+    process = None
+    try:
+        process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-        return result.returncode == 0
+        for idx in range(len(word_positions)):
+            if idx > 0:
+                repaint_word(idx - 1, color_read)
+            repaint_word(idx, color_current)
+            process.stdin.write(canvas.tobytes())
+
+        process.stdin.close()
+        process.wait(timeout=300)
+        return process.returncode == 0
 
     except subprocess.TimeoutExpired:
+        process.kill()
         return False
     except Exception as e:
-        logger.error(f"Karaoke overlay failed: {e}")
+        console.print(f"[red]Karaoke overlay failed: {e}[/red]")
+        if process is not None:
+            process.kill()
         return False
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
 
 
-def create_video_with_ken_burns(image_path: Path, duration: float, output_path: Path) -> bool:
+def create_video_with_ken_burns(image_path: Path, duration: float, output_path: Path,
+                                profile: SegmentProfile = SEGMENT_PROFILE) -> bool:
     """Create a video from a static image with smooth Ken Burns (slow zoom) effect.
 
     Uses ease-in-out interpolation via frame number for jitter-free zooming.
@@ -285,7 +394,7 @@ def create_video_with_ken_burns(image_path: Path, duration: float, output_path:
     if duration <= 0:
         return False
 
-    fps = 30
+    fps = profile.fps
     total_frames = int(duration * fps)
 
     # Smooth ease-in-out zoom using cosine interpolation
@@ -295,12 +404,14 @@ def create_video_with_ken_burns(image_path: Path, duration: float, output_path:
     zoom_range = 0.08  # 8% zoom — subtle but visible, no jitter
     zoom_expr = f"1+{zoom_range}*(1-cos(on/{total_frames}*PI))/2"
 
+    # Zoom on a 2x canvas so the pan doesn't shimmer at output size
     filter_complex = (
-        f"scale=3840:2160:force_original_aspect_ratio=decrease,"
-        f"pad=3840:2160:(ow-iw)/2:(oh-ih)/2:black,"
+        f"scale={profile.width * 2}:{profile.height * 2}:force_original_aspect_ratio=decrease,"
+        f"pad={profile.width * 2}:{profile.height * 2}:(ow-iw)/2:(oh-ih)/2:black,"
         f"zoompan=z='{zoom_expr}':"
         f"x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':"
-        f"d={total_frames}:s=1920x1080:fps={fps}"
+        f"d={total_frames}:s={profile.size}:fps={fps},"
+        f"{profile.filters()}"
     )
 
     cmd = [
@@ -309,8 +420,8 @@ def create_video_with_ken_burns(image_path: Path, duration: float, output_path:
         "-i", str(image_path),
         "-vf", filter_complex,
         "-t", str(duration),
-        "-c:v", "libx264", "-preset", "fast", "-crf", "23",
-        "-pix_fmt", "yuv420p",
+        *profile.output_args(),
+        "-an",
         str(output_path)
     ]
 
@@ -321,21 +432,30 @@ def create_video_with_ken_burns(image_path: Path, duration: float, output_path:
         return False
 
 
-def create_static_image_video(image_path: Path, duration: float, output_path: Path) -> bool:
-    """Create a video from a static image with no zoom/pan — just scale and hold."""
+def create_static_image_video(image_path: Path, duration: float, output_path: Path,
+                              profile: SegmentProfile = SEGMENT_PROFILE) -> bool:
+    """Create a video from a static image with no zoom/pan — just scale and hold.
+
+    The image is read once per second and scaled once per read; the fps
+    filter repeats it up to the profile's frame rate. Encoding with the
+    still-image tune and a long GOP makes the repeated frames nearly free.
+    """
     if duration <= 0:
         return False
 
-    fps = 30
+    w, h = profile.width, profile.height
     cmd = [
         "ffmpeg", "-y",
-        "-loop", "1",
+        "-loop", "1", "-framerate", "1",
         "-i", str(image_path),
-        "-vf", "scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2:black",
+        "-vf", (
+            f"scale={w}:{h}:force_original_aspect_ratio=decrease,"
+            f"pad={w}:{h}:(ow-iw)/2:(oh-ih)/2:black,"
+            f"{profile.filters()}"
+        ),
         "-t", str(duration),
-        "-c:v", "libx264", "-preset", "fast", "-crf", "23",
-        "-pix_fmt", "yuv420p",
-        "-r", str(fps),
+        *profile.output_args(still=True),
+        "-an",
         str(output_path)
     ]
 
@@ -346,6 +466,169 @@ def create_static_image_video(image_path: Path, duration: float, output_path: Pa
         return False
 
 
+def render_segment(seg: VisualSegment, segment_path: Path,
+                   profile: SegmentProfile = SEGMENT_PROFILE) -> bool:
+    """Render one visual segment to video, picking the encoder by display mode."""
+    if seg.display_mode == "transcript" or (not seg.image_path or not seg.image_path.exists()):
+        # Transcript overlay — text on dark background
+        return create_transcript_overlay(
+            seg.transcript_text or f"Segment {seg.segment_idx}",
+            seg.audio_duration,
+            segment_path,
+            profile=profile
+        )
+
+    # Only use Ken Burns effect for dall_e (AI-generated) images
+    if seg.display_mode == "dall_e":
+        return create_video_with_ken_burns(seg.image_path, seg.audio_duration, segment_path, profile=profile)
+
+    # For web_image, figure_sync, and all others: static hold (no zoom)
+    return create_static_image_video(seg.image_path, seg.audio_duration, segment_path, profile=profile)
+
+
+def segment_cache_key(seg: VisualSegment, profile: SegmentProfile = SEGMENT_PROFILE) -> str:
+    """Content-addressed cache key for a segment render.
+
+    Covers everything that determines the segment's bytes: the image
+    contents (or transcript text), duration, display mode, encoder
+    settings and the ffmpeg version.
+    """
+    uses_image = not (
+        seg.display_mode == "transcript" or not seg.image_path or not seg.image_path.exists()
+    )
+    return cache_key(
+        kind="assemble_segment",
+        display_mode=seg.display_mode,
+        image=file_digest(str(seg.image_path)) if uses_image else None,
+        text=None if uses_image else (seg.transcript_text or f"Segment {seg.segment_idx}"),
+        duration=seg.audio_duration,
+        # Thread count only changes how fast the encode runs, not what it's for
+        encoder={k: v for k, v in asdict(profile).items() if k != "threads"},
+        ffmpeg=ffmpeg_version(),
+    )
+
+
+def render_segment_with_retry(
+    seg: VisualSegment,
+    segment_path: Path,
+    retries: int = 1,
+    cache: Optional[RenderCache] = None,
+    reuse_cached: bool = True,
+    profile: SegmentProfile = SEGMENT_PROFILE,
+) -> bool:
+    """Render a segment, retrying failed attempts up to `retries` more times.
+
+    With a cache, an identical earlier render is reused instead of
+    re-encoding (unless reuse_cached is False), and fresh renders are
+    stored for next time.
+    """
+    key = None
+    if cache is not None:
+        try:
+            key = segment_cache_key(seg, profile)
+        except OSError:
+            key = None
+    if key is not None and reuse_cached and cache.materialize(key, segment_path):
+        return True
+
+    for attempt in range(retries + 1):
+        try:
+            if render_segment(seg, segment_path, profile=profile):
+                if key is not None:
+                    cache.put(key, segment_path)
+                return True
+        except Exception as e:
+            if attempt == retries:
+                console.print(
+                    f"[{get_theme().error}]Segment {seg.segment_idx:03d} render failed: "
+                    f"{type(e).__name__}: {escape(str(e))}[/]"
+                )
+    return False
+
+
+def default_jobs() -> int:
+    """Default number of parallel segment renders.
+
+    libx264 already spreads one encode over several cores, so this runs one
+    render per DEFAULT_THREADS_PER_JOB cores rather than one per core.
+    """
+    return max(1, (os.cpu_count() or 1) // DEFAULT_THREADS_PER_JOB)
+
+
+def threads_per_job(jobs: int) -> int:
+    """Encoder threads for each of `jobs` concurrent renders (their share of the cores)."""
+    return max(1, (os.cpu_count() or 1) // max(1, jobs))
+
+
+async def render_segments_parallel(
+    segments: List[VisualSegment],
+    segments_dir: Path,
+    jobs: int,
+    retries: int = 1,
+    skip_existing: bool = True,
+    on_complete: Optional[Callable[[VisualSegment, bool], None]] = None,
+    cache: Optional[RenderCache] = None,
+    profile: SegmentProfile = SEGMENT_PROFILE,
+) -> List[Path]:
+    """Render segments on a bounded worker pool.
+
+    Each worker runs one blocking ffmpeg/Pillow render, so the event loop
+    stays free. Results are returned in segment order regardless of the
+    order workers finish in; failed segments are omitted.
+
+    Args:
+        segments: Segments to render
+        segments_dir: Directory for segment_XXX.mp4 files
+        jobs: Maximum number of concurrent renders
+        retries: Extra attempts for a segment whose render fails
+        skip_existing: Reuse segment files that already exist. With a cache,
+            reuse is decided by content key rather than file existence, so a
+            segment whose image, text or duration changed is re-rendered.
+        on_complete: Called with (segment, success) as each segment finishes
+        cache: Content-addressed render cache shared across runs
+        profile: Encoding profile for every segment. Unless it sets its own
+            thread count, each render is capped at its share of the cores.
+
+    Returns:
+        Paths of successfully rendered segments, in segment order
+    """
+    loop = asyncio.get_running_loop()
+    rendered: Dict[int, Path] = {}
+    if not profile.threads:
+        profile = replace(profile, threads=threads_per_job(jobs))
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+
+        async def _render(position: int, seg: VisualSegment, segment_path: Path):
+            success = await loop.run_in_executor(
+                pool, render_segment_with_retry, seg, segment_path, retries,
+                cache, skip_existing, profile
+            )
+            return position, seg, segment_path, success
+
+        pending = []
+        for position, seg in enumerate(segments):
+            segment_path = segments_dir / f"segment_{seg.segment_idx:03d}.mp4"
+
+            # Skip if exists and skip_existing is True (the cache decides otherwise)
+            if skip_existing and cache is None and segment_path.exists():
+                rendered[position] = segment_path
+                if on_complete:
+                    on_complete(seg, True)
+                continue
+
+            pending.append(_render(position, seg, segment_path))
+
+        for next_done in asyncio.as_completed(pending):
+            position, seg, segment_path, success = await next_done
+            if success:
+                rendered[position] = segment_path
+            if on_complete:
+                on_complete(seg, success)
+
+    return [rendered[position] for position in sorted(rendered)]
+
+
 def concatenate_audio(audio_clips: List[AudioClip], output_path: Path) -> bool:
     """Concatenate all audio clips into a single file."""
     if not audio_clips:
@@ -374,8 +657,33 @@ def concatenate_audio(audio_clips: List[AudioClip], output_path: Path) -> bool:
         os.unlink(concat_file)
 
 
-def create_final_video(video_segments: List[Path], audio_path: Path, output_path: Path) -> bool:
-    """Concatenate video segments and add audio track."""
+async def find_stream_copy_mismatches(
+    video_segments: List[Path],
+    profile: SegmentProfile = SEGMENT_PROFILE,
+) -> Dict[Path, List[str]]:
+    """Probe segments (concurrently) and report any that deviate from the profile.
+
+    An empty result means the concat demuxer can copy the video stream.
+    Segments rendered by older versions, or reused via --skip-existing
+    from another profile, show up here.
+    """
+    infos = await get_media_probe().probe_many(video_segments)
+    mismatches = {}
+    for path, info in zip(video_segments, infos):
+        problems = profile.mismatches(info)
+        if problems:
+            mismatches[Path(path)] = problems
+    return mismatches
+
+
+def create_final_video(video_segments: List[Path], audio_path: Path, output_path: Path,
+                       stream_copy: bool = True,
+                       profile: SegmentProfile = SEGMENT_PROFILE) -> bool:
+    """Concatenate video segments and add audio track.
+
+    With stream_copy (segments checked by find_stream_copy_mismatches), the
+    video stream is copied as-is; otherwise it is re-encoded to the profile.
+    """
     if not video_segments:
         return False
 
@@ -391,12 +699,12 @@ def create_final_video(video_segments: List[Path], audio_path: Path, output_path
             "-f", "concat", "-safe", "0",
             "-i", concat_file,
             "-i", str(audio_path),
-            "-c:v", "copy",
+            *(["-c:v", "copy"] if stream_copy else profile.output_args()),
             "-c:a", "aac", "-b:a", "192k",
             "-map", "0:v", "-map", "1:a",
             str(output_path)
         ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300 if stream_copy else 3600)
         return result.returncode == 0
     except subprocess.TimeoutExpired:
         return False
@@ -617,14 +925,83 @@ def print_assembly_summary(segments: List[VisualSegment], t):
     console.print()
 
 
+async def _render_cut(
+    segments: List[VisualSegment],
+    segments_dir: Path,
+    audio_combined: Path,
+    output_path: Path,
+    profile: SegmentProfile,
+    jobs: int,
+    retries: int,
+    skip_existing: bool,
+    cache: Optional[RenderCache],
+    progress: Progress,
+    t,
+    label: str = "Rendering segments",
+) -> Tuple[bool, int]:
+    """Render all segments with a profile and join them with the narration.
+
+    Returns:
+        (whether the output video was created, number of segments rendered)
+    """
+    segments_dir.mkdir(parents=True, exist_ok=True)
+    task = progress.add_task(f"{label}...", total=len(segments))
+
+    def _on_segment_complete(seg: VisualSegment, success: bool):
+        status = "done" if success else "failed"
+        progress.update(
+            task,
+            advance=1,
+            description=f"{label}: segment {seg.segment_idx:03d} ({seg.display_mode}) {status}"
+        )
+
+    video_segments = await render_segments_parallel(
+        segments,
+        segments_dir,
+        jobs=jobs,
+        retries=retries,
+        skip_existing=skip_existing,
+        on_complete=_on_segment_complete,
+        cache=cache,
+        profile=profile,
+    )
+    progress.update(task, description=f"{label}: joining {len(video_segments)} segments")
+
+    # Stream copy is only safe if every segment matches the encoding profile
+    mismatches = await find_stream_copy_mismatches(video_segments, profile)
+    if mismatches:
+        console.print(
+            f"[{t.warning}]{label}: {len(mismatches)} segment(s) don't match the segment profile; "
+            f"re-encoding the final video instead of stream-copying[/]"
+        )
+        for path, problems in list(mismatches.items())[:5]:
+            console.print(f"[{t.dimmed}]  {path.name}: {', '.join(problems)}[/]")
+
+    # Off the event loop, so a concurrent render keeps scheduling segments
+    ok = await asyncio.to_thread(
+        create_final_video, video_segments, audio_combined, output_path,
+        stream_copy=not mismatches, profile=profile,
+    )
+    progress.update(task, description=f"{label}: {'done' if ok else 'failed'}")
+    return ok, len(video_segments)
+
+
 async def _assemble_async(
     run_dir: str,
     output: Optional[str],
     skip_existing: bool,
+    jobs: Optional[int] = None,
+    retries: int = 1,
+    use_cache: bool = True,
+    encoder_profile: Optional[str] = None,
+    preview: bool = False,
 ):
     """Main async assembly function."""
     t = get_theme()
     run_path = Path(run_dir)
+    jobs = jobs or default_jobs()
+    cache = RenderCache() if use_cache else None
+    profile = SEGMENT_PROFILE if encoder_profile is None else SegmentProfile.from_encoder_profile(encoder_profile)
 
     if not run_path.exists():
         raise click.ClickException(f"Run directory not found: {run_dir}")
@@ -652,6 +1029,11 @@ async def _assemble_async(
 
     assembly_manifest = None  # Will be saved for debugging
 
+    # Probe all narration up front, concurrently; segment building then
+    # reads durations from the probe cache
+    if audio_dir.exists():
+        await get_media_probe().probe_many(sorted(audio_dir.glob("audio_*.*")))
+
     if structured_script and content_library:
         console.print(f"[{t.success}]Found structured script and content library (Unified Architecture)[/]")
         librarian = ContentLibrarian(content_library)
@@ -707,9 +1089,8 @@ async def _assemble_async(
         raise click.ClickException("Failed to concatenate audio")
     console.print(f"[{t.success}]Audio combined: {audio_combined.name}[/]\n")
 
-    # Create video segments
-    console.print(f"[{t.label}]Creating video segments...[/]")
-    video_segments = []
+    output_path = Path(output) if output else output_dir / "rough_cut.mp4"
+    render_args = dict(retries=retries, skip_existing=skip_existing, cache=cache, t=t)
 
     with Progress(
         SpinnerColumn(),
@@ -718,58 +1099,58 @@ async def _assemble_async(
         TextColumn("{task.completed}/{task.total}"),
         console=console
     ) as progress:
-        task = progress.add_task("Rendering segments...", total=len(segments))
-
-        for seg in segments:
-            segment_path = segments_dir / f"segment_{seg.segment_idx:03d}.mp4"
-
-            # Skip if exists and skip_existing is True
-            if skip_existing and segment_path.exists():
-                video_segments.append(segment_path)
-                progress.advance(task)
-                continue
-
-            progress.update(
-                task,
-                description=f"Segment {seg.segment_idx:03d} ({seg.display_mode})..."
+        if not preview:
+            console.print(f"[{t.label}]Creating video segments ({jobs} parallel jobs)...[/]")
+            ok, segment_count = await _render_cut(
+                segments, segments_dir, audio_combined, output_path, profile=profile,
+                jobs=jobs, progress=progress, **render_args,
             )
-
-            success = False
-            if seg.display_mode == "transcript" or (not seg.image_path or not seg.image_path.exists()):
-                # Transcript overlay — text on dark background
-                success = create_transcript_overlay(
-                    seg.transcript_text or f"Segment {seg.segment_idx}",
-                    seg.audio_duration,
-                    segment_path
+        else:
+            # Low-resolution proxy of the whole timeline alongside the full
+            # render; it gets the larger share of the jobs so it's ready first.
+            # Encoder threads are sized for both renders' jobs combined.
+            preview_path = output_dir / "preview" / "rough_cut_preview.mp4"
+            threads = threads_per_job(jobs)
+            preview_profile = replace(SegmentProfile.from_encoder_profile("draft"), threads=threads)
+            full_profile = replace(profile, threads=threads)
+
+            async def _preview_render(preview_jobs: int):
+                ok, _ = await _render_cut(
+                    segments, output_dir / "preview" / "segments", audio_combined, preview_path,
+                    profile=preview_profile, jobs=preview_jobs,
+                    progress=progress, label="Draft preview", **render_args,
                 )
-            elif seg.image_path and seg.image_path.exists():
-                # Only use Ken Burns effect for dall_e (AI-generated) images
-                if seg.display_mode == "dall_e":
-                    success = create_video_with_ken_burns(
-                        seg.image_path,
-                        seg.audio_duration,
-                        segment_path
-                    )
+                if ok:
+                    console.print(f"[{t.success}]Preview ready:[/] [cyan]{preview_path}[/]")
                 else:
-                    # For web_image, figure_sync, and all others: static hold (no zoom)
-                    success = create_static_image_video(
-                        seg.image_path,
-                        seg.audio_duration,
-                        segment_path
-                    )
-
-            if success:
-                video_segments.append(segment_path)
-
-            progress.advance(task)
-
-    console.print(f"\n[{t.success}]Created {len(video_segments)} video segments[/]\n")
-
-    # Create final video
-    output_path = Path(output) if output else output_dir / "rough_cut.mp4"
-    console.print(f"[{t.label}]Creating final video...[/]")
+                    console.print(f"[{t.warning}]Preview render failed; the full render continues[/]")
+
+            if jobs == 1:
+                # One job can't be split: preview first, then the full render
+                console.print(f"[{t.label}]Rendering draft preview, then the full render (1 job)...[/]")
+                await _preview_render(1)
+                ok, segment_count = await _render_cut(
+                    segments, segments_dir, audio_combined, output_path, profile=full_profile,
+                    jobs=1, progress=progress, label="Full render", **render_args,
+                )
+            else:
+                preview_jobs = (jobs + 1) // 2
+                full_jobs = jobs - preview_jobs
+                console.print(
+                    f"[{t.label}]Rendering draft preview ({preview_jobs} jobs) "
+                    f"alongside the full render ({full_jobs} jobs)...[/]"
+                )
+                _, (ok, segment_count) = await asyncio.gather(
+                    _preview_render(preview_jobs),
+                    _render_cut(
+                        segments, segments_dir, audio_combined, output_path, profile=full_profile,
+                        jobs=full_jobs, progress=progress, label="Full render", **render_args,
+                    ),
+                )
 
-    if create_final_video(video_segments, audio_combined, output_path):
+    if cache is not None:
+        console.print(f"[{t.dimmed}]Render cache: {cache.hits} hits, {cache.misses} misses[/]")
+    if ok:
         duration = get_media_duration(output_path)
         size_mb = output_path.stat().st_size / (1024 * 1024)
 
@@ -780,7 +1161,7 @@ async def _assemble_async(
                 f"Output: [cyan]{output_path}[/]\n"
                 f"Duration: [green]{duration:.1f}s ({duration/60:.1f}m)[/]\n"
                 f"Size: [yellow]{size_mb:.1f} MB[/]\n"
-                f"Segments: {len(video_segments)}"
+                f"Segments: {segment_count}"
             ),
             title="Success",
             border_style=t.success
@@ -803,7 +1184,38 @@ async def _assemble_async(
     default=True,
     help="Skip re-rendering existing segments (default: True)"
 )
-def assemble_cmd(run_dir, output, skip_existing):
+@click.option(
+    "--jobs", "-j",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Parallel segment renders (default: one per 4 CPU cores)"
+)
+@click.option(
+    "--retries",
+    type=click.IntRange(min=0),
+    default=1,
+    help="Extra attempts for a segment whose render fails (default: 1)"
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=True,
+    help="Reuse identical segment renders from the render cache (default: True)"
+)
+@click.option(
+    "--profile",
+    "encoder_profile",
+    type=click.Choice(list(ENCODER_PROFILES)),
+    default=None,
+    help="Encoder profile for segments (default: 1080p, fast preset, CRF 23)"
+)
+@click.option(
+    "--preview",
+    is_flag=True,
+    help="Render a draft proxy of the whole cut (assembly/preview/rough_cut_preview.mp4) "
+         "alongside the full render, with half the jobs each"
+)
+def assemble_cmd(run_dir, output, skip_existing, jobs, retries, use_cache, encoder_profile, preview):
     """Assemble rough cut video from a production run.
 
     RUN_DIR is the path to a video production run directory
@@ -819,6 +1231,12 @@ def assemble_cmd(run_dir, output, skip_existing):
     Examples:
       claude-studio assemble artifacts/video_production/20260207_123456
       claude-studio assemble ./my_run --output final.mp4
+      claude-studio assemble ./my_run --jobs 4
+      claude-studio assemble ./my_run --no-cache
+      claude-studio assemble ./my_run --profile draft
+      claude-studio assemble ./my_run --preview
     """
-    import asyncio
-    asyncio.run(_assemble_async(run_dir, output, skip_existing))
+    asyncio.run(_assemble_async(
+        run_dir, output, skip_existing, jobs, retries, use_cache,
+        encoder_profile=encoder_profile, preview=preview,
+    ))
@@ -0,0 +1,138 @@
+"""Cache CLI - Inspect and prune the on-disk artifact caches"""
+
+import json
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import click
+from rich.console import Console
+from rich.table import Table
+from rich import box
+
+console = Console()
+
+
+def _tts_cache():
+    from core.tts_cache import TTSCache
+    return TTSCache()
+
+
+def _render_cache():
+    from core.render_cache import RenderCache
+    return RenderCache()
+
+
+def _response_cache():
+    from core.response_cache import ResponseCache
+    return ResponseCache()
+
+
+def _qa_cache():
+    from core.qa_cache import QACache
+    return QACache()
+
+
+def _probe_cache():
+    from core.media_probe import MediaProbe
+    return MediaProbe()
+
+
+# name -> (description, factory); all use their default directories under artifacts/cache
+CACHES: Dict[str, Tuple[str, Callable[[], Any]]] = {
+    "tts": ("TTS narration", _tts_cache),
+    "renders": ("Rendered segments", _render_cache),
+    "claude": ("Claude responses", _response_cache),
+    "qa": ("QA results", _qa_cache),
+    "probe": ("Media metadata", _probe_cache),
+}
+
+
+def _format_size(size_bytes: int) -> str:
+    if size_bytes >= 1024 ** 3:
+        return f"{size_bytes / 1024 ** 3:.2f} GB"
+    if size_bytes >= 1024 ** 2:
+        return f"{size_bytes / 1024 ** 2:.1f} MB"
+    if size_bytes >= 1024:
+        return f"{size_bytes / 1024:.1f} KB"
+    return f"{size_bytes} B"
+
+
+@click.group()
+def cache_cmd():
+    """Artifact cache management
+
+    \b
+    Caches under artifacts/cache let reruns skip repeated work:
+      tts      Narration audio per paragraph, voice and provider settings
+      renders  Rendered video segments (assemble)
+      claude   Claude responses (--response-cache)
+      qa       QA verdicts per clip and scene
+      probe    ffprobe metadata per file (path, size, mtime)
+
+    \b
+    Examples:
+      claude-studio cache stats
+      claude-studio cache prune tts --max-size 500
+      claude-studio cache prune --all
+    """
+    pass
+
+
+@cache_cmd.command("stats")
+@click.argument("names", nargs=-1, type=click.Choice(list(CACHES)))
+@click.option("--json", "as_json", is_flag=True, help="Output as JSON")
+def stats_cmd(names: tuple, as_json: bool):
+    """Show entry counts and sizes of the caches (default: all)"""
+    stats = {name: CACHES[name][1]().stats() for name in (names or CACHES)}
+
+    if as_json:
+        click.echo(json.dumps(stats, indent=2))
+        return
+
+    table = Table(title="Artifact Caches", box=box.ROUNDED)
+    table.add_column("Cache", style="cyan")
+    table.add_column("Entries", justify="right", style="green")
+    table.add_column("Size", justify="right", style="green")
+    table.add_column("Limit", justify="right", style="dim")
+    table.add_column("Location", style="dim")
+
+    for name, data in stats.items():
+        label = CACHES[name][0]
+        if "audio_seconds" in data and data["entries"]:
+            label += f" ({data['audio_seconds'] / 60:.1f} min)"
+        if "size_bytes" in data:
+            size = _format_size(data["size_bytes"])
+            limit = _format_size(data["max_size_bytes"])
+        else:
+            size = "-"
+            limit = f"{data['max_entries']} entries"
+        table.add_row(f"{name}  [dim]{label}[/dim]", str(data["entries"]), size, limit, data["cache_dir"])
+
+    console.print(table)
+
+
+@cache_cmd.command("prune")
+@click.argument("names", nargs=-1, type=click.Choice(list(CACHES)))
+@click.option("--max-size", type=float, default=None,
+              help="Shrink size-bounded caches to this many MB (default: their configured limit)")
+@click.option("--all", "clear", is_flag=True, help="Remove every entry")
+def prune_cmd(names: tuple, max_size: Optional[float], clear: bool):
+    """Evict least recently used entries (default: all caches)
+
+    Without options, each cache is trimmed to its configured limit (QA
+    results past their TTL are dropped too).
+    """
+    for name in names or CACHES:
+        cache = CACHES[name][1]()
+        if clear:
+            removed = cache.evict(0)
+        elif max_size is not None:
+            if not hasattr(cache, "max_size_bytes"):
+                console.print(f"[dim]{name}: not size-bounded, skipped (use --all to clear)[/dim]")
+                continue
+            removed = cache.evict(int(max_size * 1024 ** 2))
+        else:
+            removed = cache.evict()
+
+        size = cache.stats().get("size_bytes")
+        remaining = f", {_format_size(size)} left" if size is not None else ""
+        console.print(f"[green]{name}:[/green] removed {removed} entries{remaining}")
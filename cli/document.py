@@ -44,7 +44,8 @@ def document_cmd():
 @click.option("--mock", is_flag=True, help="Use mock analysis (no LLM calls)")
 @click.option("--project-name", "-n", help="Project name (defaults to filename)")
 @click.option("--output-dir", "-o", type=click.Path(), help="Output directory (default: artifacts/projects/)")
-def ingest_cmd(source: str, mock: bool, project_name: str, output_dir: str):
+@click.option("--response-cache", is_flag=True, help="Reuse cached Claude responses for unchanged inputs (artifacts/cache/claude)")
+def ingest_cmd(source: str, mock: bool, project_name: str, output_dir: str, response_cache: bool):
     """Ingest a document and extract knowledge atoms.
 
     Extracts text, figures, and structure from a PDF using PyMuPDF,
@@ -68,17 +69,24 @@ def ingest_cmd(source: str, mock: bool, project_name: str, output_dir: str):
     ))
 
     # Run the async ingestion
-    asyncio.run(_run_ingest(source_path, project_name, mock, output_dir))
+    asyncio.run(_run_ingest(source_path, project_name, mock, output_dir, response_cache))
 
 
-async def _run_ingest(source_path: Path, project_name: str, mock: bool, output_dir: str):
+async def _run_ingest(
+    source_path: Path,
+    project_name: str,
+    mock: bool,
+    output_dir: str,
+    response_cache: bool = False,
+):
     """Run document ingestion asynchronously"""
     from core.claude_client import ClaudeClient
+    from core.response_cache import ResponseCache
     from agents.document_ingestor import DocumentIngestorAgent
 
     console.print("\n[cyan]Phase 1:[/cyan] Extracting content with PyMuPDF...")
 
-    client = ClaudeClient() if not mock else None
+    client = ClaudeClient(cache=ResponseCache() if response_cache else None) if not mock else None
     agent = DocumentIngestorAgent(claude_client=client, mock_mode=mock)
 
     try:
@@ -78,147 +78,194 @@ def _save_project(project_dir: Path, project):
         json.dump(project.to_dict(), f, indent=2, ensure_ascii=False)
 
 
-def _rebuild_knowledge_graph(project_dir: Path, project) -> None:
-    """Rebuild the unified KnowledgeGraph from all source DocumentGraphs.
-
-    Merges atoms, builds topic/entity indices, detects cross-source links
-    by shared entity co-occurrence.
-    """
-    from core.models.knowledge import KnowledgeGraph, CrossSourceLink
-    from core.models.document import DocumentAtom, AtomType
+KG_FILE = "knowledge_graph.json"
+KG_DELTA_FILE = "knowledge_graph.delta.jsonl"
+KG_COMPACT_AFTER = 32  # Delta entries to accumulate before folding them into the snapshot
+
+# Stopwords that shouldn't be standalone themes
+THEME_STOPWORDS = {
+    "this", "that", "with", "from", "have", "been", "their", "which",
+    "also", "more", "than", "into", "each", "such", "only", "other",
+    "some", "these", "those", "over", "many", "most", "both", "does",
+    "used", "using", "based", "however", "results", "experimental",
+    "international", "introduction", "related", "conclusion", "nature",
+    "conference", "proceedings", "references", "abstract", "proposed",
+    "machine", "neural", "network", "networks", "learning", "training",
+    "computer", "vision", "language", "intelligence", "artificial",
+    "analysis", "system", "systems", "performance", "algorithm",
+    "knowledge", "information", "processing", "research",
+}
 
-    all_atoms: Dict[str, DocumentAtom] = {}
-    atom_sources: Dict[str, str] = {}
-    topic_index: Dict[str, List[str]] = {}
-    entity_index: Dict[str, List[str]] = {}
 
-    sources_dir = project_dir / "sources"
+def _key_themes(graph, source_count: int) -> List[str]:
+    """Identify key themes (topics appearing in most sources, filtering noise)"""
+    key_themes = []
+    if source_count == 0:
+        return key_themes
 
-    for source_id, source in project.sources.items():
-        graph_path = sources_dir / source_id / "document_graph.json"
-        if not graph_path.exists():
+    for topic, atom_ids in sorted(graph.topic_index.items(), key=lambda x: -len(x[1])):
+        # Skip stopwords and short single words (keep multi-word topics)
+        if topic.lower() in THEME_STOPWORDS:
+            continue
+        # Single words must be at least 6 chars to be meaningful themes
+        if ' ' not in topic and len(topic) < 6:
             continue
+        # Filter institutional/venue names using content-aware check
+        if not is_theme_candidate(topic):
+            continue
+        topic_sources = set(graph.atom_sources.get(aid) for aid in atom_ids)
+        topic_sources.discard(None)
+        if len(topic_sources) >= min(2, source_count):
+            key_themes.append(topic)
+        if len(key_themes) >= 10:
+            break
+    return key_themes
 
-        with open(graph_path, encoding="utf-8") as f:
-            graph_data = json.load(f)
-
-        for atom_id, atom_data in graph_data.get("atoms", {}).items():
-            atom = DocumentAtom(
-                atom_id=atom_data["atom_id"],
-                atom_type=AtomType(atom_data["atom_type"]),
-                content=atom_data.get("content", ""),
-                source_page=atom_data.get("source_page"),
-                source_location=atom_data.get("source_location"),
-                topics=atom_data.get("topics", []),
-                entities=atom_data.get("entities", []),
-                relationships=atom_data.get("relationships", []),
-                importance_score=atom_data.get("importance_score", 0.5),
-                caption=atom_data.get("caption"),
-                figure_number=atom_data.get("figure_number"),
-                data_summary=atom_data.get("data_summary"),
-            )
-            all_atoms[atom_id] = atom
-            atom_sources[atom_id] = source_id
-
-            # Build topic index
-            for topic in atom.topics:
-                if topic not in topic_index:
-                    topic_index[topic] = []
-                topic_index[topic].append(atom_id)
 
-            # Build entity index
-            for entity in atom.entities:
-                if entity not in entity_index:
-                    entity_index[entity] = []
-                entity_index[entity].append(atom_id)
-
-    # Detect cross-source links via shared entities
-    cross_links: List[CrossSourceLink] = []
-    link_counter = 0
-
-    for entity, atom_ids in entity_index.items():
-        # Get unique sources for this entity
-        sources_with_entity = {}
-        for aid in atom_ids:
-            sid = atom_sources.get(aid)
-            if sid:
-                if sid not in sources_with_entity:
-                    sources_with_entity[sid] = []
-                sources_with_entity[sid].append(aid)
-
-        # If entity appears in 2+ sources, create cross-links
-        source_ids = list(sources_with_entity.keys())
-        if len(source_ids) >= 2:
-            for i in range(len(source_ids) - 1):
-                for j in range(i + 1, len(source_ids)):
-                    # Link first atom from each source
-                    src_a = source_ids[i]
-                    src_b = source_ids[j]
-                    atom_a = sources_with_entity[src_a][0]
-                    atom_b = sources_with_entity[src_b][0]
-
-                    link_counter += 1
-                    cross_links.append(CrossSourceLink(
-                        link_id=f"link_{link_counter:04d}",
-                        source_atom_id=atom_a,
-                        target_atom_id=atom_b,
-                        source_source_id=src_a,
-                        target_source_id=src_b,
-                        relationship="same_topic",
-                        confidence=0.6,
-                        created_by="auto",
-                    ))
-
-    # Identify key themes (topics appearing in most sources, filtering noise)
-    source_count = len(project.sources)
-    key_themes = []
-    # Stopwords that shouldn't be standalone themes
-    theme_stopwords = {
-        "this", "that", "with", "from", "have", "been", "their", "which",
-        "also", "more", "than", "into", "each", "such", "only", "other",
-        "some", "these", "those", "over", "many", "most", "both", "does",
-        "used", "using", "based", "however", "results", "experimental",
-        "international", "introduction", "related", "conclusion", "nature",
-        "conference", "proceedings", "references", "abstract", "proposed",
-        "machine", "neural", "network", "networks", "learning", "training",
-        "computer", "vision", "language", "intelligence", "artificial",
-        "analysis", "system", "systems", "performance", "algorithm",
-        "knowledge", "information", "processing", "research",
-    }
-    if source_count > 0:
-        for topic, atom_ids in sorted(topic_index.items(), key=lambda x: -len(x[1])):
-            # Skip stopwords and short single words (keep multi-word topics)
-            if topic.lower() in theme_stopwords:
-                continue
-            # Single words must be at least 6 chars to be meaningful themes
-            if ' ' not in topic and len(topic) < 6:
-                continue
-            # Filter institutional/venue names using content-aware check
-            if not is_theme_candidate(topic):
-                continue
-            topic_sources = set(atom_sources.get(aid) for aid in atom_ids)
-            topic_sources.discard(None)
-            if len(topic_sources) >= min(2, source_count):
-                key_themes.append(topic)
-            if len(key_themes) >= 10:
-                break
+def _load_source_atoms(project_dir: Path, source_id: str) -> Dict[str, Dict[str, Any]]:
+    """Serialized atoms of a source's saved DocumentGraph (empty if it has none)"""
+    graph_path = project_dir / "sources" / source_id / "document_graph.json"
+    if not graph_path.exists():
+        return {}
+    with open(graph_path, encoding="utf-8") as f:
+        return json.load(f).get("atoms", {})
 
-    graph = KnowledgeGraph(
-        project_id=project.project_id,
-        atoms=all_atoms,
-        atom_sources=atom_sources,
-        cross_links=cross_links,
-        topic_index=topic_index,
-        entity_index=entity_index,
-        key_themes=key_themes,
-    )
 
-    # Save (exclude raw atom content for large graphs, keep references)
-    graph_path = project_dir / "knowledge_graph.json"
-    with open(graph_path, "w", encoding="utf-8") as f:
+def _apply_graph_delta(graph, entry: Dict[str, Any]) -> None:
+    """Replay one delta log entry onto a KnowledgeGraph"""
+    from core.models.knowledge import atom_from_dict
+
+    if entry["op"] == "add_source":
+        atoms = entry.get("atoms", {})
+        # Already in the snapshot if a compaction was interrupted before the log was cleared
+        if not any(aid in graph.atom_sources for aid in atoms):
+            graph.add_source(entry["source_id"], {aid: atom_from_dict(a) for aid, a in atoms.items()})
+    elif entry["op"] == "remove_source":
+        graph.remove_source(entry["source_id"])
+
+    if "key_themes" in entry:
+        graph.key_themes = entry["key_themes"]
+
+
+def _read_knowledge_graph(project_dir: Path):
+    """Load the graph snapshot and replay its delta log.
+
+    Returns:
+        (KnowledgeGraph or None if there is no snapshot, number of delta entries replayed)
+    """
+    from core.models.knowledge import KnowledgeGraph
+
+    graph_path = project_dir / KG_FILE
+    if not graph_path.exists():
+        return None, 0
+    with open(graph_path, encoding="utf-8") as f:
+        graph = KnowledgeGraph.from_dict(json.load(f))
+
+    replayed = 0
+    delta_path = project_dir / KG_DELTA_FILE
+    if delta_path.exists():
+        with open(delta_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn final line from an interrupted write
+                _apply_graph_delta(graph, entry)
+                replayed += 1
+    return graph, replayed
+
+
+def _load_knowledge_graph(project_dir: Path):
+    """Load a project's KnowledgeGraph (snapshot plus delta log), or None"""
+    return _read_knowledge_graph(project_dir)[0]
+
+
+def _write_knowledge_graph(project_dir: Path, graph) -> None:
+    """Write a full graph snapshot and clear the delta log it now includes"""
+    import os
+
+    graph_path = project_dir / KG_FILE
+    tmp_path = graph_path.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
         json.dump(graph.to_dict(), f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, graph_path)
+
+    delta_path = project_dir / KG_DELTA_FILE
+    if delta_path.exists():
+        delta_path.unlink()
+
+
+def _rebuild_knowledge_graph(project_dir: Path, project):
+    """Rebuild the unified KnowledgeGraph from all source DocumentGraphs.
+
+    Merges atoms, builds topic/entity indices, detects cross-source links
+    by shared entity co-occurrence. Adding or removing a single source
+    should go through _update_knowledge_graph instead.
+    """
+    from core.models.knowledge import KnowledgeGraph, atom_from_dict
+
+    graph = KnowledgeGraph(project_id=project.project_id)
+    for source_id in project.sources:
+        atoms = _load_source_atoms(project_dir, source_id)
+        graph.add_source(source_id, {aid: atom_from_dict(a) for aid, a in atoms.items()})
+
+    graph.key_themes = _key_themes(graph, len(project.sources))
+    _write_knowledge_graph(project_dir, graph)
 
     project.has_knowledge_graph = True
+    return graph
+
+
+def _update_knowledge_graph(
+    project_dir: Path,
+    project,
+    added: Optional[Dict[str, Dict[str, Any]]] = None,
+    removed: Optional[List[str]] = None,
+):
+    """Apply source additions and removals to the KnowledgeGraph incrementally.
+
+    Only the affected sources' index postings and cross-links change, and
+    the change is appended to the delta log rather than rewriting the
+    snapshot; the log is folded into the snapshot every KG_COMPACT_AFTER
+    entries.
+
+    Args:
+        project_dir: Project directory
+        project: KnowledgeProject (already updated with the source changes)
+        added: source_id -> serialized atoms of each new source
+        removed: source_ids to drop
+
+    Returns:
+        The updated KnowledgeGraph
+    """
+    from core.models.knowledge import atom_from_dict
+
+    graph, pending = _read_knowledge_graph(project_dir)
+    if graph is None:
+        return _rebuild_knowledge_graph(project_dir, project)
+
+    entries = []
+    for source_id in removed or []:
+        graph.remove_source(source_id)
+        entries.append({"op": "remove_source", "source_id": source_id})
+    for source_id, atoms in (added or {}).items():
+        graph.add_source(source_id, {aid: atom_from_dict(a) for aid, a in atoms.items()})
+        entries.append({"op": "add_source", "source_id": source_id, "atoms": atoms})
+    if not entries:
+        return graph
+
+    graph.key_themes = _key_themes(graph, len(project.sources))
+    entries[-1]["key_themes"] = graph.key_themes
+
+    if pending + len(entries) > KG_COMPACT_AFTER:
+        _write_knowledge_graph(project_dir, graph)
+    else:
+        with open(project_dir / KG_DELTA_FILE, "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    project.has_knowledge_graph = True
+    return graph
 
 
 @click.group()
@@ -272,7 +319,7 @@ def create_cmd(name: str, description: str, tags: tuple):
     # Save empty knowledge graph
     from core.models.knowledge import KnowledgeGraph
     empty_graph = KnowledgeGraph(project_id=project_id)
-    with open(project_dir / "knowledge_graph.json", "w", encoding="utf-8") as f:
+    with open(project_dir / KG_FILE, "w", encoding="utf-8") as f:
         json.dump(empty_graph.to_dict(), f, indent=2)
 
     console.print(Panel.fit(
@@ -287,13 +334,28 @@ def create_cmd(name: str, description: str, tags: tuple):
 @kb_cmd.command("add")
 @click.argument("project")
 @click.option("--paper", type=click.Path(exists=True), help="PDF paper to add")
+@click.option("--dir", "paper_dir", type=click.Path(exists=True, file_okay=False),
+              help="Add every PDF in a directory")
+@click.option("--jobs", "-j", type=int, default=2, show_default=True,
+              help="Papers ingested in parallel (with --dir)")
 @click.option("--note", "note_text", help="Add a text note as a source")
 @click.option("--title", "-t", help="Override source title")
 @click.option("--mock", is_flag=True, help="Use mock analysis (no LLM calls)")
-def add_cmd(project: str, paper: str, note_text: str, title: str, mock: bool):
+@click.option("--response-cache", is_flag=True, help="Reuse cached Claude responses for unchanged inputs (artifacts/cache/claude)")
+def add_cmd(
+    project: str,
+    paper: str,
+    paper_dir: str,
+    jobs: int,
+    note_text: str,
+    title: str,
+    mock: bool,
+    response_cache: bool,
+):
     """Add a source to a knowledge project.
 
-    Currently supports --paper (PDF files) and --note (text notes).
+    Currently supports --paper (PDF files), --dir (a directory of PDFs)
+    and --note (text notes).
     """
     project_dir = _resolve_project(project)
     if not project_dir:
@@ -301,52 +363,60 @@ def add_cmd(project: str, paper: str, note_text: str, title: str, mock: bool):
         console.print("[dim]Use 'claude-studio kb list' to see available projects.[/dim]")
         return
 
-    if not paper and not note_text:
-        console.print("[red]Specify a source to add:[/red] --paper <file.pdf> or --note \"text\"")
+    if not paper and not paper_dir and not note_text:
+        console.print("[red]Specify a source to add:[/red] --paper <file.pdf>, --dir <folder> or --note \"text\"")
         return
 
     proj = _load_project(project_dir)
     console.print(f"[cyan]Adding source to:[/cyan] {proj.name}\n")
 
     if paper:
-        asyncio.run(_add_paper(project_dir, proj, paper, title, mock))
+        asyncio.run(_add_paper(project_dir, proj, paper, title, mock, response_cache))
+    elif paper_dir:
+        asyncio.run(_add_papers(project_dir, proj, paper_dir, mock, response_cache, jobs))
     elif note_text:
         _add_note(project_dir, proj, note_text, title)
 
 
-async def _add_paper(project_dir: Path, proj, paper_path: str, title: str, mock: bool):
-    """Add a PDF paper as a knowledge source"""
-    from core.models.knowledge import KnowledgeSource, SourceType, generate_id
+def _paper_source_id(source_path: Path) -> str:
+    """Source ID from file content hash"""
+    file_hash = hashlib.sha256(source_path.read_bytes()).hexdigest()[:12]
+    return f"src_{file_hash}"
+
+
+def _create_ingestor(mock: bool, response_cache: bool, **kwargs):
+    """DocumentIngestorAgent with a (possibly caching) Claude client"""
     from agents.document_ingestor import DocumentIngestorAgent
+    from core.claude_client import ClaudeClient
+    from core.response_cache import ResponseCache
 
-    source_path = Path(paper_path).resolve()
+    client = ClaudeClient(cache=ResponseCache() if response_cache else None) if not mock else None
+    return DocumentIngestorAgent(claude_client=client, mock_mode=mock, **kwargs)
 
-    console.print("[cyan]Phase 1:[/cyan] Extracting content with PyMuPDF...")
 
+async def _ingest_paper(agent, source_path: Path, label: str = ""):
+    """Ingest one PDF, printing failures; returns the DocumentGraph or None"""
     try:
-        from core.claude_client import ClaudeClient
-        client = ClaudeClient() if not mock else None
-        agent = DocumentIngestorAgent(claude_client=client, mock_mode=mock)
-        graph = await agent.ingest(str(source_path))
+        return await agent.ingest(str(source_path))
     except ImportError as e:
         if "fitz" in str(e) or "pymupdf" in str(e).lower():
             console.print("[red]PyMuPDF not installed.[/red]")
             console.print("Install with: [bold]pip install pymupdf[/bold]")
-            return
+            return None
         raise
     except Exception as e:
-        console.print(f"[red]Ingestion failed:[/red] {e}")
-        return
+        console.print(f"[red]Ingestion failed:[/red] {label}{e}")
+        return None
 
-    # Generate source ID from file content hash
-    file_hash = hashlib.sha256(source_path.read_bytes()).hexdigest()[:12]
-    source_id = f"src_{file_hash}"
 
-    # Check for duplicate
-    if source_id in proj.sources:
-        console.print(f"[yellow]Source already exists:[/yellow] {source_id}")
-        console.print(f"[dim]Title: {proj.sources[source_id].title}[/dim]")
-        return
+def _atom_dicts(graph) -> Dict[str, Dict[str, Any]]:
+    """Serialized atoms of an ingested DocumentGraph, as stored in the knowledge graph"""
+    return {aid: atom.to_dict() for aid, atom in graph.atoms.items()}
+
+
+def _store_paper_source(project_dir: Path, proj, source_path: Path, source_id: str, graph, title: str):
+    """Save a paper's DocumentGraph and figures, and register it as a project source"""
+    from core.models.knowledge import KnowledgeSource, SourceType
 
     # Save source DocumentGraph and figures
     source_dir = project_dir / "sources" / source_id
@@ -368,11 +438,10 @@ async def _add_paper(project_dir: Path, proj, paper_path: str, title: str, mock:
             figure_count += 1
 
     # Create KnowledgeSource
-    source_title = title or graph.title or source_path.stem
     source = KnowledgeSource(
         source_id=source_id,
         source_type=SourceType.PAPER,
-        title=source_title,
+        title=title or graph.title or source_path.stem,
         authors=graph.authors,
         added_at=datetime.now().isoformat(),
         source_path=str(source_path),
@@ -384,32 +453,128 @@ async def _add_paper(project_dir: Path, proj, paper_path: str, title: str, mock:
     )
 
     proj.add_source(source)
+    return source
 
-    # Rebuild unified knowledge graph
-    console.print("[cyan]Rebuilding knowledge graph...[/cyan]")
-    _rebuild_knowledge_graph(project_dir, proj)
 
-    # Save updated project
-    _save_project(project_dir, proj)
-
-    # Load graph to show stats
-    with open(project_dir / "knowledge_graph.json", encoding="utf-8") as f:
-        kg_data = json.load(f)
-    cross_link_count = len(kg_data.get("cross_links", []))
-    shared_entities = {
-        e: aids for e, aids in kg_data.get("entity_index", {}).items()
-        if len(set(kg_data.get("atom_sources", {}).get(aid, "") for aid in aids)) > 1
-    }
+def _print_graph_stats(proj, kg):
+    """Print knowledge graph size, cross-links and shared entities"""
+    shared_entities = kg.get_shared_entities()
 
-    console.print(f"[green]Source added:[/green] {source_id} (paper)")
-    console.print(f"  [dim]Title:[/dim] {source_title}")
-    console.print(f"  [dim]Atoms:[/dim] {source.atom_count} | [dim]Pages:[/dim] {source.page_count} | [dim]Figures:[/dim] {figure_count}")
-    console.print(f"[green]Knowledge graph rebuilt:[/green] {proj.total_atoms} atoms, {cross_link_count} cross-links")
+    console.print(f"[green]Knowledge graph updated:[/green] {proj.total_atoms} atoms, {kg.cross_link_count} cross-links")
     if shared_entities:
         top_shared = list(shared_entities.keys())[:5]
         console.print(f"  [dim]Shared entities:[/dim] {', '.join(top_shared)}")
 
 
+async def _add_paper(
+    project_dir: Path,
+    proj,
+    paper_path: str,
+    title: str,
+    mock: bool,
+    response_cache: bool = False,
+):
+    """Add a PDF paper as a knowledge source"""
+    source_path = Path(paper_path).resolve()
+
+    # Check for duplicate before spending any tokens
+    source_id = _paper_source_id(source_path)
+    if source_id in proj.sources:
+        console.print(f"[yellow]Source already exists:[/yellow] {source_id}")
+        console.print(f"[dim]Title: {proj.sources[source_id].title}[/dim]")
+        return
+
+    console.print("[cyan]Phase 1:[/cyan] Extracting content with PyMuPDF...")
+
+    agent = _create_ingestor(mock, response_cache)
+    graph = await _ingest_paper(agent, source_path)
+    if graph is None:
+        return
+
+    source = _store_paper_source(project_dir, proj, source_path, source_id, graph, title)
+
+    # Merge the new source into the unified knowledge graph
+    console.print("[cyan]Updating knowledge graph...[/cyan]")
+    kg = _update_knowledge_graph(project_dir, proj, added={source_id: _atom_dicts(graph)})
+
+    # Save updated project
+    _save_project(project_dir, proj)
+
+    console.print(f"[green]Source added:[/green] {source_id} (paper)")
+    console.print(f"  [dim]Title:[/dim] {source.title}")
+    console.print(f"  [dim]Atoms:[/dim] {source.atom_count} | [dim]Pages:[/dim] {source.page_count} | [dim]Figures:[/dim] {source.figure_count}")
+    _print_graph_stats(proj, kg)
+
+
+async def _add_papers(
+    project_dir: Path,
+    proj,
+    paper_dir: str,
+    mock: bool,
+    response_cache: bool = False,
+    jobs: int = 2,
+):
+    """Add every PDF in a directory, ingesting several at once"""
+    import os
+
+    paths = sorted(p.resolve() for p in Path(paper_dir).iterdir() if p.suffix.lower() == ".pdf")
+    if not paths:
+        console.print(f"[yellow]No PDF files in {paper_dir}[/yellow]")
+        return
+
+    pending = []
+    seen_ids = set()
+    for path in paths:
+        source_id = _paper_source_id(path)
+        if source_id in proj.sources or source_id in seen_ids:
+            console.print(f"[dim]Skipping {path.name}: already added ({source_id})[/dim]")
+            continue
+        seen_ids.add(source_id)
+        pending.append((path, source_id))
+
+    if not pending:
+        return
+
+    jobs = max(1, min(jobs, len(pending)))
+    console.print(f"[cyan]Ingesting {len(pending)} papers ({jobs} at a time)...[/cyan]")
+
+    # Papers share the CPU cores for page extraction
+    agent = _create_ingestor(
+        mock, response_cache,
+        extraction_workers=max(1, (os.cpu_count() or 1) // jobs),
+    )
+    semaphore = asyncio.Semaphore(jobs)
+
+    async def ingest(path: Path):
+        async with semaphore:
+            graph = await _ingest_paper(agent, path, label=f"{path.name}: ")
+            if graph is not None:
+                console.print(f"  [green]✓[/green] {path.name} ({graph.atom_count} atoms)")
+            return graph
+
+    graphs = await asyncio.gather(*[ingest(path) for path, _ in pending])
+
+    # Register in directory order, so source order doesn't depend on timing
+    added = []
+    added_atoms = {}
+    for (path, source_id), graph in zip(pending, graphs):
+        if graph is not None:
+            added.append(_store_paper_source(project_dir, proj, path, source_id, graph, None))
+            added_atoms[source_id] = _atom_dicts(graph)
+
+    if not added:
+        return
+
+    console.print("[cyan]Updating knowledge graph...[/cyan]")
+    kg = _update_knowledge_graph(project_dir, proj, added=added_atoms)
+    _save_project(project_dir, proj)
+
+    console.print(f"[green]Sources added:[/green] {len(added)} of {len(pending)} papers")
+    for source in added:
+        console.print(f"  [dim]{source.source_id}[/dim] {source.title} ({source.atom_count} atoms, {source.page_count} pages)")
+    _print_graph_stats(proj, kg)
+
+
 def _add_note(project_dir: Path, proj, note_text: str, title: str):
     """Add a text note as a knowledge source"""
     from core.models.knowledge import Note, generate_id
@@ -487,14 +652,8 @@ def show_cmd(project: str, graph: bool):
 
     # Knowledge graph stats
     if graph and proj.has_knowledge_graph:
-        kg_path = project_dir / "knowledge_graph.json"
-        if kg_path.exists():
-            with open(kg_path, encoding="utf-8") as f:
-                kg_data = json.load(f)
-
-            from core.models.knowledge import KnowledgeGraph
-            kg = KnowledgeGraph.from_dict(kg_data)
-
+        kg = _load_knowledge_graph(project_dir)
+        if kg is not None:
             console.print(f"\n[bold]Knowledge Graph:[/bold]")
             console.print(f"  Atoms: {kg.atom_count}")
             console.print(f"  Cross-links: {kg.cross_link_count}")
@@ -608,15 +767,17 @@ def list_cmd():
 
 @kb_cmd.command("remove")
 @click.argument("project")
+@click.option("--source", "-s", "source_id", help="Remove only this source (ID or ID prefix)")
 @click.option("--force", "-f", is_flag=True, help="Skip confirmation prompt")
-def remove_cmd(project: str, force: bool):
-    """Remove a knowledge project.
+def remove_cmd(project: str, source_id: Optional[str], force: bool):
+    """Remove a knowledge project, or one source from it.
 
     PROJECT can be the project name, ID, or ID prefix.
 
     Examples:
         claude-studio kb remove uav-positioning
         claude-studio kb remove kb_256dc --force
+        claude-studio kb remove uav-positioning --source src_3f2a
     """
     import shutil
 
@@ -628,6 +789,10 @@ def remove_cmd(project: str, force: bool):
 
     proj = _load_project(project_dir)
 
+    if source_id:
+        _remove_source(project_dir, proj, source_id, force)
+        return
+
     if not force:
         console.print(f"[bold]About to remove:[/bold] {proj.name}")
         console.print(f"[dim]ID:[/dim] {proj.project_id}")
@@ -643,6 +808,40 @@ def remove_cmd(project: str, force: bool):
     console.print(f"[green]Removed project:[/green] {proj.name} ({proj.project_id})")
 
 
+def _remove_source(project_dir: Path, proj, source_id: str, force: bool):
+    """Remove one source and its atoms from a project"""
+    import shutil
+
+    if source_id not in proj.sources:
+        matches = [sid for sid in proj.sources if sid.startswith(source_id)]
+        if len(matches) != 1:
+            console.print(f"[red]Source not found:[/red] {source_id}")
+            console.print("[dim]Use 'kb sources' to see available sources[/dim]")
+            return
+        source_id = matches[0]
+
+    source = proj.sources[source_id]
+    if not force:
+        console.print(f"[bold]About to remove source:[/bold] {source.title}")
+        console.print(f"[dim]ID:[/dim] {source_id}")
+        console.print()
+
+        if not click.confirm("Are you sure you want to remove this source?"):
+            console.print("[dim]Cancelled[/dim]")
+            return
+
+    proj.remove_source(source_id)
+    kg = _update_knowledge_graph(project_dir, proj, removed=[source_id])
+    _save_project(project_dir, proj)
+
+    source_dir = project_dir / "sources" / source_id
+    if source_dir.exists():
+        shutil.rmtree(source_dir)
+
+    console.print(f"[green]Removed source:[/green] {source.title} ({source_id})")
+    _print_graph_stats(proj, kg)
+
+
 def _build_concept_from_kb(
     proj: 'KnowledgeProject',
     kg: 'KnowledgeGraph',
@@ -809,7 +1008,6 @@ def produce_cmd_kb(project, prompt, sources, tier, duration, budget, provider, a
     """
     import time
     from core.models.audio import AudioTier
-    from core.models.knowledge import KnowledgeGraph
     from cli.produce import _run_production
 
     # Resolve project
@@ -824,15 +1022,11 @@ def produce_cmd_kb(project, prompt, sources, tier, duration, budget, provider, a
         return
 
     # Load knowledge graph
-    kg_path = project_dir / "knowledge_graph.json"
-    if not kg_path.exists():
+    kg = _load_knowledge_graph(project_dir)
+    if kg is None:
         console.print("[red]No knowledge graph found.[/red] Add sources to build the graph.")
         return
 
-    with open(kg_path, encoding="utf-8") as f:
-        kg_data = json.load(f)
-    kg = KnowledgeGraph.from_dict(kg_data)
-
     # Filter sources if specified
     source_filter = list(sources) if sources else None
     if source_filter:
@@ -1157,14 +1351,10 @@ def inspect_cmd(project: Optional[str], file_path: Optional[str], show_topics: b
         proj = _load_project(project_dir)
 
         # Load knowledge graph
-        kg_path = project_dir / "knowledge_graph.json"
-        if not kg_path.exists():
+        kg = _load_knowledge_graph(project_dir)
+        if kg is None:
             console.print("[red]No knowledge graph found.[/red] Add sources first.")
             return
-
-        with open(kg_path, encoding="utf-8") as f:
-            kg_data = json.load(f)
-        kg = KnowledgeGraph.from_dict(kg_data)
     else:
         console.print("[red]Specify a project name or --file path[/red]")
         return
@@ -1409,7 +1599,6 @@ def script_cmd(project, prompt, duration, style, sources, output, structured):
 async def _generate_kb_script(project, prompt, duration, style, sources, output, save_structured):
     """Generate a podcast-style script from KB content."""
     import time
-    from core.models.knowledge import KnowledgeGraph
     from core.models.structured_script import StructuredScript
     from core.claude_client import ClaudeClient
     from cli.theme import get_theme
@@ -1428,15 +1617,11 @@ async def _generate_kb_script(project, prompt, duration, style, sources, output,
         return
 
     # Load knowledge graph
-    kg_path = project_dir / "knowledge_graph.json"
-    if not kg_path.exists():
+    kg = _load_knowledge_graph(project_dir)
+    if kg is None:
         console.print("[red]No knowledge graph found.[/red] Add sources to build the graph.")
         return
 
-    with open(kg_path, encoding="utf-8") as f:
-        kg_data = json.load(f)
-    kg = KnowledgeGraph.from_dict(kg_data)
-
     source_filter = list(sources) if sources else None
 
     # Build rich context from KB
@@ -40,6 +40,10 @@ def get_manager_with_context(ctx_obj: dict):
         config.default_actor_id = ctx_obj["actor_id"]
     if ctx_obj.get("backend") == "local":
         config.mode = MemoryMode.LOCAL
+    if ctx_obj.get("storage_format"):
+        config.storage_format = ctx_obj["storage_format"]
+    if ctx_obj.get("search_mode"):
+        config.search_mode = ctx_obj["search_mode"]
 
     # Reset global manager to apply new config
     from core.memory.multi_tenant_manager import reset_memory_manager, MultiTenantMemoryManager
@@ -56,8 +60,15 @@ def get_manager_with_context(ctx_obj: dict):
 @click.option("--backend", "-b", envvar="MEMORY_BACKEND",
               type=click.Choice(["local", "hosted"]), default="local",
               help="Memory backend (local or hosted)")
+@click.option("--storage-format", envvar="MEMORY_STORAGE_FORMAT",
+              type=click.Choice(["json", "journal", "sqlite"]), default=None,
+              help="Local storage format: json files, append-only journals or a shared "
+                   "SQLite database (default: json)")
+@click.option("--search-mode", envvar="MEMORY_SEARCH_MODE",
+              type=click.Choice(["bm25", "semantic"]), default=None,
+              help="Local search ranking: bm25 keywords or offline semantic embeddings (default: bm25)")
 @click.pass_context
-def memory_cmd(ctx, org: str, actor: str, backend: str):
+def memory_cmd(ctx, org: str, actor: str, backend: str, storage_format: str, search_mode: str):
     """Memory system management
 
     \b
@@ -69,6 +80,8 @@ def memory_cmd(ctx, org: str, actor: str, backend: str):
       --org, -o      Organization ID for multi-tenant context
       --actor, -a    Actor (user) ID for multi-tenant context
       --backend, -b  Memory backend (local or hosted)
+      --storage-format  Local storage format (json, journal or sqlite)
+      --search-mode     Local search ranking (bm25 or semantic)
 
     \b
     Commands:
@@ -84,6 +97,8 @@ def memory_cmd(ctx, org: str, actor: str, backend: str):
       migrate     Migrate from legacy long_term.json format
       seed        Seed curated platform learnings
       clear       Clear learnings (with confirmation)
+      compact     Fold namespace journals into snapshots
+      convert     Copy all records to another storage format
       tree        Show namespace hierarchy
       preferences Show user preferences
       set-pref    Set a user preference
@@ -92,6 +107,8 @@ def memory_cmd(ctx, org: str, actor: str, backend: str):
     ctx.obj["org_id"] = org
     ctx.obj["actor_id"] = actor
     ctx.obj["backend"] = backend
+    ctx.obj["storage_format"] = storage_format
+    ctx.obj["search_mode"] = search_mode
 
 
 @memory_cmd.command()
@@ -654,13 +671,15 @@ def add(ctx, provider: str, pattern: str, level: str, category: str, tag: tuple)
         tags_list = [provider, category]  # Always include provider tag for filtering
         if tag:
             tags_list.extend(list(tag))
-        return await manager.store_provider_learning(
+        record_id = await manager.store_provider_learning(
             provider=provider,
             learning={"pattern": pattern, "category": category},
             level=level_enum,
             ctx=ns_ctx,
             tags=tags_list,
         )
+        await manager.flush()
+        return record_id
 
     record_id = asyncio.run(store_learning())
 
@@ -688,10 +707,11 @@ def export(ctx, output: str, provider: str, level: str):
       claude-studio memory export -p luma -o luma_learnings.json
     """
     from core.memory.backends.local import LocalMemoryBackend
+    from core.memory.backends.sqlite import SqliteMemoryBackend
 
     manager = get_manager_with_context(ctx.obj)
 
-    if not isinstance(manager.backend, LocalMemoryBackend):
+    if not isinstance(manager.backend, (LocalMemoryBackend, SqliteMemoryBackend)):
         console.print("[red]Export is only supported for local backend[/red]")
         return
 
@@ -762,10 +782,11 @@ def import_cmd(ctx, input_file: str, merge: bool):
       claude-studio memory import shared_learnings.json --merge
     """
     from core.memory.backends.local import LocalMemoryBackend
+    from core.memory.backends.sqlite import SqliteMemoryBackend
 
     manager = get_manager_with_context(ctx.obj)
 
-    if not isinstance(manager.backend, LocalMemoryBackend):
+    if not isinstance(manager.backend, (LocalMemoryBackend, SqliteMemoryBackend)):
         console.print("[red]Import is only supported for local backend[/red]")
         return
 
@@ -779,6 +800,7 @@ def import_cmd(ctx, input_file: str, merge: bool):
 
     async def do_import():
         await manager.backend.import_all(data)
+        await manager.flush()
 
     asyncio.run(do_import())
 
@@ -808,13 +830,15 @@ def promote(ctx, namespace: str, record_id: str, reason: str):
     provider = parsed.get("provider_id")
 
     async def do_promote():
-        return await manager.promote_learning(
+        new_id = await manager.promote_learning(
             record_id=record_id,
             from_namespace=namespace,
             ctx=ns_ctx,
             provider=provider,
             reason=reason,
         )
+        await manager.flush()
+        return new_id
 
     new_id = asyncio.run(do_promote())
 
@@ -887,6 +911,80 @@ def clear(ctx, provider: str, level: str, force: bool):
     console.print(f"[green]Cleared {deleted} records[/green]")
 
 
+@memory_cmd.command()
+@click.option("--prefix", default="", help="Only compact namespaces under this prefix")
+@click.pass_context
+def compact(ctx, prefix: str):
+    """Fold append-only namespace journals into their JSON snapshots
+
+    \b
+    Examples:
+      claude-studio memory compact
+      claude-studio memory compact --prefix /org/local
+    """
+    from core.memory.backends.local import LocalMemoryBackend
+
+    manager = get_manager_with_context(ctx.obj)
+
+    if not isinstance(manager.backend, LocalMemoryBackend):
+        console.print("[red]Compaction is only supported for local backend[/red]")
+        return
+
+    async def do_compact():
+        namespaces = await manager.backend.list_namespaces(prefix)
+        for namespace in namespaces:
+            await manager.backend.compact(namespace)
+        return len(namespaces)
+
+    count = asyncio.run(do_compact())
+    console.print(f"[green]Compacted {count} namespaces[/green]")
+
+
+@memory_cmd.command()
+@click.option("--to", "target_format", required=True,
+              type=click.Choice(["json", "journal", "sqlite"]),
+              help="Storage format to copy records into")
+@click.pass_context
+def convert(ctx, target_format: str):
+    """Copy all local records into another storage format
+
+    Reads from the current --storage-format and writes to --to under the
+    same base path. Record IDs and timestamps are kept, and re-running
+    replaces records instead of duplicating them; the source is left untouched.
+
+    \b
+    Examples:
+      claude-studio memory convert --to sqlite
+      claude-studio memory --storage-format sqlite convert --to json
+    """
+    from core.memory.backends.local import LocalMemoryBackend
+    from core.memory.backends.sqlite import SqliteMemoryBackend, copy_records
+
+    manager = get_manager_with_context(ctx.obj)
+    source = manager.backend
+
+    if not isinstance(source, (LocalMemoryBackend, SqliteMemoryBackend)):
+        console.print("[red]Conversion is only supported for local backend[/red]")
+        return
+
+    source_format = manager.config.storage_format
+    if target_format == source_format or (
+        target_format != "sqlite" and isinstance(source, LocalMemoryBackend)
+    ):
+        # json and journal read each other's files; nothing to copy
+        console.print(f"[yellow]Records are already readable as {target_format}[/yellow]")
+        return
+
+    base_path = manager.config.base_path
+    if target_format == "sqlite":
+        target = SqliteMemoryBackend(db_path=os.path.join(base_path, "memory.db"))
+    else:
+        target = LocalMemoryBackend(base_path=base_path, storage_format=target_format)
+
+    count = asyncio.run(copy_records(source, target))
+    console.print(f"[green]Copied {count} records from {source_format} to {target_format}[/green]")
+
+
 @memory_cmd.command()
 @click.option("--provider", "-p", default="luma", help="Provider for examples")
 @click.pass_context
@@ -996,7 +1094,8 @@ def set_pref(ctx, key: str, value: str):
         parsed_value = value
 
     async def set_prefs():
-        return await manager.set_preferences({key: parsed_value}, ns_ctx)
+        await manager.set_preferences({key: parsed_value}, ns_ctx)
+        await manager.flush()
 
     asyncio.run(set_prefs())
 
@@ -1140,6 +1239,7 @@ def migrate(ctx, legacy_path: str, to_level: str, dry_run: bool):
                 )
                 counts["provider_learnings"] += 1
 
+        await manager.flush()
         return counts
 
     with console.status("Migrating..."):
@@ -1226,6 +1326,7 @@ def seed(ctx, seed_file: str, level: str, force: bool):
                     tags=[provider, category, "seeded"],
                 )
                 seeded += 1
+        await manager.flush()
         return seeded
 
     with console.status("Seeding..."):
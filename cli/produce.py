@@ -34,6 +34,7 @@ from core.claude_client import ClaudeClient
 from core.budget import ProductionTier, BudgetTracker
 from core.models.audio import AudioTier
 from core.models.edit_decision import EditDecisionList, ExportFormat
+from core.models.render import RenderConfig, ENCODER_PROFILES, DEFAULT_ENCODER_PROFILE
 from core.models.memory import RunStage, PilotMemory, AssetMemory
 from core.memory import memory_manager, bootstrap_all_providers
 from core.providers import MockVideoProvider
@@ -609,6 +610,15 @@ def load_seed_assets(directory: str) -> List[SeedAsset]:
               default="visual_storyboard", help="Narrative style (podcast=rich NotebookLM-style narration)")
 @click.option('--mode', type=click.Choice(['video-led', 'audio-led']), default='video-led',
               help='Production mode: video-led (video determines timing) or audio-led (audio determines timing)')
+@click.option("--stream-qa", is_flag=True,
+              help="Run QA on each video as soon as it finishes generating; failed scenes are regenerated once")
+@click.option("--qa-cache/--no-qa-cache", "use_qa_cache", default=True,
+              help="Reuse QA results for footage already scored against the same scene (default: on)")
+@click.option("--profile", "render_profile", type=click.Choice(list(ENCODER_PROFILES)),
+              default=DEFAULT_ENCODER_PROFILE,
+              help="Encoder profile for the render: draft (540p), review (720p) or final (1080p, default)")
+@click.option("--preview", is_flag=True,
+              help="Render a draft proxy of the cut before the full-quality render")
 def produce_cmd(
     concept: str,
     budget: float,
@@ -628,7 +638,11 @@ def produce_cmd(
     seed_assets: Optional[str],
     execution_strategy: str,
     style: str,
-    mode: str
+    mode: str,
+    stream_qa: bool,
+    use_qa_cache: bool,
+    render_profile: str,
+    preview: bool
 ):
     """
     Run the full video production pipeline with multi-agent orchestration.
@@ -657,6 +671,13 @@ def produce_cmd(
 
         # Use seed images for video generation
         claude-studio produce -c "Product showcase" --live -s ./assets/product_images
+
+        # Verify scenes while the rest are still rendering
+        claude-studio produce -c "My video" --live -p luma --stream-qa
+
+        # Quick draft render, or a draft proxy ahead of the final render
+        claude-studio produce -c "My video" --mock --profile draft
+        claude-studio produce -c "My video" --live -p luma --preview
     """
     # Set theme (from CLI arg or environment variable)
     theme_name = theme or get_default_theme_name()
@@ -738,7 +759,11 @@ def produce_cmd(
             seed_assets=loaded_assets,
             execution_strategy=execution_strategy,
             narrative_style=style,
-            mode=mode
+            mode=mode,
+            stream_qa=stream_qa,
+            use_qa_cache=use_qa_cache,
+            render_profile=render_profile,
+            preview=preview
         ))
 
         total_time = time.time() - start_time
@@ -781,7 +806,11 @@ async def _run_production(
     seed_assets: Optional[List[SeedAsset]] = None,
     execution_strategy: str = "auto",
     narrative_style: str = "visual_storyboard",
-    mode: str = "video-led"
+    mode: str = "video-led",
+    stream_qa: bool = False,
+    use_qa_cache: bool = True,
+    render_profile: str = DEFAULT_ENCODER_PROFILE,
+    preview: bool = False
 ) -> dict:
     """Run the production pipeline with impressive agent orchestration display"""
 
@@ -790,6 +819,7 @@ async def _run_production(
     from agents.video_generator import VideoGeneratorAgent
     from agents.audio_generator import AudioGeneratorAgent
     from agents.qa_verifier import QAVerifierAgent
+    from core.qa_cache import QACache
     from agents.critic import CriticAgent, SceneResult
     from agents.editor import EditorAgent
 
@@ -852,7 +882,11 @@ async def _run_production(
     script_writer = ScriptWriterAgent(claude_client=claude)
     video_generator = VideoGeneratorAgent(provider=video_provider, num_variations=variations)
     audio_generator = AudioGeneratorAgent(claude_client=claude, audio_provider=audio_provider)
-    qa_verifier = QAVerifierAgent(claude_client=claude, mock_mode=not use_live)
+    qa_verifier = QAVerifierAgent(
+        claude_client=claude,
+        mock_mode=not use_live,
+        cache=QACache() if use_qa_cache else None
+    )
     critic = CriticAgent(claude_client=claude)
     editor = EditorAgent(claude_client=claude)
 
@@ -1018,6 +1052,9 @@ async def _run_production(
     # Use graph-based execution if we have mixed modes or sequential groups
     has_sequential = any(g.mode.value == "sequential" for g in execution_graph.groups)
 
+    # Streaming QA results by scene, filled when QA runs during generation
+    streamed_qa_results: Optional[Dict[str, list]] = None
+
     if has_sequential and hasattr(video_generator.provider, 'submit_generation'):
         # Use graph execution for continuity-aware generation
         video_candidates = await video_generator.generate_with_graph(
@@ -1028,6 +1065,46 @@ async def _run_production(
             num_variations=variations,
             seed_asset_lookup=seed_asset_lookup
         )
+    elif stream_qa:
+        # Download and QA each video while slower generations are still rendering
+        async def download(video):
+            if video.video_url and video.video_url.startswith("http"):
+                local_path = run_dir / "videos" / f"{video.scene_id}_v{video.variation_id}.mp4"
+                if await video_provider.download_video(video.video_url, str(local_path)):
+                    video.video_url = str(local_path)
+
+        async def regenerate(scene, video):
+            return await video_generator.regenerate_variation(
+                scene, video.variation_id, pilot.tier, seed_asset_lookup
+            )
+
+        streamed_qa_results = {}
+        async for video, qa in qa_verifier.verify_stream(
+            video_generator.stream_scenes(
+                scenes=scenes,
+                production_tier=pilot.tier,
+                budget_per_scene=pilot.allocated_budget / len(scenes),
+                num_variations=variations,
+                seed_asset_lookup=seed_asset_lookup
+            ),
+            scenes=scenes,
+            original_request=concept,
+            production_tier=pilot.tier,
+            prepare=download,
+            regenerate=regenerate
+        ):
+            video_candidates.setdefault(video.scene_id, []).append(video)
+            streamed_qa_results.setdefault(video.scene_id, []).append((video.variation_id, qa))
+
+        # Restore variation order (videos arrive in completion order)
+        for scene_id in video_candidates:
+            video_candidates[scene_id].sort(key=lambda v: v.variation_id)
+            streamed_qa_results[scene_id] = [
+                qa for _, qa in sorted(streamed_qa_results[scene_id], key=lambda item: item[0])
+            ]
+        video_candidates = {
+            s.scene_id: video_candidates[s.scene_id] for s in scenes if s.scene_id in video_candidates
+        }
     else:
         # Fall back to simple parallel generation
         video_candidates = await video_generator.generate_scenes_parallel(
@@ -1041,7 +1118,8 @@ async def _run_production(
     # Calculate total cost and download videos
     for scene in scenes:
         scene_videos = video_candidates.get(scene.scene_id, [])
-        scene_cost = sum(v.generation_cost for v in scene_videos)
+        # Include generations replaced after failing streaming QA
+        scene_cost = sum(v.generation_cost + v.metadata.get("discarded_cost", 0.0) for v in scene_videos)
         total_video_cost += scene_cost
 
         # Download videos if they have URLs
@@ -1176,20 +1254,22 @@ async def _run_production(
     total_count = 0
 
     for scene in scenes:
-        videos = video_candidates.get(scene.scene_id, [])
-        scene_qa = []
-        for video in videos:
-            qa = await qa_verifier.verify_video(
-                scene=scene,
-                generated_video=video,
-                original_request=concept,
-                production_tier=pilot.tier
-            )
-            video.quality_score = qa.overall_score
-            scene_qa.append(qa)
-            total_count += 1
-            if qa.passed:
-                passed_count += 1
+        if streamed_qa_results is not None:
+            # Already verified during video generation
+            scene_qa = streamed_qa_results.get(scene.scene_id, [])
+        else:
+            scene_qa = []
+            for video in video_candidates.get(scene.scene_id, []):
+                qa = await qa_verifier.verify_video(
+                    scene=scene,
+                    generated_video=video,
+                    original_request=concept,
+                    production_tier=pilot.tier
+                )
+                video.quality_score = qa.overall_score
+                scene_qa.append(qa)
+        total_count += len(scene_qa)
+        passed_count += sum(1 for qa in scene_qa if qa.passed)
         qa_results[scene.scene_id] = scene_qa
 
     qa_time = time.time() - stage_start
@@ -1199,7 +1279,9 @@ async def _run_production(
         "total": total_count,
         "passed": passed_count,
         "pass_rate": pass_rate,
-        "duration": qa_time
+        "duration": qa_time,
+        "streamed": streamed_qa_results is not None,
+        "cache_hits": qa_verifier.cache.hits if qa_verifier.cache else 0
     }
 
     if not as_json:
@@ -1490,7 +1572,10 @@ async def _run_production(
         console.print(f"│   [{t.agent_name}]▶[/{t.agent_name}] [{t.agent_name}]FFmpegRenderer[/{t.agent_name}]")
 
     from core.renderer import FFmpegRenderer
-    renderer = FFmpegRenderer(output_dir=str(run_dir / "renders"))
+    renderer = FFmpegRenderer(
+        output_dir=str(run_dir / "renders"),
+        config=RenderConfig.for_profile(render_profile)
+    )
     ffmpeg_check = await renderer.check_ffmpeg_installed()
 
     if ffmpeg_check["installed"]:
@@ -1500,7 +1585,21 @@ async def _run_production(
             console.print("│     └─ Adding transitions and overlays...")
 
         # Don't pass run_id since output_dir is already run-specific (run_dir/renders)
-        render_result = await renderer.render(edl=edl, audio_tracks=[])
+        if preview:
+            from core.render_scheduler import FFmpegJobScheduler
+
+            def _on_preview(preview_result):
+                if preview_result.success:
+                    results["preview_video"] = preview_result.output_path
+                    if not as_json:
+                        preview_name = Path(preview_result.output_path).name
+                        console.print(f"│     └─ [{t.success}]Preview: preview/{preview_name}[/{t.success}]")
+
+            _, render_result = await renderer.render_with_preview(
+                edl=edl, audio_tracks=[], on_preview=_on_preview, scheduler=FFmpegJobScheduler()
+            )
+        else:
+            render_result = await renderer.render(edl=edl, audio_tracks=[])
 
         if render_result.success:
             results["output_video"] = render_result.output_path
@@ -27,6 +27,7 @@ from core.models.structured_script import StructuredScript
 from core.models.content_library import ContentLibrary, AssetType, AssetStatus
 from core.content_librarian import ContentLibrarian
 from core.dop import assign_visuals, get_visual_plan_summary
+from core.tts_cache import TTSCache
 
 console = Console()
 
@@ -700,10 +701,14 @@ async def generate_scene_audio(
     script_text: str = None,
     structured_script: "StructuredScript" = None,
     content_library: "ContentLibrary" = None,
+    tts_cache=None,
 ) -> dict:
     """
     Generate audio for each scene using ElevenLabs (scene-by-scene to avoid length limits).
 
+    With a TTSCache, paragraphs whose text, voice and provider settings are
+    unchanged since an earlier run reuse that run's audio.
+
     Contract (UNIFIED_PRODUCTION_ARCHITECTURE.md):
     - READS: StructuredScript.segments[].text
     - WRITES: Audio files + registers them in ContentLibrary
@@ -829,6 +834,7 @@ async def generate_scene_audio(
             voice_id=voice_id,
             on_chunk_complete=_on_complete,
             on_chunk_error=_on_error,
+            cache=tts_cache,
         )
 
     # Post-process: populate audio_paths, write back to StructuredScript, register in ContentLibrary
@@ -860,7 +866,10 @@ async def generate_scene_audio(
             )
             librarian.library.register(asset)
 
+    cached_count = sum(1 for c in chunks if c.cached)
     console.print(f"[{t.success}]Generated {len(audio_paths)} audio clips[/]")
+    if cached_count:
+        console.print(f"[{t.dimmed}]Reused {cached_count} clips from the TTS cache[/]")
     console.print(f"[{t.dimmed}]Total characters: {total_chars} | Est. cost: ${total_cost:.3f}[/]")
 
     return audio_paths
@@ -1145,9 +1154,9 @@ async def generate_live_assets(
                         image_path = str(dst)
                     else:
                         # Download from URL if not already downloaded
-                        import aiohttp
+                        from core.providers.http import http_session
                         dst = images_dir / f"{plan.scene_id}.png"
-                        async with aiohttp.ClientSession() as session:
+                        async with http_session() as session:
                             async with session.get(result.image_url) as resp:
                                 if resp.status == 200:
                                     dst.write_bytes(await resp.read())
@@ -1250,7 +1259,8 @@ async def _produce_video_async(
     scene_limit: Optional[int] = None,
     scene_start: int = 0,
     generate_audio: bool = True,
-    voice_id: str = "pFZP5JQG7iQjIQuC4Bku"
+    voice_id: str = "pFZP5JQG7iQjIQuC4Bku",
+    use_tts_cache: bool = True,
 ):
     """Main async production function"""
     t = get_theme()
@@ -1724,6 +1734,7 @@ async def _produce_video_async(
             # Pass StructuredScript and ContentLibrary for Unified Production Architecture
             structured_script=structured_script if use_dop else None,
             content_library=content_library if use_dop else None,
+            tts_cache=TTSCache() if use_tts_cache else None,
         )
 
     # Save asset manifest (for both live and mock)
@@ -1855,7 +1866,13 @@ async def _produce_video_async(
     default="lily",
     help="ElevenLabs voice (lily, rachel, adam, or voice_id)"
 )
-def produce_video_cmd(from_training, script, output, live, style, kb, budget, show_tiers, limit, start, audio, voice):
+@click.option(
+    "--tts-cache/--no-tts-cache",
+    "tts_cache",
+    default=True,
+    help="Reuse narration for unchanged paragraphs from artifacts/cache/tts (default: enabled)"
+)
+def produce_video_cmd(from_training, script, output, live, style, kb, budget, show_tiers, limit, start, audio, voice, tts_cache):
     """Produce an explainer video from a podcast script.
 
     \b
@@ -1900,5 +1917,6 @@ def produce_video_cmd(from_training, script, output, live, style, kb, budget, sh
         scene_limit=limit,
         scene_start=start,
         generate_audio=audio,
-        voice_id=voice_id
+        voice_id=voice_id,
+        use_tts_cache=tts_cache,
     ))
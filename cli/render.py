@@ -5,6 +5,7 @@ import json
 import asyncio
 import tempfile
 from pathlib import Path
+from typing import Dict
 
 import click
 from rich.console import Console
@@ -12,8 +13,11 @@ from rich.table import Table
 from rich import box
 
 from core.renderer import FFmpegRenderer
+from core.render_scheduler import FFmpegJobScheduler
 from core.models.edit_decision import EditDecisionList, EditCandidate, EditDecision
-from core.models.render import RenderConfig, AudioTrack, TrackType
+from core.models.render import (
+    RenderConfig, AudioTrack, TrackType, ENCODER_PROFILES, DEFAULT_ENCODER_PROFILE
+)
 from core.secrets import get_api_key
 
 console = Console()
@@ -109,7 +113,22 @@ def render_cmd():
 @click.option("--candidate", "-c", help="Candidate ID to render (default: recommended)")
 @click.option("--output", "-o", type=click.Path(), help="Output file path")
 @click.option("--list-candidates", "-l", is_flag=True, help="List available candidates")
-def edl_cmd(run_id: str, candidate: str, output: str, list_candidates: bool):
+@click.option("--single-pass/--multi-pass", default=True,
+              help="Render in one FFmpeg pass (default) or the legacy multi-step pipeline")
+@click.option("--cache/--no-cache", "use_cache", default=True,
+              help="Reuse identical renders from the render cache (default: on)")
+@click.option("--all", "-a", "render_all", is_flag=True,
+              help="Render every candidate concurrently (recommended finishes first)")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=None,
+              help="Concurrent FFmpeg jobs with --all or --preview (default: based on CPU cores)")
+@click.option("--threads", type=click.IntRange(min=1), default=None,
+              help="FFmpeg threads per job with --all or --preview (default: cores / jobs)")
+@click.option("--profile", type=click.Choice(list(ENCODER_PROFILES)), default=DEFAULT_ENCODER_PROFILE,
+              help="Encoder profile: draft (540p), review (720p) or final (1080p, default)")
+@click.option("--preview", is_flag=True,
+              help="Render a draft proxy first, then the full render (renders/<run>/preview/)")
+def edl_cmd(run_id: str, candidate: str, output: str, list_candidates: bool, single_pass: bool,
+            use_cache: bool, render_all: bool, jobs: int, threads: int, profile: str, preview: bool):
     """
     Render a final video from an existing production run.
 
@@ -128,7 +147,22 @@ def edl_cmd(run_id: str, candidate: str, output: str, list_candidates: bool):
 
         # Render to a specific output file
         claude-studio render edl 20260107_224324 -o my_video.mp4
+
+        # Use the legacy multi-step render pipeline
+        claude-studio render edl 20260107_224324 --multi-pass
+
+        # Render all candidates at once on a shared FFmpeg job queue
+        claude-studio render edl 20260107_224324 --all
+
+        # Quick low-resolution render to check the cut
+        claude-studio render edl 20260107_224324 --profile draft
+
+        # Draft proxy first, full-quality render right behind it
+        claude-studio render edl 20260107_224324 --preview
     """
+    if preview and render_all:
+        raise click.UsageError("--preview renders a single candidate; it can't be combined with --all")
+
     # Find run directory
     run_dir = Path("artifacts/runs") / run_id
     if not run_dir.exists():
@@ -167,6 +201,34 @@ def edl_cmd(run_id: str, candidate: str, output: str, list_candidates: bool):
         console.print(table)
         return
 
+    if render_all:
+        console.print(f"[cyan]Rendering all {len(edl.candidates)} candidates[/cyan]")
+        try:
+            results = asyncio.run(_render_edl_all(
+                edl=edl,
+                run_dir=run_dir,
+                single_pass=single_pass,
+                use_cache=use_cache,
+                jobs=jobs,
+                threads=threads,
+                profile=profile
+            ))
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise
+
+        table = Table(box=box.ROUNDED)
+        table.add_column("ID", style="cyan")
+        table.add_column("Status")
+        table.add_column("Output")
+        table.add_column("Render time")
+        for cid, result in results.items():
+            status = "[green]OK[/green]" if result.success else f"[red]{result.error_message}[/red]"
+            render_time = f"{result.render_time:.1f}s" if result.render_time is not None else "-"
+            table.add_row(cid, status, result.output_path or "-", render_time)
+        console.print(table)
+        return
+
     # Select candidate
     candidate_id = candidate or edl.recommended_candidate_id
     console.print(f"[cyan]Rendering candidate: {candidate_id}[/cyan]")
@@ -213,7 +275,13 @@ def edl_cmd(run_id: str, candidate: str, output: str, list_candidates: bool):
             edl=edl,
             candidate_id=candidate_id,
             run_dir=run_dir,
-            output_path=output
+            output_path=output,
+            single_pass=single_pass,
+            use_cache=use_cache,
+            profile=profile,
+            preview=preview,
+            jobs=jobs,
+            threads=threads
         ))
 
         if result.success:
@@ -237,16 +305,25 @@ async def _render_edl(
     edl: EditDecisionList,
     candidate_id: str,
     run_dir: Path,
-    output_path: str = None
+    output_path: str = None,
+    single_pass: bool = True,
+    use_cache: bool = True,
+    profile: str = DEFAULT_ENCODER_PROFILE,
+    preview: bool = False,
+    jobs: int = None,
+    threads: int = None
 ) -> 'RenderResult':
-    """Render the EDL"""
+    """Render the EDL (after a draft proxy with preview)"""
     from core.models.render import RenderResult
 
     # Setup renderer
     render_dir = run_dir / "renders"
     render_dir.mkdir(exist_ok=True)
 
-    renderer = FFmpegRenderer(output_dir=str(render_dir))
+    renderer = FFmpegRenderer(
+        output_dir=str(render_dir),
+        config=RenderConfig.for_profile(profile, single_pass=single_pass, use_cache=use_cache)
+    )
 
     # Check FFmpeg
     ffmpeg_check = await renderer.check_ffmpeg_installed()
@@ -257,12 +334,29 @@ async def _render_edl(
         )
 
     # Render
-    result = await renderer.render(
-        edl=edl,
-        candidate_id=candidate_id,
-        audio_tracks=[],
-        run_id=run_dir.name
-    )
+    if preview:
+        def _on_preview(preview_result: RenderResult):
+            if preview_result.success:
+                console.print(f"[green]Preview ready:[/green] {preview_result.output_path}")
+                console.print("[dim]Final render continues...[/dim]")
+            else:
+                console.print(f"[yellow]Preview failed: {preview_result.error_message}[/yellow]")
+
+        _, result = await renderer.render_with_preview(
+            edl=edl,
+            candidate_id=candidate_id,
+            audio_tracks=[],
+            run_id=run_dir.name,
+            on_preview=_on_preview,
+            scheduler=FFmpegJobScheduler(max_jobs=jobs, threads_per_job=threads)
+        )
+    else:
+        result = await renderer.render(
+            edl=edl,
+            candidate_id=candidate_id,
+            audio_tracks=[],
+            run_id=run_dir.name
+        )
 
     # Copy to custom output path if specified
     if output_path and result.success and result.output_path:
@@ -273,6 +367,41 @@ async def _render_edl(
     return result
 
 
+async def _render_edl_all(
+    edl: EditDecisionList,
+    run_dir: Path,
+    single_pass: bool = True,
+    use_cache: bool = True,
+    jobs: int = None,
+    threads: int = None,
+    profile: str = DEFAULT_ENCODER_PROFILE
+) -> Dict[str, 'RenderResult']:
+    """Render every EDL candidate concurrently on one FFmpeg job scheduler"""
+    from core.models.render import RenderResult
+
+    render_dir = run_dir / "renders"
+    render_dir.mkdir(exist_ok=True)
+
+    renderer = FFmpegRenderer(
+        output_dir=str(render_dir),
+        config=RenderConfig.for_profile(profile, single_pass=single_pass, use_cache=use_cache)
+    )
+
+    ffmpeg_check = await renderer.check_ffmpeg_installed()
+    if not ffmpeg_check["installed"]:
+        return {
+            c.candidate_id: RenderResult(success=False, error_message="FFmpeg not installed")
+            for c in edl.candidates
+        }
+
+    return await renderer.render_all(
+        edl=edl,
+        audio_tracks=[],
+        run_id=run_dir.name,
+        scheduler=FFmpegJobScheduler(max_jobs=jobs, threads_per_job=threads)
+    )
+
+
 @click.command("mix")
 @click.argument("video_file", type=click.Path(exists=True))
 @click.option("--text", "-t", help="Text to convert to speech (TTS)")
@@ -18,6 +18,8 @@ from core.budget import ProductionTier
 from agents.script_writer import Scene
 from agents.video_generator import GeneratedVideo
 from agents.qa_verifier import QAVerifierAgent, QAResult
+from core.qa_cache import QACache
+from core.media_probe import get_media_probe
 from agents.critic import CriticAgent, SceneResult, PilotResults
 from agents.producer import PilotStrategy
 from agents.editor import EditorAgent
@@ -31,7 +33,10 @@ console = Console()
 @click.option("--skip-qa", is_flag=True, help="Skip QA verification (use if already completed)")
 @click.option("--skip-critic", is_flag=True, help="Skip critic analysis")
 @click.option("--skip-editor", is_flag=True, help="Skip EDL creation")
-def resume_cmd(run_id: str, live: bool, skip_qa: bool, skip_critic: bool, skip_editor: bool):
+@click.option("--qa-cache/--no-qa-cache", "use_qa_cache", default=True,
+              help="Reuse QA results for footage already scored against the same scene (default: on)")
+def resume_cmd(run_id: str, live: bool, skip_qa: bool, skip_critic: bool, skip_editor: bool,
+               use_qa_cache: bool):
     """
     Resume a production from where it stopped.
 
@@ -52,10 +57,11 @@ def resume_cmd(run_id: str, live: bool, skip_qa: bool, skip_critic: bool, skip_e
       - videos/*.mp4 (generated videos)
       - memory.json (run metadata)
     """
-    asyncio.run(_resume(run_id, live, skip_qa, skip_critic, skip_editor))
+    asyncio.run(_resume(run_id, live, skip_qa, skip_critic, skip_editor, use_qa_cache))
 
 
-async def _resume(run_id: str, use_live: bool, skip_qa: bool, skip_critic: bool, skip_editor: bool):
+async def _resume(run_id: str, use_live: bool, skip_qa: bool, skip_critic: bool, skip_editor: bool,
+                  use_qa_cache: bool = True):
     """Resume production implementation"""
 
     # Convert run_id to path
@@ -152,15 +158,8 @@ async def _resume(run_id: str, use_live: bool, skip_qa: bool, skip_critic: bool,
         scene_id = f"{parts[0]}_{parts[1]}"  # scene_1
         variation_id = int(parts[2][1:])  # 0 from v0
 
-        # Get actual video duration using ffprobe
-        import subprocess
-        result = subprocess.run(
-            ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
-             '-of', 'default=noprint_wrappers=1:nokey=1', str(video_file)],
-            capture_output=True,
-            text=True
-        )
-        actual_duration = float(result.stdout.strip()) if result.returncode == 0 else 5.0
+        # Get actual video duration (cached across resumes by the media probe)
+        actual_duration = get_media_probe().duration_sync(video_file) or 5.0
 
         # Create GeneratedVideo with CORRECT metadata (no incorrect chain metadata)
         video = GeneratedVideo(
@@ -194,7 +193,11 @@ async def _resume(run_id: str, use_live: bool, skip_qa: bool, skip_critic: bool,
 
     # Initialize agents
     claude = ClaudeClient()
-    qa_verifier = QAVerifierAgent(claude_client=claude, mock_mode=not use_live)
+    qa_verifier = QAVerifierAgent(
+        claude_client=claude,
+        mock_mode=not use_live,
+        cache=QACache() if use_qa_cache else None
+    )
     critic = CriticAgent(claude_client=claude)
     editor = EditorAgent(claude_client=claude)
 
@@ -304,6 +307,8 @@ async def _resume(run_id: str, use_live: bool, skip_qa: bool, skip_critic: bool,
 
         pass_rate = int(100 * passed_count / total_count) if total_count > 0 else 0
         console.print(f"[green]✓[/green] QA complete: {passed_count}/{total_count} passed ({pass_rate}%)")
+        if qa_verifier.cache is not None and qa_verifier.cache.hits:
+            console.print(f"[dim]  {qa_verifier.cache.hits} result(s) reused from the QA cache[/dim]")
         console.print()
     else:
         console.print("[dim]Skipping QA verification[/dim]\n")
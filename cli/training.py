@@ -11,6 +11,8 @@ from rich.console import Console
 from rich.logging import RichHandler
 
 from core.claude_client import ClaudeClient
+from core.response_cache import ResponseCache
+from core.tts_cache import TTSCache
 from core.memory.manager import MemoryManager
 from core.models.knowledge import KnowledgeGraph as DocumentGraph
 
@@ -233,13 +235,22 @@ def training():
 @click.option('--output-dir', default='artifacts/training_output', help='Output directory for results')
 @click.option('--max-trials', default=5, help='Maximum number of training trials')
 @click.option('--with-audio', is_flag=True, help='Generate TTS audio (disabled by default, uses reference audio)')
-def run(pairs_dir, output_dir, max_trials, with_audio):
+@click.option('--response-cache', is_flag=True, help='Reuse cached Claude responses for unchanged inputs (artifacts/cache/claude)')
+@click.option('--tts-cache/--no-tts-cache', default=True, help='With --with-audio, reuse audio for unchanged paragraphs (artifacts/cache/tts)')
+def run(pairs_dir, output_dir, max_trials, with_audio, response_cache, tts_cache):
     """Run the complete training pipeline"""
     skip_audio = not with_audio
-    asyncio.run(run_training_pipeline(pairs_dir, output_dir, max_trials, skip_audio))
+    asyncio.run(run_training_pipeline(pairs_dir, output_dir, max_trials, skip_audio, response_cache, tts_cache))
 
 
-async def run_training_pipeline(pairs_dir: str, output_dir: str, max_trials: int, skip_audio: bool):
+async def run_training_pipeline(
+    pairs_dir: str,
+    output_dir: str,
+    max_trials: int,
+    skip_audio: bool,
+    response_cache: bool = False,
+    tts_cache: bool = True,
+):
     """Main training pipeline execution"""
     pairs_path = Path(pairs_dir)
     output_path = Path(output_dir)
@@ -269,7 +280,7 @@ async def run_training_pipeline(pairs_dir: str, output_dir: str, max_trials: int
     console.print("[bold cyan]Claude Studio Producer - Training Pipeline[/bold cyan]\n")
 
     # Initialize clients and usage tracking
-    claude_client = ClaudeClient()
+    claude_client = ClaudeClient(cache=ResponseCache() if response_cache else None)
     memory_manager = MemoryManager()
     total_usage = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
 
@@ -587,6 +598,7 @@ async def run_training_pipeline(pairs_dir: str, output_dir: str, max_trials: int
             output_dir=output_path,
             style_profile=aggregated_profile,
             skip_audio=skip_audio,
+            tts_cache=TTSCache() if tts_cache else None,
         )
 
         # Add training loop usage to total
@@ -44,6 +44,7 @@ class AudioChunkResult:
     text: str
     char_count: int
     estimated_cost: float
+    cached: bool = False  # Served from the TTS cache (no API call, no cost)
 
 
 async def generate_audio_chunks(
@@ -53,37 +54,76 @@ async def generate_audio_chunks(
     voice_id: str = "pFZP5JQG7iQjIQuC4Bku",
     on_chunk_complete: Optional[Callable[[int, int, str], None]] = None,
     on_chunk_error: Optional[Callable[[str, Exception], None]] = None,
+    max_concurrency: Optional[int] = None,
+    cache=None,  # Optional[TTSCache]
 ) -> List[AudioChunkResult]:
     """
     Generate individual audio files for a list of text items.
 
+    Chunks are synthesized concurrently within the provider's declared
+    request limits (see core.tts_scheduler), and each file's duration is
+    probed as soon as it is written.
+
     Args:
         provider: Any AudioProvider implementing generate_speech()
         items: List of (audio_id, text) tuples. Items with text < 5 chars are skipped.
         output_dir: Directory to write MP3 files into (created if missing)
         voice_id: Voice identifier passed to provider.generate_speech()
-        on_chunk_complete: Optional callback(current_index, total, audio_id) after each chunk
+        on_chunk_complete: Optional callback(completed_index, total, audio_id) as each chunk finishes
         on_chunk_error: Optional callback(audio_id, exception) on failure
+        max_concurrency: Override the provider's concurrent request limit
+        cache: Optional TTSCache; hits are linked into output_dir with their
+            stored duration, skipping both the API call and the probe
 
     Returns:
-        List of AudioChunkResult for successfully generated chunks.
+        List of AudioChunkResult for successfully generated chunks, in item order.
     """
+    from core.tts_cache import tts_cache_key
+    from core.tts_scheduler import TTSLimits, TTSScheduler
+
     output_dir.mkdir(parents=True, exist_ok=True)
-    results = []
     total = len(items)
+    completed = 0
 
-    for i, (audio_id, text) in enumerate(items):
-        if not text or len(text.strip()) < 5:
-            if on_chunk_complete:
-                on_chunk_complete(i, total, audio_id)
-            continue
+    limits = TTSLimits.for_provider(provider)
+    if max_concurrency is not None:
+        limits.max_concurrency = max(1, max_concurrency)
+    scheduler = TTSScheduler(limits)
+
+    def _complete(audio_id: str):
+        nonlocal completed
+        if on_chunk_complete:
+            on_chunk_complete(completed, total, audio_id)
+        completed += 1
 
+    async def _generate(audio_id: str, text: str) -> Optional[AudioChunkResult]:
         try:
             clean_text = clean_text_for_tts(text)
-            result = await provider.generate_speech(text=clean_text, voice_id=voice_id)
+            audio_path = output_dir / f"{audio_id}.mp3"
+
+            key = None
+            if cache is not None:
+                key = tts_cache_key(provider, clean_text, voice_id)
+                duration = cache.materialize(key, audio_path)
+                if duration is not None:
+                    return AudioChunkResult(
+                        audio_id=audio_id,
+                        path=audio_path,
+                        duration_sec=duration,
+                        text=text,
+                        char_count=len(text),
+                        estimated_cost=0.0,
+                        cached=True,
+                    )
+
+            result = await scheduler.run(
+                lambda: provider.generate_speech(text=clean_text, voice_id=voice_id),
+                characters=len(clean_text),
+            )
 
             if result.success and (result.audio_data or result.audio_path):
-                audio_path = output_dir / f"{audio_id}.mp3"
+                # Never write through a hard link left by an earlier cached run
+                audio_path.unlink(missing_ok=True)
                 if result.audio_data:
                     audio_path.write_bytes(result.audio_data)
                 elif result.audio_path:
@@ -91,25 +131,36 @@ async def generate_audio_chunks(
                     import shutil
                     shutil.copy2(result.audio_path, audio_path)
 
+                # Probed outside the request slot, so the next request can start
                 duration = await get_audio_duration(audio_path)
                 cost = provider.estimate_cost(text)
+                if key is not None and duration > 0:
+                    cache.put(key, audio_path, duration, provider=provider.name, voice_id=voice_id)
 
-                results.append(AudioChunkResult(
+                return AudioChunkResult(
                     audio_id=audio_id,
                     path=audio_path,
                     duration_sec=duration,
                     text=text,
                     char_count=len(text),
                     estimated_cost=cost,
-                ))
+                )
         except Exception as e:
             if on_chunk_error:
                 on_chunk_error(audio_id, e)
+        finally:
+            _complete(audio_id)
+        return None
 
-        if on_chunk_complete:
-            on_chunk_complete(i, total, audio_id)
+    tasks = []
+    for audio_id, text in items:
+        if not text or len(text.strip()) < 5:
+            _complete(audio_id)
+            continue
+        tasks.append(_generate(audio_id, text))
 
-    return results
+    results = await asyncio.gather(*tasks)
+    return [r for r in results if r is not None]
 
 
 async def get_audio_duration(audio_path: Path) -> float:
@@ -119,19 +170,20 @@ async def get_audio_duration(audio_path: Path) -> float:
     Tries mutagen first (fast, pure-Python), falls back to ffprobe.
     Returns 0.0 if neither works.
     """
-    # Try mutagen (no subprocess needed)
-    try:
+    # Try mutagen (no subprocess needed); file reads run off the event loop
+    def _mutagen_length() -> float:
         from mutagen.mp3 import MP3
-        audio_info = MP3(str(audio_path))
-        return audio_info.info.length
+        return MP3(str(audio_path)).info.length
+
+    try:
+        return await asyncio.to_thread(_mutagen_length)
     except Exception:
         pass
 
-    # Fall back to ffprobe via FFmpegRenderer
+    # Fall back to ffprobe (cached by the shared media probe)
     try:
-        from core.renderer import FFmpegRenderer
-        renderer = FFmpegRenderer()
-        duration = await renderer._get_duration(str(audio_path))
+        from core.media_probe import get_media_probe
+        duration = await get_media_probe().duration(audio_path)
         return duration if duration else 0.0
     except Exception:
         return 0.0
@@ -4,11 +4,23 @@ Handles all the message parsing and API interaction
 """
 
 import re
+import copy
 import json
 import base64
 from pathlib import Path
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, Callable, Awaitable, Tuple
 from core.secrets import get_api_key
+from core.response_cache import ResponseCache, response_key, image_digest
+from core.claude_pool import get_claude_pool
+
+MODEL = "claude-sonnet-4-20250514"
+TEXT_MAX_TOKENS = 16384
+VISION_MAX_TOKENS = 4096
+
+
+def _cached_usage() -> Dict[str, Any]:
+    """Usage reported for a response served from the cache"""
+    return {'input_tokens': 0, 'output_tokens': 0, 'total_tokens': 0, 'cached': True}
 
 
 class ClaudeClient:
@@ -17,14 +29,43 @@ class ClaudeClient:
     Handles all the message object parsing internally
     """
     
-    def __init__(self, debug: bool = False):
+    def __init__(self, debug: bool = False, cache: Optional[ResponseCache] = None):
+        """
+        Args:
+            debug: Print prompts/responses
+            cache: Response cache for repeated prompts (default: from CLAUDE_RESPONSE_CACHE, usually off)
+        """
         self.debug = debug
-        
+        self.cache = cache if cache is not None else ResponseCache.from_env()
+
+    def without_cache(self) -> 'ClaudeClient':
+        """Copy of this client that always calls the API (for agents that need fresh responses)"""
+        client = copy.copy(self)
+        client.cache = None
+        return client
+
+    async def _cached(
+        self,
+        use_cache: bool,
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+        **key_parts: Any,
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Serve a call from the response cache when enabled; returns (entry, from_cache)"""
+        if not use_cache or self.cache is None:
+            return await call(), False
+
+        key = response_key(model=MODEL, **key_parts)
+        entry, from_cache = await self.cache.get_or_call(key, call)
+        if from_cache and self.debug:
+            print(f"[DEBUG] Response cache hit ({key[:12]})")
+        return entry, from_cache
+
     async def query(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
-        return_usage: bool = False
+        return_usage: bool = False,
+        use_cache: bool = True,
     ) -> Union[str, tuple[str, Optional[Dict[str, int]]]]:
         """
         Send a query to Claude and get back clean text response with optional usage metadata
@@ -33,6 +74,7 @@ class ClaudeClient:
             prompt: The user prompt
             system_prompt: Optional system prompt (not supported in simple query API)
             return_usage: If True, return (response, usage_dict); if False, return just response
+            use_cache: Set False to bypass the response cache for this call
 
         Returns:
             If return_usage=False (default): Just the response text string
@@ -40,7 +82,8 @@ class ClaudeClient:
                 - input_tokens: Number of input tokens
                 - output_tokens: Number of output tokens
                 - total_tokens: Total tokens used
-                Returns (response_text, None) if usage data unavailable
+                Returns (response_text, None) if usage data unavailable.
+                Cached responses report zero tokens and 'cached': True.
 
         Raises:
             ImportError: If neither Claude Agent SDK nor Anthropic SDK is available
@@ -51,32 +94,59 @@ class ClaudeClient:
         else:
             full_prompt = prompt
 
-        response_text = ""
-        usage = None
-
         if self.debug:
             print(f"\n[DEBUG] Sending prompt ({len(full_prompt)} chars)")
 
+        entry, from_cache = await self._cached(
+            use_cache,
+            lambda: self._send_text(full_prompt),
+            kind="text",
+            max_tokens=TEXT_MAX_TOKENS,
+            prompt=full_prompt,
+        )
+        response_text = entry["text"]
+        usage = _cached_usage() if from_cache else entry.get("usage")
+
+        if self.debug:
+            print(f"[DEBUG] Received response ({len(response_text)} chars)")
+            if usage:
+                print(f"[DEBUG] Usage: {usage['input_tokens']} in + {usage['output_tokens']} out = {usage['total_tokens']} total")
+            print(f"[DEBUG] First 500 chars:")
+            print(response_text[:500])
+            print("[DEBUG] ---")
+
+        # Return based on return_usage parameter (backward compatibility)
+        if return_usage:
+            return response_text.strip(), usage
+        else:
+            return response_text.strip()
+
+    async def _send_text(self, full_prompt: str) -> Dict[str, Any]:
+        """Call the API with a text prompt; returns {"text", "usage"}"""
+        response_text = ""
+        usage = None
+
         # Try Claude Agent SDK first
         try:
             from claude_agent_sdk import query
-            async for message in query(prompt=full_prompt):
-                text = self._extract_text_from_message(message)
-                if text:
-                    response_text += text
-                # Try to extract usage from message if available
-                if hasattr(message, 'usage') and message.usage:
-                    usage = {
-                        'input_tokens': getattr(message.usage, 'input_tokens', 0),
-                        'output_tokens': getattr(message.usage, 'output_tokens', 0),
-                    }
-                    usage['total_tokens'] = usage['input_tokens'] + usage['output_tokens']
+            async with get_claude_pool().slot():
+                async for message in query(prompt=full_prompt):
+                    text = self._extract_text_from_message(message)
+                    if text:
+                        response_text += text
+                    # Try to extract usage from message if available
+                    if hasattr(message, 'usage') and message.usage:
+                        usage = {
+                            'input_tokens': getattr(message.usage, 'input_tokens', 0),
+                            'output_tokens': getattr(message.usage, 'output_tokens', 0),
+                        }
+                        usage['total_tokens'] = usage['input_tokens'] + usage['output_tokens']
         except (ImportError, Exception) as sdk_err:
             # Fall back to Anthropic SDK (catches both missing SDK and runtime errors)
             if self.debug and not isinstance(sdk_err, ImportError):
                 print(f"[DEBUG] Claude Agent SDK failed: {sdk_err}, falling back to Anthropic SDK")
             try:
-                import anthropic
+                import anthropic  # noqa: F401 - availability check
 
                 api_key = get_api_key("ANTHROPIC_API_KEY")
                 if not api_key:
@@ -85,21 +155,12 @@ class ClaudeClient:
                         "For testing without API keys, use MockClaudeClient from tests.mocks"
                     )
 
-                client = anthropic.Anthropic(api_key=api_key)
-                response = client.messages.create(
-                    model="claude-sonnet-4-20250514",
-                    max_tokens=16384,
+                return await get_claude_pool().create_message(
+                    api_key,
+                    model=MODEL,
+                    max_tokens=TEXT_MAX_TOKENS,
                     messages=[{"role": "user", "content": full_prompt}]
                 )
-                response_text = response.content[0].text
-
-                # Extract usage from Anthropic SDK response
-                if hasattr(response, 'usage'):
-                    usage = {
-                        'input_tokens': response.usage.input_tokens,
-                        'output_tokens': response.usage.output_tokens,
-                        'total_tokens': response.usage.input_tokens + response.usage.output_tokens,
-                    }
             except ImportError:
                 raise ImportError(
                     "Neither claude-agent-sdk nor anthropic SDK is installed. "
@@ -107,25 +168,14 @@ class ClaudeClient:
                     "For testing without API keys, use MockClaudeClient from tests.mocks"
                 )
 
-        if self.debug:
-            print(f"[DEBUG] Received response ({len(response_text)} chars)")
-            if usage:
-                print(f"[DEBUG] Usage: {usage['input_tokens']} in + {usage['output_tokens']} out = {usage['total_tokens']} total")
-            print(f"[DEBUG] First 500 chars:")
-            print(response_text[:500])
-            print("[DEBUG] ---")
-
-        # Return based on return_usage parameter (backward compatibility)
-        if return_usage:
-            return response_text.strip(), usage
-        else:
-            return response_text.strip()
+        return {"text": response_text, "usage": usage}
 
     async def query_with_image(
         self,
         prompt: str,
         image_path: Union[str, Path],
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        use_cache: bool = True,
     ) -> str:
         """
         Send a query to Claude with an image for vision analysis
@@ -134,6 +184,7 @@ class ClaudeClient:
             prompt: The user prompt
             image_path: Path to the image file (local path or URL)
             system_prompt: Optional system prompt
+            use_cache: Set False to bypass the response cache for this call
 
         Returns:
             Clean text response from Claude
@@ -170,65 +221,39 @@ class ClaudeClient:
             print(f"\n[DEBUG] Sending vision query with image: {image_path.name}")
             print(f"[DEBUG] Image size: {len(image_data)} bytes")
 
-        # Vision queries require direct Anthropic SDK
-        try:
-            import anthropic
-
-            api_key = get_api_key("ANTHROPIC_API_KEY")
-            if not api_key:
-                raise ValueError(
-                    "ANTHROPIC_API_KEY not set (check keychain or env). "
-                    "Vision queries require the Anthropic SDK."
-                )
-
-            client = anthropic.Anthropic(api_key=api_key)
-
-            # Build message content with image
-            message_content = [
-                {
-                    "type": "image",
-                    "source": {
-                        "type": "base64",
-                        "media_type": media_type,
-                        "data": image_b64,
-                    },
+        # Build message content with image
+        message_content = [
+            {
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": media_type,
+                    "data": image_b64,
                 },
-                {
-                    "type": "text",
-                    "text": prompt
-                }
-            ]
-
-            # Create message with vision
-            create_kwargs = {
-                "model": "claude-sonnet-4-20250514",  # Supports vision
-                "max_tokens": 4096,
-                "messages": [{"role": "user", "content": message_content}],
+            },
+            {
+                "type": "text",
+                "text": prompt
             }
-            # Only add system if provided (API doesn't accept None)
-            if system_prompt:
-                create_kwargs["system"] = system_prompt
-
-            response = client.messages.create(**create_kwargs)
-
-            response_text = response.content[0].text
-
-            if self.debug:
-                print(f"[DEBUG] Received vision response ({len(response_text)} chars)")
-
-            return response_text.strip()
-
-        except ImportError:
-            raise ImportError(
-                "anthropic SDK is required for vision queries. "
-                "Install with: pip install anthropic"
-            )
+        ]
+
+        entry, _ = await self._cached(
+            use_cache,
+            lambda: self._send_vision(message_content, system_prompt),
+            kind="vision",
+            max_tokens=VISION_MAX_TOKENS,
+            prompt=prompt,
+            system=system_prompt,
+            images=[(media_type, image_digest(image_b64))],
+        )
+        return entry["text"].strip()
 
     async def query_with_images(
         self,
         prompt: str,
         images: list,
-        system_prompt: Optional[str] = None
+        system_prompt: Optional[str] = None,
+        use_cache: bool = True,
     ) -> str:
         """
         Send a query to Claude with multiple images for vision analysis
@@ -238,6 +263,7 @@ class ClaudeClient:
             images: List of dicts with 'data' (base64) and 'media_type' keys,
                     or list of file paths (str/Path)
             system_prompt: Optional system prompt
+            use_cache: Set False to bypass the response cache for this call
 
         Returns:
             Clean text response from Claude
@@ -249,92 +275,107 @@ class ClaudeClient:
         if self.debug:
             print(f"\n[DEBUG] Sending vision query with {len(images)} images")
 
-        # Vision queries require direct Anthropic SDK
-        try:
-            import anthropic
-
-            api_key = get_api_key("ANTHROPIC_API_KEY")
-            if not api_key:
-                raise ValueError(
-                    "ANTHROPIC_API_KEY not set (check keychain or env). "
-                    "Vision queries require the Anthropic SDK."
-                )
-
-            client = anthropic.Anthropic(api_key=api_key)
-
-            # Build message content with all images
-            message_content = []
-
-            for img in images:
-                if isinstance(img, dict):
-                    # Already formatted as {data: base64, media_type: ...}
-                    message_content.append({
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": img.get("media_type", "image/jpeg"),
-                            "data": img["data"],
-                        },
-                    })
-                elif isinstance(img, (str, Path)):
-                    # File path - read and encode
-                    img_path = Path(img)
-                    if not img_path.exists():
-                        raise FileNotFoundError(f"Image not found: {img_path}")
-
-                    image_data = img_path.read_bytes()
-                    image_b64 = base64.standard_b64encode(image_data).decode("utf-8")
-
-                    extension = img_path.suffix.lower()
-                    media_type_map = {
-                        ".jpg": "image/jpeg",
-                        ".jpeg": "image/jpeg",
-                        ".png": "image/png",
-                        ".gif": "image/gif",
-                        ".webp": "image/webp"
-                    }
-                    media_type = media_type_map.get(extension, "image/jpeg")
-
-                    message_content.append({
-                        "type": "image",
-                        "source": {
-                            "type": "base64",
-                            "media_type": media_type,
-                            "data": image_b64,
-                        },
-                    })
-
-            # Add the text prompt at the end
-            message_content.append({
-                "type": "text",
-                "text": prompt
-            })
-
-            # Create message with vision
-            create_kwargs = {
-                "model": "claude-sonnet-4-20250514",  # Supports vision
-                "max_tokens": 4096,
-                "messages": [{"role": "user", "content": message_content}],
-            }
-            # Only add system if provided (API doesn't accept None)
-            if system_prompt:
-                create_kwargs["system"] = system_prompt
-
-            response = client.messages.create(**create_kwargs)
-
-            response_text = response.content[0].text
+        # Build message content with all images
+        message_content = []
 
-            if self.debug:
-                print(f"[DEBUG] Received vision response ({len(response_text)} chars)")
+        for img in images:
+            if isinstance(img, dict):
+                # Already formatted as {data: base64, media_type: ...}
+                message_content.append({
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": img.get("media_type", "image/jpeg"),
+                        "data": img["data"],
+                    },
+                })
+            elif isinstance(img, (str, Path)):
+                # File path - read and encode
+                img_path = Path(img)
+                if not img_path.exists():
+                    raise FileNotFoundError(f"Image not found: {img_path}")
+
+                image_data = img_path.read_bytes()
+                image_b64 = base64.standard_b64encode(image_data).decode("utf-8")
+
+                extension = img_path.suffix.lower()
+                media_type_map = {
+                    ".jpg": "image/jpeg",
+                    ".jpeg": "image/jpeg",
+                    ".png": "image/png",
+                    ".gif": "image/gif",
+                    ".webp": "image/webp"
+                }
+                media_type = media_type_map.get(extension, "image/jpeg")
 
-            return response_text.strip()
+                message_content.append({
+                    "type": "image",
+                    "source": {
+                        "type": "base64",
+                        "media_type": media_type,
+                        "data": image_b64,
+                    },
+                })
+
+        # Add the text prompt at the end
+        message_content.append({
+            "type": "text",
+            "text": prompt
+        })
+
+        entry, _ = await self._cached(
+            use_cache,
+            lambda: self._send_vision(message_content, system_prompt),
+            kind="vision",
+            max_tokens=VISION_MAX_TOKENS,
+            prompt=prompt,
+            system=system_prompt,
+            images=[
+                (block["source"]["media_type"], image_digest(block["source"]["data"]))
+                for block in message_content if block["type"] == "image"
+            ],
+        )
+        return entry["text"].strip()
 
+    async def _send_vision(
+        self,
+        message_content: list,
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Call the API with image + text content blocks; returns {"text", "usage"}"""
+        # Vision queries require direct Anthropic SDK
+        try:
+            import anthropic  # noqa: F401 - availability check
         except ImportError:
             raise ImportError(
                 "anthropic SDK is required for vision queries. "
                 "Install with: pip install anthropic"
             )
 
+        api_key = get_api_key("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError(
+                "ANTHROPIC_API_KEY not set (check keychain or env). "
+                "Vision queries require the Anthropic SDK."
+            )
+
+        # Create message with vision
+        create_kwargs = {
+            "model": MODEL,  # Supports vision
+            "max_tokens": VISION_MAX_TOKENS,
+            "messages": [{"role": "user", "content": message_content}],
+        }
+        # Only add system if provided (API doesn't accept None)
+        if system_prompt:
+            create_kwargs["system"] = system_prompt
+
+        result = await get_claude_pool().create_message(api_key, **create_kwargs)
+
+        if self.debug:
+            print(f"[DEBUG] Received vision response ({len(result['text'])} chars)")
+
+        return result
+
     def _extract_text_from_message(self, message) -> str:
         """Extract text content from Claude SDK message objects"""
         
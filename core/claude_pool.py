@@ -0,0 +1,213 @@
+"""
+Shared async Anthropic client for ClaudeClient.
+
+Every ClaudeClient used to build a synchronous `anthropic.Anthropic` client
+per query and call `messages.create` inside an async method, blocking the
+event loop for the whole generation (so "parallel" pilots ran one at a
+time on the Claude side) and opening a new connection each time.
+ClaudeAPIPool instead keeps, per event loop:
+
+- one `AsyncAnthropic` client, whose keep-alive connection pool is reused
+  across agents and queries,
+- a semaphore limiting how many Claude requests run at once across all
+  clients (`CLAUDE_MAX_CONCURRENCY`, default 8).
+
+Responses are streamed and accumulated, which keeps long generations from
+hitting read timeouts. Rate limits (429), overload (529), 5xx errors and
+dropped connections are retried with exponential backoff, honouring the
+server's `retry-after` header when present.
+
+Each loop's clients are closed when the loop shuts down (`asyncio.run`
+calls `loop.shutdown_asyncgens()`, which finalizes the keeper generator
+registered below, as in core.providers.http), so CLI runs release their
+connections too. `close_claude_clients()` closes them explicitly (the API
+server calls it on shutdown).
+"""
+
+import asyncio
+import os
+import random
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+
+@dataclass
+class ClaudePoolConfig:
+    """Concurrency and retry settings for Claude API requests"""
+    max_concurrency: int = 8  # Requests in flight at once (per event loop)
+    max_retries: int = 5
+    base_delay: float = 1.0  # Seconds before the first retry; doubles each time
+    max_delay: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> 'ClaudePoolConfig':
+        """Create config from environment variables"""
+        return cls(
+            max_concurrency=int(os.environ.get("CLAUDE_MAX_CONCURRENCY", 8)),
+            max_retries=int(os.environ.get("CLAUDE_MAX_RETRIES", 5)),
+        )
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Whether a failed request is worth retrying (rate limit, overload, network)"""
+    import anthropic
+
+    if isinstance(error, (anthropic.RateLimitError, anthropic.APIConnectionError)):
+        return True  # APITimeoutError is an APIConnectionError
+    if isinstance(error, anthropic.APIStatusError):
+        return error.status_code == 529 or error.status_code >= 500
+    return False
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds the server asked us to wait, if it said"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("retry-after")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class ClaudeAPIPool:
+    """Per-event-loop AsyncAnthropic clients and concurrency limits"""
+
+    def __init__(self, config: Optional[ClaudePoolConfig] = None):
+        self.config = config or ClaudePoolConfig.from_env()
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._keepers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.retries = 0
+
+    async def _keep_until_loop_shutdown(self):
+        """Async generator whose finalizer closes this loop's clients"""
+        try:
+            yield
+        finally:
+            await self.aclose()
+
+    async def _register_loop(self, loop: asyncio.AbstractEventLoop):
+        if loop not in self._keepers:
+            keeper = self._keep_until_loop_shutdown()
+            await keeper.__anext__()  # Now tracked by the loop's shutdown_asyncgens()
+            self._keepers[loop] = keeper
+
+    async def client(self, api_key: str):
+        """Shared AsyncAnthropic client for the running loop"""
+        import anthropic
+
+        loop = asyncio.get_running_loop()
+        clients = self._clients.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None or client.is_closed():
+            client = anthropic.AsyncAnthropic(
+                api_key=api_key,
+                max_retries=0,  # Retried here, outside the concurrency slot
+            )
+            clients[api_key] = client
+            await self._register_loop(loop)
+        return client
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the running loop's concurrent request slots"""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.config.max_concurrency)
+            self._semaphores[loop] = semaphore
+        async with semaphore:
+            yield
+
+    async def create_message(
+        self,
+        api_key: str,
+        on_text: Optional[Callable[[str], None]] = None,
+        **create_kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        Stream a message and return its accumulated text and token usage.
+
+        Args:
+            api_key: Anthropic API key
+            on_text: Optional callback for each streamed text fragment
+            **create_kwargs: Arguments for `messages.stream` (model, max_tokens, messages, system)
+
+        Returns:
+            {"text": str, "usage": {"input_tokens", "output_tokens", "total_tokens"}}
+        """
+        client = await self.client(api_key)
+        attempt = 0
+
+        while True:
+            try:
+                async with self.slot():
+                    parts = []
+                    async with client.messages.stream(**create_kwargs) as stream:
+                        async for text in stream.text_stream:
+                            parts.append(text)
+                            if on_text:
+                                on_text(text)
+                        message = await stream.get_final_message()
+                break
+            except Exception as e:
+                if attempt >= self.config.max_retries or not _is_retryable(e):
+                    raise
+                delay = _retry_after(e)
+                if delay is None:
+                    delay = self.config.base_delay * (2 ** attempt) * random.uniform(0.8, 1.2)
+                attempt += 1
+                self.retries += 1
+                await asyncio.sleep(min(delay, self.config.max_delay))
+
+        usage = None
+        if getattr(message, "usage", None) is not None:
+            usage = {
+                'input_tokens': message.usage.input_tokens,
+                'output_tokens': message.usage.output_tokens,
+                'total_tokens': message.usage.input_tokens + message.usage.output_tokens,
+            }
+        return {"text": "".join(parts), "usage": usage}
+
+    async def aclose(self):
+        """Close the running loop's clients (they are recreated on next use)"""
+        clients = self._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.close()
+
+
+_pool: Optional[ClaudeAPIPool] = None
+
+
+def get_claude_pool() -> ClaudeAPIPool:
+    """Get the process-wide pool (created on first use)"""
+    global _pool
+    if _pool is None:
+        _pool = ClaudeAPIPool()
+    return _pool
+
+
+def configure_claude(config: ClaudePoolConfig) -> ClaudeAPIPool:
+    """
+    Replace the process-wide pool with one using new limits.
+
+    Requests already waiting on the old pool's semaphore keep its limit.
+    """
+    global _pool
+    _pool = ClaudeAPIPool(config)
+    return _pool
+
+
+async def close_claude_clients():
+    """Close the shared Anthropic clients of the running loop"""
+    if _pool is not None:
+        await _pool.aclose()
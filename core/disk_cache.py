@@ -0,0 +1,143 @@
+"""
+Shared storage for the on-disk artifact caches (renders, QA results, Claude
+responses, TTS audio).
+
+Each cache keeps its entries as small groups of files sharing a name stem:
+    <cache_dir>/<shard>/<stem>.<suffix>
+written to a temp file and renamed into place. DiskCache lists those
+entries, evicts the least recently used ones and reports stats, so each
+cache only defines its keys and file format.
+
+Listing entries stats every file in the cache, so puts don't evict on every
+call: eviction runs on a cache object's first put and then every
+EVICT_EVERY puts. Between runs a cache can exceed its limit by that many
+entries.
+"""
+
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+EVICT_EVERY = 100
+
+
+class CacheEntry(NamedTuple):
+    """One cache entry: its files, their total size and newest mtime"""
+    files: List[Path]
+    size: int
+    mtime: float
+
+
+class DiskCache:
+    """
+    Directory of cache entries with hit/miss counters and LRU eviction.
+
+    Safe to share between threads and between processes using the same
+    directory. Subclasses implement evict() and usually stats().
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = Path(cache_dir)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._puts = 0
+
+    def _count(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _stored(self):
+        """Call after each put; evicts on the first put and every EVICT_EVERY after"""
+        with self._lock:
+            self._puts += 1
+            evict_now = (self._puts - 1) % EVICT_EVERY == 0
+        if evict_now:
+            self.evict()
+
+    def _entries(self) -> List[CacheEntry]:
+        """All complete entries (temp files excluded), grouped by name stem"""
+        if not self.cache_dir.exists():
+            return []
+        groups: Dict[Tuple[Path, str], List[Path]] = {}
+        for path in self.cache_dir.glob("*/*"):
+            if path.suffix != ".tmp":
+                groups.setdefault((path.parent, path.stem), []).append(path)
+
+        entries = []
+        for files in groups.values():
+            try:
+                stats = [path.stat() for path in files]
+            except OSError:
+                continue  # Removed meanwhile
+            entries.append(CacheEntry(
+                files,
+                sum(s.st_size for s in stats),
+                max(s.st_mtime for s in stats),
+            ))
+        return entries
+
+    def _remove(self, entry: CacheEntry):
+        for path in entry.files:
+            path.unlink(missing_ok=True)
+
+    def _evict_lru(self, entries: List[CacheEntry], fits: Callable[[int, int], bool]) -> int:
+        """
+        Remove entries, oldest first, until fits(total_size, count) holds.
+
+        Returns:
+            Number of entries removed
+        """
+        total = sum(entry.size for entry in entries)
+        count = len(entries)
+        removed = 0
+        for entry in sorted(entries, key=lambda e: e.mtime):
+            if fits(total, count):
+                break
+            self._remove(entry)
+            total -= entry.size
+            count -= 1
+            removed += 1
+        return removed
+
+    def evict(self) -> int:
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, total size and hit/miss counters."""
+        entries = self._entries()
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len(entries),
+            "size_bytes": sum(entry.size for entry in entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+class SizeBoundedCache(DiskCache):
+    """DiskCache that evicts least recently used entries above a total size"""
+
+    def __init__(self, cache_dir: str, max_size_bytes: int):
+        super().__init__(cache_dir)
+        self.max_size_bytes = max_size_bytes
+
+    def evict(self, max_size_bytes: Optional[int] = None) -> int:
+        """
+        Remove least recently used entries until the cache fits its limit.
+
+        Args:
+            max_size_bytes: Override the configured limit (e.g. 0 to clear)
+
+        Returns:
+            Number of entries removed
+        """
+        limit = self.max_size_bytes if max_size_bytes is None else max_size_bytes
+        return self._evict_lru(self._entries(), lambda size, _: size <= limit)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, total size and hit/miss counters."""
+        return {**super().stats(), "max_size_bytes": self.max_size_bytes}
@@ -0,0 +1,433 @@
+"""
+Media probing with a persistent metadata cache.
+
+Durations used to be probed all over the place: the renderer spawned
+ffprobe for every clip on every render, QA ran its own ffprobe, and the
+assembly and mixing helpers built a new FFmpegRenderer per call just to ask
+for one duration. MediaProbe replaces them with one service:
+
+- a single `ffprobe -show_format -show_streams` JSON call per file yields
+  duration, container, video codec/resolution/fps/pixel format and audio
+  codec/sample rate/channel layout (MediaInfo),
+- results are cached by (path, size, mtime), in memory for the process and
+  as small JSON entries on disk, so reruns and `resume` don't probe
+  unchanged files again:
+    artifacts/cache/probe/<key[:2]>/<key>.json
+- concurrent probes of the same file share one ffprobe process, and
+  `probe_many` probes a batch of files concurrently (bounded by
+  `max_concurrency`).
+
+Files that can't be probed (missing, still being written, no ffprobe) are
+not cached.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import weakref
+from dataclasses import asdict, dataclass, fields
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# Bump when MediaInfo gains fields or parsing changes
+PROBE_CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = "artifacts/cache/probe"
+DEFAULT_MAX_ENTRIES = 20000
+DEFAULT_MAX_CONCURRENCY = 8
+PROBE_TIMEOUT = 30.0
+
+PathLike = Union[str, Path]
+StatKey = Tuple[str, int, int]
+
+
+@dataclass
+class MediaInfo:
+    """Stream metadata of a media file"""
+    path: str
+    duration: Optional[float] = None  # Seconds
+    format_name: Optional[str] = None  # Container, e.g. "mov,mp4,m4a,3gp,3g2,mj2"
+    video_codec: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    fps: Optional[float] = None
+    pix_fmt: Optional[str] = None
+    time_base: Optional[str] = None  # Video stream timebase, e.g. "1/15360"
+    sample_aspect_ratio: Optional[str] = None
+    audio_codec: Optional[str] = None
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    channel_layout: Optional[str] = None
+
+    @property
+    def has_video(self) -> bool:
+        return self.video_codec is not None
+
+    @property
+    def has_audio(self) -> bool:
+        return self.audio_codec is not None
+
+    @property
+    def resolution(self) -> Optional[Tuple[int, int]]:
+        if self.width is None or self.height is None:
+            return None
+        return self.width, self.height
+
+    @classmethod
+    def from_ffprobe(cls, path: str, data: Dict[str, Any]) -> 'MediaInfo':
+        """Build from `ffprobe -print_format json -show_format -show_streams` output"""
+        fmt = data.get("format", {})
+        streams = data.get("streams", [])
+        # Cover art in audio files shows up as a single-frame video stream
+        video = next(
+            (s for s in streams
+             if s.get("codec_type") == "video"
+             and not s.get("disposition", {}).get("attached_pic")),
+            None,
+        )
+        audio = next((s for s in streams if s.get("codec_type") == "audio"), None)
+
+        duration = _to_float(fmt.get("duration"))
+        if duration is None:
+            stream_durations = [_to_float(s.get("duration")) for s in streams]
+            duration = max((d for d in stream_durations if d is not None), default=None)
+
+        info = cls(path=path, duration=duration, format_name=fmt.get("format_name"))
+        if video is not None:
+            info.video_codec = video.get("codec_name")
+            info.width = video.get("width")
+            info.height = video.get("height")
+            info.fps = _frame_rate(video.get("avg_frame_rate")) or _frame_rate(video.get("r_frame_rate"))
+            info.pix_fmt = video.get("pix_fmt")
+            info.time_base = video.get("time_base")
+            info.sample_aspect_ratio = video.get("sample_aspect_ratio")
+        if audio is not None:
+            info.audio_codec = audio.get("codec_name")
+            info.sample_rate = int(audio["sample_rate"]) if audio.get("sample_rate") else None
+            info.channels = audio.get("channels")
+            info.channel_layout = audio.get("channel_layout")
+        return info
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'MediaInfo':
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _frame_rate(value: Optional[str]) -> Optional[float]:
+    """ffprobe rate string ("30000/1001") as a float, None for "0/0" or missing"""
+    try:
+        rate = Fraction(value)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+    return float(rate) if rate > 0 else None
+
+
+def find_ffprobe(ffmpeg_path: Optional[str] = None) -> Optional[str]:
+    """Find FFprobe executable (on PATH or next to FFmpeg)."""
+    ffprobe = shutil.which("ffprobe")
+    if ffprobe:
+        return ffprobe
+
+    ffmpeg_path = ffmpeg_path or shutil.which("ffmpeg")
+    if ffmpeg_path:
+        ffmpeg_dir = os.path.dirname(ffmpeg_path)
+        for name in ("ffprobe", "ffprobe.exe"):
+            candidate = os.path.join(ffmpeg_dir, name)
+            if os.path.exists(candidate):
+                return candidate
+
+    return None
+
+
+def ffprobe_command(ffprobe: str, path: str) -> List[str]:
+    """ffprobe invocation returning format and stream metadata as JSON"""
+    return [
+        ffprobe,
+        "-v", "error",
+        "-print_format", "json",
+        "-show_format",
+        "-show_streams",
+        path,
+    ]
+
+
+class MediaProbe:
+    """
+    Cached ffprobe metadata lookups.
+
+    Safe to share between threads and event loops, and between processes
+    using the same cache directory (entries are written to a temp file and
+    renamed into place).
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        ffprobe_path: Optional[str] = None,
+    ):
+        """
+        Initialize the probe.
+
+        Args:
+            cache_dir: Directory for persisted results (None = memory only)
+            max_entries: Evict least recently used entries above this count
+            max_concurrency: ffprobe processes running at once (per event loop)
+            ffprobe_path: FFprobe executable (found on first use if not given)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self.max_concurrency = max_concurrency
+        self.ffprobe_path = ffprobe_path
+        self.hits = 0
+        self.misses = 0
+        self._memory: Dict[StatKey, MediaInfo] = {}
+        self._lock = threading.Lock()
+        self._puts = 0
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[StatKey, asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def _stat_key(path: PathLike) -> Optional[StatKey]:
+        abs_path = os.path.abspath(path)
+        try:
+            stat = os.stat(abs_path)
+        except OSError:
+            return None
+        return abs_path, stat.st_size, stat.st_mtime_ns
+
+    def _entry_path(self, stat_key: StatKey) -> Path:
+        payload = json.dumps([PROBE_CACHE_VERSION, *stat_key])
+        key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _lookup(self, stat_key: StatKey) -> Optional[MediaInfo]:
+        """Memory, then disk; counts a hit or a miss"""
+        with self._lock:
+            info = self._memory.get(stat_key)
+
+        if info is None and self.cache_dir is not None:
+            entry = self._entry_path(stat_key)
+            try:
+                with open(entry, "r") as f:
+                    info = MediaInfo.from_dict(json.load(f))
+                os.utime(entry)
+            except (OSError, ValueError, TypeError):
+                info = None
+
+        with self._lock:
+            if info is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._memory[stat_key] = info
+        return info
+
+    def _store(self, stat_key: StatKey, info: MediaInfo):
+        with self._lock:
+            self._memory[stat_key] = info
+            self._puts += 1
+            evict_now = self._puts % 100 == 0
+        if self.cache_dir is None:
+            return
+
+        entry = self._entry_path(stat_key)
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        except OSError:
+            return  # Read-only or full disk: the memory cache still works
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(asdict(info), f)
+            os.replace(tmp_path, entry)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        if evict_now:
+            self.evict()
+
+    def _parse(self, stat_key: StatKey, returncode: int, stdout: bytes) -> Optional[MediaInfo]:
+        if returncode != 0:
+            return None
+        try:
+            info = MediaInfo.from_ffprobe(stat_key[0], json.loads(stdout))
+        except (ValueError, TypeError, AttributeError):
+            return None
+        # A file still being written can change under ffprobe; only cache
+        # results for the version of the file that was actually probed
+        if self._stat_key(stat_key[0]) == stat_key:
+            self._store(stat_key, info)
+        return info
+
+    def _ffprobe(self) -> Optional[str]:
+        if self.ffprobe_path is None:
+            self.ffprobe_path = find_ffprobe()
+        return self.ffprobe_path
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _run(self, stat_key: StatKey) -> Optional[MediaInfo]:
+        ffprobe = self._ffprobe()
+        if not ffprobe:
+            return None
+
+        async with self._semaphore():
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *ffprobe_command(ffprobe, stat_key[0]),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            except OSError:
+                return None
+            try:
+                stdout, _ = await asyncio.wait_for(process.communicate(), PROBE_TIMEOUT)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return None
+
+        return self._parse(stat_key, process.returncode, stdout)
+
+    async def probe(self, path: PathLike) -> Optional[MediaInfo]:
+        """
+        Metadata of a media file.
+
+        Returns:
+            MediaInfo, or None if the file is missing or ffprobe fails
+        """
+        stat_key = self._stat_key(path)
+        if stat_key is None:
+            return None
+        info = self._lookup(stat_key)
+        if info is not None:
+            return info
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.setdefault(loop, {})
+        task = inflight.get(stat_key)
+        if task is None:
+            task = loop.create_task(self._run(stat_key))
+            inflight[stat_key] = task
+            task.add_done_callback(lambda _: inflight.pop(stat_key, None))
+        # Shielded, so one cancelled caller doesn't fail the others waiting
+        return await asyncio.shield(task)
+
+    async def probe_many(self, paths: Iterable[PathLike]) -> List[Optional[MediaInfo]]:
+        """Probe files concurrently; results are in input order"""
+        return list(await asyncio.gather(*(self.probe(path) for path in paths)))
+
+    async def duration(self, path: PathLike) -> Optional[float]:
+        """Duration in seconds, or None if unknown"""
+        info = await self.probe(path)
+        return info.duration if info else None
+
+    def probe_sync(self, path: PathLike) -> Optional[MediaInfo]:
+        """Blocking probe() for synchronous callers"""
+        stat_key = self._stat_key(path)
+        if stat_key is None:
+            return None
+        info = self._lookup(stat_key)
+        if info is not None:
+            return info
+
+        ffprobe = self._ffprobe()
+        if not ffprobe:
+            return None
+        try:
+            result = subprocess.run(
+                ffprobe_command(ffprobe, stat_key[0]),
+                capture_output=True, timeout=PROBE_TIMEOUT
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        return self._parse(stat_key, result.returncode, result.stdout)
+
+    def duration_sync(self, path: PathLike) -> Optional[float]:
+        """Blocking duration() for synchronous callers"""
+        info = self.probe_sync(path)
+        return info.duration if info else None
+
+    def _entries(self) -> List[Tuple[Path, float]]:
+        """All persisted entries as (path, mtime)."""
+        if self.cache_dir is None or not self.cache_dir.exists():
+            return []
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                entries.append((path, path.stat().st_mtime))
+            except OSError:
+                continue
+        return entries
+
+    def evict(self, max_entries: Optional[int] = None) -> int:
+        """
+        Remove least recently used persisted entries above the limit.
+
+        Args:
+            max_entries: Override the configured limit (0 also clears memory)
+
+        Returns:
+            Number of entries removed
+        """
+        limit = self.max_entries if max_entries is None else max_entries
+        if limit == 0:
+            with self._lock:
+                self._memory.clear()
+
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        removed = 0
+        for path, _ in entries[:max(0, len(entries) - limit)]:
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and hit/miss counters."""
+        return {
+            "cache_dir": str(self.cache_dir) if self.cache_dir else None,
+            "entries": len(self._entries()),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_probe: Optional[MediaProbe] = None
+
+
+def get_media_probe() -> MediaProbe:
+    """Get the process-wide probe (created on first use)"""
+    global _probe
+    if _probe is None:
+        _probe = MediaProbe(
+            max_concurrency=int(os.environ.get("MEDIA_PROBE_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+        )
+    return _probe
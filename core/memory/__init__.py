@@ -14,6 +14,7 @@ from core.memory.namespace import (
 )
 from core.memory.backends.base import MemoryBackend, MemoryRecord, RetrievalResult
 from core.memory.backends.local import LocalMemoryBackend
+from core.memory.backends.sqlite import SqliteMemoryBackend
 from core.memory.multi_tenant_manager import (
     MultiTenantMemoryManager,
     MultiTenantConfig,
@@ -44,6 +45,7 @@ __all__ = [
     "MemoryRecord",
     "RetrievalResult",
     "LocalMemoryBackend",
+    "SqliteMemoryBackend",
     # Multi-tenant manager
     "MultiTenantMemoryManager",
     "MultiTenantConfig",
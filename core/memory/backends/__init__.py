@@ -2,11 +2,14 @@
 
 from core.memory.backends.base import MemoryBackend, MemoryRecord
 from core.memory.backends.local import LocalMemoryBackend
+from core.memory.backends.sqlite import SqliteMemoryBackend, copy_records
 
 __all__ = [
     "MemoryBackend",
     "MemoryRecord",
     "LocalMemoryBackend",
+    "SqliteMemoryBackend",
+    "copy_records",
 ]
 
 # AgentCore backend will be imported conditionally when AWS dependencies are available
@@ -104,6 +104,7 @@ class MemoryBackend(ABC):
 
     Implementations:
     - LocalMemoryBackend: JSON file storage for development
+    - SqliteMemoryBackend: SQLite database shared by concurrent processes
     - AgentCoreMemoryBackend: AWS AgentCore Memory for production
     """
 
@@ -308,3 +309,12 @@ class MemoryBackend(ABC):
         record.updated_at = datetime.utcnow()
         await self.update(record)
         return record
+
+    async def flush(self):
+        """
+        Persist any buffered writes.
+
+        No-op for backends that write through; LocalMemoryBackend batches
+        writes and overrides this.
+        """
+        pass
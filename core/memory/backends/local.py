@@ -11,17 +11,254 @@ This allows:
 - Easy migration to AgentCore
 - File-based inspection during development
 - Git-trackable platform learnings (seed data)
+
+Namespaces are cached in memory after the first read and revalidated
+against the file's inode/mtime/size, so reads only touch disk when another
+process changed the file. Writes are batched: a namespace is marked dirty
+and written back once after `flush_delay` seconds (atomically, via a temp
+file and rename), or immediately on `flush()`. If another process rewrote
+the file in the meantime, the pending changes are merged into its records
+rather than overwriting them.
+
+With `storage_format="journal"` each namespace instead gets an append-only
+JSONL journal next to its JSON snapshot:
+    artifacts/memory/platform/learnings/global.json   (snapshot)
+    artifacts/memory/platform/learnings/global.jsonl  (ops since snapshot)
+Every create/update/delete appends one line, and the journal is periodically
+compacted into the snapshot. Both formats are read the same way (snapshot,
+then journal replay), so either backend can read files written by the other.
+
+With `search_mode="semantic"`, search ranks by cosine similarity of local
+embeddings (see core.memory.vector_index) instead of BM25 keyword scores.
+Vectors are stored next to each namespace file, so semantic search works
+fully offline.
 """
 
 import json
 import asyncio
+import os
+import uuid
+import weakref
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 import re
 
+import numpy as np
+
 from core.memory.backends.base import MemoryBackend, MemoryRecord, RetrievalResult
 from core.memory.namespace import MultiTenantNamespaceBuilder
+from core.memory.search_index import InvertedIndex, collection_stats, tokenize, top_k as select_top_k
+from core.memory.vector_index import HashingEmbedder, VectorIndex
+
+
+@dataclass
+class _NamespaceCache:
+    """In-memory copy of one namespace file"""
+    path: Path
+    records: List[MemoryRecord]
+    index: Dict[str, MemoryRecord]  # record_id -> record
+    signature: Optional[Tuple[int, int, int]]  # File (inode, mtime_ns, size) when last read/written
+    dirty: bool = False
+    # Changes not yet written back: record_id -> record (None = deleted)
+    pending: Dict[str, Optional[MemoryRecord]] = field(default_factory=dict)
+
+    # Journal state: signature and byte offset of the journal as last replayed
+    journal_signature: Optional[Tuple[int, int, int]] = None
+    journal_offset: int = 0
+    journal_ops: int = 0  # Ops appended since the last snapshot
+
+    # Built on first search, then kept in step with every mutation
+    search_index: Optional[InvertedIndex] = None
+    vector_index: Optional[VectorIndex] = None
+
+    @property
+    def journal_path(self) -> Path:
+        return self.path.with_suffix(".jsonl")
+
+    def reindex(self, record: MemoryRecord):
+        if self.search_index is not None:
+            self.search_index.add(record)
+        if self.vector_index is not None:
+            self.vector_index.upsert(record)
+
+    def unindex(self, record_id: str):
+        if self.search_index is not None:
+            self.search_index.remove(record_id)
+        if self.vector_index is not None:
+            self.vector_index.remove(record_id)
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int, int]]:
+    """(inode, mtime_ns, size) of a file, or None if it doesn't exist"""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _read_records(file_path: Path) -> List[MemoryRecord]:
+    """Parse all records from a namespace file"""
+    if not file_path.exists():
+        return []
+
+    try:
+        with open(file_path, 'r') as f:
+            data = json.load(f)
+
+        if isinstance(data, list):
+            return [MemoryRecord.from_dict(d) for d in data]
+        elif isinstance(data, dict) and "records" in data:
+            return [MemoryRecord.from_dict(d) for d in data["records"]]
+        else:
+            # Legacy format - single record
+            return [MemoryRecord.from_dict(data)]
+    except (json.JSONDecodeError, KeyError) as e:
+        print(f"Warning: Error loading {file_path}: {e}")
+        return []
+
+
+def _merge_from_disk(entry: _NamespaceCache, signature: Optional[Tuple[int, int, int]]):
+    """Re-read a file another process rewrote and re-apply our unwritten changes on top"""
+    merged = {r.record_id: r for r in _read_records(entry.path)}
+    for record_id, record in entry.pending.items():
+        if record is None:
+            merged.pop(record_id, None)
+        else:
+            merged[record_id] = record
+
+    for record_id in entry.index.keys() - merged.keys():
+        entry.unindex(record_id)
+    for record in merged.values():
+        if entry.index.get(record.record_id) is not record:
+            entry.reindex(record)
+
+    entry.records = list(merged.values())
+    entry.index = merged
+    entry.signature = signature
+
+
+def _write_namespace_file(namespace: str, entry: _NamespaceCache):
+    """Atomically write a namespace file (temp file + rename) and mark it clean"""
+    entry.path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Don't overwrite records another process wrote since we last read the file
+    signature = _file_signature(entry.path)
+    if entry.dirty and signature != entry.signature:
+        _merge_from_disk(entry, signature)
+
+    data = {
+        "namespace": namespace,
+        "updated_at": datetime.utcnow().isoformat(),
+        "record_count": len(entry.records),
+        "records": [r.to_dict() for r in entry.records]
+    }
+
+    tmp_path = entry.path.with_name(f".{entry.path.name}.{uuid.uuid4().hex[:8]}.tmp")
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+        os.replace(tmp_path, entry.path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    # The snapshot now holds everything the journal recorded. Replaying a
+    # journal left behind by a crash at this point is harmless (ops are
+    # idempotent upserts/deletes), but it would be wasted work.
+    if entry.journal_path.exists():
+        entry.journal_path.unlink()
+
+    entry.signature = _file_signature(entry.path)
+    entry.dirty = False
+    entry.pending.clear()
+    entry.journal_signature = None
+    entry.journal_offset = 0
+    entry.journal_ops = 0
+
+    _persist_vectors(entry)
+
+
+def _persist_vectors(entry: _NamespaceCache):
+    """Write embeddings made since the vector files were read (write path only)"""
+    if entry.vector_index is not None:
+        try:
+            entry.vector_index.persist()
+        except OSError as e:
+            print(f"Warning: Error writing {entry.vector_index.vectors_path}: {e}")
+
+
+def _put_record(entry: _NamespaceCache, record: MemoryRecord):
+    """Insert a record as-is, replacing any cached record with the same ID"""
+    existing = entry.index.get(record.record_id)
+    if existing is None:
+        entry.records.append(record)
+    else:
+        for i, r in enumerate(entry.records):
+            if r is existing:
+                entry.records[i] = record
+                break
+    entry.index[record.record_id] = record
+    entry.reindex(record)
+
+
+def _apply_journal_op(entry: _NamespaceCache, op: Dict[str, Any]):
+    """Apply one journal op to a cached namespace (idempotent)"""
+    kind = op.get("op")
+
+    if kind in ("create", "update"):
+        _put_record(entry, MemoryRecord.from_dict(op["record"]))
+
+    elif kind == "delete":
+        record_id = op.get("record_id")
+        if entry.index.pop(record_id, None) is not None:
+            entry.records = [r for r in entry.records if r.record_id != record_id]
+            entry.unindex(record_id)
+
+
+def _replay_journal(entry: _NamespaceCache, start: int = 0) -> int:
+    """
+    Apply journal ops from byte offset `start` onward.
+
+    A trailing line without a newline (an append in progress, or one torn
+    by a crash) is left for later; unparseable complete lines are skipped.
+
+    Returns:
+        Offset just past the last complete line
+    """
+    try:
+        with open(entry.journal_path, 'rb') as f:
+            f.seek(start)
+            data = f.read()
+    except FileNotFoundError:
+        return start
+
+    complete = data.rfind(b"\n") + 1
+    for line in data[:complete].splitlines():
+        if not line.strip():
+            continue
+        try:
+            _apply_journal_op(entry, json.loads(line))
+            entry.journal_ops += 1
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            print(f"Warning: Skipping bad journal line in {entry.journal_path}: {e}")
+
+    return start + complete
+
+
+def _flush_dirty(base_path: Path, cache: Dict[str, _NamespaceCache]):
+    """Write any unflushed namespaces (runs when the backend is collected or at exit)"""
+    if not base_path.exists():
+        # The store itself was removed; don't recreate it
+        return
+    for namespace, entry in list(cache.items()):
+        if entry.dirty:
+            try:
+                _write_namespace_file(namespace, entry)
+            except OSError as e:
+                print(f"Warning: Error writing {entry.path}: {e}")
 
 
 class LocalMemoryBackend(MemoryBackend):
@@ -30,19 +267,63 @@ class LocalMemoryBackend(MemoryBackend):
 
     Stores each namespace as a JSON file containing an array of records.
     Thread-safe via asyncio locks.
+
+    Records are served from an in-memory cache indexed by record_id, and
+    writes are batched into one atomic file write per namespace. Returned
+    records are the cached objects; persist changes with update().
     """
 
-    def __init__(self, base_path: str = "artifacts/memory"):
+    STORAGE_FORMATS = ("json", "journal")
+    SEARCH_MODES = ("bm25", "semantic")
+
+    def __init__(
+        self,
+        base_path: str = "artifacts/memory",
+        flush_delay: float = 0.5,
+        storage_format: str = "json",
+        compact_threshold: int = 500,
+        search_mode: str = "bm25",
+        embedder: Optional[Any] = None,
+    ):
         """
         Initialize local backend.
 
         Args:
             base_path: Base directory for memory files
+            flush_delay: Seconds to batch writes before writing a namespace
+                back to disk (0 = write through on every change). JSON format only.
+            storage_format: "json" (rewrite one file per namespace) or
+                "journal" (append-only JSONL journal plus snapshot)
+            compact_threshold: Journal ops after which a namespace is
+                compacted into its snapshot
+            search_mode: "bm25" (keyword ranking) or "semantic" (cosine
+                similarity of local embeddings)
+            embedder: Embedder for semantic search (default: HashingEmbedder)
         """
+        if storage_format not in self.STORAGE_FORMATS:
+            raise ValueError(
+                f"Unknown storage format '{storage_format}'. "
+                f"Available: {', '.join(self.STORAGE_FORMATS)}"
+            )
+        if search_mode not in self.SEARCH_MODES:
+            raise ValueError(
+                f"Unknown search mode '{search_mode}'. "
+                f"Available: {', '.join(self.SEARCH_MODES)}"
+            )
+
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.flush_delay = flush_delay
+        self.storage_format = storage_format
+        self.compact_threshold = compact_threshold
+        self.search_mode = search_mode
+        self.embedder = embedder or HashingEmbedder()
         self._locks: Dict[str, asyncio.Lock] = {}
-        self._cache: Dict[str, List[MemoryRecord]] = {}
+        self._cache: Dict[str, _NamespaceCache] = {}
+        self._flush_handles: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.TimerHandle]] = {}
+
+        # Pending writes still reach disk if flush() is never called
+        self._finalizer = weakref.finalize(self, _flush_dirty, self.base_path, self._cache)
 
     def _get_lock(self, namespace: str) -> asyncio.Lock:
         """Get or create a lock for a namespace"""
@@ -56,101 +337,243 @@ class LocalMemoryBackend(MemoryBackend):
         path_str = namespace.strip("/")
         return self.base_path / f"{path_str}.json"
 
-    async def _load_namespace(self, namespace: str) -> List[MemoryRecord]:
-        """Load all records from a namespace file"""
+    def _read_namespace_file(self, file_path: Path) -> List[MemoryRecord]:
+        """Parse all records from a namespace file"""
+        return _read_records(file_path)
+
+    async def _load_entry(self, namespace: str) -> _NamespaceCache:
+        """
+        Get the cached namespace, re-reading the file only if it changed.
+
+        Unflushed local changes are merged over the file on disk if another
+        process rewrote it meanwhile.
+        """
         file_path = self._namespace_to_path(namespace)
+        entry = self._cache.get(namespace)
+        signature = _file_signature(file_path)
+        journal_signature = _file_signature(file_path.with_suffix(".jsonl"))
+
+        if entry is not None and entry.dirty and entry.signature != signature:
+            _merge_from_disk(entry, signature)
+
+        if entry is not None and entry.signature == signature:
+            if entry.journal_signature == journal_signature:
+                return entry
+
+            # Same journal, grown since we last read it: replay just the tail
+            same_journal = (
+                journal_signature is not None
+                and (
+                    (entry.journal_signature is None and entry.journal_offset == 0)
+                    or (
+                        entry.journal_signature is not None
+                        and entry.journal_signature[0] == journal_signature[0]
+                    )
+                )
+                and journal_signature[2] >= entry.journal_offset
+            )
+            if same_journal:
+                entry.journal_offset = _replay_journal(entry, entry.journal_offset)
+                entry.journal_signature = journal_signature
+                return entry
+
+        records = self._read_namespace_file(file_path)
+        entry = _NamespaceCache(
+            path=file_path,
+            records=records,
+            index={r.record_id: r for r in records},
+            signature=signature,
+        )
+        if journal_signature is not None:
+            entry.journal_offset = _replay_journal(entry)
+            entry.journal_signature = journal_signature
+        self._cache[namespace] = entry
+        return entry
 
-        if not file_path.exists():
-            return []
+    async def _load_namespace(self, namespace: str) -> List[MemoryRecord]:
+        """Load all records from a namespace (served from cache)"""
+        return (await self._load_entry(namespace)).records
+
+    def _mark_dirty(self, namespace: str, entry: _NamespaceCache):
+        """Queue a namespace for write-back, batching writes within flush_delay"""
+        entry.dirty = True
+
+        if self.flush_delay <= 0:
+            _write_namespace_file(namespace, entry)
+            return
+
+        loop = asyncio.get_running_loop()
+        pending = self._flush_handles.get(namespace)
+        if pending is not None and pending[0] is loop:
+            return  # Already scheduled; this change rides along
 
+        handle = loop.call_later(
+            self.flush_delay,
+            lambda: asyncio.ensure_future(self.flush(namespace))
+        )
+        self._flush_handles[namespace] = (loop, handle)
+
+    def _append_journal(
+        self,
+        entry: _NamespaceCache,
+        op: str,
+        record: Optional[MemoryRecord] = None,
+        record_id: Optional[str] = None,
+    ):
+        """Append one op to a namespace journal (a single O_APPEND write)"""
+        line: Dict[str, Any] = {"op": op, "ts": datetime.utcnow().isoformat()}
+        if record is not None:
+            line["record"] = record.to_dict()
+        else:
+            line["record_id"] = record_id
+        data = (json.dumps(line, default=str) + "\n").encode("utf-8")
+
+        journal_path = entry.journal_path
+        journal_path.parent.mkdir(parents=True, exist_ok=True)
+
+        before = _file_signature(journal_path)
+        if before is not None and before[2] > 0:
+            # Start on a fresh line if a crash left a partial op behind
+            with open(journal_path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+
+        fd = os.open(journal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
         try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-
-            if isinstance(data, list):
-                return [MemoryRecord.from_dict(d) for d in data]
-            elif isinstance(data, dict) and "records" in data:
-                return [MemoryRecord.from_dict(d) for d in data["records"]]
-            else:
-                # Legacy format - single record
-                return [MemoryRecord.from_dict(data)]
-        except (json.JSONDecodeError, KeyError) as e:
-            print(f"Warning: Error loading {file_path}: {e}")
-            return []
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        entry.journal_ops += 1
+
+        # Skip re-reading our own op, unless another writer appended meanwhile
+        # (then the next read replays from the old offset; ops are idempotent)
+        after = _file_signature(journal_path)
+        before_size = before[2] if before is not None else 0
+        if before_size == entry.journal_offset and after[2] == before_size + len(data):
+            entry.journal_offset = after[2]
+            entry.journal_signature = after
+
+    def _record_change(
+        self,
+        namespace: str,
+        entry: _NamespaceCache,
+        op: str,
+        record: Optional[MemoryRecord] = None,
+        record_id: Optional[str] = None,
+    ):
+        """Persist a mutation in the configured storage format"""
+        if self.storage_format == "journal":
+            self._append_journal(entry, op, record=record, record_id=record_id)
+            if entry.journal_ops >= self.compact_threshold:
+                _write_namespace_file(namespace, entry)
+        else:
+            entry.pending[record_id if record is None else record.record_id] = record
+            self._mark_dirty(namespace, entry)
 
-    async def _save_namespace(self, namespace: str, records: List[MemoryRecord]):
-        """Save all records to a namespace file"""
-        file_path = self._namespace_to_path(namespace)
+    async def compact(self, namespace: Optional[str] = None):
+        """
+        Fold journals into their snapshots and remove the journal files.
 
-        # Ensure directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        Compaction assumes a single writer per namespace; other processes
+        may keep reading (they reload once the journal disappears).
 
-        data = {
-            "namespace": namespace,
-            "updated_at": datetime.utcnow().isoformat(),
-            "record_count": len(records),
-            "records": [r.to_dict() for r in records]
-        }
+        Args:
+            namespace: Namespace to compact (default: all namespaces)
+        """
+        namespaces = [namespace] if namespace else await self.list_namespaces()
 
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        for ns in namespaces:
+            async with self._get_lock(ns):
+                entry = await self._load_entry(ns)
+                if entry.dirty or entry.journal_path.exists():
+                    _write_namespace_file(ns, entry)
+                else:
+                    _persist_vectors(entry)
+
+    async def flush(self, namespace: Optional[str] = None):
+        """
+        Write pending changes to disk now.
+
+        Args:
+            namespace: Namespace to flush (default: all namespaces)
+        """
+        namespaces = [namespace] if namespace else list(self._cache)
+
+        # Embeddings made while searching are written here too, never on the read path
+        for ns in namespaces:
+            pending = self._flush_handles.pop(ns, None)
+            if pending is not None:
+                pending[1].cancel()
 
-        # Update cache
-        self._cache[namespace] = records
+            entry = self._cache.get(ns)
+            if entry is None:
+                continue
+            if not entry.dirty and (entry.vector_index is None or not entry.vector_index.pending_rows):
+                continue
+
+            async with self._get_lock(ns):
+                if entry.dirty:
+                    _write_namespace_file(ns, entry)
+                else:
+                    _persist_vectors(entry)
 
     async def create(self, record: MemoryRecord) -> str:
         """Create a new memory record"""
         async with self._get_lock(record.namespace):
-            records = await self._load_namespace(record.namespace)
+            entry = await self._load_entry(record.namespace)
 
             # Ensure unique ID
-            existing_ids = {r.record_id for r in records}
-            while record.record_id in existing_ids:
-                import uuid
+            while record.record_id in entry.index:
                 record.record_id = str(uuid.uuid4())
 
             record.created_at = datetime.utcnow()
             record.updated_at = datetime.utcnow()
-            records.append(record)
+            entry.records.append(record)
+            entry.index[record.record_id] = record
+            entry.reindex(record)
 
-            await self._save_namespace(record.namespace, records)
+            self._record_change(record.namespace, entry, "create", record=record)
             return record.record_id
 
     async def get(self, namespace: str, record_id: str) -> Optional[MemoryRecord]:
         """Get a specific record by ID"""
-        records = await self._load_namespace(namespace)
-        for record in records:
-            if record.record_id == record_id:
-                return record
-        return None
+        entry = await self._load_entry(namespace)
+        return entry.index.get(record_id)
 
     async def update(self, record: MemoryRecord) -> bool:
         """Update an existing record"""
         async with self._get_lock(record.namespace):
-            records = await self._load_namespace(record.namespace)
+            entry = await self._load_entry(record.namespace)
 
-            for i, r in enumerate(records):
-                if r.record_id == record.record_id:
-                    record.updated_at = datetime.utcnow()
-                    records[i] = record
-                    await self._save_namespace(record.namespace, records)
-                    return True
+            existing = entry.index.get(record.record_id)
+            if existing is None:
+                return False
 
-            return False
+            record.updated_at = datetime.utcnow()
+            if existing is not record:
+                for i, r in enumerate(entry.records):
+                    if r is existing:
+                        entry.records[i] = record
+                        break
+                entry.index[record.record_id] = record
+            entry.reindex(record)
+
+            self._record_change(record.namespace, entry, "update", record=record)
+            return True
 
     async def delete(self, namespace: str, record_id: str) -> bool:
         """Delete a record"""
         async with self._get_lock(namespace):
-            records = await self._load_namespace(namespace)
-            initial_count = len(records)
-
-            records = [r for r in records if r.record_id != record_id]
+            entry = await self._load_entry(namespace)
 
-            if len(records) < initial_count:
-                await self._save_namespace(namespace, records)
-                return True
+            if entry.index.pop(record_id, None) is None:
+                return False
 
-            return False
+            entry.records = [r for r in entry.records if r.record_id != record_id]
+            entry.unindex(record_id)
+            self._record_change(namespace, entry, "delete", record_id=record_id)
+            return True
 
     async def list(
         self,
@@ -169,8 +592,8 @@ class LocalMemoryBackend(MemoryBackend):
                 if any(tag in r.tags for tag in tags)
             ]
 
-        # Sort by created_at descending (newest first)
-        records.sort(key=lambda r: r.created_at or datetime.min, reverse=True)
+        # Sort by created_at descending (newest first); never reorder the cache
+        records = sorted(records, key=lambda r: r.created_at or datetime.min, reverse=True)
 
         # Apply pagination
         return records[offset:offset + limit]
@@ -183,104 +606,145 @@ class LocalMemoryBackend(MemoryBackend):
         tags: Optional[List[str]] = None,
     ) -> List[RetrievalResult]:
         """
-        Search for records across namespaces using text matching.
+        Search for records across namespaces.
 
-        For local backend, this does simple text search on text_content and content.
-        For semantic search, use AgentCore backend.
-        """
-        results = []
-        query_lower = query.lower()
-        query_words = set(query_lower.split())
+        In "bm25" mode, uses each namespace's inverted index (built on first
+        search and updated incrementally afterwards), so a query only visits
+        records containing its terms; scores are normalized so the best match
+        is 1.0. In "semantic" mode, scores are cosine similarities against
+        each namespace's memory-mapped vectors.
 
-        for namespace in namespaces:
+        A query without any terms (e.g. "") matches every record: the newest
+        ones are returned, each with score 1.0.
+        """
+        entries = []
+        for namespace in dict.fromkeys(namespaces):
             try:
-                records = await self._load_namespace(namespace)
+                entry = await self._load_entry(namespace)
             except Exception:
                 continue
+            entries.append((namespace, entry))
+
+        if not tokenize(query):
+            return self._list_recent(entries, top_k, tags)
+        if self.search_mode == "semantic":
+            return self._search_semantic(entries, query, top_k, tags)
+        return self._search_bm25(entries, query, top_k, tags)
 
-            for record in records:
+    def _list_recent(
+        self,
+        entries: List[Tuple[str, _NamespaceCache]],
+        top_k: int,
+        tags: Optional[List[str]],
+    ) -> List[RetrievalResult]:
+        """Tag-filtered records across the namespaces, newest first"""
+        matched = [
+            (namespace, record)
+            for namespace, entry in entries
+            for record in entry.records
+            if not tags or any(tag in record.tags for tag in tags)
+        ]
+        matched.sort(key=lambda m: m[1].created_at, reverse=True)
+        return [
+            RetrievalResult(record=record, score=1.0, source_namespace=namespace)
+            for namespace, record in matched[:top_k]
+        ]
+
+    def _search_bm25(
+        self,
+        entries: List[Tuple[str, _NamespaceCache]],
+        query: str,
+        top_k: int,
+        tags: Optional[List[str]],
+    ) -> List[RetrievalResult]:
+        """BM25 ranking over the namespaces' inverted indexes"""
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens:
+            return []
+
+        for _, entry in entries:
+            if entry.search_index is None:
+                entry.search_index = InvertedIndex.from_records(entry.records)
+
+        idf, avg_length = collection_stats([e.search_index for _, e in entries], query_tokens)
+
+        scored = []
+        for namespace, entry in entries:
+            for record_id, score in entry.search_index.score(query_tokens, idf, avg_length).items():
+                record = entry.index.get(record_id)
+                if record is None:
+                    continue
                 # Filter by tags if specified
                 if tags and not any(tag in record.tags for tag in tags):
                     continue
+                scored.append((score, namespace, record))
 
-                # Calculate relevance score based on text matching
-                score = self._calculate_relevance(record, query_lower, query_words)
-
-                if score > 0:
-                    results.append(RetrievalResult(
-                        record=record,
-                        score=score,
-                        source_namespace=namespace,
-                    ))
+        best = select_top_k(scored, top_k)
+        if not best or best[0][0] <= 0:
+            return []
 
-        # Sort by score descending
-        results.sort(key=lambda r: r.score, reverse=True)
+        max_score = best[0][0]
+        return [
+            RetrievalResult(
+                record=record,
+                score=score / max_score,
+                source_namespace=namespace,
+            )
+            for score, namespace, record in best
+        ]
+
+    def _search_semantic(
+        self,
+        entries: List[Tuple[str, _NamespaceCache]],
+        query: str,
+        top_k: int,
+        tags: Optional[List[str]],
+    ) -> List[RetrievalResult]:
+        """Cosine top-k over the namespaces' vector indexes"""
+        if not query.strip():
+            return []
+        query_vector = self.embedder.embed([query])[0]
 
-        return results[:top_k]
+        scored = []
+        for namespace, entry in entries:
+            if not entry.records:
+                continue
+            if entry.vector_index is None:
+                entry.vector_index = VectorIndex(entry.path, self.embedder)
+                entry.vector_index.sync(entry.records)
+            vectors = entry.vector_index
 
-    def _calculate_relevance(
-        self,
-        record: MemoryRecord,
-        query_lower: str,
-        query_words: set
-    ) -> float:
-        """Calculate relevance score for a record"""
-        score = 0.0
-
-        # Check text_content
-        if record.text_content:
-            text_lower = record.text_content.lower()
-            if query_lower in text_lower:
-                score += 1.0  # Exact match
-            else:
-                # Word overlap
-                text_words = set(text_lower.split())
-                overlap = len(query_words & text_words)
-                if overlap > 0:
-                    score += 0.5 * (overlap / len(query_words))
-
-        # Check content dict (recursive search)
-        content_text = self._extract_text_from_content(record.content).lower()
-        if content_text:
-            if query_lower in content_text:
-                score += 0.8
-            else:
-                content_words = set(content_text.split())
-                overlap = len(query_words & content_words)
-                if overlap > 0:
-                    score += 0.3 * (overlap / len(query_words))
-
-        # Check tags
-        for tag in record.tags:
-            if query_lower in tag.lower():
-                score += 0.2
-
-        return min(1.0, score)
-
-    def _extract_text_from_content(self, content: Any, max_depth: int = 3) -> str:
-        """Recursively extract text from content dict"""
-        if max_depth <= 0:
-            return ""
-
-        if isinstance(content, str):
-            return content
-        elif isinstance(content, dict):
-            parts = []
-            for value in content.values():
-                parts.append(self._extract_text_from_content(value, max_depth - 1))
-            return " ".join(parts)
-        elif isinstance(content, list):
-            parts = []
-            for item in content[:10]:  # Limit list items
-                parts.append(self._extract_text_from_content(item, max_depth - 1))
-            return " ".join(parts)
-        else:
-            return str(content) if content else ""
+            allowed = None
+            if tags:
+                # Filter by tags if specified
+                row_records = [entry.index.get(record_id) for record_id in vectors.rows]
+                allowed = np.array([
+                    r is not None and any(tag in r.tags for tag in tags)
+                    for r in row_records
+                ], dtype=bool)
+
+            for score, record_id in vectors.search(query_vector, top_k, allowed):
+                record = entry.index.get(record_id)
+                if record is not None and score > 0:
+                    scored.append((score, namespace, record))
+
+        return [
+            RetrievalResult(
+                record=record,
+                score=score,
+                source_namespace=namespace,
+            )
+            for score, namespace, record in select_top_k(scored, top_k)
+        ]
 
     async def namespace_exists(self, namespace: str) -> bool:
         """Check if a namespace has any records"""
         file_path = self._namespace_to_path(namespace)
-        if not file_path.exists():
+        if (
+            namespace not in self._cache
+            and not file_path.exists()
+            and not file_path.with_suffix(".jsonl").exists()
+        ):
             return False
 
         records = await self._load_namespace(namespace)
@@ -290,18 +754,24 @@ class LocalMemoryBackend(MemoryBackend):
         """Delete all records in a namespace"""
         async with self._get_lock(namespace):
             file_path = self._namespace_to_path(namespace)
+            journal_path = file_path.with_suffix(".jsonl")
 
-            if not file_path.exists():
+            if namespace not in self._cache and not file_path.exists() and not journal_path.exists():
                 return 0
 
             records = await self._load_namespace(namespace)
             count = len(records)
 
-            file_path.unlink()
+            vector_paths = (file_path.with_suffix(".vectors"), file_path.with_suffix(".vectors.ids"))
+            for path in (file_path, journal_path, *vector_paths):
+                if path.exists():
+                    path.unlink()
 
-            # Clear cache
-            if namespace in self._cache:
-                del self._cache[namespace]
+            # Drop cache and any pending write-back
+            pending = self._flush_handles.pop(namespace, None)
+            if pending is not None:
+                pending[1].cancel()
+            self._cache.pop(namespace, None)
 
             return count
 
@@ -321,15 +791,23 @@ class LocalMemoryBackend(MemoryBackend):
         """
         namespaces = []
 
-        for json_file in self.base_path.rglob("*.json"):
-            # Convert path back to namespace
-            rel_path = json_file.relative_to(self.base_path)
-            namespace = "/" + str(rel_path.with_suffix("")).replace("\\", "/")
+        for pattern in ("*.json", "*.jsonl"):
+            for json_file in self.base_path.rglob(pattern):
+                # Convert path back to namespace
+                rel_path = json_file.relative_to(self.base_path)
+                namespace = "/" + str(rel_path.with_suffix("")).replace("\\", "/")
 
-            if prefix and not namespace.startswith(prefix):
-                continue
+                if prefix and not namespace.startswith(prefix):
+                    continue
+
+                if namespace not in namespaces:
+                    namespaces.append(namespace)
 
-            namespaces.append(namespace)
+        # Namespaces created in this process but not yet written back
+        for namespace, entry in self._cache.items():
+            if entry.dirty and entry.records and namespace not in namespaces:
+                if not prefix or namespace.startswith(prefix):
+                    namespaces.append(namespace)
 
         return sorted(namespaces)
 
@@ -353,14 +831,30 @@ class LocalMemoryBackend(MemoryBackend):
         """
         Import records from backup/migration.
 
+        Unlike create(), record IDs and timestamps are kept, and records
+        that already exist are replaced.
+
         Args:
             data: Dict mapping namespace to list of record dicts
         """
-        for namespace, records in data.items():
-            for record_data in records:
-                record = MemoryRecord.from_dict(record_data)
-                record.namespace = namespace
-                await self.create(record)
+        for namespace, record_dicts in data.items():
+            async with self._get_lock(namespace):
+                entry = await self._load_entry(namespace)
+                records = []
+                for record_data in record_dicts:
+                    record = MemoryRecord.from_dict(record_data)
+                    record.namespace = namespace
+                    _put_record(entry, record)
+                    records.append(record)
+
+                if self.storage_format == "journal":
+                    for record in records:
+                        self._record_change(namespace, entry, "update", record=record)
+                elif records:
+                    # One write-back for the whole namespace
+                    for record in records:
+                        entry.pending[record.record_id] = record
+                    self._mark_dirty(namespace, entry)
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get storage statistics"""
@@ -372,7 +866,11 @@ class LocalMemoryBackend(MemoryBackend):
         for namespace in namespaces:
             file_path = self._namespace_to_path(namespace)
             records = await self._load_namespace(namespace)
-            size = file_path.stat().st_size if file_path.exists() else 0
+            size = sum(
+                path.stat().st_size
+                for path in (file_path, file_path.with_suffix(".jsonl"))
+                if path.exists()
+            )
 
             total_records += len(records)
             total_size += size
@@ -0,0 +1,510 @@
+"""
+SQLite storage backend for shared, concurrent use.
+
+All namespaces live in one database file (artifacts/memory/memory.db by
+default) opened in WAL mode, so several CLI processes and the API server
+can read while one of them writes. Records are stored as JSON alongside
+indexed columns:
+    records      (namespace, record_id) primary key, (namespace, created_at) index
+    record_tags  (namespace, tag, record_id) for tag filters
+    records_fts  FTS5 index over each record's searchable text
+
+`list` pages through the namespace/created_at index instead of loading the
+whole namespace, and `search` ranks with FTS5's built-in BM25.
+
+sqlite3 calls block, so each operation runs in a worker thread on a
+connection borrowed from a small pool. Writes take the database write lock
+up front (BEGIN IMMEDIATE) and wait up to `busy_timeout` seconds for other
+writers.
+
+Migrate to and from the JSON backend with `copy_records`, or the
+`cs memory convert` command; both sides use the export_all/import_all
+format.
+"""
+
+import asyncio
+import json
+import queue
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from core.memory.backends.base import MemoryBackend, MemoryRecord, RetrievalResult
+from core.memory.search_index import record_search_text, tokenize
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    namespace TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL,
+    search_text TEXT NOT NULL,
+    PRIMARY KEY (namespace, record_id)
+);
+CREATE INDEX IF NOT EXISTS idx_records_namespace_created
+    ON records (namespace, created_at);
+
+CREATE TABLE IF NOT EXISTS record_tags (
+    namespace TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    PRIMARY KEY (namespace, tag, record_id)
+);
+CREATE INDEX IF NOT EXISTS idx_record_tags_record
+    ON record_tags (namespace, record_id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS records_fts USING fts5(
+    search_text, content='records', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS records_fts_insert AFTER INSERT ON records BEGIN
+    INSERT INTO records_fts (rowid, search_text) VALUES (new.rowid, new.search_text);
+END;
+CREATE TRIGGER IF NOT EXISTS records_fts_delete AFTER DELETE ON records BEGIN
+    INSERT INTO records_fts (records_fts, rowid, search_text)
+        VALUES ('delete', old.rowid, old.search_text);
+END;
+CREATE TRIGGER IF NOT EXISTS records_fts_update AFTER UPDATE ON records BEGIN
+    INSERT INTO records_fts (records_fts, rowid, search_text)
+        VALUES ('delete', old.rowid, old.search_text);
+    INSERT INTO records_fts (rowid, search_text) VALUES (new.rowid, new.search_text);
+END;
+"""
+
+
+def _tag_filter(tags: Optional[List[str]], alias: str = "r") -> Tuple[str, List[str]]:
+    """SQL condition (and params) matching records with any of the tags"""
+    if not tags:
+        return "", []
+    placeholders = ", ".join("?" for _ in tags)
+    return (
+        f" AND EXISTS (SELECT 1 FROM record_tags t"
+        f" WHERE t.namespace = {alias}.namespace AND t.record_id = {alias}.record_id"
+        f" AND t.tag IN ({placeholders}))",
+        list(tags),
+    )
+
+
+class _ConnectionPool:
+    """Thread-safe pool of SQLite connections to one database"""
+
+    def __init__(self, db_path: Path, size: int, busy_timeout: float):
+        self.db_path = db_path
+        self.size = size
+        self.busy_timeout = busy_timeout
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._all: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout,
+            isolation_level=None,  # Transactions are explicit
+            check_same_thread=False,  # Used by one worker thread at a time
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection, opening one if the pool isn't full yet"""
+        conn = None
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if len(self._all) < self.size:
+                    conn = self._connect()
+                    self._all.append(conn)
+            if conn is None:
+                conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put(conn)
+
+    def close(self):
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all.clear()
+        self._idle = queue.LifoQueue()
+
+
+@contextmanager
+def _write_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Take the write lock up front so concurrent writers queue instead of deadlocking"""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+class SqliteMemoryBackend(MemoryBackend):
+    """
+    SQLite memory backend for concurrent multi-process access.
+
+    Implements the full MemoryBackend interface, plus the local backend's
+    admin methods (list_namespaces, export_all, import_all, get_stats).
+    Returned records are fresh copies; persist changes with update().
+    """
+
+    def __init__(
+        self,
+        db_path: str = "artifacts/memory/memory.db",
+        pool_size: int = 4,
+        busy_timeout: float = 30.0,
+    ):
+        """
+        Initialize SQLite backend.
+
+        Args:
+            db_path: Database file (created with its schema if missing)
+            pool_size: Maximum open connections (= concurrent operations)
+            busy_timeout: Seconds to wait for another writer's lock
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pool = _ConnectionPool(self.db_path, pool_size, busy_timeout)
+
+        with self._pool.connection() as conn:
+            conn.executescript(SCHEMA)
+
+    def _call(self, fn: Callable[..., Any], *args) -> Any:
+        with self._pool.connection() as conn:
+            return fn(conn, *args)
+
+    async def _run(self, fn: Callable[..., Any], *args) -> Any:
+        """Run fn(conn, *args) on a pooled connection in a worker thread"""
+        return await asyncio.to_thread(self._call, fn, *args)
+
+    def close(self):
+        """Close all pooled connections"""
+        self._pool.close()
+
+    # ==========================================================================
+    # ROW HELPERS
+    # ==========================================================================
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, record: MemoryRecord):
+        conn.execute(
+            "INSERT INTO records (namespace, record_id, created_at, updated_at, data, search_text)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                record.namespace,
+                record.record_id,
+                record.created_at.isoformat(),
+                record.updated_at.isoformat(),
+                json.dumps(record.to_dict(), default=str),
+                record_search_text(record),
+            ),
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO record_tags (namespace, tag, record_id) VALUES (?, ?, ?)",
+            [(record.namespace, tag, record.record_id) for tag in record.tags],
+        )
+
+    @staticmethod
+    def _delete_tags(conn: sqlite3.Connection, namespace: str, record_id: str):
+        conn.execute(
+            "DELETE FROM record_tags WHERE namespace = ? AND record_id = ?",
+            (namespace, record_id),
+        )
+
+    @staticmethod
+    def _to_record(data: str) -> MemoryRecord:
+        return MemoryRecord.from_dict(json.loads(data))
+
+    # ==========================================================================
+    # MemoryBackend INTERFACE
+    # ==========================================================================
+
+    async def create(self, record: MemoryRecord) -> str:
+        """Create a new memory record"""
+        def create(conn):
+            with _write_transaction(conn):
+                # Ensure unique ID
+                while conn.execute(
+                    "SELECT 1 FROM records WHERE namespace = ? AND record_id = ?",
+                    (record.namespace, record.record_id),
+                ).fetchone():
+                    record.record_id = str(uuid.uuid4())
+
+                record.created_at = datetime.utcnow()
+                record.updated_at = datetime.utcnow()
+                self._insert(conn, record)
+            return record.record_id
+
+        return await self._run(create)
+
+    async def get(self, namespace: str, record_id: str) -> Optional[MemoryRecord]:
+        """Get a specific record by ID"""
+        def get(conn):
+            return conn.execute(
+                "SELECT data FROM records WHERE namespace = ? AND record_id = ?",
+                (namespace, record_id),
+            ).fetchone()
+
+        row = await self._run(get)
+        return self._to_record(row[0]) if row else None
+
+    async def update(self, record: MemoryRecord) -> bool:
+        """Update an existing record"""
+        def update(conn):
+            with _write_transaction(conn):
+                record.updated_at = datetime.utcnow()
+                cursor = conn.execute(
+                    "UPDATE records SET updated_at = ?, data = ?, search_text = ?"
+                    " WHERE namespace = ? AND record_id = ?",
+                    (
+                        record.updated_at.isoformat(),
+                        json.dumps(record.to_dict(), default=str),
+                        record_search_text(record),
+                        record.namespace,
+                        record.record_id,
+                    ),
+                )
+                if cursor.rowcount == 0:
+                    return False
+
+                self._delete_tags(conn, record.namespace, record.record_id)
+                conn.executemany(
+                    "INSERT OR IGNORE INTO record_tags (namespace, tag, record_id) VALUES (?, ?, ?)",
+                    [(record.namespace, tag, record.record_id) for tag in record.tags],
+                )
+            return True
+
+        return await self._run(update)
+
+    async def delete(self, namespace: str, record_id: str) -> bool:
+        """Delete a record"""
+        def delete(conn):
+            with _write_transaction(conn):
+                cursor = conn.execute(
+                    "DELETE FROM records WHERE namespace = ? AND record_id = ?",
+                    (namespace, record_id),
+                )
+                self._delete_tags(conn, namespace, record_id)
+            return cursor.rowcount > 0
+
+        return await self._run(delete)
+
+    async def list(
+        self,
+        namespace: str,
+        limit: int = 100,
+        offset: int = 0,
+        tags: Optional[List[str]] = None,
+    ) -> List[MemoryRecord]:
+        """List records in a namespace, newest first (one page per query)"""
+        tag_sql, tag_params = _tag_filter(tags)
+
+        def list_page(conn):
+            return conn.execute(
+                f"SELECT data FROM records r WHERE r.namespace = ?{tag_sql}"
+                " ORDER BY r.created_at DESC, r.rowid DESC LIMIT ? OFFSET ?",
+                [namespace, *tag_params, limit, offset],
+            ).fetchall()
+
+        return [self._to_record(row[0]) for row in await self._run(list_page)]
+
+    async def search(
+        self,
+        namespaces: List[str],
+        query: str,
+        top_k: int = 10,
+        tags: Optional[List[str]] = None,
+    ) -> List[RetrievalResult]:
+        """
+        Search for records across namespaces with FTS5 BM25 ranking.
+
+        Scores are normalized so the best match is 1.0. A query without any
+        terms (e.g. "") matches every record: the newest ones are returned,
+        each with score 1.0.
+        """
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        namespaces = list(dict.fromkeys(namespaces))
+        if not namespaces:
+            return []
+
+        ns_placeholders = ", ".join("?" for _ in namespaces)
+        tag_sql, tag_params = _tag_filter(tags)
+
+        if not query_tokens:
+            def list_recent(conn):
+                return conn.execute(
+                    f"SELECT r.namespace, r.data FROM records r WHERE r.namespace IN ({ns_placeholders}){tag_sql}"
+                    " ORDER BY r.created_at DESC, r.rowid DESC LIMIT ?",
+                    [*namespaces, *tag_params, top_k],
+                ).fetchall()
+
+            return [
+                RetrievalResult(record=self._to_record(data), score=1.0, source_namespace=namespace)
+                for namespace, data in await self._run(list_recent)
+            ]
+
+        # Quote every token so user input is never parsed as FTS5 syntax
+        match = " OR ".join(f'"{token}"' for token in query_tokens)
+
+        def search(conn):
+            return conn.execute(
+                "SELECT r.namespace, r.data, bm25(records_fts) AS rank"
+                " FROM records_fts JOIN records r ON r.rowid = records_fts.rowid"
+                f" WHERE records_fts MATCH ? AND r.namespace IN ({ns_placeholders}){tag_sql}"
+                " ORDER BY rank LIMIT ?",
+                [match, *namespaces, *tag_params, top_k],
+            ).fetchall()
+
+        rows = await self._run(search)
+        if not rows or rows[0][2] >= 0:
+            return []
+
+        # bm25() is negative, lower is better
+        best = rows[0][2]
+        return [
+            RetrievalResult(
+                record=self._to_record(data),
+                score=rank / best,
+                source_namespace=namespace,
+            )
+            for namespace, data, rank in rows
+        ]
+
+    async def namespace_exists(self, namespace: str) -> bool:
+        """Check if a namespace has any records"""
+        def exists(conn):
+            return conn.execute(
+                "SELECT 1 FROM records WHERE namespace = ? LIMIT 1", (namespace,)
+            ).fetchone()
+
+        return bool(await self._run(exists))
+
+    async def delete_namespace(self, namespace: str) -> int:
+        """Delete all records in a namespace"""
+        def delete_namespace(conn):
+            with _write_transaction(conn):
+                cursor = conn.execute("DELETE FROM records WHERE namespace = ?", (namespace,))
+                conn.execute("DELETE FROM record_tags WHERE namespace = ?", (namespace,))
+            return cursor.rowcount
+
+        return await self._run(delete_namespace)
+
+    # ==========================================================================
+    # ADMIN METHODS (same as LocalMemoryBackend)
+    # ==========================================================================
+
+    async def list_namespaces(self, prefix: str = "") -> List[str]:
+        """
+        List all namespaces (for debugging/admin).
+
+        Args:
+            prefix: Optional namespace prefix to filter
+
+        Returns:
+            List of namespace strings
+        """
+        def list_namespaces(conn):
+            return conn.execute(
+                "SELECT DISTINCT namespace FROM records"
+                " WHERE substr(namespace, 1, ?) = ? ORDER BY namespace",
+                (len(prefix), prefix),
+            ).fetchall()
+
+        return [row[0] for row in await self._run(list_namespaces)]
+
+    async def export_all(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Export all records for backup/migration.
+
+        Returns:
+            Dict mapping namespace to list of record dicts
+        """
+        def export(conn):
+            return conn.execute(
+                "SELECT namespace, data FROM records ORDER BY namespace, rowid"
+            ).fetchall()
+
+        result: Dict[str, List[Dict[str, Any]]] = {}
+        for namespace, data in await self._run(export):
+            result.setdefault(namespace, []).append(json.loads(data))
+        return result
+
+    async def import_all(self, data: Dict[str, List[Dict[str, Any]]]):
+        """
+        Import records from backup/migration.
+
+        Unlike create(), record IDs and timestamps are kept, and records
+        that already exist are replaced. Everything is written in one
+        transaction.
+
+        Args:
+            data: Dict mapping namespace to list of record dicts
+        """
+        records = []
+        for namespace, record_dicts in data.items():
+            for record_data in record_dicts:
+                record = MemoryRecord.from_dict(record_data)
+                record.namespace = namespace
+                records.append(record)
+
+        def import_records(conn):
+            with _write_transaction(conn):
+                for record in records:
+                    conn.execute(
+                        "DELETE FROM records WHERE namespace = ? AND record_id = ?",
+                        (record.namespace, record.record_id),
+                    )
+                    self._delete_tags(conn, record.namespace, record.record_id)
+                    self._insert(conn, record)
+
+        await self._run(import_records)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get storage statistics"""
+        def stats(conn):
+            return conn.execute(
+                "SELECT namespace, COUNT(*), SUM(LENGTH(data)) FROM records GROUP BY namespace"
+            ).fetchall()
+
+        rows = await self._run(stats)
+        namespace_stats = [
+            {"namespace": namespace, "record_count": count, "size_bytes": size or 0}
+            for namespace, count, size in rows
+        ]
+        total_size = sum(
+            path.stat().st_size
+            for path in (self.db_path, Path(f"{self.db_path}-wal"))
+            if path.exists()
+        )
+
+        return {
+            "total_namespaces": len(namespace_stats),
+            "total_records": sum(ns["record_count"] for ns in namespace_stats),
+            "total_size_bytes": total_size,
+            "namespaces": namespace_stats,
+        }
+
+
+async def copy_records(source: MemoryBackend, target: MemoryBackend) -> int:
+    """
+    Copy every record from one backend to another (e.g. JSON files <-> SQLite).
+
+    Both backends must provide export_all/import_all.
+
+    Returns:
+        Number of records copied
+    """
+    data = await source.export_all()
+    await target.import_all(data)
+    await target.flush()
+    return sum(len(records) for records in data.values())
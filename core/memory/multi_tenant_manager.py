@@ -3,7 +3,7 @@ Multi-Tenant Memory Manager
 
 Provides a high-level API for storing and retrieving learnings across
 the namespace hierarchy. Supports:
-- Local mode: JSON file storage for development
+- Local mode: JSON file (or shared SQLite) storage for development
 - Hosted mode: AWS AgentCore with IAM access control
 
 The manager automatically handles:
@@ -30,6 +30,7 @@ from core.memory.namespace import (
 )
 from core.memory.backends.base import MemoryBackend, MemoryRecord, RetrievalResult
 from core.memory.backends.local import LocalMemoryBackend
+from core.memory.backends.sqlite import SqliteMemoryBackend
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,8 @@ class MultiTenantConfig:
     """Configuration for multi-tenant memory"""
     mode: MemoryMode = MemoryMode.LOCAL
     base_path: str = "artifacts/memory"
+    storage_format: str = "json"  # "json", "journal" (append-only JSONL) or "sqlite"
+    search_mode: str = "bm25"  # "bm25" or "semantic" (local embeddings, offline)
 
     # Default context for local development
     default_org_id: str = "local"
@@ -68,6 +71,8 @@ class MultiTenantConfig:
         return cls(
             mode=mode,
             base_path=os.environ.get("MEMORY_BASE_PATH", "artifacts/memory"),
+            storage_format=os.environ.get("MEMORY_STORAGE_FORMAT", "json"),
+            search_mode=os.environ.get("MEMORY_SEARCH_MODE", "bm25"),
             default_org_id=os.environ.get("MEMORY_ORG_ID", "local"),
             default_actor_id=os.environ.get("MEMORY_ACTOR_ID", "dev"),
             agentcore_memory_id=memory_id,
@@ -146,9 +151,15 @@ class MultiTenantMemoryManager:
                     memory_id=self.config.agentcore_memory_id,
                     region=self.config.aws_region,
                 )
+            elif self.config.storage_format == "sqlite":
+                self._backend = SqliteMemoryBackend(
+                    db_path=os.path.join(self.config.base_path, "memory.db"),
+                )
             else:
                 self._backend = LocalMemoryBackend(
-                    base_path=self.config.base_path
+                    base_path=self.config.base_path,
+                    storage_format=self.config.storage_format,
+                    search_mode=self.config.search_mode,
                 )
         return self._backend
 
@@ -574,7 +585,7 @@ class MultiTenantMemoryManager:
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get memory system statistics"""
-        if isinstance(self.backend, LocalMemoryBackend):
+        if isinstance(self.backend, (LocalMemoryBackend, SqliteMemoryBackend)):
             return await self.backend.get_stats()
 
         return {
@@ -582,6 +593,11 @@ class MultiTenantMemoryManager:
             "backend": type(self.backend).__name__,
         }
 
+    async def flush(self):
+        """Persist any writes the backend is still buffering"""
+        if self._backend is not None:
+            await self._backend.flush()
+
 
 # ==========================================================================
 # GLOBAL INSTANCE
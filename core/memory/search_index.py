@@ -0,0 +1,168 @@
+"""
+Inverted index with BM25 scoring for local memory search.
+
+Each namespace keeps one InvertedIndex (token -> postings with term
+frequencies) that is updated incrementally as records are created, updated
+and deleted, so a query only touches the postings of its own terms instead
+of re-reading and re-tokenizing every record.
+
+Queries spanning several namespaces are scored with collection statistics
+(document count, document frequencies, average length) summed across those
+namespaces, so scores from different namespaces are comparable.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from core.memory.backends.base import MemoryRecord
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Standard BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def extract_text(content: Any, max_depth: int = 3) -> str:
+    """Recursively extract text from a record's content dict"""
+    if max_depth <= 0:
+        return ""
+
+    if isinstance(content, str):
+        return content
+    elif isinstance(content, dict):
+        return " ".join(extract_text(value, max_depth - 1) for value in content.values())
+    elif isinstance(content, list):
+        # Limit list items
+        return " ".join(extract_text(item, max_depth - 1) for item in content[:10])
+    else:
+        return str(content) if content else ""
+
+
+def record_search_text(record: MemoryRecord) -> str:
+    """All searchable text of a record: text_content, content values and tags"""
+    return " ".join([
+        record.text_content or "",
+        extract_text(record.content),
+        " ".join(record.tags),
+    ])
+
+
+class InvertedIndex:
+    """Token postings and document lengths for one namespace"""
+
+    def __init__(self):
+        self.postings: Dict[str, Dict[str, int]] = {}  # token -> {record_id: term frequency}
+        self.doc_lengths: Dict[str, int] = {}
+        self.doc_tokens: Dict[str, List[str]] = {}  # record_id -> distinct tokens (for removal)
+        self.total_length = 0
+
+    @classmethod
+    def from_records(cls, records: Iterable[MemoryRecord]) -> 'InvertedIndex':
+        """Build an index over existing records"""
+        index = cls()
+        for record in records:
+            index.add(record)
+        return index
+
+    @property
+    def doc_count(self) -> int:
+        return len(self.doc_lengths)
+
+    def document_frequency(self, token: str) -> int:
+        return len(self.postings.get(token, ()))
+
+    def add(self, record: MemoryRecord):
+        """Index a record (replacing any previous version of it)"""
+        self.remove(record.record_id)
+
+        counts = Counter(tokenize(record_search_text(record)))
+        for token, tf in counts.items():
+            self.postings.setdefault(token, {})[record.record_id] = tf
+
+        length = sum(counts.values())
+        self.doc_lengths[record.record_id] = length
+        self.doc_tokens[record.record_id] = list(counts)
+        self.total_length += length
+
+    def remove(self, record_id: str):
+        """Drop a record from the index (no-op if not indexed)"""
+        length = self.doc_lengths.pop(record_id, None)
+        if length is None:
+            return
+        self.total_length -= length
+
+        for token in self.doc_tokens.pop(record_id, ()):
+            docs = self.postings.get(token)
+            if docs is None:
+                continue
+            docs.pop(record_id, None)
+            if not docs:
+                del self.postings[token]
+
+    def score(
+        self,
+        query_tokens: Sequence[str],
+        idf: Dict[str, float],
+        avg_length: float,
+    ) -> Dict[str, float]:
+        """
+        BM25 scores for every record containing at least one query token.
+
+        Args:
+            query_tokens: Distinct query tokens
+            idf: Inverse document frequency per token (collection-wide)
+            avg_length: Average document length (collection-wide)
+
+        Returns:
+            Dict mapping record_id to score
+        """
+        scores: Dict[str, float] = {}
+        avg_length = avg_length or 1.0
+
+        for token in query_tokens:
+            docs = self.postings.get(token)
+            if not docs:
+                continue
+            token_idf = idf[token]
+            for record_id, tf in docs.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.doc_lengths[record_id] / avg_length)
+                scores[record_id] = scores.get(record_id, 0.0) + token_idf * tf * (BM25_K1 + 1) / (tf + norm)
+
+        return scores
+
+
+def collection_stats(
+    indexes: Sequence[InvertedIndex],
+    query_tokens: Sequence[str],
+) -> Tuple[Dict[str, float], float]:
+    """
+    BM25 idf per query token and average document length across indexes.
+
+    Returns:
+        (idf, avg_length)
+    """
+    doc_count = sum(index.doc_count for index in indexes)
+    total_length = sum(index.total_length for index in indexes)
+
+    idf = {}
+    for token in query_tokens:
+        df = sum(index.document_frequency(token) for index in indexes)
+        # Lucene's variant: the +1 keeps idf positive for very common terms
+        idf[token] = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+
+    avg_length = total_length / doc_count if doc_count else 0.0
+    return idf, avg_length
+
+
+def top_k(scored: Iterable[Tuple[float, Any]], k: int) -> List[Tuple[float, Any]]:
+    """Highest-scoring k items (heap selection, not a full sort)"""
+    return heapq.nlargest(k, scored, key=lambda item: item[0])
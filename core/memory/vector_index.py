@@ -0,0 +1,357 @@
+"""
+Vector index for offline semantic search in the local memory backend.
+
+Records are embedded on the CPU (by default with a feature-hashing embedder
+that needs no model download or network access) and their vectors are
+stored next to the namespace file:
+    artifacts/memory/platform/learnings/global.vectors      (float32 rows)
+    artifacts/memory/platform/learnings/global.vectors.ids  (row -> record)
+
+The vector file is memory-mapped for queries and only ever appended to:
+new and updated records add a row, and superseded rows are dropped the next
+time the namespace is compacted. On open, rows are checked against a hash of
+each record's searchable text, so records changed by another process (or
+while no index was loaded) are re-embedded in one batch.
+
+Searching never writes: rows embedded since the files were read are kept in
+memory and appended by persist(), which the backend calls on its write path
+(flush and namespace writes). persist() skips the append if another process
+changed the files since they were read, so concurrent searchers can't
+misalign vectors and ids. Like journal compaction, rewriting the vector
+files assumes a single writer per namespace.
+"""
+
+import hashlib
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.memory.backends.base import MemoryRecord
+from core.memory.search_index import record_search_text, tokenize
+
+# Rows embedded per embedder call when catching up on many records
+EMBED_BATCH_SIZE = 256
+
+
+class HashingEmbedder:
+    """
+    Feature-hashing text embedder.
+
+    Words and character trigrams are hashed into a fixed number of signed
+    buckets and the result is L2-normalized, so inflections and
+    compounds ("noun" / "nouns", "light" / "lighting") land close together. Deterministic across
+    processes and machines.
+
+    Any object with `name`, `dim` and `embed(texts) -> (n, dim) array` can be
+    used instead, e.g. a small local sentence-embedding model.
+    """
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+        self.name = f"hashing-v1-{dim}"
+        self._buckets: Dict[str, Tuple[int, float]] = {}  # Feature -> (bucket, sign)
+
+    def _bucket(self, feature: str) -> Tuple[int, float]:
+        bucket = self._buckets.get(feature)
+        if bucket is None:
+            digest = int.from_bytes(
+                hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little"
+            )
+            bucket = ((digest >> 1) % self.dim, 1.0 if digest & 1 else -1.0)
+            if len(self._buckets) < 500_000:
+                self._buckets[feature] = bucket
+        return bucket
+
+    def _features(self, text: str) -> Iterable[Tuple[str, float]]:
+        for token in tokenize(text):
+            yield f"w:{token}", 1.0
+            padded = f" {token} "
+            for i in range(len(padded) - 2):
+                yield f"c:{padded[i:i + 3]}", 0.5
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts as unit-length float32 rows"""
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            counts: Dict[int, float] = {}
+            for feature, weight in self._features(text):
+                index, sign = self._bucket(feature)
+                counts[index] = counts.get(index, 0.0) + sign * weight
+            if counts:
+                vectors[row, list(counts)] = list(counts.values())
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+class VectorIndex:
+    """Memory-mapped embedding matrix for one namespace"""
+
+    def __init__(self, namespace_path: Path, embedder):
+        """
+        Open (or start) the vector files for a namespace.
+
+        Args:
+            namespace_path: Path of the namespace JSON file
+            embedder: Embedder producing unit-length vectors
+        """
+        self.embedder = embedder
+        self.dim = embedder.dim
+        self.vectors_path = namespace_path.with_suffix(".vectors")
+        self.ids_path = namespace_path.with_suffix(".vectors.ids")
+
+        self.rows: List[Optional[str]] = []  # Row -> record_id (None = superseded)
+        self.row_of: Dict[str, int] = {}  # Live record_id -> row
+        self.hashes: Dict[str, str] = {}  # Live record_id -> text hash when embedded
+        self._live = bytearray()  # Row -> 1 if live (viewed as a numpy mask at query time)
+        self._matrix: Optional[np.ndarray] = None
+
+        self._stored = 0  # Leading rows that are on disk
+        self._pending: List[np.ndarray] = []  # Vectors of rows after those, not yet written
+        self._ids_signature: Optional[Tuple[int, int]] = None  # ids file (size, mtime_ns) when read
+        self._replace_files = False  # Files on disk are unusable; rewrite them on persist
+
+        self._read()
+
+    @property
+    def header(self) -> Dict[str, object]:
+        return {"embedder": self.embedder.name, "dim": self.dim}
+
+    @property
+    def dead_rows(self) -> int:
+        return len(self.rows) - len(self.row_of)
+
+    def _ids_file_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.ids_path.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def _read(self):
+        """Load row ids; ignore the files if they don't match the embedder"""
+        self._ids_signature = self._ids_file_signature()
+        try:
+            with open(self.ids_path, 'r') as f:
+                lines = f.read().splitlines()
+        except FileNotFoundError:
+            lines = []
+
+        entries = []
+        try:
+            if lines and json.loads(lines[0]) == self.header:
+                entries = [json.loads(line) for line in lines[1:] if line.strip()]
+            elif lines:
+                lines = []
+        except json.JSONDecodeError:
+            lines, entries = [], []
+
+        if not lines or self._stored_rows() < len(entries):
+            # Missing, unreadable or from another embedder: start over
+            self._replace_files = bool(lines) or self.vectors_path.exists()
+            return
+
+        # Rows past the ids (vectors are written first) are ignored until persist()
+        for entry in entries:
+            self._track(entry["id"], entry["h"])
+        self._stored = len(entries)
+
+    def _stored_rows(self) -> int:
+        try:
+            return self.vectors_path.stat().st_size // (self.dim * 4)
+        except FileNotFoundError:
+            return 0
+
+    def _track(self, record_id: str, text_hash: str):
+        """Register a new row for a record, superseding its previous row"""
+        previous = self.row_of.get(record_id)
+        if previous is not None:
+            self.rows[previous] = None
+            self._live[previous] = 0
+        self.row_of[record_id] = len(self.rows)
+        self.hashes[record_id] = text_hash
+        self.rows.append(record_id)
+        self._live.append(1)
+
+    @property
+    def pending_rows(self) -> int:
+        return len(self.rows) - self._stored
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """(rows, dim) view of the vector file, followed by rows not yet written"""
+        if self._matrix is None or self._matrix.shape[0] != len(self.rows):
+            if not self.rows:
+                return np.zeros((0, self.dim), dtype=np.float32)
+            stored = np.memmap(
+                self.vectors_path, dtype=np.float32, mode='r', shape=(self._stored, self.dim)
+            ) if self._stored else np.zeros((0, self.dim), dtype=np.float32)
+            self._matrix = np.concatenate([stored, *self._pending]) if self._pending else stored
+        return self._matrix
+
+    def _append(self, records: Sequence[MemoryRecord]):
+        """Embed records in batches and add their rows (in memory until persist())"""
+        for start in range(0, len(records), EMBED_BATCH_SIZE):
+            batch = records[start:start + EMBED_BATCH_SIZE]
+            texts = [record_search_text(r) for r in batch]
+            self._pending.append(np.asarray(self.embedder.embed(texts), dtype=np.float32))
+            for record, text in zip(batch, texts):
+                self._track(record.record_id, _text_hash(text))
+
+        self._matrix = None
+
+    def persist(self) -> bool:
+        """
+        Write rows embedded since the files were read (write path only).
+
+        Appends the new rows, or rewrites both files when they were unusable
+        or mostly superseded rows. Nothing is written if another process
+        changed the files since this index read them; the rows then stay in
+        memory and are re-embedded by whichever process opens the files next.
+
+        Returns:
+            True if the files are now up to date with this index
+        """
+        if not self.pending_rows and not self._replace_files:
+            return True
+        if self._ids_file_signature() != self._ids_signature:
+            return False
+
+        if self._replace_files or (self.dead_rows > 64 and self.dead_rows > len(self.row_of)):
+            self.compact()
+            return True
+
+        if self._stored == 0:
+            self.ids_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.ids_path, 'w') as f:
+                f.write(json.dumps(self.header) + "\n")
+        if self._stored_rows() > self._stored:
+            # Vectors are written before their ids; drop rows whose ids never made it
+            os.truncate(self.vectors_path, self._stored * self.dim * 4)
+
+        with open(self.vectors_path, 'ab') as f:
+            for vectors in self._pending:
+                f.write(vectors.tobytes())
+        with open(self.ids_path, 'a') as f:
+            f.write("".join(
+                json.dumps({"id": record_id, "h": self.hashes.get(record_id, "")}) + "\n"
+                for record_id in self.rows[self._stored:]
+            ))
+
+        self._stored = len(self.rows)
+        self._pending = []
+        self._ids_signature = self._ids_file_signature()
+        self._matrix = None
+        return True
+
+    def _rewrite(self, vectors: np.ndarray, record_ids: List[str]):
+        """Replace both files with the given rows (temp files + rename)"""
+        self.vectors_path.parent.mkdir(parents=True, exist_ok=True)
+        suffix = uuid.uuid4().hex[:8]
+        tmp_vectors = self.vectors_path.with_name(f".{self.vectors_path.name}.{suffix}.tmp")
+        tmp_ids = self.ids_path.with_name(f".{self.ids_path.name}.{suffix}.tmp")
+
+        hashes = [self.hashes.get(record_id, "") for record_id in record_ids]
+        try:
+            with open(tmp_vectors, 'wb') as f:
+                f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+            with open(tmp_ids, 'w') as f:
+                f.write(json.dumps(self.header) + "\n")
+                for record_id, text_hash in zip(record_ids, hashes):
+                    f.write(json.dumps({"id": record_id, "h": text_hash}) + "\n")
+            os.replace(tmp_vectors, self.vectors_path)
+            os.replace(tmp_ids, self.ids_path)
+        finally:
+            for path in (tmp_vectors, tmp_ids):
+                if path.exists():
+                    path.unlink()
+
+        self._matrix = None
+        self.rows, self.row_of = [], {}
+        self.hashes, self._live = {}, bytearray()
+        for record_id, text_hash in zip(record_ids, hashes):
+            self._track(record_id, text_hash)
+        self._stored = len(record_ids)
+        self._pending = []
+        self._ids_signature = self._ids_file_signature()
+        self._replace_files = False
+
+    def compact(self):
+        """Drop superseded rows from the vector files"""
+        live = [(row, record_id) for row, record_id in enumerate(self.rows) if record_id is not None]
+        vectors = np.array(self.matrix[[row for row, _ in live]]) if live else np.zeros((0, self.dim), dtype=np.float32)
+        self._rewrite(vectors, [record_id for _, record_id in live])
+
+    def sync(self, records: Sequence[MemoryRecord]):
+        """Embed records that are new or changed since their row was written"""
+        current = {r.record_id for r in records}
+        for record_id in [rid for rid in self.row_of if rid not in current]:
+            self.remove(record_id)
+
+        stale = [
+            r for r in records
+            if self.hashes.get(r.record_id) != _text_hash(record_search_text(r))
+        ]
+        if stale:
+            self._append(stale)
+
+    def upsert(self, record: MemoryRecord):
+        """Embed a created or updated record (skipped if its text is unchanged)"""
+        if self.hashes.get(record.record_id) != _text_hash(record_search_text(record)):
+            self._append([record])
+
+    def remove(self, record_id: str):
+        """Forget a record's row (dropped from disk on the next compaction)"""
+        row = self.row_of.pop(record_id, None)
+        if row is not None:
+            self.rows[row] = None
+            self._live[row] = 0
+            self.hashes.pop(record_id, None)
+
+    def search(
+        self,
+        query_vector: np.ndarray,
+        k: int,
+        allowed: Optional[np.ndarray] = None,
+    ) -> List[Tuple[float, str]]:
+        """
+        Cosine top-k over live rows.
+
+        Args:
+            query_vector: Unit-length query embedding
+            k: Number of results
+            allowed: Optional boolean mask over rows (e.g. a tag filter)
+
+        Returns:
+            (score, record_id) pairs, best first
+        """
+        if not self.row_of or k <= 0:
+            return []
+
+        scores = np.asarray(self.matrix @ query_vector, dtype=np.float32)
+        live = np.frombuffer(bytes(self._live), dtype=bool).copy()
+        if allowed is not None:
+            live &= allowed
+        scores[~live] = -np.inf
+
+        k = min(k, int(live.sum()))
+        if k == 0:
+            return []
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best])]
+        return [(float(scores[row]), self.rows[row]) for row in best]
+
+    def delete_files(self):
+        """Remove the vector files from disk (write path only)"""
+        for path in (self.vectors_path, self.ids_path):
+            if path.exists():
+                path.unlink()
@@ -43,6 +43,7 @@ from .render import (
     RenderConfig,
     RenderResult,
     RenderJob,
+    ENCODER_PROFILES,
 )
 from .qa import (
     FrameAnalysis,
@@ -127,6 +128,7 @@ __all__ = [
     "RenderConfig",
     "RenderResult",
     "RenderJob",
+    "ENCODER_PROFILES",
     # QA visual analysis models
     "FrameAnalysis",
     "QAVisualAnalysis",
@@ -195,6 +195,24 @@ class Connection:
         )
 
 
+def atom_from_dict(data: Dict[str, Any]) -> DocumentAtom:
+    """Rebuild a DocumentAtom from its serialized form (raw_data is not stored)"""
+    return DocumentAtom(
+        atom_id=data["atom_id"],
+        atom_type=AtomType(data["atom_type"]),
+        content=data.get("content", ""),
+        source_page=data.get("source_page"),
+        source_location=data.get("source_location"),
+        topics=data.get("topics", []),
+        entities=data.get("entities", []),
+        relationships=data.get("relationships", []),
+        importance_score=data.get("importance_score", 0.5),
+        caption=data.get("caption"),
+        figure_number=data.get("figure_number"),
+        data_summary=data.get("data_summary"),
+    )
+
+
 @dataclass
 class KnowledgeGraph:
     """Unified knowledge graph spanning all sources in a project"""
@@ -260,6 +278,96 @@ class KnowledgeGraph:
                 shared[entity] = atom_ids
         return shared
 
+    def add_source(self, source_id: str, atoms: Dict[str, DocumentAtom]) -> List[CrossSourceLink]:
+        """
+        Merge one source's atoms into the graph.
+
+        Only the new atoms' index postings are added, and cross-links are
+        created between this source and the sources it shares entities with
+        (first atom of each source per entity), so the cost is proportional
+        to the source, not to the whole graph.
+
+        Returns:
+            The cross-links created for this source
+        """
+        first_atom_by_entity: Dict[str, str] = {}
+        for atom_id, atom in atoms.items():
+            self.atoms[atom_id] = atom
+            self.atom_sources[atom_id] = source_id
+            for topic in atom.topics:
+                self.topic_index.setdefault(topic, []).append(atom_id)
+            for entity in atom.entities:
+                self.entity_index.setdefault(entity, []).append(atom_id)
+                first_atom_by_entity.setdefault(entity, atom_id)
+
+        link_counter = self._last_link_number()
+        new_links = []
+        for entity, target_atom_id in first_atom_by_entity.items():
+            # First atom of every other source with this entity, in index order
+            other_sources: Dict[str, str] = {}
+            for aid in self.entity_index[entity]:
+                sid = self.atom_sources.get(aid)
+                if sid and sid != source_id and sid not in other_sources:
+                    other_sources[sid] = aid
+
+            for other_source_id, source_atom_id in other_sources.items():
+                link_counter += 1
+                new_links.append(CrossSourceLink(
+                    link_id=f"link_{link_counter:04d}",
+                    source_atom_id=source_atom_id,
+                    target_atom_id=target_atom_id,
+                    source_source_id=other_source_id,
+                    target_source_id=source_id,
+                    relationship="same_topic",
+                    confidence=0.6,
+                    created_by="auto",
+                ))
+
+        self.cross_links.extend(new_links)
+        return new_links
+
+    def remove_source(self, source_id: str) -> int:
+        """
+        Drop one source's atoms, their index postings and its cross-links.
+
+        Returns:
+            Number of atoms removed
+        """
+        removed = {aid for aid, sid in self.atom_sources.items() if sid == source_id}
+        if not removed:
+            return 0
+
+        topics, entities = set(), set()
+        for atom_id in removed:
+            del self.atom_sources[atom_id]
+            atom = self.atoms.pop(atom_id, None)
+            if atom is not None:
+                topics.update(atom.topics)
+                entities.update(atom.entities)
+
+        for index, keys in ((self.topic_index, topics), (self.entity_index, entities)):
+            for key in keys:
+                postings = [aid for aid in index.get(key, []) if aid not in removed]
+                if postings:
+                    index[key] = postings
+                else:
+                    index.pop(key, None)
+
+        self.cross_links = [
+            link for link in self.cross_links
+            if source_id not in (link.source_source_id, link.target_source_id)
+        ]
+        return len(removed)
+
+    def _last_link_number(self) -> int:
+        """Highest numeric suffix among link IDs, so new IDs never collide"""
+        last = 0
+        for link in self.cross_links:
+            suffix = link.link_id.rsplit("_", 1)[-1]
+            if suffix.isdigit():
+                last = max(last, int(suffix))
+        return last
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "project_id": self.project_id,
@@ -274,22 +382,10 @@ class KnowledgeGraph:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'KnowledgeGraph':
-        atoms = {}
-        for aid, atom_data in data.get("atoms", {}).items():
-            atoms[aid] = DocumentAtom(
-                atom_id=atom_data["atom_id"],
-                atom_type=AtomType(atom_data["atom_type"]),
-                content=atom_data.get("content", ""),
-                source_page=atom_data.get("source_page"),
-                source_location=atom_data.get("source_location"),
-                topics=atom_data.get("topics", []),
-                entities=atom_data.get("entities", []),
-                relationships=atom_data.get("relationships", []),
-                importance_score=atom_data.get("importance_score", 0.5),
-                caption=atom_data.get("caption"),
-                figure_number=atom_data.get("figure_number"),
-                data_summary=atom_data.get("data_summary"),
-            )
+        atoms = {
+            aid: atom_from_dict(atom_data)
+            for aid, atom_data in data.get("atoms", {}).items()
+        }
 
         cross_links = [
             CrossSourceLink.from_dict(link)
@@ -345,6 +441,16 @@ class KnowledgeProject:
         self.total_pages += source.page_count
         self.updated_at = datetime.now().isoformat()
 
+    def remove_source(self, source_id: str) -> Optional[KnowledgeSource]:
+        """Remove a source and update aggregate counts"""
+        source = self.sources.pop(source_id, None)
+        if source is not None:
+            self.total_atoms -= source.atom_count
+            self.total_figures -= source.figure_count
+            self.total_pages -= source.page_count
+            self.updated_at = datetime.now().isoformat()
+        return source
+
     def get_source(self, source_id: str) -> Optional[KnowledgeSource]:
         return self.sources.get(source_id)
 
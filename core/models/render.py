@@ -6,7 +6,7 @@ for combining video clips and audio tracks into final outputs.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from enum import Enum
 
 
@@ -89,6 +89,10 @@ class RenderConfig:
         video_bitrate: Video bitrate (e.g., "5M" for 5 Mbps)
         audio_bitrate: Audio bitrate (e.g., "192k")
         pixel_format: Pixel format (yuv420p for compatibility)
+        single_pass: Compile each candidate into one filter_complex invocation
+            (decode and encode once). Falls back to the multi-step pipeline
+            if the single-pass render fails.
+        use_cache: Reuse identical renders from the content-addressed render cache
     """
     output_width: int = 1920
     output_height: int = 1080
@@ -105,6 +109,53 @@ class RenderConfig:
     # CRF for quality-based encoding (0-51, lower = better, 23 is default)
     crf: int = 23
 
+    # Render each candidate in a single FFmpeg pass
+    single_pass: bool = True
+
+    # Reuse cached trims, overlays and renders keyed by their inputs
+    use_cache: bool = True
+
+    @classmethod
+    def for_profile(cls, profile: str, **overrides: Any) -> 'RenderConfig':
+        """
+        Config for a named encoder profile (see ENCODER_PROFILES).
+
+        Args:
+            profile: "draft", "review" or "final"
+            **overrides: Fields to set on top of the profile (e.g. use_cache)
+
+        Raises:
+            ValueError: If the profile is unknown
+        """
+        if profile not in ENCODER_PROFILES:
+            raise ValueError(
+                f"Unknown encoder profile '{profile}' (choose from {', '.join(ENCODER_PROFILES)})"
+            )
+        return cls(**{**ENCODER_PROFILES[profile], **overrides})
+
+
+# Named encoder profiles. All use software libx264/AAC, so they behave the
+# same on any machine; they trade resolution and compression effort for speed.
+ENCODER_PROFILES: Dict[str, Dict[str, Any]] = {
+    # Proxy for checking the cut: renders in seconds, not for delivery
+    "draft": {
+        "output_width": 960, "output_height": 540,
+        "preset": "ultrafast", "crf": 32, "audio_bitrate": "96k",
+    },
+    # Watchable 720p for sharing with reviewers
+    "review": {
+        "output_width": 1280, "output_height": 720,
+        "preset": "veryfast", "crf": 26, "audio_bitrate": "128k",
+    },
+    # Delivery quality (the RenderConfig defaults)
+    "final": {
+        "output_width": 1920, "output_height": 1080,
+        "preset": "medium", "crf": 23, "audio_bitrate": "192k",
+    },
+}
+
+DEFAULT_ENCODER_PROFILE = "final"
+
 
 @dataclass
 class RenderResult:
@@ -0,0 +1,243 @@
+"""
+PyMuPDF extraction of text blocks and caption-anchored figures.
+
+Extraction is CPU-bound and independent per page, so large documents are
+split into page ranges and extracted in a process pool (PyMuPDF holds the
+GIL, so threads wouldn't help). Each worker opens the document once, pulls
+the text blocks of its pages, finds figure captions among them and renders
+the region above each caption. Results are merged in page order, so the
+output is identical to a serial pass:
+
+    text_blocks, images, page_count, metadata = extract_pdf(path)
+
+Workers are spawned (not forked) because ingestion runs extraction from a
+worker thread; starting them costs about a second, so documents under
+PARALLEL_MIN_PAGES are extracted in-process.
+"""
+
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+PAGES_PER_SHARD = 16
+PARALLEL_MIN_PAGES = 64  # Smaller documents are faster in-process
+
+FIGURE_ZOOM = 2.0  # Render figures at 2x resolution for quality
+
+CAPTION_PATTERN = re.compile(
+    r"(FIGURE|Figure|Fig\.?|TABLE|Table)\s*(\d+)",
+    re.IGNORECASE
+)
+
+# (figure key, image dict or None if the region was skipped), in page order
+FigureOutcome = Tuple[str, Optional[Dict[str, Any]]]
+
+
+def page_text_blocks(page, page_num: int) -> List[Dict[str, Any]]:
+    """Text blocks of one page with position and font hints"""
+    import fitz  # PyMuPDF
+
+    text_blocks = []
+    blocks = page.get_text("dict", flags=fitz.TEXT_PRESERVE_WHITESPACE)["blocks"]
+    for block in blocks:
+        if block["type"] != 0:  # Text blocks only
+            continue
+
+        # Combine lines within the block
+        text = ""
+        for line in block.get("lines", []):
+            line_text = ""
+            for span in line.get("spans", []):
+                line_text += span.get("text", "")
+            text += line_text + "\n"
+        text = text.strip()
+        if not text:
+            continue
+
+        # Detect font size for structure hints
+        font_sizes = []
+        is_bold = False
+        for line in block.get("lines", []):
+            for span in line.get("spans", []):
+                font_sizes.append(span.get("size", 12))
+                if "bold" in span.get("font", "").lower():
+                    is_bold = True
+
+        avg_font_size = sum(font_sizes) / len(font_sizes) if font_sizes else 12
+
+        text_blocks.append({
+            "text": text,
+            "page": page_num,
+            "bbox": (block["bbox"][0], block["bbox"][1],
+                     block["bbox"][2], block["bbox"][3]),
+            "font_size": avg_font_size,
+            "is_bold": is_bold,
+        })
+    return text_blocks
+
+
+def find_figure_captions(text_blocks: List[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+    """Figure/table captions among text blocks, grouped by page"""
+    captions_by_page: Dict[int, List[Dict[str, Any]]] = {}
+    for block in text_blocks:
+        text = block["text"].strip()
+        match = CAPTION_PATTERN.match(text)
+        if match:
+            captions_by_page.setdefault(block["page"], []).append({
+                "text": text,
+                "bbox": block["bbox"],
+                "figure_num": match.group(2),
+                "figure_type": match.group(1).upper().replace(".", ""),
+            })
+    return captions_by_page
+
+
+def render_caption_figures(page, page_num: int, captions: List[Dict[str, Any]]) -> List[FigureOutcome]:
+    """
+    Render the region above each caption on a page.
+
+    Only the clipped regions are rendered, never the full page.
+    """
+    import fitz
+
+    page_width = page.rect.width
+    mat = fitz.Matrix(FIGURE_ZOOM, FIGURE_ZOOM)
+    outcomes: List[FigureOutcome] = []
+
+    for cap in captions:
+        fig_key = f"{cap['figure_type']}_{cap['figure_num']}"
+
+        # Figure region is above the caption
+        # Use full page width, from up to 400pt above the caption to its top
+        cap_y0 = cap["bbox"][1]
+        margin = 10  # Small margin
+        fig_x0 = margin
+        fig_x1 = page_width - margin
+        fig_y0 = max(0, cap_y0 - 400)
+        fig_y1 = cap_y0 - 5  # Just above caption
+
+        image = None
+        # Skip if region is too small
+        if fig_y1 - fig_y0 >= 50:
+            try:
+                fig_pix = page.get_pixmap(matrix=mat, clip=fitz.Rect(fig_x0, fig_y0, fig_x1, fig_y1))
+                img_bytes = fig_pix.tobytes("png")
+                if len(img_bytes) >= 5000:  # Skip if too small
+                    image = {
+                        "page": page_num,
+                        "bbox": (fig_x0, fig_y0, fig_x1, fig_y1),
+                        "image_bytes": img_bytes,
+                        "ext": "png",
+                        "width": fig_pix.width,
+                        "height": fig_pix.height,
+                        "figure_number": cap["figure_num"],
+                        "caption": cap["text"],
+                    }
+            except Exception:
+                image = None
+        outcomes.append((fig_key, image))
+
+    return outcomes
+
+
+def merge_figures(outcomes: List[FigureOutcome]) -> List[Dict[str, Any]]:
+    """
+    Keep the first occurrence of each figure number, in page order.
+
+    A figure whose first caption region was skipped stays skipped, matching
+    a serial pass.
+    """
+    seen_figures = set()
+    images = []
+    for fig_key, image in outcomes:
+        if fig_key in seen_figures:
+            continue
+        seen_figures.add(fig_key)
+        if image is not None:
+            images.append(image)
+    return images
+
+
+def extract_page_range(
+    path: str, start: int, end: int, render_figures: bool = True
+) -> Tuple[List[Dict[str, Any]], List[FigureOutcome]]:
+    """Text blocks and caption figures of pages [start, end) (runs in workers)"""
+    import fitz
+
+    doc = fitz.open(path)
+    try:
+        text_blocks: List[Dict[str, Any]] = []
+        for page_num in range(start, end):
+            text_blocks.extend(page_text_blocks(doc[page_num], page_num))
+
+        outcomes: List[FigureOutcome] = []
+        if render_figures:
+            captions_by_page = find_figure_captions(text_blocks)
+            for page_num in sorted(captions_by_page):
+                outcomes.extend(render_caption_figures(doc[page_num], page_num, captions_by_page[page_num]))
+    finally:
+        doc.close()
+    return text_blocks, outcomes
+
+
+def extract_pdf(
+    path: str,
+    render_figures: bool = True,
+    max_workers: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], int, Dict[str, Any]]:
+    """
+    Extract a PDF's text blocks and caption-anchored figures.
+
+    Args:
+        path: PDF file path
+        render_figures: Also render figure regions above captions
+        max_workers: Worker processes for large documents (default: CPU count, 1 = in-process)
+
+    Returns:
+        (text_blocks, images, page_count, metadata)
+    """
+    import fitz
+
+    doc = fitz.open(path)
+    page_count = len(doc)
+    metadata = {
+        "title": doc.metadata.get("title", ""),
+        "author": doc.metadata.get("author", ""),
+        "subject": doc.metadata.get("subject", ""),
+        "keywords": doc.metadata.get("keywords", ""),
+        "creator": doc.metadata.get("creator", ""),
+        "creation_date": doc.metadata.get("creationDate", ""),
+    }
+    doc.close()
+
+    shards = [
+        (start, min(start + PAGES_PER_SHARD, page_count))
+        for start in range(0, page_count, PAGES_PER_SHARD)
+    ]
+    workers = min(max_workers or os.cpu_count() or 1, len(shards))
+
+    if page_count >= PARALLEL_MIN_PAGES and workers > 1:
+        # Spawned workers are safe to start from threads (ingest runs extraction in one)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as pool:
+            results = list(pool.map(
+                extract_page_range,
+                [path] * len(shards),
+                [start for start, _ in shards],
+                [end for _, end in shards],
+                [render_figures] * len(shards),
+            ))
+    else:
+        results = [extract_page_range(path, 0, page_count, render_figures)]
+
+    text_blocks: List[Dict[str, Any]] = []
+    outcomes: List[FigureOutcome] = []
+    for shard_blocks, shard_outcomes in results:
+        text_blocks.extend(shard_blocks)
+        outcomes.extend(shard_outcomes)
+
+    return text_blocks, merge_figures(outcomes), page_count, metadata
@@ -19,6 +19,13 @@ from .base import (
     StorageResult,
 )
 from .mock import MockVideoProvider
+from .http import (
+    HTTPPoolConfig,
+    configure_http,
+    close_http_clients,
+    http_client,
+    http_session,
+)
 
 # Video providers
 from .video import (
@@ -77,6 +84,12 @@ __all__ = [
     "StorageResult",
     # Mock provider
     "MockVideoProvider",
+    # Shared HTTP pools
+    "HTTPPoolConfig",
+    "configure_http",
+    "close_http_clients",
+    "http_client",
+    "http_session",
     # Video providers
     "RunwayProvider",
     "PikaProvider",
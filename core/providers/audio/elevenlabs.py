@@ -9,6 +9,7 @@ import asyncio
 from typing import Optional, Dict, Any, List, AsyncIterator
 import aiohttp
 from ..base import AudioProvider, AudioProviderConfig, AudioGenerationResult
+from ..http import http_session
 from core.secrets import get_api_key
 
 
@@ -24,6 +25,7 @@ class ElevenLabsProvider(AudioProvider):
     """
     
     _is_stub = False
+    max_concurrent_requests = 3  # Starter plan; higher plans allow more (TTS_MAX_CONCURRENCY)
     
     def __init__(
         self,
@@ -180,7 +182,7 @@ class ElevenLabsProvider(AudioProvider):
         
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.post(
                 url,
                 json=request_body,
@@ -281,7 +283,7 @@ class ElevenLabsProvider(AudioProvider):
         url = f"{self.config.base_url}/v1/text-to-speech/{effective_voice_id}/stream"
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.post(
                 url,
                 json=request_body,
@@ -320,7 +322,7 @@ List of voice dictionaries containing:
         url = f"{self.config.base_url}/v1/voices"
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.get(
                 url,
                 headers=headers,
@@ -381,7 +383,7 @@ List of voice dictionaries containing:
         url = f"{self.config.base_url}/v1/voices/{voice_id}"
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.get(
                 url,
                 headers=headers,
@@ -416,7 +418,7 @@ List of voice dictionaries containing:
         url = f"{self.config.base_url}/v1/models"
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.get(
                 url,
                 headers=headers,
@@ -452,7 +454,7 @@ List of voice dictionaries containing:
         url = f"{self.config.base_url}/v1/user/subscription"
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.get(
                 url,
                 headers=headers,
@@ -488,7 +490,7 @@ List of voice dictionaries containing:
         url = f"{self.config.base_url}/v1/history"
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.get(
                 url,
                 headers=headers,
@@ -558,7 +560,7 @@ List of voice dictionaries containing:
             "xi-api-key": self.config.api_key
         }
         
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.post(
                 url,
                 data=form,
@@ -10,6 +10,7 @@ import base64
 from typing import Optional, Dict, Any, List
 import aiohttp
 from ..base import AudioProvider, AudioProviderConfig, AudioGenerationResult
+from ..http import http_session
 from core.secrets import get_api_key
 
 
@@ -241,7 +242,7 @@ class GoogleTTSProvider(AudioProvider):
         url = f"{self.API_URL}/text:synthesize"
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.post(
                 url,
                 json=request_body,
@@ -346,7 +347,7 @@ class GoogleTTSProvider(AudioProvider):
         
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.get(
                 url,
                 headers=headers,
@@ -465,7 +466,7 @@ class GoogleTTSProvider(AudioProvider):
         url = f"{self.API_URL}/text:synthesizeLongAudio"
         headers = self._get_headers()
         
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             # Submit long audio synthesis job
             async with session.post(
                 url,
@@ -27,6 +27,7 @@ from enum import Enum
 import httpx
 
 from ..base import AudioProvider, AudioProviderConfig, AudioGenerationResult
+from ..http import http_client
 
 
 # =============================================================================
@@ -136,19 +137,37 @@ class InworldProvider(AudioProvider):
             )
 
         # The API key from Inworld Portal is base64-encoded
-        self.client = httpx.AsyncClient(
-            base_url=self.inworld_config.base_url,
-            headers={
-                "Authorization": f"Basic {self.config.api_key}",
-                "Content-Type": "application/json",
-            },
+        self.headers = {
+            "Authorization": f"Basic {self.config.api_key}",
+            "Content-Type": "application/json",
+        }
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send an API request on the shared (HTTP/2 when available) client"""
+        client = await http_client()
+        response = await client.request(
+            method,
+            f"{self.inworld_config.base_url}{path}",
+            headers=self.headers,
             timeout=self.config.timeout,
+            **kwargs
         )
+        response.raise_for_status()
+        return response
 
     @property
     def name(self) -> str:
         return "inworld"
 
+    def synthesis_settings(self) -> Dict[str, Any]:
+        """Model and audio settings live on the Inworld config"""
+        return {
+            "model": self.inworld_config.model.value,
+            "default_voice": self.inworld_config.default_voice,
+            "audio_format": self.inworld_config.audio_format.value,
+            "sample_rate": self.inworld_config.sample_rate,
+        }
+
     # =========================================================================
     # MAIN SYNTHESIS
     # =========================================================================
@@ -223,11 +242,11 @@ class InworldProvider(AudioProvider):
         # TODO: Implement actual API call
         # Endpoint: POST /tts/synthesize
 
-        response = await self.client.post(
+        response = await self._request(
+            "POST",
             "/tts/synthesize",
             json=request_body
         )
-        response.raise_for_status()
 
         data = response.json()
 
@@ -274,8 +293,7 @@ class InworldProvider(AudioProvider):
         # TODO: Implement actual API call
         # Endpoint: GET /voices
 
-        response = await self.client.get("/voices")
-        response.raise_for_status()
+        response = await self._request("GET", "/voices")
 
         voices = []
         for v in response.json().get("voices", []):
@@ -368,8 +386,8 @@ class InworldProvider(AudioProvider):
             return False
 
     async def close(self):
-        """Clean up resources"""
-        await self.client.aclose()
+        """No-op: the shared HTTP client is closed with the event loop"""
+        pass
 
     async def __aenter__(self):
         return self
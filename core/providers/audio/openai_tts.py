@@ -20,6 +20,7 @@ import aiohttp
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from ..base import AudioProvider, AudioProviderConfig, AudioGenerationResult
+from ..http import http_session
 
 
 class OpenAITTSProvider(AudioProvider):
@@ -108,9 +109,10 @@ class OpenAITTSProvider(AudioProvider):
 
         try:
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with http_session() as session:
                 async with session.post(
                     self.API_URL,
+                    timeout=timeout,
                     headers={
                         "Authorization": f"Bearer {self.config.api_key}",
                         "Content-Type": "application/json"
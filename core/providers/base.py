@@ -200,6 +200,10 @@ class AudioProvider(ABC):
     All audio providers (ElevenLabs, OpenAI TTS, Google TTS) must implement this interface.
     """
 
+    # Request limits honoured by core.tts_scheduler when generating many chunks
+    max_concurrent_requests: int = 4
+    characters_per_minute: Optional[int] = None  # None = no character budget
+
     def __init__(self, config: AudioProviderConfig):
         self.config = config
 
@@ -209,6 +213,21 @@ class AudioProvider(ABC):
         """Provider name identifier"""
         pass
 
+    def synthesis_settings(self) -> Dict[str, Any]:
+        """
+        Settings besides text and voice that shape the generated audio.
+
+        Part of the TTS cache key (core.tts_cache). The default covers the
+        model and every `default_*` attribute (voice settings, speaking rate,
+        encoding...); override if a provider keeps settings elsewhere.
+        """
+        settings = {
+            name: value for name, value in vars(self).items()
+            if name.startswith("default_")
+        }
+        settings["model"] = getattr(self, "model", None)
+        return settings
+
     @abstractmethod
     async def generate_speech(
         self,
@@ -0,0 +1,176 @@
+"""
+Shared HTTP connection pools for provider clients.
+
+Opening a new client per request pays a TCP + TLS handshake every time (a
+120-segment TTS run used to do that per paragraph). Providers instead borrow
+a process-wide session from this registry, which keeps per-host keep-alive
+pools with configurable limits:
+
+    async with http_session() as session:
+        async with session.post(url, json=body, headers=headers) as response:
+            ...
+
+Sessions are bound to an event loop, so the registry keeps one per running
+loop. Each loop's clients are closed when the loop shuts down (`asyncio.run`
+and pytest-asyncio call `loop.shutdown_asyncgens()`, which finalizes the
+keeper generator registered below), or explicitly with
+`close_http_clients()` (e.g. in the API server's lifespan).
+
+`http_client()` provides an equivalent shared httpx client, using HTTP/2
+when the optional `h2` package is installed.
+"""
+
+import asyncio
+import os
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional
+
+import aiohttp
+
+
+@dataclass
+class HTTPPoolConfig:
+    """Connection limits for the shared pools"""
+    max_connections: int = 100  # Across all hosts
+    max_connections_per_host: int = 16
+    keepalive_timeout: float = 30.0  # Seconds an idle connection stays open
+    dns_cache_ttl: int = 300
+    http2: bool = True  # httpx client only; needs the `h2` package
+
+    @classmethod
+    def from_env(cls) -> 'HTTPPoolConfig':
+        """Create config from environment variables"""
+        return cls(
+            max_connections=int(os.environ.get("HTTP_MAX_CONNECTIONS", 100)),
+            max_connections_per_host=int(os.environ.get("HTTP_MAX_CONNECTIONS_PER_HOST", 16)),
+            keepalive_timeout=float(os.environ.get("HTTP_KEEPALIVE_TIMEOUT", 30.0)),
+            http2=os.environ.get("HTTP_HTTP2", "1").lower() not in ("0", "false", "no"),
+        )
+
+
+class HTTPClientRegistry:
+    """Per-event-loop shared aiohttp sessions and httpx clients"""
+
+    def __init__(self, config: Optional[HTTPPoolConfig] = None):
+        self.config = config or HTTPPoolConfig.from_env()
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._httpx_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._keepers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def _keep_until_loop_shutdown(self):
+        """Async generator whose finalizer closes this loop's clients"""
+        try:
+            yield
+        finally:
+            await self.aclose()
+
+    async def _register_loop(self, loop: asyncio.AbstractEventLoop):
+        if loop not in self._keepers:
+            keeper = self._keep_until_loop_shutdown()
+            await keeper.__anext__()  # Now tracked by the loop's shutdown_asyncgens()
+            self._keepers[loop] = keeper
+
+    async def session(self) -> aiohttp.ClientSession:
+        """Shared aiohttp session for the running loop"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_connections,
+                limit_per_host=self.config.max_connections_per_host,
+                keepalive_timeout=self.config.keepalive_timeout,
+                ttl_dns_cache=self.config.dns_cache_ttl,
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[loop] = session
+            await self._register_loop(loop)
+        return session
+
+    async def httpx_client(self):
+        """Shared httpx.AsyncClient for the running loop (HTTP/2 if available)"""
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "httpx is required for this provider. "
+                "Install with: pip install httpx"
+            )
+
+        loop = asyncio.get_running_loop()
+        client = self._httpx_clients.get(loop)
+        if client is None or client.is_closed:
+            http2 = self.config.http2
+            if http2:
+                try:
+                    import h2  # noqa: F401
+                except ImportError:
+                    http2 = False
+            client = httpx.AsyncClient(
+                http2=http2,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_connections_per_host,
+                    keepalive_expiry=self.config.keepalive_timeout,
+                ),
+            )
+            self._httpx_clients[loop] = client
+            await self._register_loop(loop)
+        return client
+
+    async def aclose(self):
+        """Close the running loop's clients (they are recreated on next use)"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(loop, None)
+        if session is not None and not session.closed:
+            await session.close()
+        client = self._httpx_clients.pop(loop, None)
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+
+_registry: Optional[HTTPClientRegistry] = None
+
+
+def get_http_registry() -> HTTPClientRegistry:
+    """Get the process-wide registry (created on first use)"""
+    global _registry
+    if _registry is None:
+        _registry = HTTPClientRegistry()
+    return _registry
+
+
+def configure_http(config: HTTPPoolConfig) -> HTTPClientRegistry:
+    """
+    Replace the process-wide registry with one using new limits.
+
+    Call before any provider makes a request; clients already created by
+    the old registry keep their limits until their loop shuts down.
+    """
+    global _registry
+    _registry = HTTPClientRegistry(config)
+    return _registry
+
+
+@asynccontextmanager
+async def http_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """Borrow the shared aiohttp session (it stays open after the block)"""
+    yield await get_http_registry().session()
+
+
+async def http_client():
+    """Get the shared httpx client"""
+    return await get_http_registry().httpx_client()
+
+
+async def close_http_clients():
+    """Close the shared clients of the running loop"""
+    if _registry is not None:
+        await _registry.aclose()
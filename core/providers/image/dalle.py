@@ -21,6 +21,7 @@ import hashlib
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from ..base import ImageProvider, ImageProviderConfig, ImageGenerationResult
+from ..http import http_session
 
 
 class DalleProvider(ImageProvider):
@@ -136,9 +137,10 @@ class DalleProvider(ImageProvider):
 
         try:
             timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with http_session() as session:
                 async with session.post(
                     self.API_URL,
+                    timeout=timeout,
                     headers={
                         "Authorization": f"Bearer {self.config.api_key}",
                         "Content-Type": "application/json"
@@ -213,7 +215,7 @@ class DalleProvider(ImageProvider):
         prompt_hash = hashlib.md5(prompt.encode()).hexdigest()[:8]
         output_path = output_dir / f"dalle_{prompt_hash}.png"
 
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.get(url) as response:
                 if response.status == 200:
                     output_path.write_bytes(await response.read())
@@ -254,7 +256,7 @@ class DalleProvider(ImageProvider):
         """
         try:
             # Use a simple models list endpoint to validate
-            async with aiohttp.ClientSession() as session:
+            async with http_session() as session:
                 async with session.get(
                     "https://api.openai.com/v1/models",
                     headers={"Authorization": f"Bearer {self.config.api_key}"}
@@ -25,6 +25,7 @@ from typing import Dict, Any, List, Optional
 import aiohttp
 
 from ..base import ImageProvider, ImageProviderConfig, ImageGenerationResult
+from ..http import http_session
 
 
 # Categories of images to prefer for technical/educational content
@@ -105,9 +106,7 @@ class WikimediaProvider(ImageProvider):
         search_query = self._clean_query(prompt)
 
         try:
-            async with aiohttp.ClientSession(
-                headers={"User-Agent": self.USER_AGENT}
-            ) as session:
+            async with http_session() as session:
                 # Try progressively simpler queries until we get results
                 detailed = await self._search_with_fallback(
                     session, search_query, max_results
@@ -511,7 +510,7 @@ class WikimediaProvider(ImageProvider):
     ) -> bool:
         """Download an image to local path."""
         try:
-            async with session.get(url) as resp:
+            async with session.get(url, headers={"User-Agent": WikimediaProvider.USER_AGENT}) as resp:
                 if resp.status != 200:
                     return False
                 output_path.parent.mkdir(parents=True, exist_ok=True)
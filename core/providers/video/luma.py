@@ -29,6 +29,8 @@ from typing import Dict, Any, Optional, List
 from lumaai import LumaAI
 
 from ..base import VideoProvider, VideoProviderConfig, GenerationResult, ProviderType
+from ..http import http_session
+from .luma_poller import LumaStatusPoller
 from core.secrets import get_api_key
 
 
@@ -77,6 +79,14 @@ class LumaProvider(VideoProvider):
         super().__init__(config)
         self.model = model
         self.client = LumaAI(auth_token=self.config.api_key)
+        self._poller: Optional[LumaStatusPoller] = None
+
+    @property
+    def poller(self) -> LumaStatusPoller:
+        """Shared status poller for this provider's in-flight generations"""
+        if self._poller is None or self._poller.client is not self.client:
+            self._poller = LumaStatusPoller(self.client)
+        return self._poller
 
     @property
     def name(self) -> str:
@@ -157,8 +167,8 @@ class LumaProvider(VideoProvider):
             }
 
         try:
-            # Create generation (synchronous call, returns generation object)
-            generation = self.client.generations.create(**request_params)
+            # Create generation (the SDK is synchronous; keep it off the event loop)
+            generation = await asyncio.to_thread(self.client.generations.create, **request_params)
 
             # Wait for completion
             video_url = await self._wait_for_completion(
@@ -327,7 +337,7 @@ class LumaProvider(VideoProvider):
 
         # Submit generation (returns immediately)
         try:
-            generation = self.client.generations.create(**request_params)
+            generation = await asyncio.to_thread(self.client.generations.create, **request_params)
         except Exception as e:
             # Re-raise with more context about what failed
             raise Exception(f"Luma submit_generation failed: {str(e)}") from e
@@ -358,7 +368,7 @@ class LumaProvider(VideoProvider):
             generation_id: ID from submit_generation
             submission_info: Info dict from submit_generation
             timeout: Maximum wait time in seconds
-            poll_interval: Seconds between status checks
+            poll_interval: Longest interval between status checks
             quiet: If True, suppress progress output
 
         Returns:
@@ -406,12 +416,15 @@ class LumaProvider(VideoProvider):
         quiet: bool = False
     ) -> str:
         """
-        Poll until generation completes.
+        Wait until generation completes.
+
+        Status checks go through the provider's shared poller, which batches
+        them across all in-flight generations and backs off adaptively.
 
         Args:
             generation_id: Luma generation ID
             timeout: Maximum wait time in seconds (default: 600 = 10 min)
-            poll_interval: Seconds between status checks (default: 10)
+            poll_interval: Longest interval between status checks (default: 10)
             quiet: If True, suppress progress output
 
         Returns:
@@ -421,37 +434,30 @@ class LumaProvider(VideoProvider):
             TimeoutError: If generation doesn't complete in time
             Exception: If generation fails
         """
-        import time
-        start_time = time.time()
-        elapsed = 0
-
         if not quiet:
             print(f"[Luma] Waiting for generation {generation_id}...")
 
-        while elapsed < timeout:
-            # Get current status (synchronous call)
-            generation = self.client.generations.get(generation_id)
-            elapsed = int(time.time() - start_time)
-
+        def on_update(generation, elapsed: int):
             if not quiet:
                 print(f"[Luma] Status: {generation.state} (elapsed: {elapsed}s)")
 
-            if generation.state == "completed":
-                # Return video URL from assets
-                if hasattr(generation, 'assets') and generation.assets:
-                    if not quiet:
-                        print(f"[Luma] Completed! URL: {generation.assets.video}")
-                    return generation.assets.video
-                raise Exception("Generation completed but no video URL found")
-
-            elif generation.state == "failed":
-                reason = getattr(generation, 'failure_reason', 'Unknown error')
-                raise Exception(f"Luma generation failed: {reason}")
+        generation = await self.poller.wait(
+            generation_id,
+            timeout=timeout,
+            max_interval=poll_interval,
+            on_update=on_update,
+        )
 
-            # Still processing (queued, dreaming, etc.)
-            await asyncio.sleep(poll_interval)
+        if generation.state == "completed":
+            # Return video URL from assets
+            if hasattr(generation, 'assets') and generation.assets:
+                if not quiet:
+                    print(f"[Luma] Completed! URL: {generation.assets.video}")
+                return generation.assets.video
+            raise Exception("Generation completed but no video URL found")
 
-        raise TimeoutError(f"Luma generation timed out after {timeout}s (last state: {generation.state})")
+        reason = getattr(generation, 'failure_reason', 'Unknown error')
+        raise Exception(f"Luma generation failed: {reason}")
 
     async def generate_continuous(
         self,
@@ -520,7 +526,7 @@ class LumaProvider(VideoProvider):
             Status dict with id, status, video_url, failure_reason
         """
         try:
-            generation = self.client.generations.get(job_id)
+            generation = await asyncio.to_thread(self.client.generations.get, job_id)
             return {
                 "id": generation.id,
                 "status": generation.state,
@@ -546,14 +552,13 @@ class LumaProvider(VideoProvider):
             True if successful, False otherwise
         """
         try:
-            import httpx
-
-            async with httpx.AsyncClient() as client:
-                response = await client.get(video_url, follow_redirects=True)
-                response.raise_for_status()
+            async with http_session() as session:
+                async with session.get(video_url) as response:
+                    response.raise_for_status()
 
-                with open(output_path, "wb") as f:
-                    f.write(response.content)
+                    with open(output_path, "wb") as f:
+                        async for chunk in response.content.iter_chunked(1024 * 1024):
+                            f.write(chunk)
 
             return True
         except Exception:
@@ -583,7 +588,7 @@ class LumaProvider(VideoProvider):
         """
         try:
             # Try to list camera motions as a simple validation call
-            self.client.generations.camera_motion.list()
+            await asyncio.to_thread(self.client.generations.camera_motion.list)
             return True
         except Exception:
             return False
@@ -596,7 +601,7 @@ class LumaProvider(VideoProvider):
             List of camera motion keys (e.g., ["orbit", "pan_left", ...])
         """
         try:
-            concepts = self.client.generations.camera_motion.list()
+            concepts = await asyncio.to_thread(self.client.generations.camera_motion.list)
             return [c.key for c in concepts] if concepts else []
         except Exception:
             return []
@@ -612,7 +617,7 @@ class LumaProvider(VideoProvider):
             List of generation info dicts
         """
         try:
-            response = self.client.generations.list(limit=limit)
+            response = await asyncio.to_thread(self.client.generations.list, limit=limit)
 
             # The response is a GenerationListResponse object
             # Access the generations list from the response
@@ -667,7 +672,7 @@ class LumaProvider(VideoProvider):
         Raises:
             Exception: If generation is not completed or download fails
         """
-        gen = self.client.generations.get(generation_id)
+        gen = await asyncio.to_thread(self.client.generations.get, generation_id)
         if gen.state != "completed":
             raise Exception(f"Generation {generation_id} is not completed (state: {gen.state})")
 
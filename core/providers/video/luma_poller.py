@@ -0,0 +1,261 @@
+"""
+Shared status poller for Luma generations.
+
+The Luma SDK is synchronous, and polling each generation in its own loop
+blocked the event loop once per status call - with 20+ scenes in flight,
+other agents (QA, audio) starved. LumaStatusPoller instead tracks every
+in-flight generation of a client in one background task:
+
+- Each tick checks all generations that are due with a single
+  `generations.list` call (when more than one is in flight), falling back
+  to individual `generations.get` calls, at most `max_concurrent_requests`
+  at a time, for any the listing didn't include.
+- SDK calls run in worker threads, so the event loop never blocks.
+- Each generation backs off on its own: checked every couple of seconds at
+  first (so quick failures surface quickly), then less often while Luma is
+  "dreaming" (rendering takes minutes).
+- Each waiter's future resolves as soon as its generation finishes.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+# Seconds between checks of one generation
+INITIAL_INTERVAL = 2.0
+QUEUED_MAX_INTERVAL = 5.0  # Cap while queued/pending
+BACKOFF = 1.5
+
+TERMINAL_STATES = ("completed", "failed")
+
+# Consecutive failed status requests before a wait gives up
+MAX_STATUS_ERRORS = 3
+
+
+@dataclass
+class _Waiter:
+    """One generation being waited on"""
+    generation_id: str
+    future: asyncio.Future
+    started: float
+    deadline: float
+    max_interval: float
+    interval: float
+    next_check: float
+    state: Optional[str] = None
+    errors: int = 0
+    on_update: Optional[Callable[[Any, int], None]] = None
+
+
+class LumaStatusPoller:
+    """Multiplexes status polling for all in-flight generations of one client"""
+
+    def __init__(
+        self,
+        client,
+        max_concurrent_requests: int = 4,
+        list_limit: int = 100,
+        initial_interval: float = INITIAL_INTERVAL,
+        queued_max_interval: float = QUEUED_MAX_INTERVAL,
+        backoff: float = BACKOFF,
+    ):
+        """
+        Initialize the poller.
+
+        Args:
+            client: LumaAI client
+            max_concurrent_requests: Individual status requests in flight at once
+            list_limit: Most generations fetched by one listing call
+            initial_interval: Seconds before the first check of a generation
+            queued_max_interval: Longest interval while a generation is queued
+            backoff: Interval growth factor per check
+        """
+        self.client = client
+        self.list_limit = list_limit
+        self.initial_interval = initial_interval
+        self.queued_max_interval = queued_max_interval
+        self.backoff = backoff
+
+        self._semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self._waiters: Dict[str, List[_Waiter]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+        self.list_calls = 0
+        self.get_calls = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of generations currently being polled"""
+        return len(self._waiters)
+
+    async def wait(
+        self,
+        generation_id: str,
+        timeout: float = 600,
+        max_interval: float = 10.0,
+        on_update: Optional[Callable[[Any, int], None]] = None,
+    ) -> Any:
+        """
+        Wait until a generation completes or fails.
+
+        Args:
+            generation_id: Luma generation ID
+            timeout: Maximum wait time in seconds
+            max_interval: Longest interval between checks (reached while dreaming)
+            on_update: Optional callback(generation, elapsed_seconds) on state changes
+
+        Returns:
+            The final generation object (state "completed" or "failed")
+
+        Raises:
+            TimeoutError: If the generation doesn't finish in time
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        interval = min(self.initial_interval, max_interval)
+        waiter = _Waiter(
+            generation_id=generation_id,
+            future=loop.create_future(),
+            started=now,
+            deadline=now + timeout,
+            max_interval=max_interval,
+            interval=interval,
+            next_check=now + interval,
+            on_update=on_update,
+        )
+        self._waiters.setdefault(generation_id, []).append(waiter)
+        self._ensure_running()
+
+        try:
+            return await waiter.future
+        finally:
+            self._remove(waiter)
+
+    def _remove(self, waiter: _Waiter):
+        waiters = self._waiters.get(waiter.generation_id)
+        if waiters and waiter in waiters:
+            waiters.remove(waiter)
+            if not waiters:
+                del self._waiters[waiter.generation_id]
+
+    def _ensure_running(self):
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.ensure_future(self._run())
+        else:
+            # Reschedule around the new waiter
+            self._wakeup.set()
+
+    async def _run(self):
+        """Poll until no generation is being waited on"""
+        loop = asyncio.get_running_loop()
+
+        while self._waiters:
+            now = loop.time()
+            all_waiters = [w for ws in self._waiters.values() for w in ws if not w.future.done()]
+
+            for waiter in all_waiters:
+                if now >= waiter.deadline:
+                    waiter.future.set_exception(TimeoutError(
+                        f"Luma generation timed out after {int(now - waiter.started)}s "
+                        f"(last state: {waiter.state})"
+                    ))
+
+            due = [w for w in all_waiters if not w.future.done() and w.next_check <= now]
+            if due:
+                await self._check(due)
+
+            pending = [w for ws in self._waiters.values() for w in ws if not w.future.done()]
+            if not pending:
+                # Let finished waiters unregister before deciding to stop
+                await asyncio.sleep(0)
+                continue
+
+            wake_at = min(min(w.next_check, w.deadline) for w in pending)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), max(0.0, wake_at - loop.time()))
+            except asyncio.TimeoutError:
+                pass
+
+    async def _check(self, due: List[_Waiter]):
+        """Fetch the status of every due generation (one listing call if possible)"""
+        found: Dict[str, Any] = {}
+
+        if len(self._waiters) > 1:
+            try:
+                found = await self._list_in_flight()
+            except Exception:
+                found = {}
+
+            # A listing refreshes every generation it includes, due or not
+            for generation_id, generation in found.items():
+                for waiter in list(self._waiters.get(generation_id, ())):
+                    self._update(waiter, generation)
+
+        missing = {
+            w.generation_id for w in due
+            if w.generation_id not in found and not w.future.done()
+        }
+        results = await asyncio.gather(
+            *[self._get(generation_id) for generation_id in missing],
+            return_exceptions=True,
+        )
+
+        for generation_id, result in zip(missing, results):
+            for waiter in list(self._waiters.get(generation_id, ())):
+                if isinstance(result, Exception):
+                    self._record_error(waiter, result)
+                else:
+                    self._update(waiter, result)
+
+    async def _list_in_flight(self) -> Dict[str, Any]:
+        limit = min(self.list_limit, max(10, 2 * len(self._waiters)))
+        async with self._semaphore:
+            self.list_calls += 1
+            response = await asyncio.to_thread(self.client.generations.list, limit=limit)
+
+        generations = getattr(response, "generations", None) or []
+        return {g.id: g for g in generations if g.id in self._waiters}
+
+    async def _get(self, generation_id: str) -> Any:
+        async with self._semaphore:
+            self.get_calls += 1
+            return await asyncio.to_thread(self.client.generations.get, generation_id)
+
+    def _update(self, waiter: _Waiter, generation: Any):
+        """Apply a fresh status and schedule the next check"""
+        if waiter.future.done():
+            return
+
+        now = asyncio.get_running_loop().time()
+        waiter.errors = 0
+
+        if generation.state != waiter.state:
+            waiter.state = generation.state
+            if waiter.on_update:
+                waiter.on_update(generation, int(now - waiter.started))
+
+        if generation.state in TERMINAL_STATES:
+            waiter.future.set_result(generation)
+            return
+
+        cap = waiter.max_interval if generation.state == "dreaming" else min(
+            self.queued_max_interval, waiter.max_interval
+        )
+        waiter.interval = min(waiter.interval * self.backoff, cap)
+        waiter.next_check = now + waiter.interval
+
+    def _record_error(self, waiter: _Waiter, error: Exception):
+        """Retry a failed status request later, giving up after repeated failures"""
+        if waiter.future.done():
+            return
+
+        waiter.errors += 1
+        if waiter.errors >= MAX_STATUS_ERRORS:
+            waiter.future.set_exception(error)
+            return
+
+        waiter.interval = min(waiter.interval * self.backoff, waiter.max_interval)
+        waiter.next_check = asyncio.get_running_loop().time() + waiter.interval
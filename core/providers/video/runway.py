@@ -6,8 +6,9 @@ import base64
 import mimetypes
 import os
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any
 from ..base import VideoProvider, VideoProviderConfig, GenerationResult, ProviderType
+from ..http import get_http_registry
 from core.budget import ProductionTier
 
 
@@ -40,19 +41,15 @@ class RunwayProvider(VideoProvider):
         if not self.config.api_key:
             raise ValueError("Runway API key required")
 
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.headers = {
+            "Authorization": f"Bearer {self.config.api_key}",
+            "Content-Type": "application/json",
+            "X-Runway-Version": self.API_VERSION
+        }
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                headers={
-                    "Authorization": f"Bearer {self.config.api_key}",
-                    "Content-Type": "application/json",
-                    "X-Runway-Version": self.API_VERSION
-                }
-            )
-        return self.session
+        """Get the shared aiohttp session (API calls pass self.headers)"""
+        return await get_http_registry().session()
 
     async def generate_video(
         self,
@@ -134,6 +131,7 @@ class RunwayProvider(VideoProvider):
             async with session.post(
                 endpoint,
                 json=payload,
+                headers=self.headers,
                 timeout=aiohttp.ClientTimeout(total=30)  # Initial request timeout
             ) as response:
                 response_text = await response.text()
@@ -241,6 +239,7 @@ class RunwayProvider(VideoProvider):
         try:
             async with session.get(
                 f"{self.STATUS_ENDPOINT}/{job_id}",
+                headers=self.headers,
                 timeout=aiohttp.ClientTimeout(total=30)
             ) as response:
                 if response.status != 200:
@@ -367,6 +366,7 @@ class RunwayProvider(VideoProvider):
             async with session.post(
                 self.UPLOADS_ENDPOINT,
                 json=upload_request,
+                headers=self.headers,
                 timeout=aiohttp.ClientTimeout(total=30)
             ) as response:
                 if response.status not in (200, 201):
@@ -382,17 +382,16 @@ class RunwayProvider(VideoProvider):
             if not upload_url or not runway_uri:
                 raise RuntimeError(f"Invalid upload response: {upload_info}")
 
-            # Upload using a new session without auth headers
-            async with aiohttp.ClientSession() as upload_session:
-                async with upload_session.put(
-                    upload_url,
-                    data=image_data,
-                    headers={"Content-Type": mime_type},
-                    timeout=aiohttp.ClientTimeout(total=120)
-                ) as upload_response:
-                    if upload_response.status not in (200, 201):
-                        error_text = await upload_response.text()
-                        raise RuntimeError(f"Failed to upload image: {error_text}")
+            # Upload to the presigned URL without auth headers
+            async with session.put(
+                upload_url,
+                data=image_data,
+                headers={"Content-Type": mime_type},
+                timeout=aiohttp.ClientTimeout(total=120)
+            ) as upload_response:
+                if upload_response.status not in (200, 201):
+                    error_text = await upload_response.text()
+                    raise RuntimeError(f"Failed to upload image: {error_text}")
 
             return runway_uri
 
@@ -416,6 +415,7 @@ class RunwayProvider(VideoProvider):
             # Try to hit the tasks endpoint to verify auth
             async with session.get(
                 f"{self.STATUS_ENDPOINT}",
+                headers=self.headers,
                 timeout=aiohttp.ClientTimeout(total=10)
             ) as response:
                 # 200 or 404 (no tasks) means auth worked
@@ -425,6 +425,5 @@ class RunwayProvider(VideoProvider):
             return False
 
     async def close(self):
-        """Close aiohttp session"""
-        if self.session and not self.session.closed:
-            await self.session.close()
+        """No-op: the shared HTTP session is closed with the event loop"""
+        pass
@@ -0,0 +1,231 @@
+"""
+Persistent cache of QA results, keyed by what the footage looks like.
+
+Vision QA is the most expensive step after generation, and reruns (`resume`,
+repeated `produce` runs) often verify the same clips again. Entries are
+keyed by:
+- a perceptual hash (dHash) of each sampled frame, so re-downloaded or
+  re-encoded copies of a clip still match,
+- a hash of the scene specification and request the footage was judged
+  against, and
+- the production tier (thresholds and style expectations differ).
+
+Entries are JSON files grouped by scene spec and tier:
+    artifacts/cache/qa/<spec-hash>/<footage-hash digest>.json
+A lookup tries the exact footage first, then scans that group (a handful of
+entries: one per distinct clip judged against the scene) for footage within
+`max_distance` bits of the query. Hits refresh the entry's mtime; entries
+older than the TTL are dropped, and the least recently used ones are evicted
+past `max_entries` (see core.disk_cache).
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from PIL import Image
+
+from core.disk_cache import DiskCache
+
+# Bump when the QA prompt or scoring changes in a way that invalidates results
+QA_CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = "artifacts/cache/qa"
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600  # 30 days
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def frame_dhash(image_bytes: bytes) -> int:
+    """
+    64-bit difference hash of an image.
+
+    The image is shrunk to 9x8 grayscale and each bit records whether a pixel
+    is brighter than its right neighbour, so the hash survives rescaling and
+    re-compression.
+    """
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        pixels = list(image.convert("L").resize((9, 8), Image.LANCZOS).getdata())
+
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (1 if left > right else 0)
+    return value
+
+
+def footage_hash(frames: Sequence[bytes]) -> str:
+    """Perceptual hash of a clip: the frame dHashes in order, as hex"""
+    return "".join(f"{frame_dhash(frame):016x}" for frame in frames)
+
+
+def hash_distance(a: str, b: str) -> Optional[int]:
+    """Differing bits between two footage hashes (None if frame counts differ)"""
+    if len(a) != len(b):
+        return None
+    return bin(int(a, 16) ^ int(b, 16)).count("1") if a else 0
+
+
+def spec_hash(production_tier: str, **spec: Any) -> str:
+    """Hash of everything (besides the footage) that determines a QA verdict"""
+    payload = json.dumps(
+        {"version": QA_CACHE_VERSION, "tier": production_tier, **spec},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+
+
+class QACache(DiskCache):
+    """
+    TTL- and size-bounded store for QA results.
+
+    Results are stored as plain dicts; QAVerifierAgent converts them to and
+    from QAResult.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_distance: int = 6,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+            ttl_seconds: Entries older than this are ignored and removed (None = never)
+            max_entries: Evict least recently used entries above this count
+            max_distance: Most differing hash bits (across all frames) that still match
+        """
+        super().__init__(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_distance = max_distance
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - stored_at > self.ttl_seconds
+
+    def _entry_path(self, spec_key: str, footage: str) -> Path:
+        # Footage hashes grow with the frame count; keep file names short
+        digest = hashlib.sha1(footage.encode("utf-8")).hexdigest()[:20]
+        return self.cache_dir / spec_key / f"{digest}.json"
+
+    def _read(self, entry: Path) -> Optional[Dict[str, Any]]:
+        """Load an entry, dropping it if expired or unreadable"""
+        try:
+            with open(entry, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if self._expired(data.get("stored_at", 0)):
+            entry.unlink(missing_ok=True)
+            return None
+        return data
+
+    def get(self, spec_key: str, footage: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the stored result for the closest matching footage.
+
+        Args:
+            spec_key: spec_hash() of the scene, request and tier
+            footage: footage_hash() of the sampled frames
+
+        Returns:
+            The stored result dict, or None on a miss
+        """
+        result = None
+        exact = self._entry_path(spec_key, footage)
+        candidates = [exact] if exact.exists() else []
+        if not candidates and self.max_distance > 0 and exact.parent.is_dir():
+            candidates = list(exact.parent.glob("*.json"))
+
+        best: Optional[Tuple[int, Path, Dict[str, Any]]] = None
+        for entry in candidates:
+            data = self._read(entry)
+            if data is None:
+                continue
+            distance = hash_distance(data.get("footage", ""), footage)
+            if distance is not None and distance <= self.max_distance:
+                if best is None or distance < best[0]:
+                    best = (distance, entry, data)
+
+        if best is not None:
+            _, entry, data = best
+            try:
+                os.utime(entry)
+                result = data["result"]
+            except (OSError, KeyError):
+                result = None
+
+        self._count(hit=result is not None)
+        return result
+
+    def put(self, spec_key: str, footage: str, result: Any):
+        """
+        Store a QA result.
+
+        Args:
+            spec_key: spec_hash() of the scene, request and tier
+            footage: footage_hash() of the sampled frames
+            result: QAResult dataclass or plain dict
+        """
+        if not isinstance(result, dict):
+            result = asdict(result)
+
+        entry = self._entry_path(spec_key, footage)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"stored_at": time.time(), "footage": footage, "result": result}, f, default=str)
+            os.replace(tmp_path, entry)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self._stored()
+
+    def evict(self, max_entries: Optional[int] = None) -> int:
+        """
+        Remove expired entries, then least recently used ones above the limit.
+
+        Args:
+            max_entries: Override the configured limit (e.g. 0 to clear)
+
+        Returns:
+            Number of entries removed
+        """
+        limit = self.max_entries if max_entries is None else max_entries
+
+        removed = 0
+        keep = []
+        for entry in self._entries():
+            # mtime >= stored_at, so this only drops entries get() would reject
+            if self.ttl_seconds is not None and time.time() - entry.mtime > self.ttl_seconds:
+                self._remove(entry)
+                removed += 1
+            else:
+                keep.append(entry)
+
+        return removed + self._evict_lru(keep, lambda _, count: count <= limit)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and hit/miss counters."""
+        return {
+            "cache_dir": str(self.cache_dir),
+            "entries": len(self._entries()),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
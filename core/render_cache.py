@@ -0,0 +1,195 @@
+"""
+Content-addressed cache for rendered media intermediates.
+
+Render outputs (trimmed clips, text overlays, assembled segments, final
+candidate renders) are stored under a key derived from everything that
+determines their bytes: input file digests, trim points, overlay settings,
+encoder parameters and the FFmpeg version. Identical work across edit
+candidates, reruns and `resume` is then a cache hit instead of an encode.
+
+Entries live as flat files under the cache directory. Hits refresh the
+entry's mtime, and the least recently used entries are evicted once the
+cache grows past its size limit (see core.disk_cache).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from core.disk_cache import SizeBoundedCache
+
+# Bump when rendering code changes in a way that alters output bytes
+RENDER_CACHE_VERSION = 2
+
+DEFAULT_CACHE_DIR = "artifacts/cache/renders"
+DEFAULT_MAX_SIZE_BYTES = 10 * 1024 ** 3  # 10 GB
+
+_digest_lock = threading.Lock()
+_digest_memo: Dict[Tuple[str, int, int], str] = {}
+
+
+def file_digest(path: str) -> str:
+    """
+    SHA-256 of a file's contents.
+
+    Memoized per process on (path, size, mtime) so repeated lookups of the
+    same unchanged input don't re-read it.
+    """
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    memo_key = (abs_path, stat.st_size, stat.st_mtime_ns)
+
+    with _digest_lock:
+        cached = _digest_memo.get(memo_key)
+    if cached:
+        return cached
+
+    sha = hashlib.sha256()
+    with open(abs_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            sha.update(block)
+    digest = sha.hexdigest()
+
+    with _digest_lock:
+        _digest_memo[memo_key] = digest
+    return digest
+
+
+def cache_key(**parts: Any) -> str:
+    """Build a cache key from keyword parts (order-independent)."""
+    payload = json.dumps(
+        {"version": RENDER_CACHE_VERSION, **parts},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def ffmpeg_version(ffmpeg_path: str = "ffmpeg") -> str:
+    """First line of `ffmpeg -version` (cached), or "unknown"."""
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-version"],
+            capture_output=True, text=True, timeout=30
+        )
+        if result.returncode == 0 and result.stdout:
+            return result.stdout.splitlines()[0].strip()
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    return "unknown"
+
+
+class RenderCache(SizeBoundedCache):
+    """Size-bounded, content-addressed store for rendered media files."""
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+            max_size_bytes: Evict least recently used entries above this size
+        """
+        super().__init__(cache_dir, max_size_bytes)
+
+    def _entry_path(self, key: str, suffix: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}{suffix}"
+
+    def get(self, key: str, suffix: str = ".mp4") -> Optional[Path]:
+        """Return the cached file for a key (refreshing its LRU position), or None."""
+        entry = self._entry_path(key, suffix)
+        try:
+            os.utime(entry)
+        except OSError:
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        return entry
+
+    def materialize(self, key: str, dest: Path) -> bool:
+        """
+        Place the cached file for a key at dest.
+
+        On a hit the entry is copied to dest, never linked: render paths that
+        bypass the cache (e.g. `--no-cache`) overwrite their outputs in place
+        with `ffmpeg -y`, which would otherwise write through a shared inode
+        into the cache entry. On a miss any existing dest is removed. An
+        entry evicted (e.g. by another process) before it could be copied
+        counts as a miss.
+
+        Returns:
+            True on a cache hit
+        """
+        dest = Path(dest)
+        entry = self._entry_path(key, dest.suffix)
+
+        if dest.exists() or dest.is_symlink():
+            # Also replaces hard links left by earlier versions of the cache
+            dest.unlink()
+
+        if not entry.exists():
+            self._count(hit=False)
+            return False
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=dest.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(entry, tmp_path)
+            os.replace(tmp_path, dest)
+        except OSError:
+            # Evicted since the check above (e.g. by another process)
+            self._count(hit=False)
+            return False
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        self._count(hit=True)
+        return True
+
+    def put(self, key: str, src: Path) -> Optional[Path]:
+        """
+        Store a rendered file under a key.
+
+        The file is copied into the cache (never linked), so later writes
+        to src can't corrupt the entry.
+
+        Returns:
+            Path of the cache entry, or None if src doesn't exist
+        """
+        src = Path(src)
+        if not src.exists():
+            return None
+
+        entry = self._entry_path(key, src.suffix)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            shutil.copyfile(src, tmp_path)
+            os.replace(tmp_path, entry)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self._stored()
+        return entry
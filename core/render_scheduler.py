@@ -0,0 +1,138 @@
+"""
+Shared FFmpeg job scheduler for concurrent renders.
+
+Rendering every candidate of an EDL at once would oversubscribe the CPU if
+each candidate spawned ffmpeg freely. The scheduler runs all encodes on one
+core-aware queue instead: a fixed number of jobs run at a time, each capped
+at its share of the cores via `-threads`, waiting jobs start in priority
+order (so the recommended candidate finishes first), and identical sub-jobs
+submitted by several candidates run only once.
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# libx264 stops scaling well beyond a handful of threads per encode, so on
+# larger machines it's faster to run more encodes side by side
+DEFAULT_THREADS_PER_JOB = 4
+
+
+class FFmpegJobScheduler:
+    """
+    Priority queue of FFmpeg jobs with a bounded number of concurrent slots.
+
+    Lower priority values run first. Share one instance between renderers
+    (all jobs must be submitted from the same event loop).
+    """
+
+    def __init__(
+        self,
+        max_jobs: Optional[int] = None,
+        threads_per_job: Optional[int] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_jobs: Concurrent ffmpeg processes (default: cores / threads_per_job)
+            threads_per_job: `-threads` for each job (default: cores / max_jobs,
+                or DEFAULT_THREADS_PER_JOB when neither is given)
+        """
+        cores = os.cpu_count() or 1
+
+        if max_jobs is None and threads_per_job is None:
+            threads_per_job = min(DEFAULT_THREADS_PER_JOB, cores)
+        if max_jobs is None:
+            max_jobs = max(1, cores // threads_per_job)
+        if threads_per_job is None:
+            threads_per_job = max(1, cores // max_jobs)
+
+        self.max_jobs = max_jobs
+        self.threads_per_job = threads_per_job
+
+        self._active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
+        self.jobs_run = 0
+        self.jobs_deduplicated = 0
+
+    async def _acquire(self, priority: int) -> None:
+        """Wait for a free slot; waiters are served lowest priority first."""
+        if self._active < self.max_jobs and not self._waiters:
+            self._active += 1
+            return
+
+        slot = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), slot))
+        try:
+            await slot
+        except asyncio.CancelledError:
+            # The slot may have been handed over just as we were cancelled
+            if slot.done() and not slot.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiter, or free it."""
+        while self._waiters:
+            _, _, slot = heapq.heappop(self._waiters)
+            if not slot.done():
+                slot.set_result(None)
+                return
+        self._active -= 1
+
+    def with_threads(self, cmd: List[str]) -> List[str]:
+        """Insert the per-job `-threads` limit before the output path."""
+        return [*cmd[:-1], "-threads", str(self.threads_per_job), cmd[-1]]
+
+    async def run(self, cmd: List[str], priority: int = 0) -> Tuple[int, bytes, bytes]:
+        """
+        Run one ffmpeg command when a slot is free.
+
+        Args:
+            cmd: FFmpeg command, ending with the output path
+            priority: Lower values start first
+
+        Returns:
+            (returncode, stdout, stderr)
+        """
+        await self._acquire(priority)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self.with_threads(cmd),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            stdout, stderr = await process.communicate()
+            self.jobs_run += 1
+            return process.returncode, stdout, stderr
+        finally:
+            self._release()
+
+    async def run_once(self, key: str, job: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run a job, or join an identical job already in flight.
+
+        Candidates that share a sub-job (the same clip trimmed the same way)
+        await a single execution and all receive its result.
+
+        Args:
+            key: Identity of the job (e.g. its render cache key)
+            job: Coroutine factory, called only if no identical job is running
+
+        Returns:
+            The job's result
+        """
+        shared = self._in_flight.get(key)
+        if shared is None:
+            shared = asyncio.ensure_future(job())
+            self._in_flight[key] = shared
+            shared.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.jobs_deduplicated += 1
+        return await asyncio.shield(shared)
@@ -6,11 +6,13 @@ Combines video clips and audio tracks from an EDL into a final rendered video.
 
 import asyncio
 import os
+import shlex
 import shutil
 import tempfile
 import time
+from dataclasses import asdict
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple, Callable, Awaitable
 from datetime import datetime
 
 from core.models.edit_decision import EditDecisionList, EditCandidate, EditDecision
@@ -23,6 +25,9 @@ from core.models.render import (
     RenderResult,
     RenderJob,
 )
+from core.media_probe import MediaProbe, find_ffprobe, get_media_probe
+from core.render_cache import RenderCache, cache_key, file_digest, ffmpeg_version
+from core.render_scheduler import FFmpegJobScheduler
 
 
 class FFmpegNotFoundError(Exception):
@@ -49,7 +54,11 @@ class FFmpegRenderer:
     def __init__(
         self,
         output_dir: str = "artifacts/renders",
-        config: Optional[RenderConfig] = None
+        config: Optional[RenderConfig] = None,
+        cache: Optional[RenderCache] = None,
+        scheduler: Optional[FFmpegJobScheduler] = None,
+        priority: int = 0,
+        probe: Optional[MediaProbe] = None
     ):
         """
         Initialize the renderer.
@@ -57,14 +66,30 @@ class FFmpegRenderer:
         Args:
             output_dir: Directory for rendered output files
             config: Render configuration (uses defaults if not provided)
+            cache: Render cache for intermediates (default cache if
+                config.use_cache is set and none is given)
+            scheduler: Shared FFmpeg job queue (None = run encodes directly)
+            priority: Scheduler priority for this renderer's jobs (lower first)
+            probe: Media probe for durations and stream info (shared one if not given)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.config = config or RenderConfig()
 
+        if cache is None and self.config.use_cache:
+            cache = RenderCache()
+        self.cache = cache
+        self.scheduler = scheduler
+        self.priority = priority
+
         # Check FFmpeg availability
         self._ffmpeg_path = self._find_ffmpeg()
 
+        self.probe = probe or get_media_probe()
+        if self.probe.ffprobe_path is None:
+            # FFmpeg may live outside PATH (e.g. a WinGet install)
+            self.probe.ffprobe_path = find_ffprobe(self._ffmpeg_path)
+
     def _find_ffmpeg(self) -> str:
         """Find FFmpeg executable."""
         ffmpeg = shutil.which("ffmpeg")
@@ -161,6 +186,139 @@ class FFmpegRenderer:
             output_dir=render_dir
         )
 
+    async def render_all(
+        self,
+        edl: EditDecisionList,
+        audio_tracks: Optional[List[AudioTrack]] = None,
+        run_id: Optional[str] = None,
+        scheduler: Optional[FFmpegJobScheduler] = None
+    ) -> Dict[str, RenderResult]:
+        """
+        Render every candidate in an EDL concurrently.
+
+        All candidates share one FFmpeg job scheduler, so encodes are spread
+        over the available cores, the recommended candidate's jobs run
+        first, and sub-jobs common to several candidates run once.
+
+        Args:
+            edl: The Edit Decision List containing candidates
+            audio_tracks: Additional audio tracks to mix into every candidate
+            run_id: Optional run ID for output organization
+            scheduler: Job scheduler to use (default: this renderer's, or a
+                new one sized to the machine)
+
+        Returns:
+            RenderResult per candidate ID, in EDL order
+        """
+        scheduler = scheduler or self.scheduler or FFmpegJobScheduler()
+
+        render_dir = self.output_dir / run_id if run_id else self.output_dir
+        render_dir.mkdir(parents=True, exist_ok=True)
+
+        # Recommended candidate first; the rest keep their EDL order
+        ordered = sorted(
+            edl.candidates,
+            key=lambda c: c.candidate_id != edl.recommended_candidate_id
+        )
+
+        async def _render(priority: int, candidate: EditCandidate) -> RenderResult:
+            renderer = FFmpegRenderer(
+                output_dir=str(self.output_dir),
+                config=self.config,
+                cache=self.cache,
+                scheduler=scheduler,
+                priority=priority
+            )
+            return await renderer.render_candidate(
+                candidate=candidate,
+                audio_tracks=audio_tracks or [],
+                output_dir=render_dir
+            )
+
+        results = await asyncio.gather(
+            *(_render(priority, c) for priority, c in enumerate(ordered))
+        )
+        by_id = {c.candidate_id: r for c, r in zip(ordered, results)}
+        return {c.candidate_id: by_id[c.candidate_id] for c in edl.candidates}
+
+    async def render_with_preview(
+        self,
+        edl: EditDecisionList,
+        candidate_id: Optional[str] = None,
+        audio_tracks: Optional[List[AudioTrack]] = None,
+        run_id: Optional[str] = None,
+        preview_config: Optional[RenderConfig] = None,
+        on_preview: Optional[Callable[[RenderResult], Any]] = None,
+        scheduler: Optional[FFmpegJobScheduler] = None
+    ) -> Tuple[RenderResult, RenderResult]:
+        """
+        Render a low-resolution proxy of a candidate, then this renderer's render.
+
+        Both renders share one FFmpeg job scheduler and the proxy's jobs go
+        first, so reviewers get a watchable cut within seconds while the
+        full-quality encode carries on. With a single job slot the final
+        render starts once the proxy is done instead (it could otherwise take
+        the slot first and hold up the proxy).
+
+        Args:
+            edl: The Edit Decision List containing candidates
+            candidate_id: Which candidate to render (default: recommended)
+            audio_tracks: Additional audio tracks to mix in
+            run_id: Optional run ID for output organization
+            preview_config: Proxy render config (default: the "draft" profile)
+            on_preview: Called with the proxy's RenderResult as soon as it's done
+            scheduler: Job scheduler to use (default: this renderer's, or a
+                new one sized to the machine)
+
+        Returns:
+            (preview result, final result). The proxy is written to a
+            "preview" subdirectory of the render directory.
+        """
+        scheduler = scheduler or self.scheduler or FFmpegJobScheduler()
+        preview_config = preview_config or RenderConfig.for_profile(
+            "draft",
+            single_pass=self.config.single_pass,
+            use_cache=self.config.use_cache
+        )
+        render_dir = self.output_dir / run_id if run_id else self.output_dir
+
+        preview_renderer = FFmpegRenderer(
+            output_dir=str(render_dir / "preview"),
+            config=preview_config,
+            cache=self.cache,
+            scheduler=scheduler,
+            priority=0,
+            probe=self.probe
+        )
+        final_renderer = FFmpegRenderer(
+            output_dir=str(self.output_dir),
+            config=self.config,
+            cache=self.cache,
+            scheduler=scheduler,
+            priority=1,
+            probe=self.probe
+        )
+
+        async def _preview() -> RenderResult:
+            result = await preview_renderer.render(
+                edl=edl, candidate_id=candidate_id, audio_tracks=audio_tracks
+            )
+            if on_preview:
+                on_preview(result)
+            return result
+
+        async def _final() -> RenderResult:
+            return await final_renderer.render(
+                edl=edl, candidate_id=candidate_id, audio_tracks=audio_tracks, run_id=run_id
+            )
+
+        if scheduler.max_jobs < 2:
+            preview = await _preview()
+            return preview, await _final()
+
+        preview, final = await asyncio.gather(_preview(), _final())
+        return preview, final
+
     async def render_candidate(
         self,
         candidate: EditCandidate,
@@ -177,6 +335,10 @@ class FFmpegRenderer:
         4. Mix audio tracks
         5. Output final file
 
+        With ``config.single_pass`` (the default) steps 2-5 run as one FFmpeg
+        filter_complex invocation; the multi-step pipeline is used as a
+        fallback if that fails.
+
         Args:
             candidate: The edit candidate to render
             audio_tracks: Audio tracks to mix in
@@ -210,34 +372,63 @@ class FFmpegRenderer:
                 error_message="Mock render - no real video files to process"
             )
 
+        if self.config.single_pass:
+            result = await self._render_single_pass(
+                candidate=candidate,
+                clips=valid_decisions,
+                audio_tracks=audio_tracks,
+                output_dir=output_dir,
+                start_time=start_time
+            )
+            if result is not None:
+                return result
+            # Fall through to the multi-step pipeline
+
         try:
             # Step 1: Trim clips according to in_point/out_point
             trimmed_clips = []
-            trim_dir = output_dir / "trimmed"
-            trim_dir.mkdir(exist_ok=True)
+            # Per-candidate, so concurrently rendered candidates don't collide
+            trim_dir = output_dir / "trimmed" / candidate.candidate_id
+            trim_dir.mkdir(parents=True, exist_ok=True)
 
             for i, (decision, video_path) in enumerate(valid_decisions):
                 trimmed_path = trim_dir / f"clip_{i:02d}_{decision.scene_id}.mp4"
-                await self._trim_clip(
-                    input_path=video_path,
-                    output_path=str(trimmed_path),
+                trim_key = await self._cache_key(
+                    "trim", video_path,
                     in_point=decision.in_point or 0.0,
                     out_point=decision.out_point
                 )
+                if not await self._cache_materialize(trim_key, trimmed_path):
+                    await self._run_step(trim_key, trimmed_path, lambda: self._trim_clip(
+                        input_path=video_path,
+                        output_path=str(trimmed_path),
+                        in_point=decision.in_point or 0.0,
+                        out_point=decision.out_point
+                    ))
 
                 # Step 1b: Apply text overlay if specified
                 current_path = str(trimmed_path) if os.path.exists(trimmed_path) else video_path
                 if decision.text_overlay:
                     text_path = trim_dir / f"clip_{i:02d}_{decision.scene_id}_text.mp4"
-                    await self.add_text_overlay(
-                        video_path=current_path,
+                    text_key = await self._cache_key(
+                        "text_overlay", current_path,
                         text=decision.text_overlay,
-                        output_path=str(text_path),
                         position=decision.text_position or "center",
                         style=decision.text_style or "title",
                         start_time=decision.text_start_time,
-                        duration=decision.text_duration
+                        duration=decision.text_duration,
+                        font=self._find_font()
                     )
+                    if not await self._cache_materialize(text_key, text_path):
+                        await self._run_step(text_key, text_path, lambda: self.add_text_overlay(
+                            video_path=current_path,
+                            text=decision.text_overlay,
+                            output_path=str(text_path),
+                            position=decision.text_position or "center",
+                            style=decision.text_style or "title",
+                            start_time=decision.text_start_time,
+                            duration=decision.text_duration
+                        ))
                     if os.path.exists(text_path):
                         current_path = str(text_path)
 
@@ -249,11 +440,7 @@ class FFmpegRenderer:
 
             # Step 2: Apply transitions and concatenate
             # Check if we have any dissolve transitions
-            has_dissolves = any(
-                d.transition_out in ("dissolve", "cross_dissolve") or
-                d.transition_in in ("dissolve", "cross_dissolve")
-                for d, _ in trimmed_clips
-            )
+            has_dissolves = self._has_dissolves(trimmed_clips)
 
             if has_dissolves and len(trimmed_clips) > 1:
                 # Use xfade for dissolve transitions
@@ -321,6 +508,394 @@ class FFmpegRenderer:
                 render_time=time.time() - start_time
             )
 
+    async def _render_single_pass(
+        self,
+        candidate: EditCandidate,
+        clips: List[Tuple[EditDecision, str]],
+        audio_tracks: List[AudioTrack],
+        output_dir: Path,
+        start_time: float
+    ) -> Optional[RenderResult]:
+        """
+        Render an edit candidate with a single FFmpeg invocation.
+
+        Trims, text overlays, the xfade/concat chain, boundary fades and the
+        audio mix are compiled into one filter_complex, so every frame is
+        decoded and encoded exactly once and no intermediates hit the disk.
+
+        Args:
+            candidate: The edit candidate to render
+            clips: List of (EditDecision, video_path) tuples with existing files
+            audio_tracks: Audio tracks to mix in
+            output_dir: Directory for output files
+            start_time: Wall-clock start of the render (for render_time)
+
+        Returns:
+            RenderResult on success, or None if the caller should fall back
+            to the multi-step pipeline
+        """
+        existing_tracks = [t for t in audio_tracks if os.path.exists(t.path)]
+        final_output = output_dir / f"{candidate.candidate_id}_final.mp4"
+
+        # The whole render is keyed on its inputs, so reruns and resumes of an
+        # unchanged candidate skip the encode entirely
+        render_key = await self._cache_key(
+            "single_pass",
+            *[path for _, path in clips],
+            *[t.path for t in existing_tracks],
+            decisions=[self._decision_cache_params(d) for d in candidate.decisions],
+            audio_tracks=[
+                {k: v for k, v in asdict(t).items() if k != "path"}
+                for t in existing_tracks
+            ],
+            font=self._find_font()
+        )
+        if await self._cache_materialize(render_key, final_output):
+            return RenderResult(
+                success=True,
+                output_path=str(final_output),
+                duration=await self._get_duration(str(final_output)),
+                file_size=os.path.getsize(final_output),
+                render_time=time.time() - start_time
+            )
+
+        # Clip durations are needed up front for xfade offsets and fades
+        source_durations = await asyncio.gather(
+            *(self._get_duration(path) for _, path in clips)
+        )
+        durations = []
+        for (decision, _), source_duration in zip(clips, source_durations):
+            in_point = decision.in_point or 0.0
+            if decision.out_point is not None:
+                duration = decision.out_point - in_point
+                if source_duration:
+                    duration = min(duration, source_duration - in_point)
+            elif source_duration:
+                duration = source_duration - in_point
+            else:
+                return None
+            if duration <= 0:
+                return None
+            durations.append(duration)
+
+        # Source audio only survives plain concatenation in the multi-step
+        # pipeline (xfade and mix_audio both drop it), so mirror that here
+        clip_has_audio = None
+        if not existing_tracks and not self._has_dissolves(clips):
+            clip_has_audio = list(await asyncio.gather(
+                *(self._has_audio_stream(path) for _, path in clips)
+            ))
+
+        filter_complex, video_label, audio_label = self._build_single_pass_graph(
+            clips=clips,
+            durations=durations,
+            audio_tracks=existing_tracks,
+            transitions=self._build_transitions(candidate.decisions),
+            clip_has_audio=clip_has_audio
+        )
+
+        cmd = [self._ffmpeg_path, "-y"]
+        for (decision, path), duration in zip(clips, durations):
+            cmd.extend([
+                "-ss", str(decision.in_point or 0.0),  # Seek before input (fast)
+                "-t", f"{duration:.3f}",
+                "-i", path,
+            ])
+        for track in existing_tracks:
+            cmd.extend(["-i", track.path])
+
+        cmd.extend(["-filter_complex", filter_complex, "-map", video_label])
+        if audio_label:
+            cmd.extend([
+                "-map", audio_label,
+                "-c:a", self.config.audio_codec,
+                "-b:a", self.config.audio_bitrate,
+            ])
+        cmd.extend([
+            "-c:v", self.config.video_codec,
+            "-preset", self.config.preset,
+            "-crf", str(self.config.crf),
+            "-pix_fmt", self.config.pixel_format,
+        ])
+        if existing_tracks:
+            cmd.append("-shortest")
+        cmd.append(str(final_output))
+
+        async def _encode():
+            returncode, _, stderr = await self._run_ffmpeg(cmd)
+            if returncode == 0:
+                await self._cache_put(render_key, final_output)
+            return returncode, stderr
+
+        try:
+            returncode, stderr = await self._run_shared(render_key, final_output, _encode)
+        except FileNotFoundError:
+            return None
+
+        if returncode != 0 or not os.path.exists(final_output):
+            return None
+
+        return RenderResult(
+            success=True,
+            output_path=str(final_output),
+            duration=await self._get_duration(str(final_output)),
+            file_size=os.path.getsize(final_output),
+            render_time=time.time() - start_time,
+            ffmpeg_command=shlex.join(cmd),
+            ffmpeg_stderr=stderr.decode(errors="replace")
+        )
+
+    def _build_single_pass_graph(
+        self,
+        clips: List[Tuple[EditDecision, str]],
+        durations: List[float],
+        audio_tracks: List[AudioTrack],
+        transitions: List[Transition],
+        clip_has_audio: Optional[List[bool]] = None
+    ) -> Tuple[str, str, Optional[str]]:
+        """
+        Compile an edit into a single FFmpeg filter_complex.
+
+        Inputs are expected in order: one pre-trimmed input per clip
+        (``-ss``/``-t`` on the input), followed by one input per audio track.
+
+        Args:
+            clips: List of (EditDecision, video_path) tuples
+            durations: Trimmed duration of each clip in seconds
+            audio_tracks: Audio tracks to mix (inputs after the clips)
+            transitions: Boundary transitions (fade in/out)
+            clip_has_audio: Per-clip audio stream flags. When given (and no
+                audio tracks are mixed), source audio is concatenated too.
+
+        Returns:
+            Tuple of (filter_complex, video output label, audio output label or None)
+        """
+        cfg = self.config
+        parts = []
+
+        # Normalize every clip so concat/xfade see identical streams
+        for i, (decision, _) in enumerate(clips):
+            chain = [
+                "setpts=PTS-STARTPTS",
+                f"scale={cfg.output_width}:{cfg.output_height}:force_original_aspect_ratio=decrease",
+                f"pad={cfg.output_width}:{cfg.output_height}:(ow-iw)/2:(oh-ih)/2",
+                "setsar=1",
+                f"fps={cfg.output_fps}",
+                "settb=AVTB",
+                f"format={cfg.pixel_format}",
+            ]
+            if decision.text_overlay:
+                enable = None
+                if decision.text_start_time is not None or decision.text_duration is not None:
+                    start = decision.text_start_time or 0.0
+                    end = start + decision.text_duration if decision.text_duration else durations[i]
+                    enable = (start, end)
+                chain.append(self._build_drawtext_filter(
+                    text=decision.text_overlay,
+                    position=decision.text_position or "center",
+                    style=decision.text_style or "title",
+                    enable=enable
+                ))
+            parts.append(f"[{i}:v]{','.join(chain)}[v{i}]")
+
+        carry_audio = (
+            clip_has_audio is not None
+            and not audio_tracks
+            and any(clip_has_audio)
+        )
+
+        # Join clips: xfade chain when dissolves are present, else one concat
+        audio_label = None
+        if len(clips) > 1 and self._has_dissolves(clips):
+            current_label = "[v0]"
+            cumulative_duration = durations[0]
+            for i in range(1, len(clips)):
+                decision = clips[i - 1][0]  # Previous clip's decision (for transition_out)
+                next_label = f"[x{i}]"
+                if decision.transition_out in ("dissolve", "cross_dissolve"):
+                    trans_dur = min(
+                        decision.transition_out_duration or 0.5,
+                        cumulative_duration,
+                        durations[i]
+                    )
+                    offset = cumulative_duration - trans_dur
+                    parts.append(
+                        f"{current_label}[v{i}]xfade=transition=fade:"
+                        f"duration={trans_dur}:offset={offset:.3f}{next_label}"
+                    )
+                    cumulative_duration += durations[i] - trans_dur
+                else:
+                    parts.append(f"{current_label}[v{i}]concat=n=2:v=1:a=0{next_label}")
+                    cumulative_duration += durations[i]
+                current_label = next_label
+            timeline_duration = cumulative_duration
+        elif len(clips) > 1:
+            if carry_audio:
+                concat_inputs = ""
+                for i, has_audio in enumerate(clip_has_audio):
+                    if has_audio:
+                        parts.append(
+                            f"[{i}:a]asetpts=PTS-STARTPTS,aresample=48000,"
+                            f"aformat=channel_layouts=stereo,apad,"
+                            f"atrim=duration={durations[i]:.3f}[ca{i}]"
+                        )
+                    else:
+                        parts.append(
+                            f"anullsrc=r=48000:cl=stereo,"
+                            f"atrim=duration={durations[i]:.3f}[ca{i}]"
+                        )
+                    concat_inputs += f"[v{i}][ca{i}]"
+                parts.append(f"{concat_inputs}concat=n={len(clips)}:v=1:a=1[vcat][acat]")
+                audio_label = "[acat]"
+            else:
+                concat_inputs = "".join(f"[v{i}]" for i in range(len(clips)))
+                parts.append(f"{concat_inputs}concat=n={len(clips)}:v=1:a=0[vcat]")
+            current_label = "[vcat]"
+            timeline_duration = sum(durations)
+        else:
+            current_label = "[v0]"
+            timeline_duration = durations[0]
+            if carry_audio:
+                audio_label = "0:a"
+
+        # Boundary fades are placed against the real timeline length
+        for t in transitions:
+            if t.type == TransitionType.FADE_OUT:
+                t.position = max(0.0, timeline_duration - t.duration)
+        fade_filters = self._build_fade_filters(transitions)
+        if fade_filters:
+            parts.append(f"{current_label}{','.join(fade_filters)}[vout]")
+            current_label = "[vout]"
+
+        if audio_tracks:
+            parts.append(self._generate_filter_complex(audio_tracks, input_offset=len(clips)))
+            audio_label = "[aout]"
+
+        return ";".join(parts), current_label, audio_label
+
+    @staticmethod
+    def _has_dissolves(clips: List[Tuple[EditDecision, str]]) -> bool:
+        """Check whether any clip uses a dissolve transition."""
+        return any(
+            d.transition_out in ("dissolve", "cross_dissolve") or
+            d.transition_in in ("dissolve", "cross_dissolve")
+            for d, _ in clips
+        )
+
+    async def _cache_key(self, kind: str, *inputs: str, **params: Any) -> Optional[str]:
+        """
+        Content-addressed cache key for a render step.
+
+        Combines the step kind, the digests of its input files, the render
+        config, the FFmpeg version and any step parameters.
+
+        Also identifies the step for deduplication on a shared scheduler.
+
+        Returns:
+            Cache key, or None when there is neither a cache nor a scheduler
+        """
+        if self.cache is None and self.scheduler is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        try:
+            digests = [
+                await loop.run_in_executor(None, file_digest, path)
+                for path in inputs
+            ]
+        except OSError:
+            return None
+        version = await loop.run_in_executor(None, ffmpeg_version, self._ffmpeg_path)
+
+        return cache_key(
+            kind=kind,
+            inputs=digests,
+            config=asdict(self.config),
+            ffmpeg=version,
+            **params
+        )
+
+    async def _cache_materialize(self, key: Optional[str], output_path: Path) -> bool:
+        """Place a cached render at output_path. Returns True on a hit."""
+        if key is None or self.cache is None:
+            return False
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.cache.materialize, key, Path(output_path))
+
+    async def _cache_put(self, key: Optional[str], output_path: Path) -> None:
+        """Store a freshly rendered file in the cache."""
+        if key is None or self.cache is None or not os.path.exists(output_path):
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.cache.put, key, Path(output_path))
+
+    async def _run_shared(
+        self,
+        key: Optional[str],
+        output_path: Path,
+        job: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Run a job that writes output_path, joining an identical in-flight job.
+
+        When another candidate on the same scheduler is already producing
+        the same output (same key), wait for it and copy its file instead of
+        encoding again.
+
+        Returns:
+            The job's result
+        """
+        if key is None or self.scheduler is None:
+            return await job()
+
+        async def _owned_job():
+            return Path(output_path), await job()
+
+        produced, result = await self.scheduler.run_once(key, _owned_job)
+        if produced != Path(output_path) and produced.exists():
+            if not await self._cache_materialize(key, output_path):
+                shutil.copyfile(produced, output_path)
+        return result
+
+    async def _run_step(
+        self,
+        key: Optional[str],
+        output_path: Path,
+        render: Callable[[], Awaitable[Any]]
+    ) -> None:
+        """Render an intermediate (shared with identical in-flight steps) and cache it."""
+        async def _render_and_store():
+            await render()
+            await self._cache_put(key, output_path)
+
+        await self._run_shared(key, output_path, _render_and_store)
+
+    async def _run_ffmpeg(self, cmd: List[str]) -> Tuple[int, bytes, bytes]:
+        """
+        Run an FFmpeg encode, on the shared job scheduler when one is set.
+
+        Returns:
+            (returncode, stdout, stderr)
+        """
+        if self.scheduler is not None:
+            return await self.scheduler.run(cmd, priority=self.priority)
+
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        return process.returncode, stdout, stderr
+
+    @staticmethod
+    def _decision_cache_params(decision: EditDecision) -> Dict[str, Any]:
+        """Edit decision fields that affect rendered output (not paths or notes)."""
+        params = asdict(decision)
+        for field_name in ("video_url", "audio_url", "notes"):
+            params.pop(field_name, None)
+        return params
+
     async def _trim_clip(
         self,
         input_path: str,
@@ -348,21 +923,22 @@ class FFmpegRenderer:
             duration = out_point - in_point
             cmd.extend(["-t", str(duration)])
 
+        cfg = self.config
         cmd.extend([
-            "-c:v", self.config.video_codec,
-            "-c:a", self.config.audio_codec,
-            "-preset", self.config.preset,
-            "-crf", str(self.config.crf),
-            "-pix_fmt", self.config.pixel_format,
+            # Conform to the output size, so every profile applies here too
+            "-vf", (
+                f"scale={cfg.output_width}:{cfg.output_height}:force_original_aspect_ratio=decrease,"
+                f"pad={cfg.output_width}:{cfg.output_height}:(ow-iw)/2:(oh-ih)/2,setsar=1"
+            ),
+            "-c:v", cfg.video_codec,
+            "-c:a", cfg.audio_codec,
+            "-preset", cfg.preset,
+            "-crf", str(cfg.crf),
+            "-pix_fmt", cfg.pixel_format,
             output_path
         ])
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        await process.communicate()
+        returncode, stdout, stderr = await self._run_ffmpeg(cmd)
 
     async def _concat_with_transitions(
         self,
@@ -388,11 +964,11 @@ class FFmpegRenderer:
         for _, path in clips:
             inputs.extend(["-i", path])
 
-        # Get durations for calculating xfade offsets
-        durations = []
-        for _, path in clips:
-            dur = await self._get_duration(path)
-            durations.append(dur or 5.0)
+        # Get durations for calculating xfade offsets (probed concurrently)
+        durations = [
+            dur or 5.0
+            for dur in await asyncio.gather(*(self._get_duration(path) for _, path in clips))
+        ]
 
         # Build filter chain
         filter_parts = []
@@ -444,14 +1020,9 @@ class FFmpegRenderer:
             output_path
         ]
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await process.communicate()
+        returncode, stdout, stderr = await self._run_ffmpeg(cmd)
 
-        if process.returncode != 0:
+        if returncode != 0:
             # Fallback to simple concat if xfade fails
             await self.concat_videos(
                 video_paths=[path for _, path in clips],
@@ -507,14 +1078,9 @@ class FFmpegRenderer:
                 output_path
             ]
 
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
+            returncode, stdout, stderr = await self._run_ffmpeg(cmd)
 
-            if process.returncode != 0:
+            if returncode != 0:
                 # Try with re-encoding if stream copy fails
                 cmd = [
                     self._ffmpeg_path,
@@ -530,14 +1096,9 @@ class FFmpegRenderer:
                     output_path
                 ]
 
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                stdout, stderr = await process.communicate()
+                returncode, stdout, stderr = await self._run_ffmpeg(cmd)
 
-                if process.returncode != 0:
+                if returncode != 0:
                     raise RenderError(f"FFmpeg concat failed: {stderr.decode()}")
 
             return output_path
@@ -643,14 +1204,9 @@ class FFmpegRenderer:
             output_path
         ]
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await process.communicate()
+        returncode, stdout, stderr = await self._run_ffmpeg(cmd)
 
-        if process.returncode != 0:
+        if returncode != 0:
             raise RenderError(f"FFmpeg audio mix failed: {stderr.decode()}")
 
         return output_path
@@ -682,16 +1238,7 @@ class FFmpegRenderer:
             return output_path
 
         # Build video filter for transitions
-        filters = []
-
-        for t in transitions:
-            if t.type == TransitionType.FADE_IN:
-                filters.append(f"fade=t=in:st=0:d={t.duration}")
-            elif t.type == TransitionType.FADE_OUT:
-                filters.append(f"fade=t=out:st={t.position}:d={t.duration}")
-            elif t.type == TransitionType.FADE:
-                # Cross-fade requires xfade filter (complex)
-                filters.append(f"fade=t=out:st={t.position}:d={t.duration}")
+        filters = self._build_fade_filters(transitions)
 
         if not filters:
             shutil.copy(video_path, output_path)
@@ -711,18 +1258,36 @@ class FFmpegRenderer:
             output_path
         ]
 
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await process.communicate()
+        returncode, stdout, stderr = await self._run_ffmpeg(cmd)
 
-        if process.returncode != 0:
+        if returncode != 0:
             raise RenderError(f"FFmpeg transition failed: {stderr.decode()}")
 
         return output_path
 
+    def _build_fade_filters(self, transitions: List[Transition]) -> List[str]:
+        """
+        Build fade filters for boundary transitions.
+
+        Args:
+            transitions: List of transitions to apply
+
+        Returns:
+            List of FFmpeg fade filter strings
+        """
+        filters = []
+
+        for t in transitions:
+            if t.type == TransitionType.FADE_IN:
+                filters.append(f"fade=t=in:st=0:d={t.duration}")
+            elif t.type == TransitionType.FADE_OUT:
+                filters.append(f"fade=t=out:st={t.position}:d={t.duration}")
+            elif t.type == TransitionType.FADE:
+                # Cross-fade requires xfade filter (complex)
+                filters.append(f"fade=t=out:st={t.position}:d={t.duration}")
+
+        return filters
+
     async def add_text_overlay(
         self,
         video_path: str,
@@ -752,6 +1317,60 @@ class FFmpegRenderer:
             shutil.copy(video_path, output_path)
             return output_path
 
+        # Add timing (enable filter)
+        enable = None
+        if start_time is not None or duration is not None:
+            video_duration = await self._get_duration(video_path) or 30.0
+            start = start_time or 0.0
+            end = start + duration if duration else video_duration
+            enable = (start, end)
+
+        drawtext_filter = self._build_drawtext_filter(
+            text=text,
+            position=position,
+            style=style,
+            enable=enable
+        )
+
+        cmd = [
+            self._ffmpeg_path,
+            "-y",
+            "-i", video_path,
+            "-vf", drawtext_filter,
+            "-c:v", self.config.video_codec,
+            "-c:a", "copy",
+            "-preset", self.config.preset,
+            "-crf", str(self.config.crf),
+            output_path
+        ]
+
+        returncode, stdout, stderr = await self._run_ffmpeg(cmd)
+
+        if returncode != 0:
+            # If drawtext fails (often due to font issues), return original
+            shutil.copy(video_path, output_path)
+
+        return output_path
+
+    def _build_drawtext_filter(
+        self,
+        text: str,
+        position: str = "center",
+        style: str = "title",
+        enable: Optional[Tuple[float, float]] = None
+    ) -> str:
+        """
+        Build an FFmpeg drawtext filter for a text overlay.
+
+        Args:
+            text: Text to display
+            position: Where to place text ("center", "lower_third", "upper_third", "top", "bottom")
+            style: Text style ("title", "subtitle", "caption", "watermark")
+            enable: Optional (start, end) window in seconds (None = always shown)
+
+        Returns:
+            drawtext filter string
+        """
         # Escape special characters for FFmpeg drawtext
         escaped_text = text.replace("'", "'\\''").replace(":", "\\:")
 
@@ -821,10 +1440,8 @@ class FFmpegRenderer:
             filter_parts.append(f"boxborderw={settings['boxborderw']}")
 
         # Add timing (enable filter)
-        if start_time is not None or duration is not None:
-            video_duration = await self._get_duration(video_path) or 30.0
-            start = start_time or 0.0
-            end = start + duration if duration else video_duration
+        if enable is not None:
+            start, end = enable
             filter_parts.append(f"enable='between(t,{start},{end})'")
 
         # Try to find a font file
@@ -834,32 +1451,7 @@ class FFmpegRenderer:
             escaped_font = font_path.replace("\\", "/").replace(":", "\\:")
             filter_parts.append(f"fontfile='{escaped_font}'")
 
-        drawtext_filter = f"drawtext={':'.join(filter_parts)}"
-
-        cmd = [
-            self._ffmpeg_path,
-            "-y",
-            "-i", video_path,
-            "-vf", drawtext_filter,
-            "-c:v", self.config.video_codec,
-            "-c:a", "copy",
-            "-preset", self.config.preset,
-            "-crf", str(self.config.crf),
-            output_path
-        ]
-
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
-        )
-        stdout, stderr = await process.communicate()
-
-        if process.returncode != 0:
-            # If drawtext fails (often due to font issues), return original
-            shutil.copy(video_path, output_path)
-
-        return output_path
+        return f"drawtext={':'.join(filter_parts)}"
 
     def _find_font(self) -> Optional[str]:
         """Find a suitable font file for text overlays."""
@@ -910,7 +1502,8 @@ class FFmpegRenderer:
     def _generate_filter_complex(
         self,
         audio_tracks: List[AudioTrack],
-        ducking: bool = True
+        ducking: bool = True,
+        input_offset: int = 1
     ) -> str:
         """
         Generate FFmpeg filter_complex for audio mixing.
@@ -918,6 +1511,7 @@ class FFmpegRenderer:
         Args:
             audio_tracks: List of audio tracks
             ducking: Whether to apply ducking
+            input_offset: FFmpeg input index of the first audio track
 
         Returns:
             Filter complex string for FFmpeg
@@ -930,7 +1524,7 @@ class FFmpegRenderer:
 
         # Process each track
         for i, track in enumerate(audio_tracks):
-            input_idx = i + 1  # Input 0 is video, audio starts at 1
+            input_idx = i + input_offset  # Video inputs come first, then audio
             label = f"a{i}"
 
             # Build filter chain for this track
@@ -1023,43 +1617,14 @@ class FFmpegRenderer:
 
         return transitions
 
-    async def _get_duration(self, video_path: str) -> Optional[float]:
-        """Get duration of a video file using FFprobe."""
-        if not os.path.exists(video_path):
-            return None
-
-        ffprobe = shutil.which("ffprobe")
-        if not ffprobe:
-            # Try to find it next to ffmpeg
-            ffmpeg_dir = os.path.dirname(self._ffmpeg_path)
-            ffprobe = os.path.join(ffmpeg_dir, "ffprobe")
-            if not os.path.exists(ffprobe):
-                ffprobe = os.path.join(ffmpeg_dir, "ffprobe.exe")
-                if not os.path.exists(ffprobe):
-                    return None
-
-        cmd = [
-            ffprobe,
-            "-v", "error",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            video_path
-        ]
+    async def _has_audio_stream(self, video_path: str) -> bool:
+        """Check whether a media file has at least one audio stream."""
+        info = await self.probe.probe(video_path)
+        return info is not None and info.has_audio
 
-        try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-
-            if process.returncode == 0:
-                return float(stdout.decode().strip())
-        except Exception:
-            pass
-
-        return None
+    async def _get_duration(self, video_path: str) -> Optional[float]:
+        """Get duration of a media file (cached by the media probe)."""
+        return await self.probe.duration(video_path)
 
     async def check_ffmpeg_installed(self) -> Dict[str, Any]:
         """
@@ -9,6 +9,7 @@ import asyncio
 from pathlib import Path
 from typing import List
 
+from core.media_probe import get_media_probe
 from core.renderer import FFmpegRenderer
 from core.models.render import AudioTrack, TrackType
 
@@ -81,9 +82,7 @@ async def get_media_duration(path: str) -> float:
     Raises:
         RuntimeError: If duration cannot be determined
     """
-    # Use FFmpegRenderer's _get_duration method
-    renderer = FFmpegRenderer()
-    duration = await renderer._get_duration(path)
+    duration = await get_media_probe().duration(path)
 
     if duration is None:
         raise RuntimeError(f"Could not determine duration of {path}")
@@ -0,0 +1,164 @@
+"""
+Content-addressed cache for Claude responses.
+
+Many agent prompts are deterministic functions of their inputs: document
+chunk classification, figure descriptions, asset analysis, training segment
+classification. Re-ingesting an unchanged source or re-running a training
+trial sends the exact same requests again. With a cache attached, ClaudeClient
+answers those from disk, and concurrent identical requests share one API call.
+
+Keys cover everything that shapes a response: model, token limit, system
+prompt, prompt text and a digest of every attached image. Entries are small
+JSON files under the cache directory; hits refresh an entry's mtime, and the
+least recently used entries are evicted once the cache grows past its size
+limit (see core.disk_cache).
+
+The cache is opt-in: pass `cache=ResponseCache()` to ClaudeClient, or set
+CLAUDE_RESPONSE_CACHE=1 (or a directory path) in the environment.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from core.disk_cache import SizeBoundedCache
+
+# Bump when response handling changes in a way that invalidates entries
+RESPONSE_CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = "artifacts/cache/claude"
+DEFAULT_MAX_SIZE_BYTES = 512 * 1024 ** 2  # 512 MB
+
+ENV_VAR = "CLAUDE_RESPONSE_CACHE"
+
+
+def response_key(**parts: Any) -> str:
+    """Build a cache key from keyword parts (order-independent)."""
+    payload = json.dumps(
+        {"version": RESPONSE_CACHE_VERSION, **parts},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def image_digest(data: str) -> str:
+    """Short digest of base64 image data, used in keys instead of the image itself."""
+    return hashlib.sha256(data.encode("ascii")).hexdigest()
+
+
+class ResponseCache(SizeBoundedCache):
+    """Size-bounded store of responses, with in-flight request coalescing."""
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+            max_size_bytes: Evict least recently used entries above this size
+        """
+        super().__init__(cache_dir, max_size_bytes)
+        self.coalesced = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @classmethod
+    def from_env(cls) -> Optional['ResponseCache']:
+        """
+        Cache configured by CLAUDE_RESPONSE_CACHE, or None if unset.
+
+        "1"/"true"/"yes" use the default directory; any other value is taken
+        as the cache directory.
+        """
+        value = os.environ.get(ENV_VAR, "").strip()
+        if not value or value.lower() in ("0", "false", "no"):
+            return None
+        if value.lower() in ("1", "true", "yes"):
+            return cls()
+        return cls(cache_dir=value)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for a key (refreshing its LRU position), or None."""
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "r") as f:
+                value = json.load(f)
+            os.utime(entry)
+        except (OSError, ValueError):
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]):
+        """Store a JSON-serializable entry under a key."""
+        entry = self._entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=entry.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, entry)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self._stored()
+
+    async def get_or_call(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Return the cached entry for a key, or make the call and store its result.
+
+        Concurrent callers with the same key share one call; if it fails, they
+        all see the error and nothing is stored.
+
+        Returns:
+            (entry, from_cache) - from_cache is False only for the caller that made the call
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached, True
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight.get_loop() is loop:
+            with self._lock:
+                self.coalesced += 1
+            return await asyncio.shield(inflight), True
+
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            value = await call()
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        else:
+            future.set_result(value)
+            self.put(key, value)
+            return value, False
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, total size and hit/miss/coalesced counters."""
+        return {**super().stats(), "coalesced": self.coalesced}
@@ -113,6 +113,7 @@ async def run_training_loop(
     output_dir: Path,
     style_profile,  # Can be StyleProfile or AggregatedProfile
     skip_audio: bool = False,
+    tts_cache=None,  # Optional[TTSCache] - reuse audio for paragraphs unchanged across trials
 ) -> tuple[List[TrialResult], Dict[str, int]]:
     """
     Main training loop.
@@ -242,6 +243,7 @@ async def run_training_loop(
                         output_dir=audio_chunk_dir,
                         voice_id="pFZP5JQG7iQjIQuC4Bku",
                         on_chunk_complete=_on_chunk,
+                        cache=tts_cache,
                     )
 
                     if not chunks:
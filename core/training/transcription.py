@@ -304,10 +304,9 @@ async def get_audio_duration(audio_path: str) -> float:
     """
     Get duration of audio file in seconds.
 
-    Uses existing FFmpegRenderer infrastructure.
+    Uses the shared media probe (cached per file).
     """
-    from core.renderer import FFmpegRenderer
+    from core.media_probe import get_media_probe
 
-    renderer = FFmpegRenderer()
-    duration = await renderer._get_duration(audio_path)
+    duration = await get_media_probe().duration(audio_path)
     return duration if duration else 0.0
@@ -0,0 +1,191 @@
+"""
+Persistent cache of generated TTS audio.
+
+Every `produce-video --live` rerun and every training trial with audio used
+to re-synthesize paragraphs whose text hadn't changed, paying for each one
+again. Entries are keyed by everything that shapes the audio: provider name,
+the provider's synthesis settings (model, voice settings, speaking rate...),
+voice ID and the text actually sent (after `clean_text_for_tts`).
+
+Each entry is the audio file plus a small JSON sidecar holding its duration,
+so a hit skips both the API call and the duration probe:
+    artifacts/cache/tts/<key[:2]>/<key>.mp3
+    artifacts/cache/tts/<key[:2]>/<key>.json
+Hits refresh the entry's mtime, and the least recently used entries are
+evicted once the cache grows past its size limit (see core.disk_cache).
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from core.disk_cache import CacheEntry, SizeBoundedCache
+
+# Bump when audio handling changes in a way that invalidates entries
+TTS_CACHE_VERSION = 1
+
+DEFAULT_CACHE_DIR = "artifacts/cache/tts"
+DEFAULT_MAX_SIZE_BYTES = 2 * 1024 ** 3  # 2 GB
+
+
+def tts_cache_key(provider: Any, text: str, voice_id: Optional[str]) -> str:
+    """
+    Cache key for synthesizing `text` with a provider and voice.
+
+    Args:
+        provider: AudioProvider (its name and synthesis_settings() are part of the key)
+        text: Text as sent to the provider (already cleaned)
+        voice_id: Voice identifier
+    """
+    settings = provider.synthesis_settings() if hasattr(provider, "synthesis_settings") else {}
+    payload = json.dumps(
+        {
+            "version": TTS_CACHE_VERSION,
+            "provider": provider.name,
+            "settings": settings,
+            "voice_id": voice_id,
+            "text": text,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TTSCache(SizeBoundedCache):
+    """
+    Size-bounded store of generated speech with stored durations.
+
+    The sidecar is written last and removed first, so an entry is only
+    visible while its audio is complete.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_size_bytes: int = DEFAULT_MAX_SIZE_BYTES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding cache entries (created on first write)
+            max_size_bytes: Evict least recently used entries above this size
+        """
+        super().__init__(cache_dir, max_size_bytes)
+
+    def _audio_path(self, key: str, suffix: str = ".mp3") -> Path:
+        return self.cache_dir / key[:2] / f"{key}{suffix}"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Tuple[Path, float]]:
+        """Return (audio file, duration) for a key (refreshing its LRU position), or None."""
+        meta_path = self._meta_path(key)
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+            audio = self._audio_path(key, meta.get("suffix", ".mp3"))
+            if not audio.exists():
+                raise OSError("audio missing")
+            os.utime(meta_path)
+            os.utime(audio)
+        except (OSError, ValueError):
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        return audio, float(meta.get("duration_sec", 0.0))
+
+    def materialize(self, key: str, dest: Path) -> Optional[float]:
+        """
+        Place the cached audio for a key at dest.
+
+        On a hit the entry is hard-linked to dest (copied across filesystems).
+        On a miss any existing dest is removed, so the caller writes a fresh
+        file rather than writing through a hard link into the cache.
+
+        Returns:
+            The stored duration on a cache hit, else None
+        """
+        dest = Path(dest)
+        hit = self.get(key)
+
+        if dest.exists() or dest.is_symlink():
+            if hit is not None and os.path.samefile(hit[0], dest):
+                return hit[1]
+            dest.unlink()
+
+        if hit is None:
+            return None
+
+        audio, duration = hit
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(audio, dest)
+        except OSError:
+            shutil.copyfile(audio, dest)
+        return duration
+
+    def put(self, key: str, src: Path, duration_sec: float, **metadata: Any) -> Optional[Path]:
+        """
+        Store generated audio and its duration under a key.
+
+        The file is copied into the cache (never linked), so later writes to
+        src can't corrupt the entry.
+
+        Args:
+            key: Key from tts_cache_key()
+            src: Generated audio file
+            duration_sec: Probed duration, returned on later hits
+            **metadata: Extra JSON-serializable fields kept in the sidecar
+
+        Returns:
+            Path of the cached audio, or None if src doesn't exist
+        """
+        src = Path(src)
+        if not src.exists():
+            return None
+
+        suffix = src.suffix or ".mp3"
+        audio = self._audio_path(key, suffix)
+        audio.parent.mkdir(parents=True, exist_ok=True)
+        meta = {"duration_sec": duration_sec, "suffix": suffix, **metadata}
+
+        fd, tmp_audio = tempfile.mkstemp(dir=audio.parent, suffix=".tmp")
+        os.close(fd)
+        fd, tmp_meta = tempfile.mkstemp(dir=audio.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(meta, f)
+            shutil.copyfile(src, tmp_audio)
+            os.replace(tmp_audio, audio)
+            os.replace(tmp_meta, self._meta_path(key))
+        finally:
+            for tmp_path in (tmp_audio, tmp_meta):
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+        self._stored()
+        return audio
+
+    def _remove(self, entry: CacheEntry):
+        # Sidecar first, so a half-removed entry is never a hit
+        for path in sorted(entry.files, key=lambda p: p.suffix != ".json"):
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count, total size, stored audio duration and hit/miss counters."""
+        audio_seconds = 0.0
+        for meta_path in self.cache_dir.glob("*/*.json"):
+            try:
+                with open(meta_path, "r") as f:
+                    audio_seconds += float(json.load(f).get("duration_sec", 0.0))
+            except (OSError, ValueError):
+                pass
+        return {**super().stats(), "audio_seconds": audio_seconds}
@@ -0,0 +1,169 @@
+"""
+Rate-limit-aware scheduling of TTS requests.
+
+generate_audio_chunks used to synthesize one paragraph at a time, so a
+100-paragraph script took the sum of 100 request latencies. TTSScheduler
+runs requests concurrently within the provider's declared limits:
+
+- at most `max_concurrent_requests` requests in flight,
+- at most `characters_per_minute` characters sent in any 60 second window
+  (when the provider declares one),
+- 429 responses are retried with jittered exponential backoff, and while
+  one request backs off no new requests are started, so a burst of
+  concurrent requests doesn't keep tripping the limit.
+
+Providers declare their limits as class attributes on AudioProvider; the
+TTS_MAX_CONCURRENCY and TTS_CHARACTERS_PER_MINUTE environment variables
+override them (e.g. for a higher ElevenLabs plan).
+"""
+
+import asyncio
+import os
+import random
+import re
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Optional, Tuple
+
+RATE_LIMIT_PATTERN = re.compile(r"\b429\b|rate.?limit|too many (concurrent )?requests", re.IGNORECASE)
+
+
+@dataclass
+class TTSLimits:
+    """Concurrency, throughput and retry settings for one provider"""
+    max_concurrency: int = 4
+    characters_per_minute: Optional[int] = None  # None = no character budget
+    max_retries: int = 5
+    base_delay: float = 1.0  # Seconds before the first retry; doubles each time
+    max_delay: float = 30.0
+
+    @classmethod
+    def for_provider(cls, provider: Any) -> 'TTSLimits':
+        """Limits declared by a provider, overridden by environment variables"""
+        limits = cls()
+        concurrency = getattr(provider, "max_concurrent_requests", None)
+        if isinstance(concurrency, int) and not isinstance(concurrency, bool):
+            limits.max_concurrency = concurrency
+        cpm = getattr(provider, "characters_per_minute", None)
+        if isinstance(cpm, int) and not isinstance(cpm, bool):
+            limits.characters_per_minute = cpm
+
+        if os.environ.get("TTS_MAX_CONCURRENCY"):
+            limits.max_concurrency = int(os.environ["TTS_MAX_CONCURRENCY"])
+        if os.environ.get("TTS_CHARACTERS_PER_MINUTE"):
+            limits.characters_per_minute = int(os.environ["TTS_CHARACTERS_PER_MINUTE"])
+        limits.max_concurrency = max(1, limits.max_concurrency)
+        return limits
+
+
+def is_rate_limited(error: Any) -> bool:
+    """
+    Whether a failure is a rate limit response.
+
+    Accepts exceptions (aiohttp/httpx status errors, or the RuntimeErrors
+    providers raise with the status in the message) and failed
+    AudioGenerationResults, whose error_message carries the status.
+    """
+    for attr in ("status", "status_code"):
+        if getattr(error, attr, None) == 429:
+            return True
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    message = getattr(error, "error_message", None) or str(error)
+    return bool(RATE_LIMIT_PATTERN.search(message))
+
+
+class CharacterBudget:
+    """Sliding 60 second window limiting characters sent per minute"""
+
+    def __init__(self, characters_per_minute: int, window: float = 60.0):
+        self.characters_per_minute = characters_per_minute
+        self.window = window
+        self._sent: Deque[Tuple[float, int]] = deque()
+        self._used = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, characters: int):
+        """Wait until `characters` more can be sent within the window"""
+        # A single request larger than the budget waits for an empty window
+        characters = min(characters, self.characters_per_minute)
+        async with self._lock:  # Waiters are served in arrival order
+            while True:
+                now = time.monotonic()
+                while self._sent and self._sent[0][0] <= now - self.window:
+                    self._used -= self._sent.popleft()[1]
+                if self._used + characters <= self.characters_per_minute:
+                    self._sent.append((now, characters))
+                    self._used += characters
+                    return
+                await asyncio.sleep(self._sent[0][0] + self.window - now)
+
+
+class TTSScheduler:
+    """Runs TTS requests concurrently within a provider's limits"""
+
+    def __init__(self, limits: Optional[TTSLimits] = None):
+        self.limits = limits or TTSLimits()
+        self._semaphore = asyncio.Semaphore(self.limits.max_concurrency)
+        self._budget = (
+            CharacterBudget(self.limits.characters_per_minute)
+            if self.limits.characters_per_minute else None
+        )
+        self._resume_at = 0.0  # Monotonic time before which no request starts
+        self.retries = 0
+
+    async def _wait_for_cooldown(self):
+        while True:
+            delay = self._resume_at - time.monotonic()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    async def run(self, call: Callable[[], Awaitable[Any]], characters: int = 0) -> Any:
+        """
+        Make one request, retrying rate limit responses.
+
+        Args:
+            call: Coroutine factory making the request (called once per attempt)
+            characters: Characters the request sends, charged to the budget
+
+        Returns:
+            The call's result. A result that reports a rate limit (success
+            False) is retried like a raised 429; after max_retries the last
+            error is raised or the last result returned.
+        """
+        attempt = 0
+        while True:
+            if self._budget is not None:
+                await self._budget.acquire(characters)
+
+            async with self._semaphore:
+                await self._wait_for_cooldown()
+                try:
+                    result = await call()
+                    error = None
+                    if getattr(result, "success", True) is False and is_rate_limited(result):
+                        error = result
+                except Exception as e:
+                    if not is_rate_limited(e):
+                        raise
+                    result, error = None, e
+
+            if error is None:
+                return result
+            if attempt >= self.limits.max_retries:
+                if isinstance(error, Exception):
+                    raise error
+                return result
+
+            delay = min(
+                self.limits.base_delay * (2 ** attempt) * random.uniform(0.8, 1.2),
+                self.limits.max_delay,
+            )
+            attempt += 1
+            self.retries += 1
+            # Hold back new requests too, so the whole batch slows down
+            self._resume_at = max(self._resume_at, time.monotonic() + delay)
+            await asyncio.sleep(delay)
@@ -21,6 +21,8 @@ from server.routes import agents, workflows, artifacts
 from server.routes import memory as memory_routes
 from server.routes import runs as runs_routes
 from server.config import settings
+from core.providers.http import close_http_clients
+from core.claude_pool import close_claude_clients
 
 
 @asynccontextmanager
@@ -50,6 +52,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print("\nShutting down Claude Studio Producer server...")
+    await close_http_clients()
+    await close_claude_clients()
 
 
 # Create FastAPI app
@@ -1,10 +1,11 @@
 """Unit tests for cli/assemble.py module"""
 
 import json
+from dataclasses import replace
 import pytest
 import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch, Mock
+from unittest.mock import AsyncMock, MagicMock, patch, Mock
 
 from cli.assemble import (
     VisualSegment,
@@ -12,9 +13,22 @@ from cli.assemble import (
     load_production_run,
     build_visual_segments_from_manifest,
     build_visual_segments_from_librarian,
+    default_jobs,
     get_media_duration,
     print_assembly_summary,
+    render_segment_with_retry,
+    render_segments_parallel,
+    segment_cache_key,
+    SEGMENT_PROFILE,
+    SegmentProfile,
+    create_final_video,
+    create_static_image_video,
+    create_transcript_overlay,
+    create_video_with_ken_burns,
+    find_stream_copy_mismatches,
 )
+from core.media_probe import MediaInfo
+from core.render_cache import RenderCache
 from core.models.structured_script import (
     StructuredScript,
     ScriptSegment,
@@ -616,34 +630,48 @@ class TestBuildVisualSegmentsFromLibrarian:
 class TestGetMediaDuration:
     """Test get_media_duration() function."""
 
-    def test_get_duration_success(self):
+    @pytest.fixture
+    def video(self, tmp_path, monkeypatch):
+        from core.media_probe import MediaProbe
+        monkeypatch.setattr("core.media_probe._probe", MediaProbe(cache_dir=None, ffprobe_path="ffprobe"))
+        path = tmp_path / "video.mp4"
+        path.write_bytes(b"video")
+        return path
+
+    def test_get_duration_success(self, video):
         """Test successfully getting media duration."""
         with patch('subprocess.run') as mock_run:
-            mock_run.return_value = Mock(stdout="30.5", returncode=0)
+            mock_run.return_value = Mock(stdout=b'{"format": {"duration": "30.5"}}', returncode=0)
 
-            duration = get_media_duration(Path("/tmp/video.mp4"))
+            duration = get_media_duration(video)
 
             assert duration == 30.5
 
-    def test_get_duration_timeout(self):
+    def test_get_duration_timeout(self, video):
         """Test handling of ffprobe timeout."""
         import subprocess
         with patch('subprocess.run') as mock_run:
             mock_run.side_effect = subprocess.TimeoutExpired("ffprobe", 30)
 
-            duration = get_media_duration(Path("/tmp/video.mp4"))
+            duration = get_media_duration(video)
 
             assert duration == 0.0
 
-    def test_get_duration_invalid_output(self):
+    def test_get_duration_invalid_output(self, video):
         """Test handling of invalid ffprobe output."""
         with patch('subprocess.run') as mock_run:
-            mock_run.return_value = Mock(stdout="not a number", returncode=0)
+            mock_run.return_value = Mock(stdout=b"not json", returncode=0)
 
-            duration = get_media_duration(Path("/tmp/video.mp4"))
+            duration = get_media_duration(video)
 
             assert duration == 0.0
 
+    def test_get_duration_missing_file(self, tmp_path):
+        """Test that missing files are not probed."""
+        with patch('subprocess.run') as mock_run:
+            assert get_media_duration(tmp_path / "missing.mp4") == 0.0
+        mock_run.assert_not_called()
+
 
 # ============================================================
 # Tests for print_assembly_summary()
@@ -691,3 +719,343 @@ class TestPrintAssemblySummary:
         segments = []
         t = get_theme()
         print_assembly_summary(segments, t)
+
+
+# ============================================================
+# Tests for parallel segment rendering
+# ============================================================
+
+
+class TestRenderSegmentsParallel:
+    """Test the bounded segment render pool."""
+
+    def _segments(self, count):
+        return [
+            VisualSegment(i, "transcript", None, None, 1.0, float(i), float(i + 1), f"Segment {i}")
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_results_in_segment_order(self, temp_run_dir):
+        """Segments finishing out of order are returned in segment order."""
+        import time
+
+        def slow_first(seg, path, **kwargs):
+            time.sleep(0.05 if seg.segment_idx == 0 else 0.0)
+            return True
+
+        completed = []
+        with patch('cli.assemble.render_segment', side_effect=slow_first):
+            paths = await render_segments_parallel(
+                self._segments(4), temp_run_dir, jobs=4, skip_existing=False,
+                on_complete=lambda seg, ok: completed.append(seg.segment_idx),
+            )
+
+        assert [p.name for p in paths] == [f"segment_{i:03d}.mp4" for i in range(4)]
+        assert sorted(completed) == [0, 1, 2, 3]
+        assert completed[-1] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_segments_omitted(self, temp_run_dir):
+        """Segments that fail every attempt are left out of the result."""
+        with patch('cli.assemble.render_segment', side_effect=lambda seg, path, **kwargs: seg.segment_idx != 1):
+            paths = await render_segments_parallel(
+                self._segments(3), temp_run_dir, jobs=2, retries=0, skip_existing=False,
+            )
+
+        assert [p.name for p in paths] == ["segment_000.mp4", "segment_002.mp4"]
+
+    @pytest.mark.asyncio
+    async def test_skip_existing(self, temp_run_dir):
+        """Existing segment files are reused without rendering."""
+        (temp_run_dir / "segment_000.mp4").write_bytes(b"")
+
+        with patch('cli.assemble.render_segment', return_value=True) as mock_render:
+            paths = await render_segments_parallel(
+                self._segments(2), temp_run_dir, jobs=2, skip_existing=True,
+            )
+
+        assert len(paths) == 2
+        assert mock_render.call_count == 1
+
+    def test_retry_after_failure(self, temp_run_dir):
+        """A failed render is retried."""
+        seg = self._segments(1)[0]
+        with patch('cli.assemble.render_segment', side_effect=[RuntimeError("boom"), True]) as mock_render:
+            assert render_segment_with_retry(seg, temp_run_dir / "seg.mp4", retries=1) is True
+        assert mock_render.call_count == 2
+
+    def test_retry_exhausted(self, temp_run_dir):
+        """Retries stop after the configured number of attempts."""
+        seg = self._segments(1)[0]
+        with patch('cli.assemble.render_segment', return_value=False) as mock_render:
+            assert render_segment_with_retry(seg, temp_run_dir / "seg.mp4", retries=2) is False
+        assert mock_render.call_count == 3
+
+    def test_retry_exhausted_logs_last_error(self, temp_run_dir, capsys):
+        """The exception from the final attempt is reported, not swallowed."""
+        seg = self._segments(1)[0]
+        errors = [RuntimeError("first"), RuntimeError("encoder crashed [code 1]")]
+        with patch('cli.assemble.render_segment', side_effect=errors):
+            assert render_segment_with_retry(seg, temp_run_dir / "seg.mp4", retries=1) is False
+
+        out = capsys.readouterr().out
+        assert "Segment 000 render failed: RuntimeError: encoder crashed [code 1]" in out
+        assert "first" not in out
+
+    @pytest.mark.asyncio
+    async def test_threads_capped_per_job(self, temp_run_dir):
+        """Each concurrent render gets its share of the cores as -threads."""
+        with patch('cli.assemble.os.cpu_count', return_value=8), \
+             patch('cli.assemble.render_segment', return_value=True) as mock_render:
+            await render_segments_parallel(
+                self._segments(2), temp_run_dir, jobs=2, skip_existing=False,
+            )
+
+        profile = mock_render.call_args.kwargs["profile"]
+        assert profile.threads == 4
+        args = profile.output_args()
+        assert args[args.index("-threads") + 1] == "4"
+
+    def test_default_jobs_leaves_cores_per_encode(self):
+        with patch('cli.assemble.os.cpu_count', return_value=16):
+            assert default_jobs() == 4
+        with patch('cli.assemble.os.cpu_count', return_value=2):
+            assert default_jobs() == 1
+
+
+class TestSegmentRenderCache:
+    """Test content-addressed reuse of segment renders."""
+
+    def _segment(self, text="Hello world", duration=1.0):
+        return VisualSegment(0, "transcript", None, None, duration, 0.0, duration, text)
+
+    @staticmethod
+    def _fake_render(seg, path, **kwargs):
+        Path(path).write_bytes(seg.transcript_text.encode())
+        return True
+
+    def test_identical_segment_is_cache_hit(self, temp_run_dir):
+        """A second render of an identical segment reuses the cached file."""
+        cache = RenderCache(str(temp_run_dir / "cache"))
+        seg = self._segment()
+
+        with patch('cli.assemble.render_segment', side_effect=self._fake_render) as mock_render:
+            assert render_segment_with_retry(seg, temp_run_dir / "a.mp4", cache=cache)
+            assert render_segment_with_retry(seg, temp_run_dir / "b.mp4", cache=cache)
+
+        assert mock_render.call_count == 1
+        assert (temp_run_dir / "b.mp4").read_bytes() == b"Hello world"
+
+    def test_uncached_rerun_leaves_cache_entry_unchanged(self, temp_run_dir):
+        """A --no-cache render over a materialized segment doesn't touch the cache."""
+        cache = RenderCache(str(temp_run_dir / "cache"))
+        seg = self._segment()
+        segment_path = temp_run_dir / "segment_000.mp4"
+
+        with patch('cli.assemble.render_segment', side_effect=self._fake_render):
+            render_segment_with_retry(seg, temp_run_dir / "first.mp4", cache=cache)
+            assert render_segment_with_retry(seg, segment_path, cache=cache)
+
+            # Rendered in place (as `ffmpeg -y` does) with the cache off
+            seg.transcript_text = "Edited text"
+            assert render_segment_with_retry(seg, segment_path, cache=None)
+
+        assert segment_path.read_bytes() == b"Edited text"
+        assert cache.get(segment_cache_key(self._segment())).read_bytes() == b"Hello world"
+
+    def test_changed_text_changes_key(self):
+        """Different transcript text or duration gives a different key."""
+        assert segment_cache_key(self._segment("a")) != segment_cache_key(self._segment("b"))
+        assert segment_cache_key(self._segment(duration=1.0)) != segment_cache_key(self._segment(duration=2.0))
+
+    @pytest.mark.asyncio
+    async def test_stale_existing_segment_rerendered(self, temp_run_dir):
+        """With a cache, an existing segment file is only reused if its key matches."""
+        cache = RenderCache(str(temp_run_dir / "cache"))
+        (temp_run_dir / "segment_000.mp4").write_bytes(b"stale")
+
+        with patch('cli.assemble.render_segment', side_effect=self._fake_render) as mock_render:
+            paths = await render_segments_parallel(
+                [self._segment()], temp_run_dir, jobs=1, skip_existing=True, cache=cache,
+            )
+
+        assert mock_render.call_count == 1
+        assert paths[0].read_bytes() == b"Hello world"
+
+    def test_no_reuse_forces_render(self, temp_run_dir):
+        """reuse_cached=False re-renders even when the key is cached."""
+        cache = RenderCache(str(temp_run_dir / "cache"))
+        seg = self._segment()
+
+        with patch('cli.assemble.render_segment', side_effect=self._fake_render) as mock_render:
+            render_segment_with_retry(seg, temp_run_dir / "a.mp4", cache=cache)
+            render_segment_with_retry(seg, temp_run_dir / "a.mp4", cache=cache, reuse_cached=False)
+
+        assert mock_render.call_count == 2
+
+
+# ============================================================
+# Tests for the shared segment encoding profile
+# ============================================================
+
+
+class TestSegmentProfile:
+    """Test that every segment type encodes to the same stream parameters."""
+
+    @staticmethod
+    def _arg(cmd, flag):
+        return cmd[cmd.index(flag) + 1]
+
+    def _commands(self, tmp_path):
+        image = tmp_path / "image.png"
+        image.write_bytes(b"png")
+        with patch('cli.assemble.subprocess.run') as mock_run, \
+             patch('cli.assemble.subprocess.Popen') as mock_popen:
+            mock_run.return_value = Mock(returncode=0)
+            mock_popen.return_value = MagicMock(returncode=0)
+            create_video_with_ken_burns(image, 2.0, tmp_path / "kb.mp4")
+            create_static_image_video(image, 2.0, tmp_path / "static.mp4")
+            create_transcript_overlay("Hello world", 2.0, tmp_path / "karaoke.mp4")
+        return {
+            "ken_burns": mock_run.call_args_list[0][0][0],
+            "static": mock_run.call_args_list[1][0][0],
+            "karaoke": mock_popen.call_args[0][0],
+        }
+
+    def test_stream_parameters_pinned_for_all_segment_types(self, tmp_path):
+        for name, cmd in self._commands(tmp_path).items():
+            assert self._arg(cmd, "-r") == "30", name
+            last_pix_fmt = max(i for i, arg in enumerate(cmd) if arg == "-pix_fmt")
+            assert cmd[last_pix_fmt + 1] == "yuv420p", name
+            assert self._arg(cmd, "-video_track_timescale") == "15360", name
+            assert self._arg(cmd, "-profile:v") == "high", name
+            assert self._arg(cmd, "-level:v") == "4.0", name
+            assert "-sc_threshold" in cmd, name
+            assert self._arg(cmd, "-vf").endswith("fps=30,setsar=1/1,format=yuv420p"), name
+            assert cmd[-2] == "-an", name
+
+    def test_static_images_use_still_tune_and_long_gop(self, tmp_path):
+        commands = self._commands(tmp_path)
+        assert self._arg(commands["static"], "-tune") == "stillimage"
+        assert self._arg(commands["static"], "-g") == str(SEGMENT_PROFILE.still_gop)
+        assert self._arg(commands["static"], "-framerate") == "1"
+        assert "-tune" not in commands["ken_burns"]
+        assert self._arg(commands["ken_burns"], "-g") == str(SEGMENT_PROFILE.gop)
+
+    def test_named_encoder_profile(self, tmp_path):
+        draft = SegmentProfile.from_encoder_profile("draft")
+        assert (draft.size, draft.preset, draft.crf) == ("960x540", "ultrafast", 32)
+        assert draft.fps == SEGMENT_PROFILE.fps
+
+        seg = VisualSegment(0, "transcript", None, None, 1.0, 0.0, 1.0, "Hello")
+        assert segment_cache_key(seg, draft) != segment_cache_key(seg)
+        # A different --jobs split reuses the same renders
+        assert segment_cache_key(seg, replace(draft, threads=2)) == segment_cache_key(seg, draft)
+
+        with patch('cli.assemble.subprocess.Popen') as mock_popen:
+            mock_popen.return_value = MagicMock(returncode=0)
+            create_transcript_overlay("Hello world", 2.0, tmp_path / "karaoke.mp4", profile=draft)
+        assert "scale=960:540" in self._arg(mock_popen.call_args[0][0], "-vf")
+
+    def test_mismatches(self):
+        info = MediaInfo(
+            path="seg.mp4", video_codec="h264", width=1920, height=1080, fps=30.0,
+            pix_fmt="yuv420p", time_base="1/15360", sample_aspect_ratio="1:1",
+        )
+        assert SEGMENT_PROFILE.mismatches(info) == []
+
+        info.time_base = "1/30"
+        info.fps = 25.0
+        assert SEGMENT_PROFILE.mismatches(info) == ["fps 25.0", "timebase 1/30"]
+        assert SEGMENT_PROFILE.mismatches(None) == ["no video stream"]
+
+    @pytest.mark.asyncio
+    async def test_find_stream_copy_mismatches(self, tmp_path):
+        good = MediaInfo(
+            path="a.mp4", video_codec="h264", width=1920, height=1080, fps=30.0,
+            pix_fmt="yuv420p", time_base="1/15360", sample_aspect_ratio="1:1",
+        )
+        old = MediaInfo(path="b.mp4", video_codec="h264", width=1920, height=1080, fps=30.0,
+                        pix_fmt="yuv420p", time_base="1/15360", sample_aspect_ratio="4:3")
+        probe = Mock()
+        probe.probe_many = AsyncMock(return_value=[good, old])
+
+        with patch('cli.assemble.get_media_probe', return_value=probe):
+            mismatches = await find_stream_copy_mismatches([Path("a.mp4"), Path("b.mp4")])
+
+        assert mismatches == {Path("b.mp4"): ["SAR 4:3"]}
+
+    @pytest.mark.parametrize("stream_copy", [True, False])
+    def test_final_video_copies_or_reencodes(self, tmp_path, stream_copy):
+        with patch('cli.assemble.subprocess.run') as mock_run:
+            mock_run.return_value = Mock(returncode=0)
+            assert create_final_video(
+                [tmp_path / "segment_000.mp4"], tmp_path / "audio.mp3", tmp_path / "out.mp4",
+                stream_copy=stream_copy,
+            )
+
+        cmd = mock_run.call_args[0][0]
+        assert (self._arg(cmd, "-c:v") == "copy") == stream_copy
+        assert ("-video_track_timescale" in cmd) != stream_copy
+
+
+# ============================================================
+# Tests for the draft preview render
+# ============================================================
+
+
+class TestPreviewAssembly:
+    """Test that --preview renders the draft proxy alongside the full render."""
+
+    async def _assemble_with_preview(self, temp_run_dir, jobs):
+        import asyncio
+        from cli.assemble import _assemble_async
+
+        audio = temp_run_dir / "audio" / "audio_000.mp3"
+        audio.write_bytes(b"mp3")
+        segments = [VisualSegment(0, "transcript", None, audio, 1.0, 0.0, 1.0, "Hello")]
+        calls = {}
+
+        async def fake_render_cut(segments, segments_dir, audio_combined, output_path, profile,
+                                  jobs, label="Rendering segments", **kwargs):
+            calls[label] = {
+                "jobs": jobs, "height": profile.height, "threads": profile.threads, "started": len(calls),
+            }
+            await asyncio.sleep(0.01)
+            calls[label]["others_started"] = len(calls)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(b"mp4")
+            return True, len(segments)
+
+        with patch('cli.assemble.load_production_run', return_value=(Mock(), Mock(), None)), \
+             patch('cli.assemble.ContentLibrarian'), \
+             patch('cli.assemble.build_visual_segments_from_librarian', return_value=(segments, None)), \
+             patch('cli.assemble.concatenate_audio', return_value=True), \
+             patch('cli.assemble.get_media_duration', return_value=1.0), \
+             patch('cli.assemble.os.cpu_count', return_value=8), \
+             patch('cli.assemble._render_cut', side_effect=fake_render_cut):
+            await _assemble_async(
+                str(temp_run_dir), None, skip_existing=True, jobs=jobs, use_cache=False, preview=True,
+            )
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_preview_runs_alongside_full_render(self, temp_run_dir):
+        calls = await self._assemble_with_preview(temp_run_dir, jobs=4)
+
+        assert calls["Draft preview"]["jobs"] + calls["Full render"]["jobs"] == 4
+        assert (calls["Draft preview"]["height"], calls["Full render"]["height"]) == (540, 1080)
+        # Both started before either finished
+        assert calls["Draft preview"]["others_started"] == calls["Full render"]["others_started"] == 2
+        # Threads are the cores' share of all 4 jobs, not of each render's own jobs
+        assert calls["Draft preview"]["threads"] == calls["Full render"]["threads"] == 2
+
+    @pytest.mark.asyncio
+    async def test_single_job_renders_preview_then_full(self, temp_run_dir):
+        calls = await self._assemble_with_preview(temp_run_dir, jobs=1)
+
+        assert calls["Draft preview"]["jobs"] == calls["Full render"]["jobs"] == 1
+        # The preview finished before the full render started
+        assert calls["Draft preview"]["others_started"] == 1
+        assert calls["Full render"]["started"] == 1
@@ -202,11 +202,11 @@ class TestGetAudioDuration:
         fake_mp3 = tmp_path / "test.mp3"
         fake_mp3.write_bytes(b"fake")
 
-        mock_renderer = AsyncMock()
-        mock_renderer._get_duration = AsyncMock(return_value=7.2)
+        mock_probe = AsyncMock()
+        mock_probe.duration = AsyncMock(return_value=7.2)
 
         with patch.dict("sys.modules", {"mutagen": None, "mutagen.mp3": None}):
-            with patch("core.renderer.FFmpegRenderer", return_value=mock_renderer):
+            with patch("core.media_probe.get_media_probe", return_value=mock_probe):
                 duration = await get_audio_duration(fake_mp3)
 
         assert duration == 7.2
@@ -218,7 +218,7 @@ class TestGetAudioDuration:
         fake_mp3.write_bytes(b"fake")
 
         with patch.dict("sys.modules", {"mutagen": None, "mutagen.mp3": None}):
-            with patch("core.renderer.FFmpegRenderer", side_effect=Exception("also nope")):
+            with patch("core.media_probe.get_media_probe", side_effect=Exception("also nope")):
                 duration = await get_audio_duration(fake_mp3)
 
         assert duration == 0.0
@@ -92,10 +92,8 @@ class TestMixerFunctions:
         """Test getting media duration"""
         from core.rendering.mixer import get_media_duration
 
-        with patch('core.rendering.mixer.FFmpegRenderer') as mock_renderer_class:
-            mock_renderer = Mock()
-            mock_renderer._get_duration = AsyncMock(return_value=45.5)
-            mock_renderer_class.return_value = mock_renderer
+        with patch('core.rendering.mixer.get_media_probe') as mock_get_probe:
+            mock_get_probe.return_value.duration = AsyncMock(return_value=45.5)
 
             duration = await get_media_duration("test.mp4")
             assert duration == 45.5
@@ -105,10 +103,8 @@ class TestMixerFunctions:
         """Test that get_media_duration raises error if duration cannot be determined"""
         from core.rendering.mixer import get_media_duration
 
-        with patch('core.rendering.mixer.FFmpegRenderer') as mock_renderer_class:
-            mock_renderer = Mock()
-            mock_renderer._get_duration = AsyncMock(return_value=None)
-            mock_renderer_class.return_value = mock_renderer
+        with patch('core.rendering.mixer.get_media_probe') as mock_get_probe:
+            mock_get_probe.return_value.duration = AsyncMock(return_value=None)
 
             with pytest.raises(RuntimeError, match="Could not determine duration"):
                 await get_media_duration("test.mp4")
@@ -0,0 +1,172 @@
+"""Unit tests for the shared async Anthropic client pool"""
+
+import asyncio
+import importlib.util
+from types import SimpleNamespace
+
+import pytest
+
+anthropic = pytest.importorskip("anthropic")
+
+from core.claude_pool import ClaudeAPIPool, ClaudePoolConfig
+
+
+def _status_error(cls, status_code: int, retry_after=None):
+    """An anthropic API error without building a real HTTP response"""
+    error = cls.__new__(cls)
+    Exception.__init__(error, f"HTTP {status_code}")
+    error.status_code = status_code
+    headers = {"retry-after": retry_after} if retry_after is not None else {}
+    error.response = SimpleNamespace(headers=headers)
+    return error
+
+
+class FakeStream:
+    def __init__(self, messages, chunks):
+        self.messages = messages
+        self.chunks = chunks
+
+    async def __aenter__(self):
+        self.messages.active += 1
+        self.messages.peak = max(self.messages.peak, self.messages.active)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.messages.active -= 1
+
+    @property
+    def text_stream(self):
+        async def gen():
+            for chunk in self.chunks:
+                await asyncio.sleep(self.messages.delay)
+                yield chunk
+        return gen()
+
+    async def get_final_message(self):
+        return SimpleNamespace(usage=SimpleNamespace(input_tokens=7, output_tokens=len(self.chunks)))
+
+
+class FakeMessages:
+    """Scripted `messages.stream`: raises queued errors first, then streams chunks"""
+
+    def __init__(self, chunks=("Hel", "lo"), errors=(), delay=0.0):
+        self.chunks = list(chunks)
+        self.errors = list(errors)
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    def stream(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.errors:
+            raise self.errors.pop(0)
+        return FakeStream(self, self.chunks)
+
+
+def _pool(messages, **config):
+    pool = ClaudeAPIPool(ClaudePoolConfig(base_delay=0.0, **config))
+
+    async def client(api_key):
+        return SimpleNamespace(messages=messages)
+
+    pool.client = client
+    return pool
+
+
+class TestClientLifetime:
+    """Test that shared clients are closed with their event loop"""
+
+    def test_closed_when_loop_shuts_down(self):
+        pool = ClaudeAPIPool(ClaudePoolConfig())
+
+        first = asyncio.run(pool.client("sk-test"))
+        second = asyncio.run(pool.client("sk-test"))
+
+        assert first is not second
+        assert first.is_closed() and second.is_closed()
+        assert len(pool._clients) == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_within_a_loop(self):
+        pool = ClaudeAPIPool(ClaudePoolConfig())
+        client = await pool.client("sk-test")
+        assert await pool.client("sk-test") is client
+        await pool.aclose()
+        assert client.is_closed()
+
+
+class TestCreateMessage:
+    """Test streaming, retries and concurrency limits"""
+
+    @pytest.mark.asyncio
+    async def test_accumulates_streamed_text(self):
+        messages = FakeMessages()
+        seen = []
+        result = await _pool(messages).create_message(
+            "key", on_text=seen.append, model="m", max_tokens=10, messages=[]
+        )
+        assert result == {
+            "text": "Hello",
+            "usage": {"input_tokens": 7, "output_tokens": 2, "total_tokens": 9},
+        }
+        assert seen == ["Hel", "lo"]
+        assert messages.calls[0]["model"] == "m"
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limits_and_overload(self):
+        messages = FakeMessages(errors=[
+            _status_error(anthropic.RateLimitError, 429, retry_after="0"),
+            _status_error(anthropic.InternalServerError, 529),
+        ])
+        pool = _pool(messages)
+        result = await pool.create_message("key", model="m", max_tokens=10, messages=[])
+        assert result["text"] == "Hello"
+        assert pool.retries == 2
+        assert len(messages.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        messages = FakeMessages(errors=[_status_error(anthropic.RateLimitError, 429) for _ in range(3)])
+        with pytest.raises(anthropic.RateLimitError):
+            await _pool(messages, max_retries=2).create_message("key", model="m", max_tokens=10, messages=[])
+        assert len(messages.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        messages = FakeMessages(errors=[_status_error(anthropic.BadRequestError, 400)])
+        with pytest.raises(anthropic.BadRequestError):
+            await _pool(messages).create_message("key", model="m", max_tokens=10, messages=[])
+        assert len(messages.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrent_requests(self):
+        messages = FakeMessages(delay=0.02)
+        pool = _pool(messages, max_concurrency=2)
+        results = await asyncio.gather(*[
+            pool.create_message("key", model="m", max_tokens=10, messages=[]) for _ in range(6)
+        ])
+        assert [r["text"] for r in results] == ["Hello"] * 6
+        assert messages.peak == 2
+
+
+class TestClaudeClientFallback:
+    """Test that ClaudeClient uses the shared pool instead of a blocking client"""
+
+    @pytest.mark.asyncio
+    async def test_query_uses_pool(self, monkeypatch):
+        import core.claude_client as claude_client
+
+        if importlib.util.find_spec("claude_agent_sdk") is not None:
+            pytest.skip("Agent SDK installed; fallback path not taken")
+
+        messages = FakeMessages(chunks=["  answer  "])
+        monkeypatch.setattr(claude_client, "get_api_key", lambda name: "test-key")
+        monkeypatch.setattr(claude_client, "get_claude_pool", lambda: _pool(messages))
+        monkeypatch.delenv("CLAUDE_RESPONSE_CACHE", raising=False)
+
+        client = claude_client.ClaudeClient()
+        text, usage = await client.query("hi", system_prompt="sys", return_usage=True)
+        assert text == "answer"
+        assert usage["total_tokens"] == 8
+        assert messages.calls[0]["messages"] == [{"role": "user", "content": "sys\n\nhi"}]
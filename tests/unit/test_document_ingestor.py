@@ -5,7 +5,7 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from core.models.document import AtomType, DocumentAtom, DocumentGraph
+from core.models.document import AtomType, ContentProfile, DocumentAtom, DocumentGraph, DocumentType
 from agents.document_ingestor import DocumentIngestorAgent, ExtractionResult
 from tests.mocks import MockClaudeClient
 
@@ -370,3 +370,77 @@ class TestExtractionResult:
         assert result.page_count == 1
         assert len(result.text_blocks) == 1
         assert len(result.images) == 0
+
+
+class OrderCheckingClient:
+    """Fake Claude client whose later requests finish first, tracking concurrency"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def _run(self, delay):
+        import asyncio
+
+        self.calls += 1
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.active -= 1
+
+    async def query(self, prompt, system_prompt=None):
+        import json
+        import re
+
+        if "Generate summaries" in prompt:
+            await self._run(0.03)
+            return json.dumps({"one_sentence": "One.", "one_paragraph": "Para.", "full_summary": "Full."})
+
+        indices = [int(i) for i in re.findall(r"\[Block (\d+),", prompt)]
+        await self._run(0.05 / (1 + indices[0] // 30))
+        return json.dumps({
+            "title": "Concurrent Paper",
+            "authors": ["A. Author"],
+            "blocks": [{"block_index": i, "type": "paragraph"} for i in indices],
+        })
+
+    async def query_with_image(self, prompt, image_path, system_prompt=None):
+        data = Path(image_path).read_bytes()
+        await self._run(0.01 if data == b"late" else 0.04)
+        return f"figure {data.decode()}"
+
+
+class TestConcurrentAnalysis:
+    """Test concurrent LLM fan-out in _llm_analyze"""
+
+    @pytest.mark.asyncio
+    async def test_results_merge_in_document_order(self):
+        client = OrderCheckingClient()
+        agent = DocumentIngestorAgent(claude_client=client, max_concurrent_requests=3)
+        extraction = ExtractionResult(
+            text_blocks=[
+                {"text": f"Block text {i}", "page": i // 10, "bbox": (0, 0, 1, 1),
+                 "font_size": 11, "is_bold": False}
+                for i in range(70)
+            ],
+            images=[
+                {"image_bytes": b"early", "ext": "png", "page": 0, "bbox": (0, 0, 1, 1)},
+                {"image_bytes": b"late", "ext": "png", "page": 1, "bbox": (0, 0, 1, 1)},
+            ],
+            page_count=7,
+            metadata={},
+        )
+        profile = ContentProfile(document_type=DocumentType.SCIENTIFIC_PAPER, confidence=1.0)
+
+        graph = await agent._llm_analyze("doc", "paper.pdf", extraction, profile)
+
+        # 1 summary + 3 chunks + 2 figures, at most 3 at a time
+        assert client.calls == 6
+        assert 1 < client.peak <= 3
+        assert [graph.atoms[a].content for a in graph.flow] == [f"Block text {i}" for i in range(70)]
+        assert [graph.atoms[f].content for f in graph.figures] == ["figure early", "figure late"]
+        assert graph.title == "Concurrent Paper"
+        assert graph.one_sentence == "One."
@@ -0,0 +1,90 @@
+"""Tests for the shared HTTP connection registry"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from core.providers.http import HTTPClientRegistry, HTTPPoolConfig
+
+
+@pytest.fixture
+async def server():
+    """Local HTTP server that records the client port of each request"""
+    ports = []
+
+    async def handler(request):
+        ports.append(request.transport.get_extra_info("peername")[1])
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    yield f"http://127.0.0.1:{port}/", ports
+
+    await runner.cleanup()
+
+
+class TestHTTPClientRegistry:
+    """Tests for HTTPClientRegistry"""
+
+    def test_config_from_env(self, monkeypatch):
+        monkeypatch.setenv("HTTP_MAX_CONNECTIONS_PER_HOST", "4")
+        monkeypatch.setenv("HTTP_HTTP2", "0")
+
+        config = HTTPPoolConfig.from_env()
+
+        assert config.max_connections_per_host == 4
+        assert config.http2 is False
+
+    @pytest.mark.asyncio
+    async def test_session_shared_and_limited(self):
+        registry = HTTPClientRegistry(HTTPPoolConfig(max_connections=10, max_connections_per_host=3))
+
+        session = await registry.session()
+
+        assert await registry.session() is session
+        assert session.connector.limit == 10
+        assert session.connector.limit_per_host == 3
+        await registry.aclose()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, server):
+        url, ports = server
+        registry = HTTPClientRegistry()
+
+        for _ in range(5):
+            session = await registry.session()
+            async with session.get(url) as response:
+                assert await response.text() == "ok"
+
+        assert len(ports) == 5
+        assert len(set(ports)) == 1
+        await registry.aclose()
+
+    def test_closed_when_loop_shuts_down(self):
+        registry = HTTPClientRegistry()
+
+        first = asyncio.run(registry.session())
+        second = asyncio.run(registry.session())
+
+        assert first is not second
+        assert first.closed and second.closed
+
+    @pytest.mark.asyncio
+    async def test_httpx_client_shared(self):
+        httpx = pytest.importorskip("httpx")
+        registry = HTTPClientRegistry()
+
+        client = await registry.httpx_client()
+
+        assert isinstance(client, httpx.AsyncClient)
+        assert await registry.httpx_client() is client
+        await registry.aclose()
+        assert client.is_closed
@@ -69,11 +69,17 @@ class TestKaraokeOverlay:
             result = create_transcript_overlay("Hello world", 0.0, Path(f.name))
             assert result is False
 
-    @patch("cli.assemble.subprocess.run")
-    def test_creates_video_with_ffmpeg_framerate(self, mock_run):
-        """Verify ffmpeg is called with -framerate (frame sequence) not -loop 1 (static)."""
+    @staticmethod
+    def _mock_ffmpeg(mock_popen):
+        process = MagicMock(returncode=0)
+        mock_popen.return_value = process
+        return process
+
+    @patch("cli.assemble.subprocess.Popen")
+    def test_creates_video_with_ffmpeg_framerate(self, mock_popen):
+        """Verify ffmpeg reads a raw frame stream from stdin, not -loop 1 (static)."""
         from cli.assemble import create_transcript_overlay
-        mock_run.return_value = MagicMock(returncode=0)
+        self._mock_ffmpeg(mock_popen)
 
         with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as f:
             output_path = f.name
@@ -85,19 +91,39 @@ class TestKaraokeOverlay:
                 Path(output_path)
             )
             assert result is True
-            # Check ffmpeg was called with framerate input
-            call_args = mock_run.call_args[0][0]
+            # Check ffmpeg was called with a piped rawvideo input
+            call_args = mock_popen.call_args[0][0]
             assert "-framerate" in call_args
             assert "-loop" not in call_args
+            assert call_args[call_args.index("-f") + 1] == "rawvideo"
+            assert call_args[call_args.index("-i") + 1] == "-"
         finally:
             if os.path.exists(output_path):
                 os.unlink(output_path)
 
-    @patch("cli.assemble.subprocess.run")
-    def test_single_word(self, mock_run):
+    @patch("cli.assemble.subprocess.Popen")
+    def test_one_frame_per_word(self, mock_popen):
+        """Frames are only emitted when the highlighted word changes."""
+        from cli.assemble import create_transcript_overlay
+        process = self._mock_ffmpeg(mock_popen)
+
+        result = create_transcript_overlay(
+            "one two three four five six", 4.0, Path("unused.mp4")
+        )
+
+        assert result is True
+        assert process.stdin.write.call_count == 6
+        frame = process.stdin.write.call_args[0][0]
+        assert len(frame) == 1920 * 1080 * 3
+        # 6 words over 4 seconds -> input rate of 3/2 frames per second
+        call_args = mock_popen.call_args[0][0]
+        assert call_args[call_args.index("-framerate") + 1] == "3/2"
+
+    @patch("cli.assemble.subprocess.Popen")
+    def test_single_word(self, mock_popen):
         """Single word should still produce valid output."""
         from cli.assemble import create_transcript_overlay
-        mock_run.return_value = MagicMock(returncode=0)
+        self._mock_ffmpeg(mock_popen)
 
         with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as f:
             output_path = f.name
@@ -109,22 +135,24 @@ class TestKaraokeOverlay:
             if os.path.exists(output_path):
                 os.unlink(output_path)
 
-    @patch("cli.assemble.subprocess.run")
-    def test_temp_frames_cleaned_up(self, mock_run):
-        """Verify temp directory is cleaned up after encoding."""
+    @patch("cli.assemble.subprocess.Popen")
+    def test_ffmpeg_failure_returns_false(self, mock_popen):
+        """A non-zero ffmpeg exit is reported as failure."""
         from cli.assemble import create_transcript_overlay
-        mock_run.return_value = MagicMock(returncode=0)
+        self._mock_ffmpeg(mock_popen).returncode = 1
 
-        with tempfile.NamedTemporaryFile(suffix='.mp4', delete=False) as f:
-            output_path = f.name
+        assert create_transcript_overlay("Hello world", 2.0, Path("unused.mp4")) is False
 
-        try:
-            create_transcript_overlay("Test text here", 2.0, Path(output_path))
-            # Temp dirs starting with karaoke_ should be cleaned up
-            temp_root = tempfile.gettempdir()
-            karaoke_dirs = [d for d in os.listdir(temp_root) if d.startswith("karaoke_")]
-            # Should be empty (cleaned up) or at most the one being used by another test
-            assert len(karaoke_dirs) <= 1
-        finally:
-            if os.path.exists(output_path):
-                os.unlink(output_path)
+    @patch("cli.assemble.subprocess.Popen")
+    def test_no_temp_frames_written(self, mock_popen):
+        """Frames are piped to ffmpeg; no karaoke_ temp directory is created."""
+        from cli.assemble import create_transcript_overlay
+        self._mock_ffmpeg(mock_popen)
+
+        temp_root = tempfile.gettempdir()
+        before = {d for d in os.listdir(temp_root) if d.startswith("karaoke_")}
+
+        create_transcript_overlay("Test text here", 2.0, Path("unused.mp4"))
+
+        after = {d for d in os.listdir(temp_root) if d.startswith("karaoke_")}
+        assert after == before
@@ -0,0 +1,111 @@
+"""Unit tests for incremental knowledge graph maintenance in the kb CLI"""
+
+import json
+
+import pytest
+
+from cli import kb
+from core.models.knowledge import KnowledgeGraph, KnowledgeProject, KnowledgeSource, SourceType
+
+
+def _atom(atom_id, topics=(), entities=()):
+    return {
+        "atom_id": atom_id,
+        "atom_type": "paragraph",
+        "content": f"Content of {atom_id}",
+        "topics": list(topics),
+        "entities": list(entities),
+    }
+
+
+SOURCES = {
+    "src_a": {
+        "a1": _atom("a1", topics=["gene editing"], entities=["CRISPR"]),
+        "a2": _atom("a2", topics=["delivery vectors"], entities=["Cas9", "AAV"]),
+    },
+    "src_b": {
+        "b1": _atom("b1", topics=["gene editing"], entities=["Cas9"]),
+    },
+    "src_c": {
+        "c1": _atom("c1", topics=["delivery vectors", "gene editing"], entities=["CRISPR", "AAV"]),
+    },
+}
+
+
+@pytest.fixture
+def project_dir(tmp_path):
+    (tmp_path / "sources").mkdir()
+    with open(tmp_path / kb.KG_FILE, "w", encoding="utf-8") as f:
+        json.dump(KnowledgeGraph(project_id="kb_test").to_dict(), f)
+    return tmp_path
+
+
+def _add(project_dir, proj, source_id):
+    """Register a source as `kb add` does and merge it incrementally"""
+    source_dir = project_dir / "sources" / source_id
+    source_dir.mkdir()
+    with open(source_dir / "document_graph.json", "w", encoding="utf-8") as f:
+        json.dump({"atoms": SOURCES[source_id]}, f)
+    proj.add_source(KnowledgeSource(source_id=source_id, source_type=SourceType.PAPER))
+    return kb._update_knowledge_graph(project_dir, proj, added={source_id: SOURCES[source_id]})
+
+
+def _shape(graph):
+    """Graph content, ignoring link IDs and link order"""
+    return (
+        set(graph.atoms),
+        graph.atom_sources,
+        {k: sorted(v) for k, v in graph.topic_index.items()},
+        {k: sorted(v) for k, v in graph.entity_index.items()},
+        sorted((l.source_atom_id, l.target_atom_id) for l in graph.cross_links),
+        graph.key_themes,
+    )
+
+
+class TestIncrementalGraph:
+    """Test delta-logged source additions and removals"""
+
+    def test_matches_full_rebuild(self, project_dir):
+        proj = KnowledgeProject(project_id="kb_test", name="Test")
+        for source_id in SOURCES:
+            _add(project_dir, proj, source_id)
+
+        proj.remove_source("src_b")
+        kb._update_knowledge_graph(project_dir, proj, removed=["src_b"])
+
+        # Additions and removals went to the delta log, not the snapshot
+        with open(project_dir / kb.KG_FILE, encoding="utf-8") as f:
+            assert json.load(f)["atoms"] == {}
+        assert len((project_dir / kb.KG_DELTA_FILE).read_text().splitlines()) == 4
+
+        loaded = kb._load_knowledge_graph(project_dir)
+        rebuilt = kb._rebuild_knowledge_graph(project_dir, proj)
+        assert _shape(loaded) == _shape(rebuilt)
+        assert loaded.key_themes == ["gene editing", "delivery vectors"]
+        assert not (project_dir / kb.KG_DELTA_FILE).exists()
+
+    def test_compacts_delta_log(self, project_dir, monkeypatch):
+        monkeypatch.setattr(kb, "KG_COMPACT_AFTER", 2)
+        proj = KnowledgeProject(project_id="kb_test", name="Test")
+        _add(project_dir, proj, "src_a")
+        _add(project_dir, proj, "src_b")
+        assert (project_dir / kb.KG_DELTA_FILE).exists()
+
+        graph = _add(project_dir, proj, "src_c")
+        assert not (project_dir / kb.KG_DELTA_FILE).exists()
+        with open(project_dir / kb.KG_FILE, encoding="utf-8") as f:
+            assert _shape(KnowledgeGraph.from_dict(json.load(f))) == _shape(graph)
+
+    def test_replay_skips_sources_already_in_snapshot(self, project_dir):
+        proj = KnowledgeProject(project_id="kb_test", name="Test")
+        _add(project_dir, proj, "src_a")
+        _add(project_dir, proj, "src_c")
+        delta = (project_dir / kb.KG_DELTA_FILE).read_text()
+
+        # Compaction interrupted after writing the snapshot
+        kb._write_knowledge_graph(project_dir, kb._load_knowledge_graph(project_dir))
+        (project_dir / kb.KG_DELTA_FILE).write_text(delta + '{"op": "add_so')
+
+        graph = kb._load_knowledge_graph(project_dir)
+        assert graph.atom_count == 3
+        assert graph.cross_link_count == 2
@@ -351,6 +351,45 @@ class TestKnowledgeGraph:
         )
         assert graph.cross_link_count == 1
 
+    def test_add_source_updates_indices_and_links(self):
+        graph = KnowledgeGraph(project_id="kb_test")
+        assert graph.add_source("src_a", {
+            "a1": self._make_atom("a1", topics=["ml"], entities=["BERT"]),
+            "a2": self._make_atom("a2", entities=["BERT", "GPT"]),
+        }) == []
+
+        links = graph.add_source("src_b", {
+            "b1": self._make_atom("b1", topics=["ml"], entities=["GPT"]),
+            "b2": self._make_atom("b2", entities=["BERT"]),
+        })
+        assert graph.topic_index == {"ml": ["a1", "b1"]}
+        assert graph.entity_index == {"BERT": ["a1", "a2", "b2"], "GPT": ["a2", "b1"]}
+        assert [(l.source_atom_id, l.target_atom_id) for l in links] == [("a2", "b1"), ("a1", "b2")]
+        assert all(l.source_source_id == "src_a" and l.target_source_id == "src_b" for l in links)
+        assert [l.link_id for l in graph.cross_links] == ["link_0001", "link_0002"]
+
+        # One link per earlier source sharing the entity
+        links = graph.add_source("src_c", {"c1": self._make_atom("c1", entities=["BERT"])})
+        assert [(l.source_source_id, l.source_atom_id) for l in links] == [("src_a", "a1"), ("src_b", "b2")]
+        assert graph.cross_links[-1].link_id == "link_0004"
+
+    def test_remove_source(self):
+        graph = KnowledgeGraph(project_id="kb_test")
+        graph.add_source("src_a", {"a1": self._make_atom("a1", topics=["ml", "nlp"], entities=["BERT"])})
+        graph.add_source("src_b", {"b1": self._make_atom("b1", topics=["ml"], entities=["BERT"])})
+        graph.add_source("src_c", {"c1": self._make_atom("c1", entities=["BERT"])})
+
+        assert graph.remove_source("src_a") == 1
+        assert graph.atoms.keys() == {"b1", "c1"}
+        assert graph.topic_index == {"ml": ["b1"]}
+        assert graph.entity_index == {"BERT": ["b1", "c1"]}
+        assert [(l.source_source_id, l.target_source_id) for l in graph.cross_links] == [("src_b", "src_c")]
+        assert graph.remove_source("src_a") == 0
+
+        # New link IDs continue after the highest surviving one
+        links = graph.add_source("src_d", {"d1": self._make_atom("d1", entities=["BERT"])})
+        assert [l.link_id for l in links] == ["link_0004", "link_0005"]
+
 
 class TestKnowledgeProject:
     """Test KnowledgeProject dataclass"""
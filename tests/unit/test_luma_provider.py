@@ -369,3 +369,141 @@ class TestEstimateCost:
         """Test cost estimation with default resolution"""
         cost = luma_provider.estimate_cost(5.0)
         assert cost == 0.40  # Default is 720p
+
+
+# ============================================================
+# Status Poller Tests
+# ============================================================
+
+class ScriptedGenerations(MockGenerations):
+    """Generations that advance through states each time they are observed"""
+    def __init__(self, scripts: dict, listed: bool = True, get_delay: float = 0.0):
+        super().__init__()
+        self.scripts = {gen_id: list(states) for gen_id, states in scripts.items()}
+        self.listed = listed
+        self.get_delay = get_delay
+
+    def _observe(self, generation_id: str):
+        states = self.scripts[generation_id]
+        state = states.pop(0) if len(states) > 1 else states[0]
+        return MockGeneration(id=generation_id, state=state, failure_reason="bad prompt" if state == "failed" else None)
+
+    def get(self, generation_id: str):
+        if self.get_delay:
+            import time
+            time.sleep(self.get_delay)
+        return self._observe(generation_id)
+
+    def list(self, limit: int = 100):
+        if not self.listed:
+            return MockGenerationListResponse([])
+        return MockGenerationListResponse([self._observe(gen_id) for gen_id in list(self.scripts)[:limit]])
+
+
+def fast_poller(client):
+    from core.providers.video.luma_poller import LumaStatusPoller
+    return LumaStatusPoller(client, initial_interval=0.01, queued_max_interval=0.02)
+
+
+class TestStatusPoller:
+    """Tests for the shared LumaStatusPoller"""
+
+    @pytest.mark.asyncio
+    async def test_batches_concurrent_waits_into_list_calls(self, mock_luma_client):
+        import asyncio
+        scripts = {f"gen-{i}": ["queued"] + ["dreaming"] * (i % 3 + 1) + ["completed"] for i in range(20)}
+        mock_luma_client.generations = ScriptedGenerations(scripts)
+        poller = fast_poller(mock_luma_client)
+
+        results = await asyncio.gather(*[
+            poller.wait(gen_id, timeout=5, max_interval=0.05) for gen_id in scripts
+        ])
+
+        assert [g.state for g in results] == ["completed"] * 20
+        assert [g.id for g in results] == list(scripts)
+        # One listing per tick; a lone straggler is fetched directly
+        assert poller.get_calls <= 2
+        assert poller.list_calls + poller.get_calls < 20
+        assert poller.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_get_when_not_listed(self, mock_luma_client):
+        import asyncio
+        scripts = {"gen-a": ["queued", "completed"], "gen-b": ["dreaming", "completed"]}
+        mock_luma_client.generations = ScriptedGenerations(scripts, listed=False)
+        poller = fast_poller(mock_luma_client)
+
+        results = await asyncio.gather(*[poller.wait(gen_id, timeout=5) for gen_id in scripts])
+
+        assert [g.state for g in results] == ["completed", "completed"]
+        assert poller.get_calls >= 2
+
+    @pytest.mark.asyncio
+    async def test_interval_backs_off_while_dreaming(self, mock_luma_client):
+        from core.providers.video.luma_poller import LumaStatusPoller, _Waiter
+        import asyncio
+        poller = LumaStatusPoller(mock_luma_client, initial_interval=2.0, queued_max_interval=5.0)
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            generation_id="gen-1", future=loop.create_future(), started=0.0,
+            deadline=1e9, max_interval=15.0, interval=2.0, next_check=0.0,
+        )
+
+        intervals = []
+        for state in ["queued"] * 4 + ["dreaming"] * 6:
+            poller._update(waiter, MockGeneration(id="gen-1", state=state))
+            intervals.append(waiter.interval)
+
+        assert intervals[:4] == [3.0, 4.5, 5.0, 5.0]  # Capped while queued
+        assert intervals[-1] == 15.0  # Slower while dreaming
+        assert intervals == sorted(intervals)
+
+    @pytest.mark.asyncio
+    async def test_does_not_block_event_loop(self, mock_luma_client):
+        import asyncio
+        mock_luma_client.generations = ScriptedGenerations({"gen-1": ["dreaming", "completed"]}, get_delay=0.1)
+        poller = fast_poller(mock_luma_client)
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.ensure_future(ticker())
+        await poller.wait("gen-1", timeout=5)
+        ticking.cancel()
+
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_wait_for_generation_failure_and_timeout(self, luma_provider, mock_luma_client):
+        mock_luma_client.generations = ScriptedGenerations({
+            "gen-bad": ["queued", "failed"],
+            "gen-slow": ["dreaming"],
+        })
+        luma_provider._poller = fast_poller(mock_luma_client)
+
+        failed = await luma_provider.wait_for_generation("gen-bad", {}, timeout=5, quiet=True)
+        assert not failed.success
+        assert "bad prompt" in failed.error_message
+
+        slow = await luma_provider.wait_for_generation("gen-slow", {}, timeout=0.1, quiet=True)
+        assert not slow.success
+        assert "timed out" in slow.error_message
+        assert "dreaming" in slow.error_message
+
+    @pytest.mark.asyncio
+    async def test_wait_for_generation_success(self, luma_provider, mock_luma_client):
+        mock_luma_client.generations = ScriptedGenerations({"gen-ok": ["queued", "dreaming", "completed"]})
+        luma_provider._poller = fast_poller(mock_luma_client)
+
+        result = await luma_provider.wait_for_generation(
+            "gen-ok", {"actual_duration": 5.0, "cost_estimate": 0.4}, timeout=5, quiet=True
+        )
+
+        assert result.success
+        assert result.video_url == MockAssets().video
+        assert result.provider_metadata["generation_id"] == "gen-ok"
@@ -0,0 +1,161 @@
+"""Unit tests for the cached media probe"""
+
+import asyncio
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.media_probe import MediaInfo, MediaProbe
+
+FFPROBE_OUTPUT = {
+    "format": {"format_name": "mov,mp4,m4a,3gp,3g2,mj2", "duration": "12.480000"},
+    "streams": [
+        {
+            "codec_type": "video", "codec_name": "h264", "width": 1920, "height": 1080,
+            "avg_frame_rate": "30000/1001", "r_frame_rate": "30000/1001",
+            "pix_fmt": "yuv420p", "time_base": "1/30000", "sample_aspect_ratio": "1:1",
+        },
+        {
+            "codec_type": "audio", "codec_name": "aac", "sample_rate": "48000",
+            "channels": 2, "channel_layout": "stereo",
+        },
+    ],
+}
+
+
+class FakeFFprobe:
+    """Stands in for asyncio.create_subprocess_exec, counting ffprobe runs"""
+
+    def __init__(self, output=FFPROBE_OUTPUT, delay=0.02, returncode=0):
+        self.output = output
+        self.delay = delay
+        self.returncode = returncode
+        self.paths = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, *cmd, **kwargs):
+        self.paths.append(cmd[-1])
+        process = MagicMock()
+        process.returncode = self.returncode
+
+        async def communicate():
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(self.delay)
+            self.active -= 1
+            return json.dumps(self.output).encode(), b""
+
+        process.communicate = communicate
+        return process
+
+
+@pytest.fixture
+def media(tmp_path):
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"clip_{i}.mp4"
+        path.write_bytes(b"x" * (i + 1))
+        paths.append(path)
+    return paths
+
+
+def _probe(tmp_path, **kwargs):
+    return MediaProbe(cache_dir=str(tmp_path / "cache"), ffprobe_path="ffprobe", **kwargs)
+
+
+class TestMediaInfo:
+    """Test parsing ffprobe JSON"""
+
+    def test_from_ffprobe(self):
+        info = MediaInfo.from_ffprobe("a.mp4", FFPROBE_OUTPUT)
+        assert info.duration == 12.48
+        assert info.resolution == (1920, 1080)
+        assert info.fps == pytest.approx(29.97, abs=0.01)
+        assert (info.video_codec, info.pix_fmt, info.time_base) == ("h264", "yuv420p", "1/30000")
+        assert (info.audio_codec, info.sample_rate, info.channel_layout) == ("aac", 48000, "stereo")
+        assert info.has_video and info.has_audio
+
+    def test_audio_only_with_cover_art(self):
+        info = MediaInfo.from_ffprobe("a.mp3", {
+            "format": {},
+            "streams": [
+                {"codec_type": "audio", "codec_name": "mp3", "duration": "4.2"},
+                {"codec_type": "video", "codec_name": "mjpeg", "avg_frame_rate": "0/0",
+                 "disposition": {"attached_pic": 1}},
+            ],
+        })
+        assert info.duration == 4.2
+        assert not info.has_video
+        assert info.fps is None
+
+
+class TestMediaProbe:
+    """Test caching, deduplication and batching"""
+
+    @pytest.mark.asyncio
+    async def test_caches_in_memory_and_on_disk(self, tmp_path, media):
+        ffprobe = FakeFFprobe()
+        with patch("core.media_probe.asyncio.create_subprocess_exec", ffprobe):
+            probe = _probe(tmp_path)
+            assert (await probe.probe(media[0])).duration == 12.48
+            assert await probe.duration(media[0]) == 12.48
+            assert len(ffprobe.paths) == 1
+
+            # A new process reads the persisted entry
+            fresh = _probe(tmp_path)
+            assert (await fresh.probe(media[0])).resolution == (1920, 1080)
+            assert len(ffprobe.paths) == 1
+            assert (fresh.hits, fresh.misses) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_changed_file_is_probed_again(self, tmp_path, media):
+        ffprobe = FakeFFprobe()
+        with patch("core.media_probe.asyncio.create_subprocess_exec", ffprobe):
+            probe = _probe(tmp_path)
+            await probe.probe(media[0])
+            media[0].write_bytes(b"re-rendered clip")
+            await probe.probe(media[0])
+        assert len(ffprobe.paths) == 2
+
+    @pytest.mark.asyncio
+    async def test_probe_many_is_concurrent_and_deduplicated(self, tmp_path, media):
+        ffprobe = FakeFFprobe()
+        with patch("core.media_probe.asyncio.create_subprocess_exec", ffprobe):
+            probe = _probe(tmp_path, max_concurrency=4)
+            infos = await probe.probe_many(media + media[:2])
+
+        assert [info.path for info in infos] == [os.path.abspath(p) for p in media + media[:2]]
+        assert sorted(ffprobe.paths) == sorted(os.path.abspath(p) for p in media)
+        assert ffprobe.peak == 4
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, tmp_path, media):
+        ffprobe = FakeFFprobe(returncode=1)
+        with patch("core.media_probe.asyncio.create_subprocess_exec", ffprobe):
+            probe = _probe(tmp_path)
+            assert await probe.probe(media[0]) is None
+            assert await probe.probe(media[0]) is None
+            assert await probe.probe(tmp_path / "missing.mp4") is None
+        assert len(ffprobe.paths) == 2
+        assert probe.stats()["entries"] == 0
+
+    def test_probe_sync_shares_the_cache(self, tmp_path, media):
+        probe = _probe(tmp_path)
+        with patch("subprocess.run") as run:
+            run.return_value = MagicMock(returncode=0, stdout=json.dumps(FFPROBE_OUTPUT).encode())
+            assert probe.duration_sync(media[0]) == 12.48
+            assert probe.probe_sync(media[0]).has_audio
+        assert run.call_count == 1
+
+    def test_evict(self, tmp_path, media):
+        probe = _probe(tmp_path)
+        with patch("subprocess.run") as run:
+            run.return_value = MagicMock(returncode=0, stdout=json.dumps(FFPROBE_OUTPUT).encode())
+            for path in media:
+                probe.probe_sync(path)
+        assert probe.evict(max_entries=4) == 2
+        assert probe.evict(0) == 4
+        assert probe.stats()["entries"] == 0
@@ -0,0 +1,255 @@
+"""Tests for BM25 and semantic search in the local memory backend"""
+
+import asyncio
+import json
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+from core.memory.backends.base import MemoryRecord
+from core.memory.backends.local import LocalMemoryBackend
+from core.memory.search_index import InvertedIndex, collection_stats, tokenize
+from core.memory.vector_index import HashingEmbedder
+
+
+def _record(text, namespace="/test/search", tags=None, record_id=None):
+    record = MemoryRecord(namespace=namespace, text_content=text, tags=tags or [])
+    if record_id:
+        record.record_id = record_id
+    return record
+
+
+class TestInvertedIndex:
+    """Tests for the index data structure"""
+
+    def test_tokenize(self):
+        assert tokenize("Use CONCRETE nouns, not 3D-ish!") == ["use", "concrete", "nouns", "not", "3d", "ish"]
+
+    def test_add_and_remove(self):
+        index = InvertedIndex.from_records([
+            _record("red fox", record_id="a"),
+            _record("red dog", record_id="b"),
+        ])
+        assert index.document_frequency("red") == 2
+
+        index.remove("a")
+        assert index.document_frequency("red") == 1
+        assert "fox" not in index.postings
+        assert index.total_length == 2
+
+    def test_rare_terms_score_higher(self):
+        index = InvertedIndex.from_records([
+            _record("camera motion slow", record_id="a"),
+            _record("camera angle wide", record_id="b"),
+            _record("camera zoom", record_id="c"),
+        ])
+        tokens = ["camera", "motion"]
+        idf, avg_length = collection_stats([index], tokens)
+        scores = index.score(tokens, idf, avg_length)
+
+        assert max(scores, key=scores.get) == "a"
+        assert idf["motion"] > idf["camera"]
+
+
+class TestBackendSearch:
+    """Tests for LocalMemoryBackend.search"""
+
+    @pytest.fixture
+    def backend(self):
+        temp = tempfile.mkdtemp()
+        yield LocalMemoryBackend(base_path=temp, flush_delay=0)
+        shutil.rmtree(temp, ignore_errors=True)
+
+    @pytest.mark.asyncio
+    async def test_best_match_first(self, backend):
+        await backend.create(_record("avoid abstract concepts in prompts"))
+        await backend.create(_record("use concrete nouns for better results"))
+        await backend.create(_record("concrete settings help"))
+
+        results = await backend.search(["/test/search"], "concrete nouns")
+
+        assert results[0].record.text_content == "use concrete nouns for better results"
+        assert results[0].score == 1.0
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_index_follows_updates_and_deletes(self, backend):
+        record = _record("slow dolly shot")
+        await backend.create(record)
+        assert await backend.search(["/test/search"], "dolly")
+
+        record.text_content = "fast whip pan"
+        await backend.update(record)
+        assert not await backend.search(["/test/search"], "dolly")
+        assert await backend.search(["/test/search"], "whip")
+
+        await backend.delete("/test/search", record.record_id)
+        assert not await backend.search(["/test/search"], "whip")
+
+    @pytest.mark.asyncio
+    async def test_across_namespaces_with_tags(self, backend):
+        await backend.create(_record("luma lighting tip", namespace="/a", tags=["luma"]))
+        await backend.create(_record("runway lighting tip", namespace="/b", tags=["runway"]))
+
+        results = await backend.search(["/a", "/b"], "lighting", tags=["runway"])
+
+        assert [r.source_namespace for r in results] == ["/b"]
+
+    @pytest.mark.asyncio
+    async def test_top_k(self, backend):
+        for i in range(20):
+            await backend.create(_record(f"tip number {i}"))
+
+        results = await backend.search(["/test/search"], "tip", top_k=5)
+
+        assert len(results) == 5
+
+    @pytest.mark.asyncio
+    async def test_empty_query_lists_newest_records(self, backend):
+        for i in range(4):
+            record = _record(f"tip number {i}", tags=["luma"] if i % 2 else [])
+            record.created_at = datetime(2026, 1, 1 + i)
+            await backend.create(record)
+
+        results = await backend.search(["/test/search"], "", top_k=3)
+        assert [r.record.text_content for r in results] == ["tip number 3", "tip number 2", "tip number 1"]
+        assert all(r.score == 1.0 for r in results)
+
+        results = await backend.search(["/test/search"], "", tags=["luma"])
+        assert [r.record.text_content for r in results] == ["tip number 3", "tip number 1"]
+
+
+class TestMemoryListCLI:
+    """`memory list` without a provider lists learnings through an empty search"""
+
+    @pytest.mark.parametrize("storage_format", ["json", "sqlite"])
+    def test_list_without_provider(self, tmp_path, monkeypatch, storage_format):
+        from cli.memory import get_manager_with_context, memory_cmd
+        from core.memory.namespace import MultiTenantNamespaceBuilder as ns
+
+        monkeypatch.setenv("MEMORY_BASE_PATH", str(tmp_path))
+        manager = get_manager_with_context({"storage_format": storage_format})
+        namespace = ns.build(ns.USER_LEARNINGS_GLOBAL, manager.get_context())
+
+        async def store():
+            await manager.backend.create(MemoryRecord(
+                namespace=namespace, content={"pattern": "Use concrete nouns for subjects"},
+            ))
+            await manager.flush()
+
+        asyncio.run(store())
+
+        result = CliRunner().invoke(memory_cmd, ["--storage-format", storage_format, "list", "--json"])
+        assert result.exit_code == 0, result.output
+        learnings = json.loads(result.output)
+        assert [l["content"]["pattern"] for l in learnings] == ["Use concrete nouns for subjects"]
+
+
+class TestSemanticSearch:
+    """Tests for offline semantic search (search_mode="semantic")"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        temp = tempfile.mkdtemp()
+        yield temp
+        shutil.rmtree(temp, ignore_errors=True)
+
+    def test_embedder_is_deterministic_and_normalized(self):
+        embedder = HashingEmbedder(dim=64)
+        vectors = embedder.embed(["concrete nouns", "concrete nouns", ""])
+
+        assert vectors.shape == (3, 64)
+        assert np.allclose(vectors[0], vectors[1])
+        assert np.isclose(np.linalg.norm(vectors[0]), 1.0)
+        assert not vectors[2].any()
+
+    @pytest.mark.asyncio
+    async def test_matches_related_wording(self, temp_dir):
+        backend = LocalMemoryBackend(base_path=temp_dir, flush_delay=0, search_mode="semantic")
+        await backend.create(_record("use concrete nouns in prompts"))
+        await backend.create(_record("avoid fast camera motion"))
+
+        results = await backend.search(["/test/search"], "noun")
+
+        assert results[0].record.text_content == "use concrete nouns in prompts"
+        assert 0 < results[0].score <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_vectors_persist_and_follow_changes(self, temp_dir):
+        backend = LocalMemoryBackend(base_path=temp_dir, flush_delay=0, search_mode="semantic")
+        keep = _record("slow dolly shot")
+        drop = _record("harsh backlight")
+        await backend.create(keep)
+        await backend.create(drop)
+        await backend.search(["/test/search"], "dolly")
+
+        # Searching embeds in memory; the rows are written on flush
+        vectors = Path(temp_dir) / "test" / "search.vectors"
+        assert not vectors.exists()
+        await backend.flush()
+        assert vectors.stat().st_size == 2 * backend.embedder.dim * 4
+
+        # Mutations after the index is loaded append/retire rows
+        await backend.delete("/test/search", drop.record_id)
+        keep.text_content = "whip pan transition"
+        await backend.update(keep)
+        await backend.flush()
+        assert vectors.stat().st_size == 3 * backend.embedder.dim * 4
+
+        reloaded = LocalMemoryBackend(base_path=temp_dir, search_mode="semantic")
+        results = await reloaded.search(["/test/search"], "whip pan")
+        assert [r.record.record_id for r in results] == [keep.record_id]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searchers_keep_rows_aligned(self, temp_dir):
+        writer = LocalMemoryBackend(base_path=temp_dir, flush_delay=0)
+        for text in ("slow dolly shot", "harsh backlight", "whip pan transition"):
+            await writer.create(_record(text))
+
+        # Two processes embed the same namespace; only one write lands
+        first = LocalMemoryBackend(base_path=temp_dir, search_mode="semantic")
+        second = LocalMemoryBackend(base_path=temp_dir, search_mode="semantic")
+        await first.search(["/test/search"], "dolly")
+        await second.search(["/test/search"], "dolly")
+        await first.flush()
+        await second.flush()
+
+        ids = (Path(temp_dir) / "test" / "search.vectors.ids").read_text().splitlines()
+        vectors = Path(temp_dir) / "test" / "search.vectors"
+        assert len(ids) - 1 == 3
+        assert vectors.stat().st_size == 3 * first.embedder.dim * 4
+
+        reloaded = LocalMemoryBackend(base_path=temp_dir, search_mode="semantic")
+        results = await reloaded.search(["/test/search"], "backlight", top_k=1)
+        assert results[0].record.text_content == "harsh backlight"
+
+    @pytest.mark.asyncio
+    async def test_tag_filter_and_top_k(self, temp_dir):
+        backend = LocalMemoryBackend(base_path=temp_dir, flush_delay=0, search_mode="semantic")
+        for i in range(6):
+            await backend.create(_record(f"lighting tip {i}", tags=["luma" if i % 2 else "runway"]))
+
+        results = await backend.search(["/test/search"], "lighting", top_k=2, tags=["luma"])
+
+        assert len(results) == 2
+        assert all("luma" in r.record.tags for r in results)
+
+    @pytest.mark.asyncio
+    async def test_delete_namespace_removes_vectors(self, temp_dir):
+        backend = LocalMemoryBackend(base_path=temp_dir, flush_delay=0, search_mode="semantic")
+        await backend.create(_record("dolly shot"))
+        await backend.search(["/test/search"], "dolly")
+
+        await backend.delete_namespace("/test/search")
+
+        assert not list(Path(temp_dir).rglob("*.vectors*"))
+        assert await backend.list_namespaces() == []
+
+    def test_unknown_search_mode(self, temp_dir):
+        with pytest.raises(ValueError, match="Unknown search mode"):
+            LocalMemoryBackend(base_path=temp_dir, search_mode="vector")
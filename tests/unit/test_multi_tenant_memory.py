@@ -1,5 +1,6 @@
 """Unit tests for multi-tenant memory system"""
 
+import json
 import pytest
 import asyncio
 import tempfile
@@ -604,6 +605,199 @@ class TestLocalMemoryBackend:
         assert "/platform/learnings" in namespaces
         assert "/org/acme/learnings" in namespaces
 
+    @pytest.mark.asyncio
+    async def test_writes_batched_until_flush(self, temp_dir):
+        """Test that creates are buffered and written once on flush"""
+        backend = LocalMemoryBackend(base_path=temp_dir, flush_delay=60)
+        for i in range(5):
+            await backend.create(MemoryRecord(namespace="/test/batch", content={"index": i}))
+
+        file_path = Path(temp_dir) / "test" / "batch.json"
+        assert not file_path.exists()
+        assert len(await backend.list("/test/batch")) == 5
+
+        await backend.flush()
+
+        reloaded = LocalMemoryBackend(base_path=temp_dir)
+        assert len(await reloaded.list("/test/batch")) == 5
+
+    @pytest.mark.asyncio
+    async def test_debounced_write_back(self, temp_dir):
+        """Test that pending writes reach disk after flush_delay"""
+        backend = LocalMemoryBackend(base_path=temp_dir, flush_delay=0.01)
+        await backend.create(MemoryRecord(namespace="/test/debounce", content={}))
+
+        await asyncio.sleep(0.05)
+
+        assert (Path(temp_dir) / "test" / "debounce.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_cached_reads_skip_disk(self, temp_dir):
+        """Test that unchanged namespace files are parsed only once"""
+        from unittest.mock import patch
+
+        writer = LocalMemoryBackend(base_path=temp_dir, flush_delay=0)
+        record_id = await writer.create(MemoryRecord(namespace="/test/cache", content={}))
+
+        backend = LocalMemoryBackend(base_path=temp_dir)
+        with patch.object(backend, "_read_namespace_file", wraps=backend._read_namespace_file) as reads:
+            for _ in range(3):
+                assert await backend.get("/test/cache", record_id) is not None
+                await backend.list("/test/cache")
+
+        assert reads.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_external_change_invalidates_cache(self, temp_dir):
+        """Test that a file rewritten by another process is re-read"""
+        backend = LocalMemoryBackend(base_path=temp_dir)
+        other = LocalMemoryBackend(base_path=temp_dir, flush_delay=0)
+
+        await other.create(MemoryRecord(namespace="/test/shared", content={"n": 1}))
+        assert len(await backend.list("/test/shared")) == 1
+
+        await other.create(MemoryRecord(namespace="/test/shared", content={"n": 2}))
+        assert len(await backend.list("/test/shared")) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_write_backs_merge(self, temp_dir):
+        """Test that two processes batching writes to one namespace keep each other's records"""
+        first = LocalMemoryBackend(base_path=temp_dir, flush_delay=60)
+        second = LocalMemoryBackend(base_path=temp_dir, flush_delay=60)
+
+        shared = MemoryRecord(namespace="/test/shared", content={"n": 0})
+        await first.create(shared)
+        await first.flush()
+
+        # Both load the namespace, then change it without seeing each other
+        assert len(await second.list("/test/shared")) == 1
+        await first.create(MemoryRecord(namespace="/test/shared", content={"n": 1}))
+        await second.create(MemoryRecord(namespace="/test/shared", content={"n": 2}))
+        await second.delete("/test/shared", shared.record_id)
+
+        await first.flush()
+        await second.flush()
+
+        reloaded = LocalMemoryBackend(base_path=temp_dir)
+        records = await reloaded.list("/test/shared")
+        assert sorted(r.content["n"] for r in records) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_dirty_cache_sees_external_write(self, temp_dir):
+        """Test that reads with unflushed changes still pick up another process's writes"""
+        backend = LocalMemoryBackend(base_path=temp_dir, flush_delay=60)
+        other = LocalMemoryBackend(base_path=temp_dir, flush_delay=0)
+
+        await backend.create(MemoryRecord(namespace="/test/shared", content={"n": 1}))
+        await other.create(MemoryRecord(namespace="/test/shared", content={"n": 2}))
+
+        records = await backend.list("/test/shared")
+        assert sorted(r.content["n"] for r in records) == [1, 2]
+
+
+class TestJournalStorage:
+    """Tests for the append-only journal storage format"""
+
+    @pytest.fixture
+    def temp_dir(self):
+        temp = tempfile.mkdtemp()
+        yield temp
+        shutil.rmtree(temp, ignore_errors=True)
+
+    @pytest.fixture
+    def backend(self, temp_dir):
+        return LocalMemoryBackend(base_path=temp_dir, storage_format="journal")
+
+    def _journal(self, temp_dir, name="test/journal"):
+        return Path(temp_dir) / f"{name}.jsonl"
+
+    @pytest.mark.asyncio
+    async def test_each_write_is_one_append(self, backend, temp_dir):
+        """Test that create/update/delete each append one journal line"""
+        record = MemoryRecord(namespace="/test/journal", content={"v": 1})
+        await backend.create(record)
+        record.content = {"v": 2}
+        await backend.update(record)
+        await backend.delete("/test/journal", record.record_id)
+
+        lines = self._journal(temp_dir).read_text().splitlines()
+        assert [json.loads(line)["op"] for line in lines] == ["create", "update", "delete"]
+        assert not (Path(temp_dir) / "test" / "journal.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_replay_rebuilds_state(self, backend, temp_dir):
+        """Test that a fresh backend recovers state by replaying the journal"""
+        keep = MemoryRecord(namespace="/test/journal", content={"v": 1})
+        drop = MemoryRecord(namespace="/test/journal", content={"v": 0})
+        await backend.create(keep)
+        await backend.create(drop)
+        keep.content = {"v": 2}
+        await backend.update(keep)
+        await backend.delete("/test/journal", drop.record_id)
+
+        reloaded = LocalMemoryBackend(base_path=temp_dir)
+        records = await reloaded.list("/test/journal")
+        assert [r.content for r in records] == [{"v": 2}]
+
+    @pytest.mark.asyncio
+    async def test_torn_final_line_is_recovered(self, backend, temp_dir):
+        """Test that a partial op left by a crash is skipped and later appends still land"""
+        await backend.create(MemoryRecord(namespace="/test/journal", content={"v": 1}))
+        with open(self._journal(temp_dir), "a") as f:
+            f.write('{"op": "create", "record": {"record_id": "tor')
+
+        recovered = LocalMemoryBackend(base_path=temp_dir, storage_format="journal")
+        assert len(await recovered.list("/test/journal")) == 1
+
+        await recovered.create(MemoryRecord(namespace="/test/journal", content={"v": 2}))
+        reloaded = LocalMemoryBackend(base_path=temp_dir)
+        assert len(await reloaded.list("/test/journal")) == 2
+
+    @pytest.mark.asyncio
+    async def test_compaction_writes_snapshot(self, temp_dir):
+        """Test that the journal is folded into the snapshot past the threshold"""
+        backend = LocalMemoryBackend(base_path=temp_dir, storage_format="journal", compact_threshold=3)
+        for i in range(4):
+            await backend.create(MemoryRecord(namespace="/test/journal", content={"i": i}))
+
+        snapshot = json.loads((Path(temp_dir) / "test" / "journal.json").read_text())
+        assert snapshot["record_count"] == 3
+        assert len(self._journal(temp_dir).read_text().splitlines()) == 1
+
+        reloaded = LocalMemoryBackend(base_path=temp_dir)
+        assert len(await reloaded.list("/test/journal")) == 4
+
+    @pytest.mark.asyncio
+    async def test_reader_tails_appends(self, backend, temp_dir):
+        """Test that another backend picks up new journal ops incrementally"""
+        reader = LocalMemoryBackend(base_path=temp_dir)
+        await backend.create(MemoryRecord(namespace="/test/journal", content={"i": 0}))
+        assert len(await reader.list("/test/journal")) == 1
+
+        await backend.create(MemoryRecord(namespace="/test/journal", content={"i": 1}))
+        assert len(await reader.list("/test/journal")) == 2
+
+    @pytest.mark.asyncio
+    async def test_export_import_across_formats(self, backend, temp_dir):
+        """Test that journal data exports into the JSON format and back"""
+        await backend.create(MemoryRecord(namespace="/test/journal", content={"i": 0}))
+        data = await backend.export_all()
+
+        other_dir = tempfile.mkdtemp()
+        try:
+            json_backend = LocalMemoryBackend(base_path=other_dir, flush_delay=0)
+            await json_backend.import_all(data)
+            assert len(await json_backend.list("/test/journal")) == 1
+            exported = await json_backend.export_all()
+            assert list(exported) == list(data)
+            assert exported["/test/journal"][0]["content"] == {"i": 0}
+        finally:
+            shutil.rmtree(other_dir, ignore_errors=True)
+
+    def test_unknown_format_rejected(self, temp_dir):
+        with pytest.raises(ValueError):
+            LocalMemoryBackend(base_path=temp_dir, storage_format="xml")
+
 
 # =============================================================================
 # MULTI-TENANT MANAGER TESTS
@@ -0,0 +1,67 @@
+"""Unit tests for sharded PyMuPDF extraction"""
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from core import pdf_extraction
+from core.pdf_extraction import extract_pdf, merge_figures
+
+
+def _noise_png(seed: int) -> bytes:
+    """A random-noise PNG (compresses badly, like a real figure)"""
+    import io
+    import random
+
+    from PIL import Image
+
+    rng = random.Random(seed)
+    image = Image.frombytes("L", (200, 160), bytes(rng.randrange(256) for _ in range(200 * 160)))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _create_long_pdf(path, pages: int = 40):
+    """A PDF with a heading and paragraph per page and a captioned figure every 5 pages"""
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 60), f"Section {i}", fontsize=16, fontname="hebo")
+        page.insert_text((72, 90), f"Paragraph text on page {i}.", fontsize=11, fontname="helv")
+        if i % 5 == 0:
+            # Noisy image so the rendered region isn't skipped as too small
+            page.insert_image(fitz.Rect(72, 120, 472, 440), stream=_noise_png(seed=i))
+            page.insert_text((72, 460), f"Figure {i // 5 + 1}: Results for part {i}", fontsize=10, fontname="helv")
+        if i == 7:
+            # Repeated reference to an earlier figure number is ignored
+            page.insert_text((72, 460), "Figure 1: again", fontsize=10, fontname="helv")
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture
+def long_pdf(tmp_path):
+    path = tmp_path / "proceedings.pdf"
+    _create_long_pdf(path)
+    return path
+
+
+class TestShardedExtraction:
+    """Test that process-pool extraction matches a serial pass"""
+
+    def test_parallel_matches_serial(self, long_pdf, monkeypatch):
+        monkeypatch.setattr(pdf_extraction, "PAGES_PER_SHARD", 8)
+        monkeypatch.setattr(pdf_extraction, "PARALLEL_MIN_PAGES", 1)
+        serial = extract_pdf(str(long_pdf), max_workers=1)
+        parallel = extract_pdf(str(long_pdf), max_workers=2)
+
+        serial_blocks, serial_images, page_count, _ = serial
+        assert page_count == 40
+        assert [b["page"] for b in serial_blocks] == sorted(b["page"] for b in serial_blocks)
+        assert [img["figure_number"] for img in serial_images] == [str(n) for n in range(1, 9)]
+        assert parallel == serial
+
+    def test_first_skipped_figure_stays_skipped(self):
+        outcomes = [("FIGURE_1", None), ("FIGURE_1", {"page": 3}), ("FIGURE_2", {"page": 4})]
+        assert merge_figures(outcomes) == [{"page": 4}]
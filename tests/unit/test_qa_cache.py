@@ -0,0 +1,107 @@
+"""Unit tests for the perceptual-hash QA result cache"""
+
+import io
+import os
+import time
+
+import pytest
+from PIL import Image, ImageDraw
+
+from core.qa_cache import QACache, footage_hash, frame_dhash, hash_distance, spec_hash
+
+
+def _jpeg(shift: int = 0, scale: float = 1.0, quality: int = 90) -> bytes:
+    """A gradient frame with a bar at a given offset"""
+    image = Image.new("L", (320, 180))
+    image.putdata([(x * 255) // 320 for y in range(180) for x in range(320)])
+    draw = ImageDraw.Draw(image)
+    draw.rectangle([40 + shift, 40, 120 + shift, 140], fill=255)
+    if scale != 1.0:
+        image = image.resize((int(320 * scale), int(180 * scale)))
+    buffer = io.BytesIO()
+    image.convert("RGB").save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return QACache(str(tmp_path / "qa"))
+
+
+class TestFootageHash:
+    """Test perceptual hashing"""
+
+    def test_survives_rescale_and_recompression(self):
+        original = frame_dhash(_jpeg())
+        reencoded = frame_dhash(_jpeg(scale=0.5, quality=40))
+        assert bin(original ^ reencoded).count("1") <= 4
+
+    def test_different_content_differs(self):
+        assert bin(frame_dhash(_jpeg()) ^ frame_dhash(_jpeg(shift=150))).count("1") > 6
+
+    def test_distance_requires_same_frame_count(self):
+        one = footage_hash([_jpeg()])
+        two = footage_hash([_jpeg(), _jpeg()])
+        assert hash_distance(one, one) == 0
+        assert hash_distance(one, two) is None
+
+    def test_spec_hash(self):
+        assert spec_hash("animated", description="a") == spec_hash("animated", description="a")
+        assert spec_hash("animated", description="a") != spec_hash("photorealistic", description="a")
+        assert spec_hash("animated", description="a") != spec_hash("animated", description="b")
+
+
+class TestQACache:
+    """Test storing, matching and evicting entries"""
+
+    def test_exact_and_near_hits(self, cache):
+        spec = spec_hash("animated", description="a")
+        footage = footage_hash([_jpeg(), _jpeg(shift=20)])
+        assert cache.get(spec, footage) is None
+
+        cache.put(spec, footage, {"overall_score": 88})
+        assert cache.get(spec, footage) == {"overall_score": 88}
+
+        reencoded = footage_hash([_jpeg(quality=40), _jpeg(shift=20, quality=40)])
+        assert cache.get(spec, reencoded) == {"overall_score": 88}
+
+        # Same footage judged against another scene is a miss
+        assert cache.get(spec_hash("animated", description="b"), footage) is None
+        assert cache.stats()["hits"] == 2
+        assert cache.stats()["misses"] == 2
+
+    def test_different_footage_misses(self, cache):
+        spec = spec_hash("animated")
+        cache.put(spec, footage_hash([_jpeg()]), {"overall_score": 88})
+        assert cache.get(spec, footage_hash([_jpeg(shift=150)])) is None
+
+    def test_ttl(self, tmp_path):
+        cache = QACache(str(tmp_path / "qa"), ttl_seconds=60)
+        footage = footage_hash([_jpeg()])
+        cache.put("spec", footage, {"overall_score": 1})
+
+        entry = next((tmp_path / "qa" / "spec").glob("*.json"))
+        old = time.time() - 3600
+        os.utime(entry, (old, old))
+        entry.write_text(entry.read_text().replace('"stored_at": ', '"stored_at": 1, "x": '))
+
+        assert cache.get("spec", footage) is None
+        assert not entry.exists()
+
+    def test_lru_eviction(self, tmp_path):
+        cache = QACache(str(tmp_path / "qa"), max_entries=2)
+        footages = [footage_hash([_jpeg(shift=s)]) for s in (0, 80, 160)]
+
+        cache.put("spec", footages[0], {"n": 0})
+        cache.put("spec", footages[1], {"n": 1})
+        entries = sorted((tmp_path / "qa" / "spec").glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for i, entry in enumerate(entries):
+            os.utime(entry, (time.time() - 100 + i, time.time() - 100 + i))
+        cache.get("spec", footages[0])  # Refresh the first entry
+
+        cache.put("spec", footages[2], {"n": 2})
+        assert cache.evict() == 1
+
+        assert cache.stats()["entries"] == 2
+        assert cache.get("spec", footages[0]) == {"n": 0}
+        assert cache.get("spec", footages[1]) is None
@@ -344,3 +344,312 @@ class TestQAVerifierIntegration:
         """Test that QAResult model can be imported"""
         from agents.qa_verifier import QAResult as ImportedQAResult
         assert ImportedQAResult is not None
+
+
+class TestStreamingQA:
+    """Tests for streaming verification (verify_stream)"""
+
+    @staticmethod
+    def make_video(scene_id: str, variation_id: int = 0, **metadata) -> GeneratedVideo:
+        return GeneratedVideo(
+            scene_id=scene_id,
+            variation_id=variation_id,
+            video_url=f"https://example.com/{scene_id}_v{variation_id}.mp4",
+            thumbnail_url="",
+            duration=5.0,
+            generation_cost=0.4,
+            provider="mock",
+            metadata=dict(metadata)
+        )
+
+    @staticmethod
+    def scripted_agent(passes) -> QAVerifierAgent:
+        """Agent whose verdict comes from passes(video) instead of real analysis"""
+        agent = QAVerifierAgent(mock_mode=True)
+
+        async def verify_video(scene, generated_video, original_request, production_tier):
+            passed = passes(generated_video)
+            return QAResult(
+                scene_id=scene.scene_id, video_url=generated_video.video_url,
+                overall_score=90 if passed else 40, visual_accuracy=0, style_consistency=0,
+                technical_quality=0, narrative_fit=0, issues=[], suggestions=[],
+                passed=passed, threshold=75,
+            )
+
+        agent.verify_video = verify_video
+        return agent
+
+    @staticmethod
+    def scenes(*scene_ids):
+        return [
+            Scene(scene_id=sid, title=sid, description="d", duration=5.0,
+                  visual_elements=[], audio_notes="", transition_in="cut", transition_out="cut",
+                  prompt_hints=[])
+            for sid in scene_ids
+        ]
+
+    @pytest.mark.asyncio
+    async def test_qa_overlaps_generation(self):
+        import asyncio
+        first_verified = asyncio.Event()
+        agent = self.scripted_agent(lambda video: True)
+        original = agent.verify_video
+
+        async def verify_video(*args, **kwargs):
+            result = await original(*args, **kwargs)
+            first_verified.set()
+            return result
+
+        agent.verify_video = verify_video
+
+        async def videos():
+            yield self.make_video("scene_1")
+            # The second video only "finishes" once the first has been verified
+            await asyncio.wait_for(first_verified.wait(), timeout=2)
+            yield self.make_video("scene_2")
+
+        results = [item async for item in agent.verify_stream(
+            videos(), self.scenes("scene_1", "scene_2"), "req", ProductionTier.MOTION_GRAPHICS
+        )]
+
+        assert [video.scene_id for video, _ in results] == ["scene_1", "scene_2"]
+        assert all(qa.passed for _, qa in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_qa_is_regenerated(self):
+        agent = self.scripted_agent(lambda video: video.metadata.get("good", False))
+        prepared = []
+        regenerated = []
+
+        async def prepare(video):
+            prepared.append(video.scene_id)
+
+        async def regenerate(scene, video):
+            regenerated.append(scene.scene_id)
+            return self.make_video(scene.scene_id, video.variation_id, good=True)
+
+        async def videos():
+            yield self.make_video("scene_1", good=True)
+            yield self.make_video("scene_2")
+
+        results = {video.scene_id: (video, qa) async for video, qa in agent.verify_stream(
+            videos(), self.scenes("scene_1", "scene_2"), "req", ProductionTier.MOTION_GRAPHICS,
+            prepare=prepare, regenerate=regenerate
+        )}
+
+        assert regenerated == ["scene_2"]
+        assert sorted(prepared) == ["scene_1", "scene_2", "scene_2"]
+        video, qa = results["scene_2"]
+        assert qa.passed
+        assert video.metadata["qa_attempts"] == 2
+        assert video.metadata["discarded_cost"] == pytest.approx(0.4)
+
+    @pytest.mark.asyncio
+    async def test_regeneration_is_bounded(self):
+        agent = self.scripted_agent(lambda video: False)
+        calls = []
+
+        async def regenerate(scene, video):
+            calls.append(scene.scene_id)
+            return self.make_video(scene.scene_id, video.variation_id)
+
+        async def videos():
+            yield self.make_video("scene_1")
+
+        results = [item async for item in agent.verify_stream(
+            videos(), self.scenes("scene_1"), "req", ProductionTier.MOTION_GRAPHICS,
+            regenerate=regenerate, max_regenerations=2
+        )]
+
+        assert len(calls) == 2
+        assert len(results) == 1
+        assert not results[0][1].passed
+        assert results[0][0].metadata["qa_attempts"] == 3
+
+    @pytest.mark.asyncio
+    async def test_verification_error_yields_failed_result(self, capsys):
+        agent = self.scripted_agent(lambda video: True)
+
+        async def prepare(video):
+            if video.scene_id == "scene_2":
+                raise OSError("download failed")
+
+        async def videos():
+            yield self.make_video("scene_1")
+            yield self.make_video("scene_2")
+
+        results = {video.scene_id: qa async for video, qa in agent.verify_stream(
+            videos(), self.scenes("scene_1", "scene_2"), "req", ProductionTier.MOTION_GRAPHICS,
+            prepare=prepare
+        )}
+
+        assert results["scene_1"].passed
+        assert not results["scene_2"].passed
+        assert results["scene_2"].issues == ["QA verification failed: OSError: download failed"]
+        assert "Verification failed for scene_2 v0" in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_stream_scenes_yields_in_completion_order(self):
+        import asyncio
+        from agents.video_generator import VideoGeneratorAgent
+        from core.providers.base import GenerationResult
+
+        delays = {"slow": 0.2, "fast": 0.01}
+
+        class SubmitWaitProvider:
+            async def submit_generation(self, prompt, duration, aspect_ratio, **kwargs):
+                key = "slow" if "slow" in prompt else "fast"
+                return {"generation_id": f"gen-{key}-000000000"}
+
+            async def wait_for_generation(self, generation_id, submission_info, quiet=False):
+                await asyncio.sleep(delays[generation_id.split("-")[1]])
+                return GenerationResult(success=True, video_url=f"https://x/{generation_id}.mp4",
+                                        duration=5.0, cost=0.4, provider_metadata={"provider": "test"})
+
+        scenes = self.scenes("slow", "fast")
+        for scene in scenes:
+            scene.description = scene.scene_id
+        generator = VideoGeneratorAgent(provider=SubmitWaitProvider())
+
+        videos = [v async for v in generator.stream_scenes(scenes, ProductionTier.MOTION_GRAPHICS, 10.0)]
+
+        assert [v.scene_id for v in videos] == ["fast", "slow"]
+
+
+class TestFrameExtraction:
+    """Tests for single-pass frame extraction"""
+
+    @staticmethod
+    def fake_jpeg(payload: bytes) -> bytes:
+        return b"\xff\xd8" + payload + b"\xff\xd9"
+
+    def test_split_jpeg_stream(self):
+        from agents.qa_verifier import split_jpeg_stream
+        images = [self.fake_jpeg(b"one\xff\x00"), self.fake_jpeg(b"two")]
+
+        assert split_jpeg_stream(b"".join(images)) == images
+        # A truncated trailing image is dropped
+        assert split_jpeg_stream(images[0] + b"\xff\xd8partial") == images[:1]
+        assert split_jpeg_stream(b"") == []
+
+    def test_command_selects_all_timestamps_in_one_pass(self):
+        agent = QAVerifierAgent(max_frame_size=768)
+        cmd = agent._frame_extraction_command("video.mp4", [3.0, 4.0, 5.0])
+
+        assert cmd[cmd.index("-ss") + 1] == "2.000"
+        vf = cmd[cmd.index("-vf") + 1]
+        assert vf.count("gte(t,") == 3
+        assert "gte(t,1.000)" in vf  # Relative to the seek point
+        assert "min(iw,768)" in vf
+        assert cmd[cmd.index("-frames:v") + 1] == "3"
+        assert cmd[-1] == "pipe:1"
+
+        full_size = QAVerifierAgent(max_frame_size=None)._frame_extraction_command("video.mp4", [3.0])
+        assert "scale" not in full_size[full_size.index("-vf") + 1]
+
+    @pytest.mark.asyncio
+    async def test_extract_frames_runs_ffmpeg_once(self, tmp_path):
+        import base64
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"")
+        agent = QAVerifierAgent(num_frames=4)
+        calls = []
+
+        async def run_ffmpeg(cmd, timeout):
+            calls.append(cmd)
+            return 0, b"".join(self.fake_jpeg(bytes([i])) for i in range(4)), b""
+
+        agent._run_ffmpeg = run_ffmpeg
+        frames, timestamps = await agent._extract_frames(str(video), total_duration=10.0)
+
+        assert len(calls) == 1
+        assert timestamps == [2.0, 4.0, 6.0, 8.0]
+        assert base64.b64decode(frames[2]["data"]) == self.fake_jpeg(bytes([2]))
+        assert all(f["media_type"] == "image/jpeg" for f in frames)
+
+    @pytest.mark.asyncio
+    async def test_extract_frames_without_output_raises(self, tmp_path):
+        video = tmp_path / "video.mp4"
+        video.write_bytes(b"")
+        agent = QAVerifierAgent()
+
+        async def run_ffmpeg(cmd, timeout):
+            return 1, b"", b"banner\nmoov atom not found\n"
+
+        agent._run_ffmpeg = run_ffmpeg
+        with pytest.raises(RuntimeError, match="Failed to extract any frames"):
+            await agent._extract_frames(str(video), total_duration=5.0)
+
+
+class TestQACacheIntegration:
+    """verify_video reuses cached results instead of calling the vision API"""
+
+    @pytest.mark.asyncio
+    async def test_second_verification_skips_vision(self, tmp_path, sample_scene, sample_video):
+        import base64
+        import io
+        from PIL import Image
+        from core.qa_cache import QACache
+
+        buffer = io.BytesIO()
+        Image.new("RGB", (64, 36), (200, 40, 40)).save(buffer, format="JPEG")
+        frame = {"data": base64.b64encode(buffer.getvalue()).decode(), "media_type": "image/jpeg"}
+
+        agent = QAVerifierAgent(mock_mode=False, cache=QACache(str(tmp_path / "qa")))
+        vision_calls = []
+
+        async def extract_frames(video_path, new_content_start=0.0, total_duration=None):
+            return [frame, frame], [1.0, 2.0]
+
+        async def analyze(scene, frames, original_request, production_tier):
+            vision_calls.append(scene.scene_id)
+            return {
+                "overall_score": 91, "visual_accuracy": 90, "style_consistency": 92,
+                "technical_quality": 88, "narrative_fit": 94, "issues": [], "suggestions": ["more light"],
+                "frame_analyses": [{"description": "red", "detected_elements": ["mountains"]}],
+                "overall_description": "a red frame",
+            }
+
+        agent._extract_frames = extract_frames
+        agent._analyze_with_vision = analyze
+
+        first = await agent.verify_video(sample_scene, sample_video, "req", ProductionTier.ANIMATED)
+        sample_video.video_url = "/runs/2/videos/test_scene_v0.mp4"
+        second = await agent.verify_video(sample_scene, sample_video, "req", ProductionTier.ANIMATED)
+
+        assert vision_calls == ["test_scene"]
+        assert agent.cache.hits == 1
+        assert second.overall_score == first.overall_score
+        assert second.passed and second.suggestions == ["more light"]
+        assert second.video_url == "/runs/2/videos/test_scene_v0.mp4"
+        assert second.visual_analysis.frame_analyses[0].description == "red"
+
+        # A different tier is judged afresh
+        await agent.verify_video(sample_scene, sample_video, "req", ProductionTier.PHOTOREALISTIC)
+        assert len(vision_calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_clips_without_frames_are_not_cached(self, tmp_path, sample_scene, sample_video):
+        from core.qa_cache import QACache
+
+        agent = QAVerifierAgent(mock_mode=False, cache=QACache(str(tmp_path / "qa")))
+        vision_calls = []
+
+        async def extract_frames(video_path, new_content_start=0.0, total_duration=None):
+            return [], []
+
+        async def analyze(scene, frames, original_request, production_tier):
+            vision_calls.append(scene.scene_id)
+            return {
+                "overall_score": 80, "visual_accuracy": 80, "style_consistency": 80,
+                "technical_quality": 80, "narrative_fit": 80, "issues": [], "suggestions": [],
+            }
+
+        agent._extract_frames = extract_frames
+        agent._analyze_with_vision = analyze
+
+        await agent.verify_video(sample_scene, sample_video, "req", ProductionTier.ANIMATED)
+        await agent.verify_video(sample_scene, sample_video, "req", ProductionTier.ANIMATED)
+
+        assert len(vision_calls) == 2
+        assert agent.cache.stats()["entries"] == 0
@@ -0,0 +1,109 @@
+"""Unit tests for the content-addressed render cache"""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from core import disk_cache
+from core.render_cache import RenderCache, cache_key, file_digest
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return RenderCache(str(tmp_path / "cache"))
+
+
+def _write(path, data):
+    path.write_bytes(data)
+    return path
+
+
+class TestCacheKey:
+    """Test key derivation"""
+
+    def test_order_independent(self):
+        assert cache_key(a=1, b="x") == cache_key(b="x", a=1)
+
+    def test_parameters_change_key(self):
+        assert cache_key(kind="trim", in_point=0.0) != cache_key(kind="trim", in_point=0.5)
+
+    def test_file_digest_tracks_contents(self, tmp_path):
+        path = _write(tmp_path / "clip.mp4", b"one")
+        first = file_digest(str(path))
+        assert file_digest(str(path)) == first
+
+        _write(path, b"two!")
+        assert file_digest(str(path)) != first
+
+
+class TestRenderCache:
+    """Test storing, materializing and evicting entries"""
+
+    def test_miss_then_hit(self, cache, tmp_path):
+        src = _write(tmp_path / "render.mp4", b"video")
+        dest = tmp_path / "out" / "render.mp4"
+
+        assert cache.materialize("k1", dest) is False
+        cache.put("k1", src)
+        assert cache.materialize("k1", dest) is True
+        assert dest.read_bytes() == b"video"
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_entry_evicted_before_copy_is_a_miss(self, cache, tmp_path):
+        """An entry removed by another process between lookup and copy doesn't raise."""
+        cache.put("k1", _write(tmp_path / "render.mp4", b"video"))
+        dest = tmp_path / "out" / "render.mp4"
+
+        with patch("core.render_cache.shutil.copyfile", side_effect=FileNotFoundError):
+            assert cache.materialize("k1", dest) is False
+        assert not dest.exists()
+        assert (cache.hits, cache.misses) == (0, 1)
+        assert not list(dest.parent.glob("*.tmp"))
+
+    def test_miss_removes_stale_dest(self, cache, tmp_path):
+        dest = _write(tmp_path / "render.mp4", b"stale")
+        assert cache.materialize("missing", dest) is False
+        assert not dest.exists()
+
+    def test_entry_is_independent_of_source(self, cache, tmp_path):
+        """Rewriting the source after put doesn't change the cached entry."""
+        src = _write(tmp_path / "render.mp4", b"original")
+        cache.put("k1", src)
+        _write(src, b"overwritten")
+
+        dest = tmp_path / "copy.mp4"
+        cache.materialize("k1", dest)
+        assert dest.read_bytes() == b"original"
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = RenderCache(str(tmp_path / "cache"), max_size_bytes=10)
+        old = cache.put("old", _write(tmp_path / "a.mp4", b"123456"))
+        past = time.time() - 100
+        os.utime(old, (past, past))
+
+        cache.put("new", _write(tmp_path / "b.mp4", b"789012"))
+        assert cache.evict() == 1
+
+        assert cache.get("old") is None
+        assert cache.get("new") is not None
+
+    def test_put_evicts_periodically(self, tmp_path):
+        """Puts walk the cache on the first call and then every EVICT_EVERY calls."""
+        cache = RenderCache(str(tmp_path / "cache"), max_size_bytes=0)
+        src = _write(tmp_path / "a.mp4", b"123")
+
+        with patch.object(disk_cache, "EVICT_EVERY", 3), \
+             patch.object(cache, "evict", wraps=cache.evict) as evict:
+            for i in range(7):
+                cache.put(f"k{i}", src)
+
+        assert evict.call_count == 3  # Puts 1, 4 and 7
+        assert cache.stats()["entries"] == 0
+
+    def test_stats(self, cache, tmp_path):
+        cache.put("k1", _write(tmp_path / "a.mp4", b"abc"))
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["size_bytes"] == 3
@@ -0,0 +1,97 @@
+"""Unit tests for the shared FFmpeg job scheduler"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.render_scheduler import FFmpegJobScheduler
+
+
+def _mock_process():
+    process = MagicMock()
+    process.returncode = 0
+    process.communicate = AsyncMock(return_value=(b"", b""))
+    return process
+
+
+class TestSizing:
+    """Test core-aware defaults"""
+
+    def test_defaults_split_cores(self):
+        with patch("core.render_scheduler.os.cpu_count", return_value=16):
+            scheduler = FFmpegJobScheduler()
+        assert scheduler.threads_per_job == 4
+        assert scheduler.max_jobs == 4
+
+    def test_explicit_jobs_sets_threads(self):
+        with patch("core.render_scheduler.os.cpu_count", return_value=8):
+            scheduler = FFmpegJobScheduler(max_jobs=2)
+        assert scheduler.threads_per_job == 4
+
+    def test_threads_inserted_before_output(self):
+        scheduler = FFmpegJobScheduler(max_jobs=1, threads_per_job=3)
+        cmd = scheduler.with_threads(["ffmpeg", "-i", "in.mp4", "out.mp4"])
+        assert cmd == ["ffmpeg", "-i", "in.mp4", "-threads", "3", "out.mp4"]
+
+
+class TestScheduling:
+    """Test concurrency limits, priorities and deduplication"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded(self):
+        scheduler = FFmpegJobScheduler(max_jobs=2, threads_per_job=1)
+        running = 0
+        peak = 0
+
+        async def _exec(*cmd, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _mock_process()
+
+        with patch("asyncio.create_subprocess_exec", side_effect=_exec):
+            await asyncio.gather(*(scheduler.run(["ffmpeg", f"{i}.mp4"]) for i in range(6)))
+
+        assert peak == 2
+        assert scheduler.jobs_run == 6
+
+    @pytest.mark.asyncio
+    async def test_waiting_jobs_start_by_priority(self):
+        scheduler = FFmpegJobScheduler(max_jobs=1, threads_per_job=1)
+        started = []
+
+        async def _exec(*cmd, **kwargs):
+            started.append(cmd[-1])
+            await asyncio.sleep(0.01)
+            return _mock_process()
+
+        with patch("asyncio.create_subprocess_exec", side_effect=_exec):
+            first = asyncio.ensure_future(scheduler.run(["ffmpeg", "first"], priority=5))
+            await asyncio.sleep(0)
+            await asyncio.gather(
+                first,
+                scheduler.run(["ffmpeg", "low"], priority=2),
+                scheduler.run(["ffmpeg", "high"], priority=0),
+            )
+
+        assert started == ["first", "high", "low"]
+
+    @pytest.mark.asyncio
+    async def test_identical_jobs_run_once(self):
+        scheduler = FFmpegJobScheduler(max_jobs=2, threads_per_job=1)
+        calls = 0
+
+        async def _job():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "done"
+
+        results = await asyncio.gather(*(scheduler.run_once("same", _job) for _ in range(3)))
+
+        assert results == ["done"] * 3
+        assert calls == 1
+        assert scheduler.jobs_deduplicated == 2
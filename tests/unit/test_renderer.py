@@ -7,6 +7,8 @@ from pathlib import Path
 from unittest.mock import AsyncMock, patch, MagicMock
 
 from core.renderer import FFmpegRenderer, RenderError, FFmpegNotFoundError
+from core.render_cache import RenderCache
+from core.render_scheduler import FFmpegJobScheduler
 from core.models.render import (
     AudioTrack,
     Transition,
@@ -270,6 +272,232 @@ class TestTransitionBuilding:
         assert len(transitions) == 0
 
 
+class TestSinglePassGraph:
+    """Tests for single-pass filter_complex compilation"""
+
+    def _clips(self, candidate):
+        return [(d, f"/videos/{d.scene_id}.mp4") for d in candidate.decisions]
+
+    def test_concat_graph(self, renderer, sample_edit_candidate):
+        """Test that cut-only edits compile to a single concat"""
+        graph, video_label, audio_label = renderer._build_single_pass_graph(
+            clips=self._clips(sample_edit_candidate),
+            durations=[5.0, 8.0],
+            audio_tracks=[],
+            transitions=renderer._build_transitions(sample_edit_candidate.decisions)
+        )
+
+        assert "[0:v]" in graph and "[1:v]" in graph
+        assert "concat=n=2:v=1:a=0[vcat]" in graph
+        assert "xfade" not in graph
+        assert "fade=t=in:st=0:d=0.5" in graph
+        # Fade out is placed against the real timeline length (13s - 1s)
+        assert "fade=t=out:st=12.0:d=1.0" in graph
+        assert video_label == "[vout]"
+        assert audio_label is None
+
+    def test_dissolve_graph_uses_xfade(self, renderer, sample_edit_candidate):
+        """Test that dissolves compile to an xfade chain with correct offsets"""
+        sample_edit_candidate.decisions[0].transition_out = "dissolve"
+        sample_edit_candidate.decisions[0].transition_out_duration = 1.0
+
+        graph, video_label, _ = renderer._build_single_pass_graph(
+            clips=self._clips(sample_edit_candidate),
+            durations=[5.0, 8.0],
+            audio_tracks=[],
+            transitions=[]
+        )
+
+        assert "[v0][v1]xfade=transition=fade:duration=1.0:offset=4.000[x1]" in graph
+        assert video_label == "[x1]"
+
+    def test_text_overlay_in_graph(self, renderer, sample_edit_candidate):
+        """Test that text overlays become per-clip drawtext filters"""
+        sample_edit_candidate.decisions[1].text_overlay = "Hello: World"
+        sample_edit_candidate.decisions[1].text_duration = 2.0
+
+        graph, _, _ = renderer._build_single_pass_graph(
+            clips=self._clips(sample_edit_candidate),
+            durations=[5.0, 8.0],
+            audio_tracks=[],
+            transitions=[]
+        )
+
+        clip_chain = [part for part in graph.split(";") if part.startswith("[1:v]")][0]
+        assert "drawtext=" in clip_chain
+        assert "Hello\\: World" in clip_chain
+        assert "between(t,0.0,2.0)" in clip_chain
+
+    def test_audio_tracks_follow_clip_inputs(self, renderer, sample_edit_candidate, sample_audio_tracks):
+        """Test that audio track inputs are indexed after the clip inputs"""
+        graph, _, audio_label = renderer._build_single_pass_graph(
+            clips=self._clips(sample_edit_candidate),
+            durations=[5.0, 8.0],
+            audio_tracks=sample_audio_tracks,
+            transitions=[]
+        )
+
+        assert "[2:a]" in graph
+        assert "[3:a]" in graph
+        assert "amix=inputs=2" in graph
+        assert audio_label == "[aout]"
+
+    def test_clip_audio_concat(self, renderer, sample_edit_candidate):
+        """Test that source audio is concatenated, with silence for silent clips"""
+        graph, _, audio_label = renderer._build_single_pass_graph(
+            clips=self._clips(sample_edit_candidate),
+            durations=[5.0, 8.0],
+            audio_tracks=[],
+            transitions=[],
+            clip_has_audio=[True, False]
+        )
+
+        assert "[0:a]" in graph
+        assert "anullsrc" in graph
+        assert "concat=n=2:v=1:a=1[vcat][acat]" in graph
+        assert audio_label == "[acat]"
+
+    @pytest.mark.asyncio
+    async def test_single_pass_falls_back_without_durations(self, renderer, sample_edit_candidate, temp_output_dir):
+        """Test that single-pass defers to the multi-step path when durations are unknown"""
+        sample_edit_candidate.decisions[0].out_point = None
+
+        with patch.object(renderer, "_get_duration", AsyncMock(return_value=None)):
+            result = await renderer._render_single_pass(
+                candidate=sample_edit_candidate,
+                clips=self._clips(sample_edit_candidate),
+                audio_tracks=[],
+                output_dir=Path(temp_output_dir),
+                start_time=0.0
+            )
+
+        assert result is None
+
+
+class TestRenderCacheIntegration:
+    """Tests for content-addressed reuse of renders"""
+
+    @pytest.fixture
+    def cached_renderer(self, temp_output_dir):
+        return FFmpegRenderer(
+            output_dir=temp_output_dir,
+            cache=RenderCache(os.path.join(temp_output_dir, "cache"))
+        )
+
+    @staticmethod
+    def _fake_ffmpeg():
+        async def _exec(*cmd, **kwargs):
+            Path(cmd[-1]).write_bytes(b"rendered")
+            process = MagicMock()
+            process.returncode = 0
+            process.communicate = AsyncMock(return_value=(b"", b""))
+            return process
+        return _exec
+
+    @pytest.mark.asyncio
+    async def test_single_pass_rerender_is_cache_hit(self, cached_renderer, sample_edit_candidate, temp_output_dir):
+        """Test that rendering an unchanged candidate twice encodes once"""
+        clips = []
+        for decision in sample_edit_candidate.decisions:
+            path = Path(temp_output_dir) / f"{decision.scene_id}.mp4"
+            path.write_bytes(decision.scene_id.encode())
+            clips.append((decision, str(path)))
+
+        output_dir = Path(temp_output_dir) / "out"
+        output_dir.mkdir()
+        exec_mock = AsyncMock(side_effect=self._fake_ffmpeg())
+
+        with patch.object(cached_renderer, "_get_duration", AsyncMock(return_value=10.0)), \
+             patch.object(cached_renderer, "_has_audio_stream", AsyncMock(return_value=False)), \
+             patch("core.renderer.asyncio.create_subprocess_exec", exec_mock):
+            for _ in range(2):
+                result = await cached_renderer._render_single_pass(
+                    candidate=sample_edit_candidate,
+                    clips=clips,
+                    audio_tracks=[],
+                    output_dir=output_dir,
+                    start_time=0.0
+                )
+                assert result.success
+
+        assert exec_mock.call_count == 1
+        assert cached_renderer.cache.hits == 1
+
+    def test_cache_disabled_by_config(self, temp_output_dir):
+        """Test that use_cache=False leaves the renderer without a cache"""
+        renderer = FFmpegRenderer(output_dir=temp_output_dir, config=RenderConfig(use_cache=False))
+        assert renderer.cache is None
+
+
+class TestRenderAll:
+    """Tests for concurrent rendering of every candidate"""
+
+    @pytest.mark.asyncio
+    async def test_recommended_candidate_gets_top_priority(self, renderer, sample_edl, sample_edit_candidate):
+        """Test that all candidates render and the recommended one is prioritized"""
+        other = EditCandidate(candidate_id="alt_cut", name="Alt", style="creative")
+        sample_edl.candidates = [other, sample_edit_candidate]
+        priorities = {}
+
+        async def _fake_render(self, candidate, audio_tracks, output_dir):
+            priorities[candidate.candidate_id] = self.priority
+            assert self.scheduler is scheduler
+            return RenderResult(success=True, output_path=f"{candidate.candidate_id}.mp4")
+
+        scheduler = FFmpegJobScheduler(max_jobs=1, threads_per_job=1)
+        with patch.object(FFmpegRenderer, "render_candidate", _fake_render):
+            results = await renderer.render_all(sample_edl, scheduler=scheduler)
+
+        assert list(results) == ["alt_cut", "test_candidate"]
+        assert all(r.success for r in results.values())
+        assert priorities == {"test_candidate": 0, "alt_cut": 1}
+
+
+class TestRenderWithPreview:
+    """Tests for the draft proxy rendered ahead of the final encode"""
+
+    @staticmethod
+    def _patch_render(calls):
+        async def _fake_render(self, edl, candidate_id=None, audio_tracks=None, run_id=None):
+            calls.append((self.config.output_height, self.priority, str(self.output_dir)))
+            return RenderResult(success=True, output_path=f"{self.config.output_height}p.mp4")
+        return patch.object(FFmpegRenderer, "render", _fake_render)
+
+    @pytest.mark.asyncio
+    async def test_proxy_renders_first_into_preview_dir(self, temp_output_dir, sample_edl):
+        renderer = FFmpegRenderer(output_dir=temp_output_dir, config=RenderConfig(use_cache=False))
+        calls, previews = [], []
+
+        with self._patch_render(calls):
+            preview, final = await renderer.render_with_preview(
+                sample_edl, run_id="run1",
+                on_preview=previews.append,
+                scheduler=FFmpegJobScheduler(max_jobs=1, threads_per_job=1),
+            )
+
+        assert (preview.output_path, final.output_path) == ("540p.mp4", "1080p.mp4")
+        assert previews == [preview]
+        assert calls == [
+            (540, 0, str(Path(temp_output_dir) / "run1" / "preview")),
+            (1080, 1, temp_output_dir),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_renders_share_scheduler_when_slots_allow(self, temp_output_dir, sample_edl):
+        renderer = FFmpegRenderer(
+            output_dir=temp_output_dir, config=RenderConfig.for_profile("review", use_cache=False)
+        )
+        calls = []
+
+        with self._patch_render(calls):
+            preview, final = await renderer.render_with_preview(
+                sample_edl, scheduler=FFmpegJobScheduler(max_jobs=2, threads_per_job=1)
+            )
+
+        assert sorted(call[:2] for call in calls) == [(540, 0), (720, 1)]
+        assert final.output_path == "720p.mp4"
+
+
 class TestMockRender:
     """Tests for mock rendering (when no real files exist)"""
 
@@ -330,6 +558,8 @@ class TestRenderConfig:
         assert config.video_codec == "libx264"
         assert config.audio_codec == "aac"
         assert config.crf == 23
+        assert config.single_pass is True
+        assert config.use_cache is True
 
     def test_custom_config(self):
         """Test custom render configuration"""
@@ -346,6 +576,20 @@ class TestRenderConfig:
         assert config.preset == "slow"
 
 
+    def test_encoder_profiles(self):
+        """Test named profiles and overrides"""
+        draft = RenderConfig.for_profile("draft", use_cache=False)
+        assert (draft.output_width, draft.output_height) == (960, 540)
+        assert (draft.preset, draft.crf) == ("ultrafast", 32)
+        assert draft.use_cache is False
+
+        final = RenderConfig.for_profile("final")
+        assert (final.output_width, final.preset, final.crf) == (1920, "medium", 23)
+
+        with pytest.raises(ValueError, match="Unknown encoder profile"):
+            RenderConfig.for_profile("ultra")
+
+
 class TestAudioTrack:
     """Tests for AudioTrack model"""
 
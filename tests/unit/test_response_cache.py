@@ -0,0 +1,168 @@
+"""Unit tests for the Claude response cache and request coalescing"""
+
+import asyncio
+import base64
+import os
+
+import pytest
+
+from core.claude_client import ClaudeClient
+from core.response_cache import ResponseCache, response_key
+
+
+class CountingClient(ClaudeClient):
+    """ClaudeClient whose API calls return canned text and are counted"""
+
+    def __init__(self, cache=None, delay: float = 0.0):
+        super().__init__(cache=cache)
+        self.text_calls = 0
+        self.vision_calls = 0
+        self.delay = delay
+
+    async def _send_text(self, full_prompt):
+        self.text_calls += 1
+        await asyncio.sleep(self.delay)
+        return {
+            "text": f"answer to {full_prompt}",
+            "usage": {"input_tokens": 10, "output_tokens": 5, "total_tokens": 15},
+        }
+
+    async def _send_vision(self, message_content, system_prompt=None):
+        self.vision_calls += 1
+        return {"text": "a picture", "usage": None}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(str(tmp_path / "claude"))
+
+
+class TestResponseCache:
+    """Test the on-disk store"""
+
+    def test_key_covers_every_part(self):
+        base = response_key(model="m", prompt="p", system=None)
+        assert base == response_key(system=None, prompt="p", model="m")
+        assert base != response_key(model="m", prompt="p", system="s")
+        assert base != response_key(model="other", prompt="p", system=None)
+
+    def test_put_get_roundtrip(self, cache):
+        assert cache.get("ab" * 32) is None
+        cache.put("ab" * 32, {"text": "hi"})
+        assert cache.get("ab" * 32) == {"text": "hi"}
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_evicts_least_recently_used(self, cache):
+        for i, key in enumerate(["aa" * 32, "bb" * 32, "cc" * 32]):
+            cache.put(key, {"text": "x" * 100})
+            path = cache._entry_path(key)
+            os.utime(path, (1000 + i, 1000 + i))
+        size = cache._entry_path("aa" * 32).stat().st_size
+
+        # Reading the oldest entry makes it the most recent
+        cache.get("aa" * 32)
+        assert cache.evict(max_size_bytes=2 * size) == 1
+        assert cache.get("bb" * 32) is None
+        assert cache.get("aa" * 32) is not None
+
+    def test_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("CLAUDE_RESPONSE_CACHE", raising=False)
+        assert ResponseCache.from_env() is None
+        monkeypatch.setenv("CLAUDE_RESPONSE_CACHE", "0")
+        assert ResponseCache.from_env() is None
+        monkeypatch.setenv("CLAUDE_RESPONSE_CACHE", str(tmp_path / "custom"))
+        assert ResponseCache.from_env().cache_dir == tmp_path / "custom"
+
+
+class TestClientCaching:
+    """Test ClaudeClient with a cache attached"""
+
+    @pytest.mark.asyncio
+    async def test_off_by_default(self, monkeypatch):
+        monkeypatch.delenv("CLAUDE_RESPONSE_CACHE", raising=False)
+        client = CountingClient()
+        await client.query("hello")
+        await client.query("hello")
+        assert client.cache is None
+        assert client.text_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_repeat_query_costs_no_tokens(self, cache):
+        client = CountingClient(cache=cache)
+        first, usage = await client.query("hello", system_prompt="be brief", return_usage=True)
+        second, cached_usage = await client.query("hello", system_prompt="be brief", return_usage=True)
+
+        assert first == second == "answer to be brief\n\nhello"
+        assert usage["total_tokens"] == 15
+        assert cached_usage == {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0, "cached": True}
+        assert client.text_calls == 1
+
+        # A different system prompt is a different request
+        await client.query("hello", system_prompt="be verbose")
+        assert client.text_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_queries_share_one_call(self, cache):
+        client = CountingClient(cache=cache, delay=0.05)
+        results = await asyncio.gather(*[client.query("same") for _ in range(5)])
+        assert set(results) == {"answer to same"}
+        assert client.text_calls == 1
+        assert cache.coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_call_is_not_cached(self, cache):
+        client = CountingClient(cache=cache)
+        calls = 0
+
+        async def flaky(full_prompt):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("overloaded")
+            return {"text": "ok", "usage": None}
+
+        client._send_text = flaky
+        with pytest.raises(RuntimeError):
+            await client.query("retry me")
+        assert await client.query("retry me") == "ok"
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_bypass(self, cache):
+        client = CountingClient(cache=cache)
+        await client.query("hello")
+        await client.query("hello", use_cache=False)
+        assert client.text_calls == 2
+
+        uncached = client.without_cache()
+        await uncached.query("hello")
+        assert uncached.text_calls == 3
+        assert client.cache is cache
+
+    @pytest.mark.asyncio
+    async def test_vision_key_uses_image_content(self, cache):
+        client = CountingClient(cache=cache)
+        red = {"data": base64.b64encode(b"red").decode(), "media_type": "image/png"}
+        blue = {"data": base64.b64encode(b"blue").decode(), "media_type": "image/png"}
+
+        await client.query_with_images("describe", [red])
+        await client.query_with_images("describe", [red])
+        assert client.vision_calls == 1
+        await client.query_with_images("describe", [blue])
+        assert client.vision_calls == 2
+
+
+class TestAgentBypass:
+    """Test per-agent opt-out"""
+
+    def test_creative_agents_bypass_cache(self, cache):
+        from agents.asset_analyzer import AssetAnalyzerAgent
+        from agents.script_writer import ScriptWriterAgent
+
+        client = ClaudeClient(cache=cache)
+        assert ScriptWriterAgent(claude_client=client).claude.cache is None
+        assert AssetAnalyzerAgent(claude_client=client).claude.cache is cache
+        assert client.cache is cache
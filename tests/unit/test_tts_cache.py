@@ -0,0 +1,134 @@
+"""Unit tests for the TTS audio cache"""
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from core.audio_utils import generate_audio_chunks
+from core.providers.base import AudioGenerationResult
+from core.tts_cache import TTSCache, tts_cache_key
+
+
+class FakeProvider:
+    """Minimal TTS provider with ElevenLabs-style settings"""
+
+    name = "fake"
+
+    def __init__(self, model="m1", stability=0.5):
+        self.model = model
+        self.default_voice_settings = {"stability": stability}
+        self.generate_speech = AsyncMock(side_effect=self._speak)
+        self.estimate_cost = MagicMock(return_value=0.01)
+
+    async def _speak(self, text, voice_id=None, **kwargs):
+        return AudioGenerationResult(success=True, audio_data=f"{voice_id}:{text}".encode())
+
+    def synthesis_settings(self):
+        return {"model": self.model, "default_voice_settings": self.default_voice_settings}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TTSCache(str(tmp_path / "tts"))
+
+
+def _write(path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+class TestTTSCache:
+    """Test the on-disk store"""
+
+    def test_key_covers_provider_settings_voice_and_text(self):
+        base = tts_cache_key(FakeProvider(), "Hello there", "v1")
+        assert base == tts_cache_key(FakeProvider(), "Hello there", "v1")
+        assert base != tts_cache_key(FakeProvider(model="m2"), "Hello there", "v1")
+        assert base != tts_cache_key(FakeProvider(stability=0.9), "Hello there", "v1")
+        assert base != tts_cache_key(FakeProvider(), "Hello there", "v2")
+        assert base != tts_cache_key(FakeProvider(), "Hello there!", "v1")
+
+    def test_put_and_materialize(self, cache, tmp_path):
+        src = _write(tmp_path / "gen" / "a.mp3", b"audio")
+        cache.put("ab" * 32, src, 2.5)
+
+        dest = tmp_path / "run" / "a.mp3"
+        assert cache.materialize("ab" * 32, dest) == 2.5
+        assert dest.read_bytes() == b"audio"
+        assert cache.materialize("cd" * 32, tmp_path / "run" / "b.mp3") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_evicts_least_recently_used_entries_with_sidecars(self, cache, tmp_path):
+        for i, key in enumerate(["aa" * 32, "bb" * 32, "cc" * 32]):
+            cache.put(key, _write(tmp_path / f"{i}.mp3", b"x" * 1000), 1.0)
+            for path in cache.cache_dir.glob(f"*/{key}.*"):
+                os.utime(path, (1000 + i, 1000 + i))
+        entry_size = cache.stats()["size_bytes"] // 3
+
+        cache.get("aa" * 32)  # Now the most recent
+        assert cache.evict(max_size_bytes=2 * entry_size) == 1
+        assert not list(cache.cache_dir.glob(f"*/{'bb' * 32}.*"))
+        assert cache.get("aa" * 32) is not None
+        assert cache.stats()["audio_seconds"] == 2.0
+
+
+class TestGenerateWithCache:
+    """Test generate_audio_chunks with a cache attached"""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_paragraphs_skip_api_and_probe(self, cache, tmp_path):
+        provider = FakeProvider()
+        items = [("p0", "First **paragraph** text"), ("p1", "Second paragraph text")]
+
+        with patch("core.audio_utils.get_audio_duration", new_callable=AsyncMock, return_value=3.0) as probe:
+            first = await generate_audio_chunks(provider, items, tmp_path / "run1", voice_id="v", cache=cache)
+            assert probe.call_count == 2
+
+            items[1] = ("p1", "Second paragraph, edited")
+            second = await generate_audio_chunks(provider, items, tmp_path / "run2", voice_id="v", cache=cache)
+            assert probe.call_count == 3
+
+        assert [c.cached for c in first] == [False, False]
+        assert [c.cached for c in second] == [True, False]
+        assert second[0].duration_sec == 3.0
+        assert second[0].estimated_cost == 0.0
+        assert provider.generate_speech.call_count == 3
+        assert (tmp_path / "run2" / "p0.mp3").read_bytes() == b"v:First paragraph text"
+
+    @pytest.mark.asyncio
+    async def test_regenerating_does_not_corrupt_linked_entry(self, cache, tmp_path):
+        provider = FakeProvider()
+        items = [("p0", "Some paragraph text")]
+        with patch("core.audio_utils.get_audio_duration", new_callable=AsyncMock, return_value=1.0):
+            await generate_audio_chunks(provider, items, tmp_path / "run", voice_id="v", cache=cache)
+            await generate_audio_chunks(provider, items, tmp_path / "run", voice_id="v", cache=cache)
+            # Same output dir without the cache: the linked file is replaced, not overwritten
+            await generate_audio_chunks(provider, items, tmp_path / "run", voice_id="other")
+
+        assert (tmp_path / "run" / "p0.mp3").read_bytes() == b"other:Some paragraph text"
+        audio, _ = cache.get(tts_cache_key(provider, "Some paragraph text", "v"))
+        assert audio.read_bytes() == b"v:Some paragraph text"
+
+
+class TestCacheCLI:
+    """Test cache stats/prune"""
+
+    def test_stats_and_prune(self, tmp_path, monkeypatch):
+        from cli import cache as cache_cli
+
+        tts = TTSCache(str(tmp_path / "tts"))
+        tts.put("ab" * 32, _write(tmp_path / "a.mp3", b"audio"), 1.0)
+        monkeypatch.setitem(cache_cli.CACHES, "tts", ("TTS narration", lambda: TTSCache(str(tmp_path / "tts"))))
+
+        runner = CliRunner()
+        result = runner.invoke(cache_cli.cache_cmd, ["stats", "tts", "--json"])
+        assert result.exit_code == 0
+        assert '"entries": 1' in result.output
+
+        result = runner.invoke(cache_cli.cache_cmd, ["prune", "tts", "--all"])
+        assert result.exit_code == 0
+        assert "removed 1 entries" in result.output
+        assert tts.stats()["entries"] == 0
@@ -0,0 +1,158 @@
+"""Unit tests for concurrent, rate-limit-aware TTS chunk generation"""
+
+import asyncio
+import time
+from dataclasses import replace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from core.audio_utils import generate_audio_chunks
+from core.providers.base import AudioGenerationResult
+from core.tts_scheduler import CharacterBudget, TTSLimits, TTSScheduler, is_rate_limited
+
+
+class FakeTTSProvider:
+    """Provider with a fixed latency that records concurrency and can return 429s"""
+
+    max_concurrent_requests = 3
+
+    def __init__(self, delay: float = 0.05, rate_limited: int = 0, raise_errors: bool = True):
+        self.delay = delay
+        self.rate_limited = rate_limited
+        self.raise_errors = raise_errors
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def generate_speech(self, text, voice_id=None, **kwargs):
+        self.calls.append(text)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay * (1 + len(self.calls) % 3))  # Uneven latencies
+            if self.rate_limited:
+                self.rate_limited -= 1
+                if self.raise_errors:
+                    raise RuntimeError("ElevenLabs API error (status 429): too_many_concurrent_requests")
+                return AudioGenerationResult(success=False, error_message="OpenAI TTS API error (429): slow down")
+            return AudioGenerationResult(success=True, audio_data=text.encode())
+        finally:
+            self.active -= 1
+
+    def estimate_cost(self, text, **kwargs):
+        return 0.0
+
+
+def _items(n):
+    return [(f"chunk_{i:03d}", f"Paragraph number {i} of the script") for i in range(n)]
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    for_provider = TTSLimits.for_provider
+    monkeypatch.setattr(
+        TTSLimits, "for_provider",
+        classmethod(lambda cls, provider: replace(for_provider(provider), base_delay=0.01)),
+    )
+    monkeypatch.delenv("TTS_MAX_CONCURRENCY", raising=False)
+    monkeypatch.delenv("TTS_CHARACTERS_PER_MINUTE", raising=False)
+
+
+class TestGenerateAudioChunksConcurrency:
+    """Test that chunks overlap within the provider's limits"""
+
+    @pytest.mark.asyncio
+    async def test_runs_within_provider_concurrency(self, tmp_path, fast_retries):
+        provider = FakeTTSProvider()
+        started = time.monotonic()
+        with patch("core.audio_utils.get_audio_duration", new_callable=AsyncMock, return_value=1.0):
+            results = await generate_audio_chunks(provider, _items(12), tmp_path)
+        elapsed = time.monotonic() - started
+
+        assert [r.audio_id for r in results] == [f"chunk_{i:03d}" for i in range(12)]
+        assert all((tmp_path / f"{r.audio_id}.mp3").read_bytes() == r.text.encode() for r in results)
+        assert provider.peak == 3
+        # Serially this takes ~1.2s (12 requests of 50-150ms)
+        assert elapsed < 1.0
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_override(self, tmp_path, fast_retries):
+        provider = FakeTTSProvider(delay=0.01)
+        with patch("core.audio_utils.get_audio_duration", new_callable=AsyncMock, return_value=1.0):
+            await generate_audio_chunks(provider, _items(6), tmp_path, max_concurrency=1)
+        assert provider.peak == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("raise_errors", [True, False])
+    async def test_retries_rate_limits(self, tmp_path, fast_retries, raise_errors):
+        provider = FakeTTSProvider(delay=0.01, rate_limited=4, raise_errors=raise_errors)
+        errors = []
+        with patch("core.audio_utils.get_audio_duration", new_callable=AsyncMock, return_value=1.0):
+            results = await generate_audio_chunks(
+                provider, _items(5), tmp_path,
+                on_chunk_error=lambda audio_id, e: errors.append(audio_id),
+            )
+        assert len(results) == 5
+        assert errors == []
+        assert len(provider.calls) == 9
+
+    @pytest.mark.asyncio
+    async def test_progress_counts_completions(self, tmp_path, fast_retries):
+        calls = []
+        with patch("core.audio_utils.get_audio_duration", new_callable=AsyncMock, return_value=1.0):
+            await generate_audio_chunks(
+                FakeTTSProvider(delay=0.01), [("a", "Hi")] + _items(4), tmp_path,
+                on_chunk_complete=lambda i, total, audio_id: calls.append((i, total)),
+            )
+        assert calls == [(i, 5) for i in range(5)]
+
+
+class TestTTSScheduler:
+    """Test the scheduler's limits on their own"""
+
+    def test_is_rate_limited(self):
+        assert is_rate_limited(RuntimeError("ElevenLabs API error (status 429): busy"))
+        assert is_rate_limited(AudioGenerationResult(success=False, error_message="Rate limit reached"))
+        assert not is_rate_limited(RuntimeError("ElevenLabs API error (status 401): bad key"))
+
+    @pytest.mark.asyncio
+    async def test_other_errors_are_not_retried(self, fast_retries):
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("status 400")
+
+        with pytest.raises(RuntimeError):
+            await TTSScheduler(TTSLimits(base_delay=0.001)).run(call)
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, fast_retries):
+        async def call():
+            raise RuntimeError("status 429")
+
+        scheduler = TTSScheduler(TTSLimits(max_retries=2, base_delay=0.001))
+        with pytest.raises(RuntimeError):
+            await scheduler.run(call)
+        assert scheduler.retries == 2
+
+    @pytest.mark.asyncio
+    async def test_character_budget_waits_for_window(self):
+        budget = CharacterBudget(100, window=0.1)
+        started = time.monotonic()
+        await budget.acquire(60)
+        await budget.acquire(40)
+        assert time.monotonic() - started < 0.05
+        await budget.acquire(10)
+        assert time.monotonic() - started >= 0.09
+
+    def test_limits_from_provider_and_env(self, monkeypatch, fast_retries):
+        assert TTSLimits.for_provider(FakeTTSProvider()).max_concurrency == 3
+        assert TTSLimits.for_provider(AsyncMock()).max_concurrency == 4  # Mocks declare nothing
+        monkeypatch.setenv("TTS_MAX_CONCURRENCY", "8")
+        monkeypatch.setenv("TTS_CHARACTERS_PER_MINUTE", "20000")
+        limits = TTSLimits.for_provider(FakeTTSProvider())
+        assert (limits.max_concurrency, limits.characters_per_minute) == (8, 20000)